@@ -1,11 +1,10 @@
 from typing import Any, Optional
 from pydantic_ai import Agent, RunContext
-from pydantic_ai.models.openai import OpenAIChatModel
-from pydantic_ai.providers.openai import OpenAIProvider
 from back.graph.dto.combat import CombatTurnContinuePayload, CombatTurnEndPayload
 from back.models.schema import LLMConfig
 from back.services.game_session_service import GameSessionService
 from back.utils.history_processors import summarize_old_messages
+from back.utils.timing import timed_tools
 
 
 class CombatAgent:
@@ -24,6 +23,9 @@ class CombatAgent:
         **Parameters:**
         - `llm_config` (LLMConfig): LLM configuration containing api_endpoint, api_key, model.
         """
+        # Imported here: the OpenAI client is only loaded when an agent is built (not at app import)
+        from pydantic_ai.models.openai import OpenAIChatModel
+        from pydantic_ai.providers.openai import OpenAIProvider
         provider = OpenAIProvider(
             base_url=llm_config.api_endpoint,
             api_key=llm_config.api_key
@@ -40,18 +42,23 @@ class CombatAgent:
             model=model,
             output_type=CombatTurnContinuePayload | CombatTurnEndPayload,
             deps_type=GameSessionService,
-            tools=[
+            tools=timed_tools([
+                combat_tools.resolve_attack_action_tool,
                 combat_tools.execute_attack_tool,
+                combat_tools.cast_spell_tool,
+                combat_tools.defend_tool,
                 combat_tools.apply_direct_damage_tool,
                 combat_tools.end_turn_tool,
                 combat_tools.check_combat_end_tool,
                 combat_tools.end_combat_tool,
                 combat_tools.get_combat_status_tool,
+                combat_tools.attack_odds_tool,
                 skill_tools.skill_check_with_character,
+                skill_tools.skill_check_odds_tool,
                 equipment_tools.inventory_remove_item,
                 equipment_tools.inventory_decrease_quantity,
                 equipment_tools.inventory_increase_quantity,
-            ],
+            ]),
             history_processors=[summarize_old_messages]
         )
 
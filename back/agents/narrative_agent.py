@@ -4,13 +4,12 @@ Narrative agent for story progression.
 
 from typing import Any, Optional
 from pydantic_ai import Agent, RunContext
-from pydantic_ai.models.openai import OpenAIChatModel
-from pydantic_ai.providers.openai import OpenAIProvider
 from back.graph.dto.combat import CombatSeedPayload
 from back.graph.dto.scenario import ScenarioEndPayload
 from back.models.schema import LLMConfig
 from back.services.game_session_service import GameSessionService
 from back.utils.history_processors import summarize_old_messages
+from back.utils.timing import timed_tools
 
 
 class NarrativeAgent:
@@ -27,6 +26,9 @@ class NarrativeAgent:
         **Parameters:**
         - `llm_config` (LLMConfig): LLM configuration containing api_endpoint, api_key, model.
         """
+        # Imported here: the OpenAI client is only loaded when an agent is built (not at app import)
+        from pydantic_ai.models.openai import OpenAIChatModel
+        from pydantic_ai.providers.openai import OpenAIProvider
         provider = OpenAIProvider(
             base_url=llm_config.api_endpoint,
             api_key=llm_config.api_key
@@ -44,7 +46,7 @@ class NarrativeAgent:
             model=model,
             output_type=str | CombatSeedPayload | ScenarioEndPayload,
             deps_type=GameSessionService,
-            tools=[
+            tools=timed_tools([
                 equipment_tools.inventory_buy_item,
                 equipment_tools.inventory_add_item,
                 equipment_tools.inventory_remove_item,
@@ -54,12 +56,13 @@ class NarrativeAgent:
                 character_tools.character_add_currency,
                 character_tools.character_remove_currency,
                 skill_tools.skill_check_with_character,
+                skill_tools.skill_check_odds_tool,
                 character_tools.character_take_damage,
                 character_tools.character_heal,
                 character_tools.character_apply_xp,
                 combat_tools.start_combat_tool,
                 scenario_tools.end_scenario_tool,
-            ],
+            ]),
             history_processors=[summarize_old_messages]
         )
 
@@ -1,13 +1,38 @@
 # back/app.py
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from back.routers import characters, scenarios, creation, gamesession, user
+from back.routers import characters, scenarios, creation, gamesession, probability, user, metrics, profiling
 from fastapi.openapi.utils import get_openapi
 from back.utils.exceptions import InternalServerError
+from back.dependencies import global_container
+from back.utils.metrics import watch_event_loop_lag
+from back.utils.warmup import warm_up
+from back.utils.profiling import ProfilingMiddleware
+from back.utils.memory import start_tracing
+from back.config import config
 import logfire
 
-app = FastAPI(title="JdR – Terres du Milieu")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Trace allocations (if enabled) before the caches are filled, for the per-subsystem memory report
+    start_tracing()
+    # Start filling the pre-generated character pool in the background
+    global_container.character_pool.schedule_refill()
+    # Sample the event-loop lag for /metrics
+    lag_watcher = asyncio.create_task(watch_event_loop_lag())
+    # Load the tokenizer, game data and agents before serving, so that the first turn is warm
+    if config.get_app_config().get("warmup", True):
+        await warm_up()
+    yield
+    lag_watcher.cancel()
+    await global_container.character_pool.close()
+
+
+app = FastAPI(title="JdR – Terres du Milieu", lifespan=lifespan)
 
 def scrubbing_callback(m: logfire.ScrubMatch):
     return m.value
@@ -32,12 +57,18 @@ app.add_middleware(
     allow_headers=["*"],  # Allow all headers
 )
 
+# On-demand profiling (X-Profile header or sampling, see /api/profiles)
+app.add_middleware(ProfilingMiddleware)
+
 # Routers REST
 app.include_router(characters.router, prefix="/api/characters")
 app.include_router(scenarios.router,  prefix="/api/scenarios")
 app.include_router(creation.router,   prefix="/api/creation")
 app.include_router(gamesession.router, prefix="/api/gamesession")
+app.include_router(probability.router, prefix="/api/probability")
 app.include_router(user.router)
+app.include_router(metrics.router)
+app.include_router(profiling.router)
 
 # Ajout de la documentation Swagger personnalisée
 @app.get("/openapi.json", include_in_schema=False)
@@ -0,0 +1,3 @@
+"""
+Benchmarks run as scripts (`python -m back.benchmarks.<name>`); not collected by pytest.
+"""
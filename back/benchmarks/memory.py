@@ -0,0 +1,116 @@
+"""
+Memory benchmark: bytes held per cached session as its history grows, measured with tracemalloc.
+For each history length, synthetic narrative histories (player messages, long GM answers, tool calls every
+few turns) are written to disk, then loaded through the history store for several sessions kept alive at
+once, as a history cache would. Prints the on-disk size, the memory per session (also as attributed to the
+`history` subsystem by `back.utils.memory`) and how many such sessions fit in 1 GiB.
+
+Usage (from the project root):
+    python -m back.benchmarks.memory [--turns 10 50 100 250 500] [--sessions 20]
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import tracemalloc
+from datetime import datetime, timezone
+from typing import List
+
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    ModelResponse,
+    TextPart,
+    ToolCallPart,
+    ToolReturnPart,
+    UserPromptPart,
+)
+from pydantic_ai.usage import RequestUsage
+
+from back.storage.pydantic_jsonl_store import PydanticJsonlStore
+from back.utils.memory import memory_report
+
+GIB = 1024 ** 3
+_PLAYER_LINE = "I draw my sword and step carefully into the ruined watchtower, listening for orcs. "
+_GM_LINE = ("The wind howls through the broken stones of Amon Sûl; shadows gather at the edge of the torchlight, "
+            "and somewhere below, iron scrapes on rock. ")
+
+
+def build_history(turns: int) -> List[ModelMessage]:
+    """Synthetic narrative history of `turns` turns (a tool call every third turn)."""
+    now = datetime.now(timezone.utc)
+    messages: List[ModelMessage] = []
+    for turn in range(turns):
+        messages.append(ModelRequest(parts=[UserPromptPart(content=_PLAYER_LINE * 2, timestamp=now)]))
+        if turn % 3 == 0:
+            call_id = f"call_{turn}"
+            messages.append(ModelResponse(
+                parts=[ToolCallPart(tool_name="skill_check_with_character",
+                                    args={"skill_name": "Perception", "difficulty_name": "Hard"},
+                                    tool_call_id=call_id)],
+                usage=RequestUsage(input_tokens=3000, output_tokens=40), model_name="deepseek-chat", timestamp=now))
+            messages.append(ModelRequest(parts=[ToolReturnPart(
+                tool_name="skill_check_with_character", tool_call_id=call_id, timestamp=now,
+                content={"skill": "Perception", "roll": 63, "target": 55, "success": True})]))
+        messages.append(ModelResponse(parts=[TextPart(content=_GM_LINE * 6)],
+                                      usage=RequestUsage(input_tokens=3100, output_tokens=420),
+                                      model_name="deepseek-chat", timestamp=now))
+    return messages
+
+
+def measure(turns: int, sessions: int, directory: str) -> dict:
+    """Loads `sessions` histories of `turns` turns and measures the memory they hold."""
+    paths = []
+    for index in range(sessions):
+        store = PydanticJsonlStore(os.path.join(directory, f"{turns}_{index}", "history_narrative.jsonl"))
+        store.save_pydantic_history(build_history(turns))
+        paths.append(store.filepath)
+    file_bytes = os.path.getsize(paths[0])
+
+    gc.collect()
+    before, _ = tracemalloc.get_traced_memory()
+    history_before = memory_report().subsystems["history"].bytes
+    cache = [PydanticJsonlStore(path).load_pydantic_history() for path in paths]
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    history_after = memory_report().subsystems["history"].bytes
+    assert all(len(history) == len(cache[0]) for history in cache)
+    del cache
+
+    per_session = (after - before) / sessions
+    return {
+        "turns": turns,
+        "messages": len(build_history(turns)),
+        "file_bytes": file_bytes,
+        "bytes_per_session": per_session,
+        "history_bytes_per_session": (history_after - history_before) / sessions,
+        "sessions_per_gib": GIB / per_session if per_session else float("inf"),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, nargs="+", default=[10, 50, 100, 250, 500],
+                        help="history lengths (turns) to measure")
+    parser.add_argument("--sessions", type=int, default=20, help="sessions held at once per measurement")
+    parser.add_argument("--frames", type=int, default=25, help="tracemalloc traceback depth")
+    args = parser.parse_args()
+
+    tracemalloc.start(args.frames)
+    with tempfile.TemporaryDirectory() as directory:
+        results = [measure(turns, args.sessions, directory) for turns in args.turns]
+    tracemalloc.stop()
+
+    print(f"{'turns':>6} {'messages':>9} {'file KiB':>9} {'KiB/session':>12} {'history KiB':>12} "
+          f"{'x file':>7} {'sessions/GiB':>13}")
+    for result in results:
+        print(f"{result['turns']:>6} {result['messages']:>9} {result['file_bytes'] / 1024:>9.1f} "
+              f"{result['bytes_per_session'] / 1024:>12.1f} {result['history_bytes_per_session'] / 1024:>12.1f} "
+              f"{result['bytes_per_session'] / result['file_bytes']:>7.2f} {result['sessions_per_gib']:>13.0f}")
+    print(f"\n{args.sessions} sessions held per measurement; 'history KiB' is the part attributed to the "
+          f"history subsystem by back.utils.memory.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Startup benchmark: import time of the application and duration of the warm-up, each measured in fresh
+interpreters (a warm `sys.modules` would hide the import cost).
+
+Usage (from the project root):
+    python -m back.benchmarks.startup [--runs 5] [--module back.app] [--top 15] [--no-warmup]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_IMPORT_SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = [name for name in ("openai", "tiktoken", "haystack") if name in sys.modules]
+print(json.dumps({{"seconds": elapsed, "heavy_modules": heavy}}))
+"""
+
+_WARMUP_SNIPPET = """
+import asyncio, json
+from back.utils.warmup import warm_up
+print(json.dumps(asyncio.run(warm_up())))
+"""
+
+
+def _run_python(args: List[str]) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    return subprocess.run([sys.executable, *args], cwd=PROJECT_ROOT, env=env, capture_output=True, text=True)
+
+
+def _last_json_line(output: str):
+    # Logs go to the console too: the result is the last JSON line
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def measure_import(module: str) -> Dict:
+    """Import time of `module` in a fresh interpreter, and the heavy modules it pulled in."""
+    process = _run_python(["-c", _IMPORT_SNIPPET.format(module=module)])
+    if process.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{process.stderr[-2000:]}")
+    return _last_json_line(process.stdout)
+
+
+def slowest_imports(module: str, top: int) -> List[Tuple[str, float]]:
+    """The `top` modules with the highest cumulative import time (`python -X importtime`)."""
+    process = _run_python(["-X", "importtime", "-c", f"import {module}"])
+    timings = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        timings.append((name.strip(), int(cumulative) / 1_000_000))
+    return sorted(timings, key=lambda item: item[1], reverse=True)[:top]
+
+
+def measure_warmup() -> Dict[str, float]:
+    """Durations of the warm-up steps, in a fresh interpreter."""
+    process = _run_python(["-c", _WARMUP_SNIPPET])
+    if process.returncode != 0:
+        raise RuntimeError(f"warm-up failed:\n{process.stderr[-2000:]}")
+    return _last_json_line(process.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per measurement")
+    parser.add_argument("--module", default="back.app", help="module whose import is measured")
+    parser.add_argument("--top", type=int, default=15, help="slowest imports to list")
+    parser.add_argument("--no-warmup", action="store_true", help="skip the warm-up measurement")
+    args = parser.parse_args()
+
+    runs = [measure_import(args.module) for _ in range(args.runs)]
+    seconds = [run["seconds"] for run in runs]
+    print(f"import {args.module}: median {statistics.median(seconds) * 1000:.0f} ms, "
+          f"min {min(seconds) * 1000:.0f} ms, max {max(seconds) * 1000:.0f} ms ({args.runs} runs)")
+    print(f"heavy modules loaded at import: {', '.join(runs[0]['heavy_modules']) or 'none'}")
+
+    print("\nslowest imports (cumulative):")
+    for name, cumulative in slowest_imports(args.module, args.top):
+        print(f"  {cumulative * 1000:8.1f} ms  {name}")
+
+    if not args.no_warmup:
+        print("\nwarm-up:")
+        for name, step_seconds in measure_warmup().items():
+            print(f"  {step_seconds * 1000:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Storage benchmark: bytes written per turn and disk usage of a history, with the previous format (indented
+JSON array rewritten whole on every turn) and with the current one (compact JSON, hot file plus compressed
+cold segment, see `back.storage.pydantic_jsonl_store`). A synthetic narrative history is saved after every
+turn, as the game loop does.
+
+Usage (from the project root):
+    python -m back.benchmarks.storage [--turns 50 100 250 500]
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from typing import Dict, List
+
+from pydantic_ai.messages import ModelMessagesTypeAdapter
+
+from back.benchmarks.memory import build_history
+from back.storage.pydantic_jsonl_store import PydanticJsonlStore
+
+
+def _disk_bytes(directory: str) -> int:
+    return sum(entry.stat().st_size for entry in os.scandir(directory) if entry.is_file())
+
+
+def measure(turns: int, directory: str) -> Dict[str, float]:
+    """Saves a history of `turns` turns after each turn, in both formats, and sums the bytes written."""
+    history = build_history(turns)
+    # Message count at the end of each turn (a turn ends with the GM's text answer)
+    ends: List[int] = [index + 1 for index, message in enumerate(history)
+                       if message.kind == "response" and message.parts[0].part_kind == "text"]
+
+    legacy_path = os.path.join(directory, f"legacy_{turns}", "history_narrative.jsonl")
+    os.makedirs(os.path.dirname(legacy_path))
+    legacy_written = 0
+    start = time.perf_counter()
+    for end in ends:
+        raw = ModelMessagesTypeAdapter.dump_json(history[:end], indent=2)
+        with open(legacy_path, "wb") as f:
+            f.write(raw)
+        legacy_written += len(raw)
+    legacy_seconds = time.perf_counter() - start
+
+    store = PydanticJsonlStore(os.path.join(directory, f"current_{turns}", "history_narrative.jsonl"))
+    written = 0
+    start = time.perf_counter()
+    for end in ends:
+        written += store._write(history[:end])["bytes_written"]
+    seconds = time.perf_counter() - start
+    assert store.load_pydantic_history() == history
+
+    return {
+        "turns": turns,
+        "legacy_disk": os.path.getsize(legacy_path),
+        "disk": _disk_bytes(os.path.dirname(store.filepath)),
+        "legacy_per_turn": legacy_written / len(ends),
+        "per_turn": written / len(ends),
+        "legacy_ms_per_turn": legacy_seconds * 1000 / len(ends),
+        "ms_per_turn": seconds * 1000 / len(ends),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, nargs="+", default=[50, 100, 250, 500],
+                        help="history lengths (turns) to measure")
+    args = parser.parse_args()
+    # The store logs every save at DEBUG level
+    logging.disable(logging.DEBUG)
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = [measure(turns, directory) for turns in args.turns]
+
+    print(f"{'turns':>6} {'disk KiB':>17} {'written KiB/turn':>19} {'ms/turn':>15}")
+    print(f"{'':>6} {'before':>8} {'after':>8} {'before':>9} {'after':>9} {'before':>7} {'after':>7}")
+    for result in results:
+        print(f"{result['turns']:>6} {result['legacy_disk'] / 1024:>8.1f} {result['disk'] / 1024:>8.1f} "
+              f"{result['legacy_per_turn'] / 1024:>9.1f} {result['per_turn'] / 1024:>9.1f} "
+              f"{result['legacy_ms_per_turn']:>7.2f} {result['ms_per_turn']:>7.2f}")
+    print("\nbefore: indented JSON rewritten whole; after: current storage configuration "
+          "(section `storage` of config.yaml).")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,38 @@
 # Centralized configuration for JdR project
 
 import os
+import json
+import atexit
 import logging
 import logging.handlers
+import queue
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 from pathlib import Path
 import yaml
 from back.models.schema import LLMConfig
 
+# LogRecord attribute holding the structured fields of `back.utils.logger` calls
+LOG_FIELDS_ATTR = "fields"
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line (Grafana/Loki); structured fields are emitted as top-level keys."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in (getattr(record, LOG_FIELDS_ATTR, None) or {}).items():
+            entry.setdefault(key, value)
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
 class Config:
     """Centralized configuration class using a YAML file."""
 
@@ -15,6 +40,7 @@ class Config:
         self.config_file = Path(__file__).parent / config_file
         self._config: Dict[str, Any] = {}
         self._logger: Optional[logging.Logger] = None
+        self._log_listener: Optional[logging.handlers.QueueListener] = None
         self._load_config()
         self._setup_logging()
 
@@ -33,7 +59,8 @@ class Config:
         ### get_llm_config
         **Description :** Retourne la configuration du modèle LLM.
         **Returns :**
-        - (LLMConfig) : Configuration avec model, api_endpoint, api_key, token_limit, keep_last_n_messages
+        - (LLMConfig) : Configuration avec model, api_endpoint, api_key, token_limit, keep_last_n_messages,
+          combat_state_token_budget, combat_log_lines
         """
         llm_config = self._config.get("llm", {})
 
@@ -43,7 +70,9 @@ class Config:
             api_endpoint=os.environ.get("DEEPSEEK_API_BASE_URL") or llm_config.get("api_endpoint", "https://api.deepseek.com"),
             api_key=os.environ.get("DEEPSEEK_API_KEY") or llm_config.get("api_key", ""),
             token_limit=int(os.environ.get("LLM_TOKEN_LIMIT") or llm_config.get("token_limit", 4000)),
-            keep_last_n_messages=int(os.environ.get("LLM_KEEP_LAST_N_MESSAGES") or llm_config.get("keep_last_n_messages", 10))
+            keep_last_n_messages=int(os.environ.get("LLM_KEEP_LAST_N_MESSAGES") or llm_config.get("keep_last_n_messages", 10)),
+            combat_state_token_budget=int(os.environ.get("LLM_COMBAT_STATE_TOKEN_BUDGET") or llm_config.get("combat_state_token_budget", 600)),
+            combat_log_lines=int(os.environ.get("LLM_COMBAT_LOG_LINES") or llm_config.get("combat_log_lines", 5))
         )
 
     def get_data_dir(self) -> str:
@@ -71,6 +100,74 @@ class Config:
         """
         return self._config.get("app", {})
 
+    def get_character_pool_config(self) -> Dict[str, Any]:
+        """
+        ### get_character_pool_config
+        **Description:** Returns the pre-generated character pool configuration.
+        **Returns:**
+        - (Dict[str, Any]): `size` (characters kept per race and culture, 0 disables the pool) and `low_watermark`
+        """
+        pool_config = self._config.get("character_pool", {})
+        return {
+            "size": int(os.environ.get("CHARACTER_POOL_SIZE") or pool_config.get("size", 2)),
+            "low_watermark": int(pool_config.get("low_watermark", 1)),
+        }
+
+    def get_profiling_config(self) -> Dict[str, Any]:
+        """
+        ### get_profiling_config
+        **Description:** Returns the on-demand request profiling configuration.
+        **Returns:**
+        - (Dict[str, Any]): `enabled`, `sample_rate`, `mode` ("cprofile" or "sampling"), `allow_header`, `paths`
+          (path prefixes eligible for sampling and for the `X-Profile` header), `max_profiles`,
+          `sampling_interval_ms` and `admin_token` (required to change the settings; if empty, only local
+          clients may change them)
+        """
+        profiling_config = self._config.get("profiling", {})
+        return {
+            "enabled": bool(profiling_config.get("enabled", False)),
+            "sample_rate": float(profiling_config.get("sample_rate", 0.0)),
+            "mode": profiling_config.get("mode", "cprofile"),
+            "allow_header": bool(profiling_config.get("allow_header", False)),
+            "paths": list(profiling_config.get("paths", ["/api/gamesession/play"])),
+            "max_profiles": int(profiling_config.get("max_profiles", 50)),
+            "sampling_interval_ms": float(profiling_config.get("sampling_interval_ms", 5)),
+            "admin_token": os.environ.get("PROFILING_ADMIN_TOKEN") or profiling_config.get("admin_token") or "",
+        }
+
+    def get_memory_config(self) -> Dict[str, Any]:
+        """
+        ### get_memory_config
+        **Description:** Returns the memory tracking configuration.
+        **Returns:**
+        - (Dict[str, Any]): `tracemalloc` (trace allocations from startup) and `frames` (traceback depth kept
+          per allocation)
+        """
+        memory_config = self._config.get("memory", {})
+        return {
+            "tracemalloc": bool(memory_config.get("tracemalloc", False)),
+            "frames": int(memory_config.get("frames", 25)),
+        }
+
+    def get_storage_config(self) -> Dict[str, Any]:
+        """
+        ### get_storage_config
+        **Description:** Returns the on-disk serialization configuration.
+        **Returns:**
+        - (Dict[str, Any]): `json_indent` (None for compact JSON), `compression` of the cold history
+          segments (`gzip`, `zstd` or `none`), `compression_level` (None for the codec default) and
+          `hot_messages` (messages kept in the plain JSON hot file before they move to a cold segment)
+        """
+        storage_config = self._config.get("storage", {})
+        indent = storage_config.get("json_indent")
+        level = storage_config.get("compression_level")
+        return {
+            "json_indent": int(indent) if indent else None,
+            "compression": str(storage_config.get("compression", "gzip")).lower(),
+            "compression_level": int(level) if level is not None else None,
+            "hot_messages": int(storage_config.get("hot_messages", 100)),
+        }
+
     def get_logging_config(self) -> Dict[str, Any]:
         """
         ### get_logging_config
@@ -81,7 +178,10 @@ class Config:
         return self._config.get("logging", {})
 
     def _setup_logging(self) -> None:
-        """Configures the logging system according to the YAML configuration."""
+        """
+        Configures the logging system according to the YAML configuration.
+        Callers only enqueue records: formatting and console/file I/O run on a `QueueListener` thread.
+        """
         logging_config = self.get_logging_config()
 
         # Log level
@@ -90,8 +190,7 @@ class Config:
         # Log format
         if logging_config.get("format", "json").lower() == "json":
             # JSON format for Grafana/Loki
-            log_format = '{"timestamp": "%(asctime)s", "level": "%(levelname)s", "logger": "%(name)s", "message": "%(message)s"}'
-            formatter = logging.Formatter(log_format, datefmt='%Y-%m-%dT%H:%M:%S.%fZ')
+            formatter: logging.Formatter = JsonFormatter()
         else:
             # Standard text format
             log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -102,6 +201,7 @@ class Config:
         logger.setLevel(log_level)
 
         # Remove existing handlers
+        self.stop_logging()
         for handler in logger.handlers[:]:
             logger.removeHandler(handler)
 
@@ -109,7 +209,7 @@ class Config:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(log_level)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers: list[logging.Handler] = [console_handler]
 
         # File handler (optional)
         log_file = logging_config.get("file")
@@ -130,11 +230,29 @@ class Config:
             )
             file_handler.setLevel(log_level)
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
+
+        # Queue: the caller thread (event loop) never waits on console or file I/O
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._log_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._log_listener.start()
+        atexit.register(self.stop_logging)
 
         # Store configured logger
         self._logger = logger
 
+    def stop_logging(self) -> None:
+        """
+        ### stop_logging
+        **Description:** Flushes the queued log records and stops the logging thread.
+        """
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            for handler in self._log_listener.handlers:
+                handler.close()
+            self._log_listener = None
+
     def get_logger(self, name: str):
         """
         ### get_logger
@@ -158,6 +276,22 @@ def get_llm_config() -> LLMConfig:
     """Compatibility function for LLM configuration."""
     return config.get_llm_config()
 
+def get_character_pool_config() -> Dict[str, Any]:
+    """Compatibility function for the character pool configuration."""
+    return config.get_character_pool_config()
+
+def get_profiling_config() -> Dict[str, Any]:
+    """Compatibility function for the profiling configuration."""
+    return config.get_profiling_config()
+
+def get_memory_config() -> Dict[str, Any]:
+    """Compatibility function for the memory tracking configuration."""
+    return config.get_memory_config()
+
+def get_storage_config() -> Dict[str, Any]:
+    """Compatibility function to get the storage configuration."""
+    return config.get_storage_config()
+
 def get_logger(name: str):
     """Compatibility function to get a configured logger."""
     return config.get_logger(name)
@@ -6,6 +6,13 @@ Manages the lifecycle of singleton services to avoid unnecessary instantiation.
 from typing import Optional
 from back.services.character_data_service import CharacterDataService
 from back.services.equipment_service import EquipmentService
+from back.services.combatant_resolver import CombatantResolver
+from back.models.domain.npc_archetypes_manager import NpcArchetypesManager
+from back.models.domain.combat_system_manager import CombatSystemManager
+from back.models.domain.spells_manager import SpellsManager
+from back.services.random_character_service import RandomCharacterService
+from back.services.character_pool_service import CharacterPoolService
+from back.config import get_character_pool_config
 from back.utils.logger import log_info
 
 class DependencyContainer:
@@ -33,6 +40,24 @@ class DependencyContainer:
         
         # 2. Initialize EquipmentService (Depends on CharacterDataService)
         self.equipment_service = EquipmentService(self.character_data_service)
+
+        # 3. Initialize CombatantResolver (Entity cache for reference-only combatants)
+        self.combatant_resolver = CombatantResolver(self.character_data_service)
+
+        # 4. Initialize NpcArchetypesManager (NPC templates compiled once, on first use)
+        self.npc_archetypes_manager = NpcArchetypesManager()
+
+        # 5. Initialize CombatSystemManager (combat rules compiled once per rules version)
+        self.combat_system_manager = CombatSystemManager()
+
+        # 6. Initialize SpellsManager (indexed spell catalog)
+        self.spells_manager = SpellsManager()
+
+        # 7. Initialize RandomCharacterService (reuses its managers across random generations)
+        self.random_character_service = RandomCharacterService(self.character_data_service)
+
+        # 8. Initialize CharacterPoolService (pre-generated random characters, filled in the background)
+        self.character_pool = CharacterPoolService(self.random_character_service, **get_character_pool_config())
         
         self._initialized = True
         log_info("DependencyContainer initialized.")
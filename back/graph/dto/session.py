@@ -2,10 +2,11 @@
 DTOs for session graph state management.
 """
 
-from typing import Any, Literal, Optional
+import asyncio
+from typing import Any, Awaitable, Callable, Literal, Optional
 from pydantic import BaseModel, Field
 from pydantic_ai.messages import ModelMessage
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from back.models.domain.preferences import UserPreferences
 
 
@@ -46,13 +47,53 @@ class PlayerMessagePayload:
 class DispatchResult:
     """
     ### DispatchResult
-    **Description:** Result of dispatching a graph run, containing serialized messages.
+    **Description:** Result of dispatching a graph run. Only the messages of this turn are serialized;
+    the full history is kept as message objects and serialized by the caller only if it needs it.
     **Attributes:**
-    - `all_messages` (list[dict[str, Any]]): Complete message history as JSON-serializable dicts.
     - `new_messages` (list[dict[str, Any]]): New messages from this turn as JSON-serializable dicts.
+    - `history` (list[ModelMessage]): Full history of `history_kind` after this turn (not serialized).
+    - `history_kind` (Literal["narrative", "combat"]): History the turn was appended to.
+    - `history_version` (int): Length of that history after this turn; clients holding
+      `history_version - len(new_messages)` messages are in sync once they append `new_messages`.
     """
-    all_messages: list[dict[str, Any]]
     new_messages: list[dict[str, Any]]
+    history: list[ModelMessage] = field(default_factory=list)
+    history_kind: Literal["narrative", "combat"] = "narrative"
+    history_version: int = 0
+
+
+class HistoryHandle:
+    """
+    ### HistoryHandle
+    **Description:** Lazy handle on the full history of one kind for the current turn. The history is
+    loaded on the first `get` and the same parsed list is shared by every later caller, so a turn
+    reads it at most once.
+    **Attributes:**
+    - `kind` (Literal["narrative", "combat"]): History kind.
+    """
+
+    def __init__(self, kind: Literal["narrative", "combat"], loader: Callable[[str], Awaitable[list[ModelMessage]]]):
+        self.kind = kind
+        self._loader = loader
+        self._messages: Optional[list[ModelMessage]] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._messages is not None
+
+    async def get(self) -> list[ModelMessage]:
+        """
+        ### get
+        **Description:** Returns the history, loading it on first use. The list is shared: appending
+        to it updates what later callers see.
+        **Returns:** The history messages.
+        """
+        if self._messages is None:
+            async with self._lock:
+                if self._messages is None:
+                    self._messages = await self._loader(self.kind)
+        return self._messages
 
 
 @dataclass
@@ -63,10 +104,29 @@ class SessionGraphState:
     **Attributes:**
     - `game_state` (GameState): Persistent game state loaded from game_state.json.
     - `pending_player_message` (PlayerMessagePayload): Current player message.
-    - `model_messages` (list[ModelMessage] | None): Buffer of history messages loaded by dispatcher.
-    - `active_history_kind` (Literal["narrative", "combat"] | None): Type of history currently loaded.
+    - `history` (HistoryHandle | None): Lazy handle on the full history of the active mode, set by the dispatcher.
+    - `active_history_kind` (Literal["narrative", "combat"] | None): Type of history of the active mode.
     """
     game_state: GameState
     pending_player_message: PlayerMessagePayload
-    model_messages: Optional[list[ModelMessage]] = None
-    active_history_kind: Optional[Literal["narrative", "combat"]] = None
\ No newline at end of file
+    history: Optional[HistoryHandle] = None
+    active_history_kind: Optional[Literal["narrative", "combat"]] = None
+
+    def history_handle(
+        self,
+        kind: Literal["narrative", "combat"],
+        loader: Callable[[str], Awaitable[list[ModelMessage]]]
+    ) -> HistoryHandle:
+        """
+        ### history_handle
+        **Description:** Returns the shared handle on the `kind` history, creating it if the state holds
+        none or one of another kind.
+        **Parameters:**
+        - `kind` (Literal["narrative", "combat"]): History kind.
+        - `loader` (Callable): Loads a history by kind (e.g. `GameSessionService.load_history`).
+        **Returns:** The history handle.
+        """
+        if self.history is None or self.history.kind != kind:
+            self.history = HistoryHandle(kind, loader)
+            self.active_history_kind = kind
+        return self.history
\ No newline at end of file
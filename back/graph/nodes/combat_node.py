@@ -2,13 +2,21 @@
 Combat node for handling combat turns.
 """
 
+import time
+
 from pydantic_graph import BaseNode, GraphRunContext, End
+from pydantic_ai.messages import ModelMessagesTypeAdapter, ModelRequest, ModelResponse, TextPart, UserPromptPart
 from back.graph.dto.session import SessionGraphState, DispatchResult
-from back.graph.dto.combat import CombatTurnEndPayload
+from back.graph.dto.combat import CombatantOutcome, CombatTurnEndPayload
 from back.agents.combat_agent import CombatAgent
+from back.models.domain.combat_state import CombatState, CombatantType
+from back.services.combat_service import CombatService
 from back.utils.logger import log_debug
 from back.services.game_session_service import GameSessionService, HISTORY_NARRATIVE, HISTORY_COMBAT
 from back.config import get_llm_config
+from back.utils.timing import PHASE_LLM, PHASE_PROMPT, timed
+from back.utils.metrics import TURNS, record_agent_run
+from back.utils.history_processors import collect_summary_usage
 
 
 class CombatNode(BaseNode[SessionGraphState, GameSessionService, DispatchResult]):
@@ -41,6 +49,7 @@ class CombatNode(BaseNode[SessionGraphState, GameSessionService, DispatchResult]
         **Returns:** End with DispatchResult containing response parts.
         """
         log_debug("Running CombatNode", session_id=ctx.deps.session_id)
+        TURNS.inc(mode="combat")
 
         # Load the active combat state
         from back.services.combat_state_service import CombatStateService
@@ -62,69 +71,139 @@ class CombatNode(BaseNode[SessionGraphState, GameSessionService, DispatchResult]
             ctx.state.game_state.session_mode = "narrative"
             ctx.state.game_state.active_combat_id = None
             await ctx.deps.update_game_state(ctx.state.game_state)
+            notice = ModelResponse(parts=[TextPart(content="Combat state lost. Returning to narrative mode.")])
             return End(DispatchResult(
-                all_messages=[],
-                new_messages=[{"role": "system", "content": "Combat state lost. Returning to narrative mode."}]
+                new_messages=ModelMessagesTypeAdapter.dump_python([notice], mode='json'),
+                history_kind=HISTORY_NARRATIVE
             ))
 
+        # Resolve pending NPC turns locally (e.g. NPCs winning initiative) before calling the LLM
+        npc_turns = []
+        if isinstance(combat_state, CombatState):
+            current = combat_state.get_current_combatant()
+            if combat_state.is_active and current and current.type == CombatantType.NPC:
+                combat_service = CombatService()
+                combat_state, npc_turns = combat_service.resolve_npc_turns(combat_state)
+                end_reason = combat_service.get_end_reason(combat_state)
+                if end_reason:
+                    # The NPCs ended the combat: no LLM combat turn against a deleted combat
+                    combat_state = combat_service.end_combat(combat_state, end_reason)
+                    combat_state_service.delete_combat_state(session_id_uuid)
+                    return await self._end_after_npc_turns(ctx, combat_state, end_reason, npc_turns)
+                combat_state_service.save_combat_state(session_id_uuid, combat_state)
+
         # Build system prompt with loaded combat state
-        from back.services.settings_service import SettingsService
-        settings_service = SettingsService()
-        language = settings_service.get_preferences().language
+        with timed(PHASE_PROMPT):
+            from back.services.settings_service import SettingsService
+            settings_service = SettingsService()
+            language = settings_service.get_preferences().language
+
+            system_prompt = await ctx.deps.build_combat_prompt(combat_state, language, npc_turns=npc_turns)
 
-        system_prompt = await ctx.deps.build_combat_prompt(combat_state, language)
+        # Full history of this turn, loaded at most once and shared
+        history = ctx.state.history_handle(HISTORY_COMBAT, ctx.deps.load_history)
 
         # Load LLM-specific history (summarized)
         llm_history = await ctx.deps.load_history_llm(HISTORY_COMBAT)
         
         if not llm_history:
-             llm_history = await ctx.deps.load_history(HISTORY_COMBAT)
-
-        # Run the agent
-        result = await self.combat_agent.run(
-            user_message=ctx.state.pending_player_message.message,
-            message_history=llm_history,
-            system_prompt=system_prompt,
-            deps=ctx.deps
-        )
+             llm_history = list(await history.get())
+
+        # Run the agent (tool calls and summarization included)
+        started = time.perf_counter()
+        with timed(PHASE_LLM), collect_summary_usage() as summary_usage:
+            result = await self.combat_agent.run(
+                user_message=ctx.state.pending_player_message.message,
+                message_history=llm_history,
+                system_prompt=system_prompt,
+                deps=ctx.deps
+            )
+        latency = time.perf_counter() - started
+        record_agent_run("combat", latency, result.usage())
+        await ctx.deps.record_turn_usage(HISTORY_COMBAT, result, latency, summary_usage)
 
         # Persist the new LLM history
         await ctx.deps.save_history_llm(HISTORY_COMBAT, result.all_messages())
 
         # Update Full History
-        full_history = await ctx.deps.load_history(HISTORY_COMBAT)
-        full_history.extend(result.new_messages())
+        full_history = await history.get()
+        new_messages = list(result.new_messages())
+        full_history.extend(new_messages)
         await ctx.deps.save_history(HISTORY_COMBAT, full_history)
 
         # Handle structured output
         output = result.output
         if isinstance(output, CombatTurnEndPayload):
-            # End combat
-            ctx.state.game_state.session_mode = "narrative"
-            ctx.state.game_state.last_combat_result = output.model_dump()
-            ctx.state.game_state.active_combat_id = None  # Clear active combat
-            
-            # TODO: Handle Player Death gracefully.
-            # If the player died (see last_combat_result), we should probably transition to a "Game Over" or "Unconscious" state
-            # rather than just returning to narrative mode as if nothing happened.
-            
-            await ctx.deps.update_game_state(ctx.state.game_state)
-            log_debug("Ending combat mode", session_id=ctx.deps.session_id)
+            await self._end_combat_mode(ctx, output)
         else:
             # Continue combat
             # Note: We don't need to save combat_state here as tools update it directly via CombatStateService
             await ctx.deps.update_game_state(ctx.state.game_state)
 
-        # Use built-in JSON serialization methods
-        import json
-        from pydantic_ai.messages import ModelMessage
-        from pydantic import TypeAdapter
-        
-        ta = TypeAdapter(list[ModelMessage])
-        all_messages_json = json.loads(ta.dump_json(full_history))
-        new_messages_json = json.loads(result.new_messages_json())
+        # Only this turn's messages are serialized; the full history is left to the caller
+        return End(DispatchResult(
+            new_messages=ModelMessagesTypeAdapter.dump_python(new_messages, mode='json'),
+            history=full_history,
+            history_kind=HISTORY_COMBAT,
+            history_version=len(full_history)
+        ))
+
+    async def _end_combat_mode(self, ctx: GraphRunContext[SessionGraphState, GameSessionService],
+                               payload: CombatTurnEndPayload) -> None:
+        """
+        ### _end_combat_mode
+        **Description:** Returns the session to narrative mode and records the combat result.
+        **Parameters:**
+        - `ctx` (GraphRunContext[SessionGraphState]): Graph context with state.
+        - `payload` (CombatTurnEndPayload): Result of the combat.
+        """
+        ctx.state.game_state.session_mode = "narrative"
+        ctx.state.game_state.last_combat_result = payload.model_dump()
+        ctx.state.game_state.active_combat_id = None  # Clear active combat
+
+        # TODO: Handle Player Death gracefully.
+        # If the player died (see last_combat_result), we should probably transition to a "Game Over" or "Unconscious" state
+        # rather than just returning to narrative mode as if nothing happened.
+
+        await ctx.deps.update_game_state(ctx.state.game_state)
+        log_debug("Ending combat mode", session_id=ctx.deps.session_id)
+
+    async def _end_after_npc_turns(self, ctx: GraphRunContext[SessionGraphState, GameSessionService],
+                                   combat_state: CombatState, end_reason: str,
+                                   npc_turns: list) -> End[DispatchResult]:
+        """
+        ### _end_after_npc_turns
+        **Description:** Ends the turn when the NPC turns resolved before the LLM call ended the combat.
+        The agent is not run (its tools would find no active combat): the NPC actions and the outcome
+        are reported as is, the combat result is recorded and the session returns to narrative mode.
+        **Parameters:**
+        - `ctx` (GraphRunContext[SessionGraphState]): Graph context with state.
+        - `combat_state` (CombatState): The ended combat state.
+        - `end_reason` (str): 'victory' or 'defeat'.
+        - `npc_turns` (list): Results of the NPC actions resolved this turn.
+        **Returns:** End with DispatchResult containing the report.
+        """
+        winners = CombatantType.PLAYER if end_reason == "victory" else CombatantType.NPC
+        payload = CombatTurnEndPayload(
+            combat_summary="\n".join([turn["message"] for turn in npc_turns] + [f"Combat ended: {end_reason}"]),
+            winners=[p.name for p in combat_state.participants if p.type == winners and p.is_alive()],
+            combatants_outcomes=[CombatantOutcome(name=p.name, is_dead=not p.is_alive())
+                                 for p in combat_state.participants],
+        )
+        await self._end_combat_mode(ctx, payload)
+
+        history = ctx.state.history_handle(HISTORY_COMBAT, ctx.deps.load_history)
+        full_history = await history.get()
+        new_messages = [
+            ModelRequest(parts=[UserPromptPart(content=ctx.state.pending_player_message.message)]),
+            ModelResponse(parts=[TextPart(content=payload.combat_summary)]),
+        ]
+        full_history.extend(new_messages)
+        await ctx.deps.save_history(HISTORY_COMBAT, full_history)
 
         return End(DispatchResult(
-            all_messages=all_messages_json,
-            new_messages=new_messages_json
-        ))
\ No newline at end of file
+            new_messages=ModelMessagesTypeAdapter.dump_python(new_messages, mode='json'),
+            history=full_history,
+            history_kind=HISTORY_COMBAT,
+            history_version=len(full_history)
+        ))
@@ -2,7 +2,6 @@
 Dispatcher node for routing between narrative and combat modes.
 """
 
-from typing import Any
 from pydantic_graph import BaseNode, GraphRunContext, End
 from back.graph.dto.session import SessionGraphState, DispatchResult
 from back.graph.nodes.narrative_node import NarrativeNode
@@ -14,7 +13,7 @@ class DispatcherNode(BaseNode[SessionGraphState, GameSessionService, DispatchRes
     """
     ### DispatcherNode
     **Description:** Routes the session to the appropriate node based on session_mode.
-    Loads the relevant history into the state.
+    Puts a lazy handle on the relevant history into the state.
     **Returns:** NarrativeNode or CombatNode based on mode.
     """
 
@@ -23,7 +22,7 @@ class DispatcherNode(BaseNode[SessionGraphState, GameSessionService, DispatchRes
     ) -> NarrativeNode | CombatNode:
         """
         ### run
-        **Description:** Determine the current mode and load the appropriate history.
+        **Description:** Determine the current mode and prepare the appropriate history handle.
         **Parameters:**
         - `ctx` (GraphRunContext[SessionGraphState]): Graph context with state.
         **Returns:** Next node to run (NarrativeNode or CombatNode).
@@ -31,9 +30,8 @@ class DispatcherNode(BaseNode[SessionGraphState, GameSessionService, DispatchRes
         mode = ctx.state.game_state.session_mode
         history_kind = HISTORY_NARRATIVE if mode == "narrative" else HISTORY_COMBAT
 
-        # Load history from GameSessionService
-        ctx.state.model_messages = await ctx.deps.load_history(history_kind)
-        ctx.state.active_history_kind = history_kind
+        # History is loaded lazily, once, by the node that needs it
+        ctx.state.history_handle(history_kind, ctx.deps.load_history)
 
         if mode == "narrative":
             return NarrativeNode()
@@ -2,7 +2,10 @@
 Narrative node for handling story progression.
 """
 
+import time
+
 from pydantic_graph import BaseNode, GraphRunContext, End
+from pydantic_ai.messages import ModelMessagesTypeAdapter
 from back.graph.dto.session import SessionGraphState, DispatchResult
 from back.graph.dto.combat import CombatSeedPayload
 from back.graph.dto.scenario import ScenarioEndPayload
@@ -10,6 +13,9 @@ from back.agents.narrative_agent import NarrativeAgent
 from back.utils.logger import log_debug
 from back.services.game_session_service import GameSessionService, HISTORY_NARRATIVE, HISTORY_COMBAT
 from back.config import get_llm_config
+from back.utils.timing import PHASE_LLM, PHASE_PROMPT, timed
+from back.utils.metrics import TURNS, record_agent_run
+from back.utils.history_processors import collect_summary_usage
 
 
 class NarrativeNode(BaseNode[SessionGraphState, GameSessionService, DispatchResult]):
@@ -39,13 +45,18 @@ class NarrativeNode(BaseNode[SessionGraphState, GameSessionService, DispatchResu
         **Returns:** End with DispatchResult containing response parts.
         """
         log_debug("Running NarrativeNode", session_id=ctx.deps.session_id)
+        TURNS.inc(mode="narrative")
 
         # Build system prompt with scenario
-        from back.services.settings_service import SettingsService
-        settings_service = SettingsService()
-        language = settings_service.get_preferences().language
-        
-        system_prompt = await ctx.deps.build_narrative_system_prompt(language)
+        with timed(PHASE_PROMPT):
+            from back.services.settings_service import SettingsService
+            settings_service = SettingsService()
+            language = settings_service.get_preferences().language
+
+            system_prompt = await ctx.deps.build_narrative_system_prompt(language)
+
+        # Full history of this turn, loaded at most once and shared
+        history = ctx.state.history_handle(HISTORY_NARRATIVE, ctx.deps.load_history)
 
         # Load LLM-specific history (summarized)
         llm_history = await ctx.deps.load_history_llm(HISTORY_NARRATIVE)
@@ -56,26 +67,33 @@ class NarrativeNode(BaseNode[SessionGraphState, GameSessionService, DispatchResu
         # But we must ensure we don't lose context on first run.
         if not llm_history:
              # Fallback to full history if LLM history is missing (e.g. first run after feature add)
-             llm_history = await ctx.deps.load_history(HISTORY_NARRATIVE)
-
-        # Run the agent with LLM history
-        result = await self.narrative_agent.run(
-            user_message=ctx.state.pending_player_message.message,
-            message_history=llm_history,
-            system_prompt=system_prompt,
-            deps=ctx.deps
-        )
+             # (a copy: the agent must not see the shared list grow)
+             llm_history = list(await history.get())
+
+        # Run the agent with LLM history (tool calls and summarization included)
+        started = time.perf_counter()
+        with timed(PHASE_LLM), collect_summary_usage() as summary_usage:
+            result = await self.narrative_agent.run(
+                user_message=ctx.state.pending_player_message.message,
+                message_history=llm_history,
+                system_prompt=system_prompt,
+                deps=ctx.deps
+            )
+        latency = time.perf_counter() - started
+        record_agent_run("narrative", latency, result.usage())
+        await ctx.deps.record_turn_usage(HISTORY_NARRATIVE, result, latency, summary_usage)
 
         # Persist the new LLM history (which might include the summary now)
         await ctx.deps.save_history_llm(HISTORY_NARRATIVE, result.all_messages())
 
         # Update Full History (Source of Truth for UI)
         # We load the full history, append the NEW messages from the agent result, and save.
-        full_history = await ctx.deps.load_history(HISTORY_NARRATIVE)
+        full_history = await history.get()
         
         # We need to append the user message and the model response(s)
         # result.new_messages() contains exactly that.
-        full_history.extend(result.new_messages())
+        new_messages = list(result.new_messages())
+        full_history.extend(new_messages)
         
         await ctx.deps.save_history(HISTORY_NARRATIVE, full_history)
 
@@ -131,34 +149,10 @@ class NarrativeNode(BaseNode[SessionGraphState, GameSessionService, DispatchResu
                 rewards=output.rewards
             )
 
-        # Use built-in JSON serialization methods
-        # We want to return the FULL history to the UI, not the summarized LLM history.
-        # We need to serialize full_history.
-        from back.storage.pydantic_jsonl_store import PydanticJsonlStore
-        # Helper to serialize list of messages
-        # Since we don't have a direct helper on result for arbitrary list, we use the store's helper or manual.
-        # PydanticJsonlStore has to_json methods? No, but we can use TypeAdapter or similar if needed.
-        # Actually, result.new_messages_json() is fine for the delta.
-        # For all_messages, we should return the full_history we just saved.
-        
-        # We can reuse the logic from PydanticJsonlStore or just rely on the fact that 
-        # the UI might reload history or we send it here.
-        # Let's try to serialize full_history using pydantic-ai's internal tools if accessible, 
-        # or just use the result's new messages and let the UI append them?
-        # The DispatchResult expects all_messages and new_messages.
-        
-        # Hack: We use the result's new_messages_json for the delta.
-        # For all_messages, we need to serialize full_history.
-        # Since full_history is a list of ModelMessage, we can use the same serialization as PydanticAI.
-        import json
-        from pydantic_ai.messages import ModelMessage
-        from pydantic import TypeAdapter
-        
-        ta = TypeAdapter(list[ModelMessage])
-        all_messages_json = json.loads(ta.dump_json(full_history))
-        new_messages_json = json.loads(result.new_messages_json())
-
+        # Only this turn's messages are serialized; the full history is left to the caller
         return End(DispatchResult(
-            all_messages=all_messages_json,
-            new_messages=new_messages_json
-        ))
\ No newline at end of file
+            new_messages=ModelMessagesTypeAdapter.dump_python(new_messages, mode='json'),
+            history=full_history,
+            history_kind=HISTORY_NARRATIVE,
+            history_version=len(full_history)
+        ))
@@ -10,7 +10,7 @@ This module provides a simplified character model with:
 - Strict Pydantic validation
 """
 from typing import List, Dict, Optional, ClassVar
-from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
+from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict, ValidationInfo
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
 from enum import Enum
@@ -19,6 +19,7 @@ from enum import Enum
 
 from back.models.enums import CharacterStatus
 from back.models.domain.items import EquipmentItem
+from back.utils.trusted_load import is_trusted_load
 
 
 class Stats(BaseModel):
@@ -49,8 +50,10 @@ class Stats(BaseModel):
     
     @field_validator('*')
     @classmethod
-    def validate_stat_range(cls, v: int) -> int:
+    def validate_stat_range(cls, v: int, info: ValidationInfo) -> int:
         """Ensure each stat is within valid range"""
+        if is_trusted_load(info):
+            return v
         if not (3 <= v <= 20):
             raise ValueError(f"Stat must be between 3 and 20, got {v}")
         return v
@@ -134,16 +137,20 @@ class Skills(BaseModel):
 
     @field_validator('artistic', 'magic_arts', 'athletic', 'combat', 'concentration', 'general')
     @classmethod
-    def validate_skill_ranks(cls, v: Dict[str, int]) -> Dict[str, int]:
+    def validate_skill_ranks(cls, v: Dict[str, int], info: ValidationInfo) -> Dict[str, int]:
         """Ensure all skill ranks are between 0 and 10"""
+        if is_trusted_load(info):
+            return v
         for skill_name, rank in v.items():
             if not (0 <= rank <= 10):
                 raise ValueError(f"Skill rank for {skill_name} must be between 0 and 10, got {rank}")
         return v
 
     @model_validator(mode='after')
-    def validate_total_development_points(self) -> 'Skills':
+    def validate_total_development_points(self, info: ValidationInfo) -> 'Skills':
         """Ensure total development points don't exceed 40"""
+        if is_trusted_load(info):
+            return self
         total = self.get_total_development_points()
         if total > 40:
             raise ValueError(f"Total development points ({total}) exceed maximum of 40")
@@ -286,8 +293,10 @@ class CombatStats(BaseModel):
     attack_bonus: int = Field(default=0, description="Base attack modifier")
     
     @model_validator(mode='after')
-    def validate_current_stats(self) -> 'CombatStats':
+    def validate_current_stats(self, info: ValidationInfo) -> 'CombatStats':
         """Ensure current HP/MP don't exceed maximum"""
+        if is_trusted_load(info):
+            return self
         if self.current_hit_points > self.max_hit_points:
             raise ValueError("Current HP cannot exceed maximum HP")
         if self.current_mana_points > self.max_mana_points:
@@ -793,9 +802,44 @@ class Character(BaseModel):
     )
 
 
+class CharacterSummary(BaseModel):
+    """
+    Lightweight projection of a character used for listings
+
+    Holds only what a character list displays, so listings can be served
+    from the character index without parsing full character files.
+    """
+
+    id: UUID = Field(..., description="Unique character identifier")
+    name: str = Field(..., description="Character name")
+    race: str = Field(..., description="Character race")
+    level: int = Field(default=1, description="Character level")
+    status: CharacterStatus = Field(default=CharacterStatus.DRAFT, description="Character lifecycle status")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+
+    @field_validator('updated_at')
+    @classmethod
+    def assume_utc(cls, value: datetime) -> datetime:
+        """Naive timestamps are stored in UTC; make them comparable with aware ones"""
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+    @classmethod
+    def from_character(cls, character: Character) -> "CharacterSummary":
+        """Project a full character onto its summary"""
+        return cls(
+            id=character.id,
+            name=character.name,
+            race=character.race,
+            level=character.level,
+            status=character.status,
+            updated_at=character.updated_at
+        )
+
+
 # Export main classes
 __all__ = [
     'Character',
+    'CharacterSummary',
     'CharacterStatus',
     'Stats',
     'Skills',
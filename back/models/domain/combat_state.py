@@ -1,11 +1,16 @@
 """Real-time combat state models."""
-from typing import List, Optional
-from pydantic import BaseModel, Field, model_validator, ConfigDict
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+from pydantic import BaseModel, Field, model_validator, ConfigDict, ValidationError, ValidationInfo, PrivateAttr
 from uuid import UUID, uuid4
 from enum import Enum
 
-from .character import Character
+from .character import Character, Equipment
 from .npc import NPC
+from back.utils.trusted_load import is_trusted_load
+
+UNARMED_WEAPON_NAME = "Unarmed Strike"
+UNARMED_WEAPON_DAMAGE = "1"
 
 class CombatantType(str, Enum):
     """
@@ -31,9 +36,10 @@ class Combatant(BaseModel):
     Purpose:
         Encapsulates all combat-relevant data for a single participant in an encounter.
         This model serves as the runtime representation of combatants, tracking their
-        current state (HP, initiative) while maintaining references to their full character
-        or NPC data. It provides a unified interface for combat operations regardless of
-        whether the combatant is a player or NPC, enabling consistent combat mechanics.
+        current state (HP, initiative) and a snapshot of the numbers combat resolution
+        needs (attack bonus, initiative bonus, weapon). The full Character or NPC is
+        only referenced by id and resolved on demand through `CombatantResolver`, which
+        keeps combat state files and combat prompts small.
 
     Attributes:
         id (UUID): Unique identifier for the combatant in this combat instance.
@@ -43,8 +49,17 @@ class Combatant(BaseModel):
         max_hit_points (int): Maximum HP, must be >= 1.
         armor_class (int): Armor Class for defense calculations, must be >= 1.
         initiative_roll (int): Result of the initiative roll determining turn order.
-        character_ref (Optional[Character]): Full Character data if this is a player.
-        npc_ref (Optional[NPC]): Full NPC data if this is an NPC.
+        character_id (Optional[UUID]): Id of the underlying Character if this is a player.
+        npc_id (Optional[UUID]): Id of the underlying NPC if this is an NPC.
+        archetype (Optional[str]): NPC archetype (e.g., 'Goblin Warrior').
+        attack_bonus (int): Attack modifier used for attack and damage rolls.
+        initiative_bonus (int): Modifier added to the initiative d20.
+        weapon_name (str): Name of the weapon used to attack.
+        weapon_damage (str): Damage dice of the weapon (e.g., '1d8+4').
+        current_mana_points (int): Mana available for spells, synced back to player characters.
+        max_mana_points (int): Maximum mana.
+        defense_bonus (int): Temporary Armor Class bonus (e.g. from the defend action),
+            cleared when the combatant's next turn starts.
     """
     id: UUID = Field(default_factory=uuid4, description="Unique identifier for the combatant")
     name: str = Field(..., description="Name of the combatant")
@@ -56,22 +71,143 @@ class Combatant(BaseModel):
     armor_class: int = Field(..., ge=1, description="Armor Class")
     initiative_roll: int = Field(..., description="Result of the initiative roll")
     
-    # Reference to the full character/NPC data (optional, for detailed info)
-    character_ref: Optional[Character] = Field(default=None, description="Full Character data if player")
-    npc_ref: Optional[NPC] = Field(default=None, description="Full NPC data if NPC")
+    # Reference to the full character/NPC data (resolved on demand by CombatantResolver)
+    character_id: Optional[UUID] = Field(default=None, description="Character id if player")
+    npc_id: Optional[UUID] = Field(default=None, description="NPC id if NPC")
+    archetype: Optional[str] = Field(default=None, description="NPC archetype")
+
+    # Combat-relevant snapshot taken from the referenced entity
+    attack_bonus: int = Field(default=0, description="Attack modifier")
+    initiative_bonus: int = Field(default=0, description="Initiative modifier")
+    weapon_name: str = Field(default=UNARMED_WEAPON_NAME, description="Name of the weapon used to attack")
+    weapon_damage: str = Field(default=UNARMED_WEAPON_DAMAGE, description="Damage dice of the weapon")
+    current_mana_points: int = Field(default=0, ge=0, description="Current mana points")
+    max_mana_points: int = Field(default=0, ge=0, description="Maximum mana points")
+    defense_bonus: int = Field(default=0, ge=0, description="Temporary Armor Class bonus until the next turn")
+
+    @model_validator(mode='before')
+    @classmethod
+    def absorb_legacy_references(cls, data: Any) -> Any:
+        """
+        Converts legacy embedded `character_ref` / `npc_ref` payloads into references.
+
+        Purpose:
+            Combat state files written before combatants became reference-only embed
+            the full Character/NPC. They are reduced to an id plus the combat snapshot
+            so that old files keep loading and shrink on their next save.
+        """
+        if not isinstance(data, dict):
+            return data
+        if 'character_ref' not in data and 'npc_ref' not in data:
+            return data
+
+        data = dict(data)
+        character_ref = data.pop('character_ref', None)
+        npc_ref = data.pop('npc_ref', None)
+        try:
+            if character_ref is not None:
+                character = character_ref if isinstance(character_ref, Character) else Character.model_validate(character_ref)
+                snapshot = cls.snapshot_from_character(character)
+            elif npc_ref is not None:
+                npc = npc_ref if isinstance(npc_ref, NPC) else NPC.model_validate(npc_ref)
+                snapshot = cls.snapshot_from_npc(npc)
+            else:
+                snapshot = {}
+        except ValidationError:
+            # Keep at least the reference when the embedded entity no longer validates
+            ref = character_ref if character_ref is not None else npc_ref
+            ref_key = 'character_id' if character_ref is not None else 'npc_id'
+            snapshot = {ref_key: ref.get('id')} if isinstance(ref, dict) else {}
+
+        for key, value in snapshot.items():
+            data.setdefault(key, value)
+        return data
 
     @model_validator(mode='after')
-    def validate_combatant_type_reference(self) -> 'Combatant':
-        if self.type == CombatantType.PLAYER and not self.character_ref:
-            raise ValueError("Player combatant must have a character_ref")
-        if self.type == CombatantType.NPC and not self.npc_ref:
-            raise ValueError("NPC combatant must have an npc_ref")
-        if self.type == CombatantType.PLAYER and self.npc_ref:
-            raise ValueError("Player combatant cannot have an npc_ref")
-        if self.type == CombatantType.NPC and self.character_ref:
-            raise ValueError("NPC combatant cannot have a character_ref")
+    def validate_combatant_type_reference(self, info: ValidationInfo) -> 'Combatant':
+        if is_trusted_load(info):
+            return self
+        if self.type == CombatantType.PLAYER and not self.character_id:
+            raise ValueError("Player combatant must have a character_id")
+        if self.type == CombatantType.NPC and not self.npc_id:
+            raise ValueError("NPC combatant must have an npc_id")
+        if self.type == CombatantType.PLAYER and self.npc_id:
+            raise ValueError("Player combatant cannot have an npc_id")
+        if self.type == CombatantType.NPC and self.character_id:
+            raise ValueError("NPC combatant cannot have a character_id")
         return self
 
+    @staticmethod
+    def _weapon_snapshot(equipment: Equipment) -> Dict[str, Any]:
+        """Returns the weapon fields of the snapshot (first weapon, or unarmed)."""
+        if equipment.weapons:
+            weapon = equipment.weapons[0]
+            return {
+                'weapon_name': weapon.name,
+                'weapon_damage': weapon.damage or UNARMED_WEAPON_DAMAGE,
+            }
+        return {'weapon_name': UNARMED_WEAPON_NAME, 'weapon_damage': UNARMED_WEAPON_DAMAGE}
+
+    @classmethod
+    def snapshot_from_character(cls, character: Character) -> Dict[str, Any]:
+        """
+        Extracts the combat-relevant numbers of a player character.
+
+        Args:
+            character (Character): The referenced character.
+
+        Returns:
+            Dict[str, Any]: Combatant fields (reference id, HP, AC, bonuses, mana, weapon).
+        """
+        return {
+            'character_id': character.id,
+            'current_hit_points': character.combat_stats.current_hit_points,
+            'max_hit_points': character.combat_stats.max_hit_points,
+            'armor_class': character.combat_stats.armor_class,
+            'attack_bonus': character.combat_stats.attack_bonus,
+            'current_mana_points': character.combat_stats.current_mana_points,
+            'max_mana_points': character.combat_stats.max_mana_points,
+            'initiative_bonus': character.calculate_initiative(),
+            **cls._weapon_snapshot(character.equipment),
+        }
+
+    @classmethod
+    def snapshot_from_npc(cls, npc: NPC) -> Dict[str, Any]:
+        """
+        Extracts the combat-relevant numbers of an NPC.
+
+        Args:
+            npc (NPC): The referenced NPC.
+
+        Returns:
+            Dict[str, Any]: Combatant fields (reference id, HP, AC, bonuses, mana, weapon).
+        """
+        return {
+            'npc_id': npc.id,
+            'archetype': npc.archetype,
+            'current_hit_points': npc.combat_stats.current_hit_points,
+            'max_hit_points': npc.combat_stats.max_hit_points,
+            'armor_class': npc.combat_stats.armor_class,
+            'attack_bonus': npc.combat_stats.attack_bonus,
+            'current_mana_points': npc.combat_stats.current_mana_points,
+            'max_mana_points': npc.combat_stats.max_mana_points,
+            'initiative_bonus': 0,
+            **cls._weapon_snapshot(npc.equipment),
+        }
+
+    # Weak reference to the CombatState indexing this combatant, notified when it falls or gets back up.
+    _owner: Optional[weakref.ref] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name != 'current_hit_points':
+            super().__setattr__(name, value)
+            return
+        was_alive = self.current_hit_points > 0
+        super().__setattr__(name, value)
+        owner = self._owner() if self._owner is not None else None
+        if owner is not None and was_alive != (self.current_hit_points > 0):
+            owner._on_vitality_change(self, not was_alive)
+
     def is_alive(self) -> bool:
         return self.current_hit_points > 0
 
@@ -101,9 +237,16 @@ class CombatState(BaseModel):
         participants (List[Combatant]): All combatants in the encounter.
         turn_order (List[UUID]): Ordered list of combatant IDs for turn resolution.
         current_turn_combatant_id (Optional[UUID]): ID of the combatant whose turn it is.
+            Kept in sync with an internal integer pointer into `turn_order`.
         round_number (int): Current round number, must be >= 1.
         is_active (bool): True if combat is ongoing, False if ended.
         log (List[str]): Chronological log of combat actions and events.
+
+    Indexes:
+        Lookups by id or alias, alive counts per camp and turn advance are served by private
+        indexes built lazily from `participants` and `turn_order`, so they stay O(1) in battles
+        with hundreds of combatants. The indexes are rebuilt whenever either list is replaced or
+        resized, and alive counters follow every change of `current_hit_points`.
     """
     id: UUID = Field(default_factory=uuid4, description="Unique identifier for this combat instance")
     participants: List[Combatant] = Field(..., description="List of all combatants in the encounter")
@@ -114,7 +257,9 @@ class CombatState(BaseModel):
     log: List[str] = Field(default_factory=list, description="Log of combat actions and events")
 
     @model_validator(mode='after')
-    def validate_turn_order_participants(self) -> 'CombatState':
+    def validate_turn_order_participants(self, info: ValidationInfo) -> 'CombatState':
+        if is_trusted_load(info):
+            return self
         participant_ids = {p.id for p in self.participants}
         if not all(turn_id in participant_ids for turn_id in self.turn_order):
             raise ValueError("Turn order contains IDs not present in participants list")
@@ -122,12 +267,99 @@ class CombatState(BaseModel):
             raise ValueError("Current turn combatant ID not found in participants")
         return self
 
+    _index_key: Optional[Tuple[weakref.ref, list, int, list, int]] = PrivateAttr(default=None)
+    _positions: Dict[UUID, int] = PrivateAttr(default_factory=dict)
+    _refs: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _aliases: Dict[UUID, str] = PrivateAttr(default_factory=dict)
+    _turn_positions: Dict[UUID, int] = PrivateAttr(default_factory=dict)
+    _next_turn: List[int] = PrivateAttr(default_factory=list)
+    _alive_counts: Dict[CombatantType, int] = PrivateAttr(default_factory=dict)
+    _turn_index: Optional[int] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == 'current_turn_combatant_id' and self._index_key is not None:
+            self._turn_index = self._turn_positions.get(value) if value is not None else None
+
+    def _ensure_index(self) -> None:
+        """(Re)build the private indexes if `participants` or `turn_order` changed."""
+        # The key holds a weak reference to the indexed state so that copies rebuild their own index.
+        key = self._index_key
+        if (key is not None and key[0]() is self and key[1] is self.participants and key[2] == len(self.participants)
+                and key[3] is self.turn_order and key[4] == len(self.turn_order)):
+            return
+        owner = weakref.ref(self)
+        key = (owner, self.participants, len(self.participants), self.turn_order, len(self.turn_order))
+
+        positions: Dict[UUID, int] = {}
+        refs: Dict[str, int] = {}
+        aliases: Dict[UUID, str] = {}
+        alive_counts = {CombatantType.PLAYER: 0, CombatantType.NPC: 0}
+        counters = {CombatantType.PLAYER: 0, CombatantType.NPC: 0}
+        for idx, p in enumerate(self.participants):
+            counters[p.type] += 1
+            alias = f"{'P' if p.type == CombatantType.PLAYER else 'E'}{counters[p.type]}"
+            positions[p.id] = idx
+            aliases[p.id] = alias
+            refs[str(p.id)] = idx
+            refs[alias] = idx
+            if p.is_alive():
+                alive_counts[p.type] += 1
+            p._owner = owner
+
+        self._positions = positions
+        self._refs = refs
+        self._aliases = aliases
+        self._alive_counts = alive_counts
+        self._turn_positions = {combatant_id: idx for idx, combatant_id in enumerate(self.turn_order)}
+        self._next_turn = [(idx + 1) % len(self.turn_order) for idx in range(len(self.turn_order))]
+        self._index_key = key
+        current = self.current_turn_combatant_id
+        self._turn_index = self._turn_positions.get(current) if current is not None else None
+
+    def _on_vitality_change(self, combatant: Combatant, alive: bool) -> None:
+        """Keep alive counters (and the dead-skipping turn links) in sync with a combatant's HP."""
+        key = self._index_key
+        idx = self._positions.get(combatant.id) if key is not None and key[0]() is self else None
+        if idx is None or self.participants[idx] is not combatant:
+            # Stale notification, e.g. from a combatant copied out of this state.
+            return
+        self._alive_counts[combatant.type] += 1 if alive else -1
+        if alive:
+            # The turn links may skip over this combatant: reset them.
+            self._next_turn = [(idx + 1) % len(self.turn_order) for idx in range(len(self.turn_order))]
+
     def get_combatant(self, combatant_id: UUID) -> Optional[Combatant]:
         """Retrieve a combatant by their ID."""
-        for p in self.participants:
-            if p.id == combatant_id:
-                return p
-        return None
+        self._ensure_index()
+        idx = self._positions.get(combatant_id)
+        return self.participants[idx] if idx is not None else None
+
+    def get_aliases(self) -> Dict[UUID, str]:
+        """
+        Short, stable aliases for participants ('P1', 'P2'... for players, 'E1', 'E2'... for NPCs).
+
+        Aliases follow the participants order, which never changes during a combat, so the
+        same combatant keeps the same alias across turns and in every prompt.
+        The returned mapping is shared with the index and must not be mutated.
+        """
+        self._ensure_index()
+        return self._aliases
+
+    def find_combatant(self, ref: str) -> Optional[Combatant]:
+        """Retrieve a combatant by UUID string or short alias (e.g. 'E2')."""
+        self._ensure_index()
+        ref = str(ref).strip()
+        idx = self._refs.get(ref)
+        if idx is None:
+            idx = self._refs.get(ref.upper()) if len(ref) < 36 else self._refs.get(ref.lower())
+        if idx is None and len(ref) != 36:
+            # UUIDs written without dashes or braces
+            try:
+                idx = self._refs.get(str(UUID(ref)))
+            except ValueError:
+                pass
+        return self.participants[idx] if idx is not None else None
 
     def get_current_combatant(self) -> Optional[Combatant]:
         """Retrieve the combatant whose turn it is."""
@@ -135,6 +367,72 @@ class CombatState(BaseModel):
             return self.get_combatant(self.current_turn_combatant_id)
         return None
 
+    @property
+    def current_turn_index(self) -> Optional[int]:
+        """Position of the current combatant in `turn_order`, or None."""
+        self._ensure_index()
+        return self._turn_index
+
+    def turn_position(self, combatant_id: UUID) -> Optional[int]:
+        """Position of a combatant in `turn_order`, or None if it has no turn."""
+        self._ensure_index()
+        return self._turn_positions.get(combatant_id)
+
+    def alive_count(self, combatant_type: CombatantType) -> int:
+        """Number of combatants of a camp still standing."""
+        self._ensure_index()
+        return self._alive_counts.get(combatant_type, 0)
+
+    def _is_alive_at(self, turn_idx: int) -> bool:
+        return self.participants[self._positions[self.turn_order[turn_idx]]].is_alive()
+
+    def advance_turn(self) -> Tuple[Optional[Combatant], bool]:
+        """
+        Move the turn pointer to the next living combatant in turn order.
+
+        Dead combatants are skipped through forward links that are path-compressed as they are
+        walked, so each fallen combatant is stepped over once rather than on every turn
+        (O(1) amortized). If the current combatant is missing from the turn order, the turn
+        goes back to the first combatant.
+
+        Returns:
+            Tuple[Optional[Combatant], bool]: The new turn holder (None if nobody is standing)
+            and whether a new round started.
+        """
+        self._ensure_index()
+        count = len(self.turn_order)
+        if not count:
+            return None, False
+
+        current = self._turn_index
+        if current is None:
+            self.current_turn_combatant_id = self.turn_order[0]
+            return self.get_current_combatant(), False
+
+        skipped: List[int] = []
+        wrapped = False
+        idx = current
+        for _ in range(count):
+            nxt = self._next_turn[idx]
+            wrapped = wrapped or nxt <= idx
+            idx = nxt
+            if self._is_alive_at(idx):
+                break
+            skipped.append(idx)
+        else:
+            return None, False
+
+        # Path compression: every walked link now points straight at the living combatant.
+        # A link i -> j only spans dead combatants and crosses the end of the turn order
+        # exactly when j <= i, so the wrap detection above stays exact.
+        for walked_idx in [current, *skipped]:
+            self._next_turn[walked_idx] = idx
+
+        self.current_turn_combatant_id = self.turn_order[idx]
+        if wrapped:
+            self.round_number += 1
+        return self.participants[self._positions[self.turn_order[idx]]], wrapped
+
     def add_log_entry(self, entry: str) -> None:
         """Add an event to the combat log."""
         self.log.append(f"Round {self.round_number} - {entry}")
@@ -151,7 +449,12 @@ class CombatState(BaseModel):
                         "current_hit_points": 60,
                         "max_hit_points": 60,
                         "armor_class": 17,
-                        "initiative_roll": 15
+                        "initiative_roll": 15,
+                        "character_id": "123e4567-e89b-12d3-a456-426614174010",
+                        "attack_bonus": 5,
+                        "initiative_bonus": 2,
+                        "weapon_name": "Longsword",
+                        "weapon_damage": "1d8+4"
                     },
                     {
                         "id": "123e4567-e89b-12d3-a456-426614174001",
@@ -160,7 +463,12 @@ class CombatState(BaseModel):
                         "current_hit_points": 15,
                         "max_hit_points": 15,
                         "armor_class": 13,
-                        "initiative_roll": 12
+                        "initiative_roll": 12,
+                        "npc_id": "123e4567-e89b-12d3-a456-426614174011",
+                        "archetype": "Goblin Warrior",
+                        "attack_bonus": 2,
+                        "weapon_name": "Scimitar",
+                        "weapon_damage": "1d6"
                     }
                 ],
                 "turn_order": [
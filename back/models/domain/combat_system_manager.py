@@ -0,0 +1,276 @@
+"""
+Combat system manager for the role-playing game system.
+Loads the combat rules from `combat_system.yaml` and compiles them once into
+`CombatRules`: dice formulas become plain Python functions, trigger strings
+('natural_20') become numbers and the action catalog becomes a lookup table.
+Compiled rules are cached per rules version (a hash of the file content).
+"""
+
+import ast
+import hashlib
+import math
+import os
+import random
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import yaml
+
+from back.config import get_data_dir
+
+_DICE_PATTERN = re.compile(r"\b(\d*)d(\d+)\b")
+# '1.5_meters' -> '1.5'
+_UNIT_PATTERN = re.compile(r"\b(\d+(?:\.\d+)?)_[A-Za-z]+\b")
+_TRIGGER_PATTERN = re.compile(r"natural_(\d+)")
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Add, ast.Sub, ast.Mult, ast.Div,
+    ast.FloorDiv, ast.USub, ast.UAdd, ast.Constant, ast.Name, ast.Load,
+)
+
+
+class _FloorDivision(ast.NodeTransformer):
+    """Game formulas round divisions down."""
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.BinOp:
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Div):
+            node.op = ast.FloorDiv()
+        return node
+
+
+class CompiledFormula:
+    """
+    A dice formula ('1d20 + agility_bonus + (intuition / 3)') compiled to a Python function.
+
+    Purpose:
+        The formula is parsed and validated once; evaluating it is a single function call.
+        Dice terms become the first positional arguments so callers can either let the
+        formula roll them or pass pre-rolled values (to know the natural d20, or to
+        evaluate many rolls in bulk). Unknown variables evaluate to 0.
+
+    Attributes:
+        source (str): The formula as written in the rules file.
+        dice (List[Tuple[int, int]]): (count, sides) of every dice term, in order.
+        variables (List[str]): Variable names used by the formula.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self.dice: List[Tuple[int, int]] = []
+
+        def replace_dice(match: re.Match) -> str:
+            self.dice.append((int(match.group(1) or 1), int(match.group(2))))
+            return f"_dice{len(self.dice) - 1}"
+
+        expression = _DICE_PATTERN.sub(replace_dice, _UNIT_PATTERN.sub(r"\1", str(source)))
+        try:
+            tree = ast.parse(expression.strip(), mode='eval')
+        except SyntaxError as e:
+            raise ValueError(f"Invalid combat formula '{source}': {e}")
+        for node in ast.walk(tree):
+            if not isinstance(node, _ALLOWED_NODES):
+                raise ValueError(f"Unsupported element '{type(node).__name__}' in combat formula '{source}'")
+            if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+                raise ValueError(f"Unsupported constant {node.value!r} in combat formula '{source}'")
+        tree = _FloorDivision().visit(tree)
+
+        names = {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+        self.variables: List[str] = sorted(name for name in names if not name.startswith('_dice'))
+        arguments = [f"_dice{i}" for i in range(len(self.dice))] + self.variables
+        function = ast.Expression(body=ast.Lambda(
+            args=ast.arguments(posonlyargs=[], args=[ast.arg(arg=name) for name in arguments],
+                               kwonlyargs=[], kw_defaults=[], defaults=[]),
+            body=tree.body,
+        ))
+        ast.fix_missing_locations(function)
+        self._function: Callable[..., float] = eval(
+            compile(function, f"<combat formula {source}>", 'eval'), {"__builtins__": {}}
+        )
+
+    def roll_dice(self) -> List[int]:
+        """Roll every dice term of the formula."""
+        return [sum(random.randint(1, sides) for _ in range(count)) for count, sides in self.dice]
+
+    def evaluate(self, values: Mapping[str, float], dice: Optional[Sequence[int]] = None) -> int:
+        """
+        Evaluate the formula.
+
+        Args:
+            values (Mapping[str, float]): Variable values; missing variables count as 0.
+            dice (Optional[Sequence[int]]): Pre-rolled dice term values. Rolled if None.
+
+        Returns:
+            int: The result, rounded down.
+        """
+        if dice is None:
+            dice = self.roll_dice()
+        return math.floor(self._function(*dice, *(values.get(name, 0) for name in self.variables)))
+
+    def __repr__(self) -> str:
+        return f"CompiledFormula({self.source!r})"
+
+
+def _parse_trigger(trigger: Any, default: int) -> int:
+    match = _TRIGGER_PATTERN.fullmatch(str(trigger)) if trigger is not None else None
+    return int(match.group(1)) if match else default
+
+
+@dataclass(frozen=True)
+class CombatRules:
+    """
+    Compiled combat rules.
+
+    Attributes:
+        version (str): Hash of the rules file content.
+        initiative (CompiledFormula): Initiative formula.
+        attack_roll (CompiledFormula): Attack roll formula.
+        damage (CompiledFormula): Damage formula ('weapon_damage' is the rolled weapon dice).
+        defense_rating (CompiledFormula): Defense rating formula.
+        critical_roll (int): Natural roll that triggers a critical hit.
+        critical_effect (str): Effect of a critical hit (e.g. 'double_damage').
+        fumble_roll (int): Natural roll that is an automatic miss.
+        actions (Dict[str, Dict[str, Any]]): Player actions by name (type, effect, bonus...).
+    """
+    version: str
+    initiative: CompiledFormula
+    attack_roll: CompiledFormula
+    damage: CompiledFormula
+    defense_rating: CompiledFormula
+    critical_roll: int = 20
+    critical_effect: str = "double_damage"
+    fumble_roll: int = 1
+    actions: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def is_critical(self, natural_roll: int) -> bool:
+        return natural_roll >= self.critical_roll
+
+    def is_fumble(self, natural_roll: int) -> bool:
+        return natural_roll <= self.fumble_roll
+
+    def critical_weapon_damage(self, weapon_damage: int) -> int:
+        """Weapon damage after the critical effect."""
+        if self.critical_effect == "double_damage":
+            return weapon_damage * 2
+        return weapon_damage
+
+    def action_bonus(self, action_name: str) -> int:
+        """Numeric bonus granted by an action (e.g. 'defend'), 0 if none."""
+        return int(self.actions.get(action_name, {}).get('bonus', 0))
+
+    @classmethod
+    def compile(cls, data: Dict[str, Any], version: str) -> 'CombatRules':
+        """
+        Compile the `combat_system` section of the rules file.
+
+        Args:
+            data (Dict[str, Any]): The `combat_system` mapping.
+            version (str): Rules version.
+
+        Returns:
+            CombatRules: The compiled rules.
+
+        Raises:
+            ValueError: If a required formula is missing or invalid.
+        """
+        mechanics = data.get('basic_mechanics', {})
+        attack = mechanics.get('attack_roll', {})
+        formulas = {
+            'initiative': data.get('initiative', {}).get('formula'),
+            'attack_roll': attack.get('formula'),
+            'damage': mechanics.get('damage_calculation', {}).get('formula'),
+            'defense_rating': mechanics.get('defense_rating', {}).get('formula'),
+        }
+        missing = [name for name, formula in formulas.items() if not formula]
+        if missing:
+            raise ValueError(f"Combat rules are missing formulas: {', '.join(missing)}")
+
+        actions = {
+            action['name']: action
+            for action in data.get('turn_structure', {}).get('player_turn', {}).get('available_actions', [])
+            if isinstance(action, dict) and action.get('name')
+        }
+        critical = attack.get('critical', {})
+        return cls(
+            version=version,
+            critical_roll=_parse_trigger(critical.get('trigger'), 20),
+            critical_effect=str(critical.get('effect', 'double_damage')),
+            fumble_roll=_parse_trigger(attack.get('fumble', {}).get('trigger'), 1),
+            actions=actions,
+            **{name: CompiledFormula(formula) for name, formula in formulas.items()},
+        )
+
+
+# Rules version -> compiled rules, shared by every manager
+_COMPILED_RULES: Dict[str, CombatRules] = {}
+
+
+class CombatSystemManager:
+    """
+    Combat system manager for the game.
+
+    Purpose:
+        Serves compiled `CombatRules` to the combat service. The rules file is read on
+        first use and again only when its modification time or size changes; identical
+        content maps to the same compiled rules through a version cache.
+    """
+
+    def __init__(self):
+        """
+        ### __init__
+        **Description:** Initialize the combat system manager. Rules are loaded lazily.
+        **Parameters:** None
+        **Returns:** None
+        """
+        self._rules: Optional[CombatRules] = None
+        self._file_signature: Optional[Tuple[str, int, int]] = None
+
+    @staticmethod
+    def _rules_path() -> str:
+        return os.path.join(get_data_dir(), 'combat_system.yaml')
+
+    def get_rules(self) -> CombatRules:
+        """
+        ### get_rules
+        **Description:** Return the compiled combat rules, recompiling only if the rules file changed.
+        **Parameters:** None
+        **Returns:** The compiled `CombatRules`.
+        """
+        path = self._rules_path()
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Combat system file not found: {path}. "
+                f"Please ensure that file exists and contains valid YAML data with combat rules."
+            )
+        signature = (path, stat.st_mtime_ns, stat.st_size)
+        if self._rules is None or signature != self._file_signature:
+            self._rules = self._load_rules(path)
+            self._file_signature = signature
+        return self._rules
+
+    def _load_rules(self, path: str) -> CombatRules:
+        """
+        ### _load_rules
+        **Description:** Load and compile the rules file, reusing compiled rules of the same version.
+        **Parameters:**
+        - `path` (str): Path of the rules file.
+        **Returns:** The compiled `CombatRules`.
+        """
+        with open(path, 'rb') as file:
+            raw = file.read()
+        version = hashlib.sha1(raw).hexdigest()
+        rules = _COMPILED_RULES.get(version)
+        if rules is not None:
+            return rules
+        try:
+            data = yaml.safe_load(raw) or {}
+        except yaml.YAMLError as e:
+            raise yaml.YAMLError(
+                f"Invalid YAML in combat system file {path}: {str(e)}. "
+                f"Please check the file format and syntax."
+            )
+        rules = CombatRules.compile(data.get('combat_system', {}), version)
+        _COMPILED_RULES[version] = rules
+        return rules
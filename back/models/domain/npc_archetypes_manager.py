@@ -0,0 +1,252 @@
+"""
+NPC archetype manager for the role-playing game system.
+Loads the NPC archetype catalog from YAML and compiles each archetype once into a
+ready-made `NPC` template (stats, equipment, combat stats). Combat NPCs are then
+created by cloning a template instead of being assembled item by item.
+"""
+
+import os
+import re
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+import yaml
+
+from back.config import get_data_dir
+from back.models.domain.character import CombatStats, Equipment, Skills, Spells, Stats
+from back.models.domain.equipment_manager import EquipmentManager
+from back.models.domain.items import EquipmentItem
+from back.models.domain.npc import NPC
+
+DEFAULT_ARCHETYPE_KEY = "generic"
+DEFAULT_TACTIC = "weakest"
+
+
+class NpcArchetypesManager:
+    """
+    NPC archetype manager for the game.
+
+    Purpose:
+        Provides combat-ready NPCs without per-NPC lookups. The archetype catalog
+        (`npc_archetypes.yaml`) is read and compiled lazily, once per manager: equipment ids
+        are resolved through `EquipmentManager` at compile time and every archetype becomes
+        an `NPC` template. `create_npc` then returns a copy-on-write clone of a template:
+        stats, skills, spells and equipment are shared with the template (combat never
+        mutates them), only identity and combat stats are per-NPC.
+
+    Attributes:
+        equipment_manager (EquipmentManager): Manager used to resolve equipment ids.
+    """
+
+    def __init__(self, equipment_manager: Optional[EquipmentManager] = None):
+        """
+        ### __init__
+        **Description:** Initialize the archetype manager. Data is loaded and compiled lazily.
+        **Parameters:**
+        - `equipment_manager` (Optional[EquipmentManager]): Equipment manager. If None, creates a new instance.
+        **Returns:** None
+        """
+        self.equipment_manager = equipment_manager if equipment_manager else EquipmentManager()
+        self._templates: Optional[Dict[str, NPC]] = None
+        self._tactics: Dict[str, str] = {}
+        self._patterns: List[Tuple[str, re.Pattern]] = []
+        self._match_cache: Dict[Tuple[str, str], str] = {}
+
+    @property
+    def templates(self) -> Dict[str, NPC]:
+        """Lazy load and compile the archetype templates."""
+        self._ensure_compiled()
+        return self._templates
+
+    def _ensure_compiled(self) -> None:
+        if self._templates is None:
+            self._compile(self._load_archetypes_data())
+
+    def _load_archetypes_data(self) -> Dict[str, Any]:
+        """
+        ### _load_archetypes_data
+        **Description:** Load the archetype catalog from YAML file.
+        **Parameters:** None
+        **Returns:** Archetype data dictionary keyed by archetype key.
+        """
+        data_path = os.path.join(get_data_dir(), 'npc_archetypes.yaml')
+        try:
+            with open(data_path, 'r', encoding='utf-8') as file:
+                data = yaml.safe_load(file) or {}
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"NPC archetypes file not found: {data_path}. "
+                f"Please ensure that file exists and contains valid YAML data with archetype definitions."
+            )
+        except yaml.YAMLError as e:
+            raise yaml.YAMLError(
+                f"Invalid YAML in NPC archetypes file {data_path}: {str(e)}. "
+                f"Please check the file format and syntax."
+            )
+        archetypes = data.get('npc_archetypes')
+        if not isinstance(archetypes, dict) or DEFAULT_ARCHETYPE_KEY not in archetypes:
+            raise ValueError(
+                f"NPC archetypes file {data_path} must define an 'npc_archetypes' mapping "
+                f"including a '{DEFAULT_ARCHETYPE_KEY}' archetype."
+            )
+        return archetypes
+
+    def _compile(self, archetypes: Dict[str, Any]) -> None:
+        """
+        ### _compile
+        **Description:** Build the NPC templates, tactics and keyword matchers of every archetype.
+        **Parameters:**
+        - `archetypes` (Dict[str, Any]): Raw archetype data keyed by archetype key.
+        **Returns:** None
+        """
+        templates: Dict[str, NPC] = {}
+        tactics: Dict[str, str] = {}
+        patterns: List[Tuple[str, re.Pattern]] = []
+        for key, data in archetypes.items():
+            templates[key] = self._compile_template(key, data)
+            tactics[key] = data.get('tactic', DEFAULT_TACTIC)
+            keywords = [key, *data.get('keywords', [])]
+            if key != DEFAULT_ARCHETYPE_KEY:
+                # Keywords match at the start of a word: 'orc' matches 'Orcs', not 'Sorcerer'
+                alternatives = "|".join(re.escape(str(keyword).lower()) for keyword in keywords)
+                patterns.append((key, re.compile(rf"\b(?:{alternatives})")))
+        self._tactics = tactics
+        self._patterns = patterns
+        self._match_cache = {}
+        self._templates = templates
+
+    def _compile_template(self, key: str, data: Dict[str, Any]) -> NPC:
+        combat = data.get('combat_stats', {})
+        hit_points = int(combat.get('hit_points', 10))
+        equipment = Equipment()
+        for item_id in data.get('equipment', {}).get('weapons', []):
+            equipment.weapons.append(self._build_item(key, item_id))
+        for item_id in data.get('equipment', {}).get('armor', []):
+            equipment.armor.append(self._build_item(key, item_id))
+
+        return NPC(
+            name=data.get('name', key),
+            archetype=data.get('name', key),
+            level=int(data.get('level', 1)),
+            stats=Stats(**data.get('stats', {})),
+            skills=Skills(),
+            equipment=equipment,
+            combat_stats=CombatStats(
+                max_hit_points=hit_points,
+                current_hit_points=hit_points,
+                armor_class=int(combat.get('armor_class', 10)),
+                attack_bonus=int(combat.get('attack_bonus', 2)),
+            ),
+            spells=Spells(),
+        )
+
+    def _build_item(self, archetype_key: str, item_id: str) -> EquipmentItem:
+        data = self.equipment_manager.get_equipment_by_id(item_id)
+        if not data:
+            raise ValueError(f"NPC archetype '{archetype_key}' references unknown equipment '{item_id}'")
+        return EquipmentItem(
+            id=str(uuid4()),
+            name=data['name'],
+            category=data.get('category', 'misc'),
+            cost_gold=data.get('cost_gold', 0),
+            cost_silver=data.get('cost_silver', 0),
+            cost_copper=data.get('cost_copper', 0),
+            weight=float(data.get('weight', 0)),
+            quantity=1,
+            equipped=True,
+            damage=data.get('damage'),
+            range=data.get('range'),
+            protection=int(data.get('protection', 0)) if data.get('protection') else None,
+            type=data.get('type')
+        )
+
+    def find_archetype_key(self, archetype: Optional[str] = None, name: str = "") -> str:
+        """
+        ### find_archetype_key
+        **Description:** Find the catalog archetype matching an NPC. The archetype text is matched
+        first, then the name, against archetype keywords in catalog order.
+        **Parameters:**
+        - `archetype` (Optional[str]): Free-text archetype (e.g. 'Goblin Archer').
+        - `name` (str): NPC name, used when the archetype does not match.
+        **Returns:** The archetype key, or the generic archetype key if nothing matches.
+        """
+        cache_key = ((archetype or "").lower(), name.lower())
+        key = self._match_cache.get(cache_key)
+        if key is not None:
+            return key
+
+        self._ensure_compiled()
+        key = DEFAULT_ARCHETYPE_KEY
+        for text in cache_key:
+            match = next((k for k, pattern in self._patterns if text and pattern.search(text)), None)
+            if match:
+                key = match
+                break
+        self._match_cache[cache_key] = key
+        return key
+
+    def get_template(self, archetype: Optional[str] = None, name: str = "") -> NPC:
+        """
+        ### get_template
+        **Description:** Return the compiled template matching an NPC. The template is shared: do not mutate it.
+        **Parameters:**
+        - `archetype` (Optional[str]): Free-text archetype.
+        - `name` (str): NPC name.
+        **Returns:** The NPC template.
+        """
+        return self.templates[self.find_archetype_key(archetype, name)]
+
+    def get_tactic(self, archetype: Optional[str] = None, name: str = "") -> str:
+        """
+        ### get_tactic
+        **Description:** Return the targeting tactic of the archetype matching an NPC.
+        **Parameters:**
+        - `archetype` (Optional[str]): Free-text archetype.
+        - `name` (str): NPC name.
+        **Returns:** One of 'weakest', 'strongest', 'easiest' or 'first'.
+        """
+        key = self.find_archetype_key(archetype, name)
+        return self._tactics.get(key, DEFAULT_TACTIC)
+
+    def create_npc(
+        self,
+        name: str,
+        archetype: Optional[str] = None,
+        hp: Optional[int] = None,
+        max_hp: Optional[int] = None,
+        ac: Optional[int] = None,
+        attack_bonus: Optional[int] = None,
+        level: Optional[int] = None,
+    ) -> NPC:
+        """
+        ### create_npc
+        **Description:** Clone the matching template into a new NPC. Only the identity and the
+        combat stats are copied; stats, skills, spells and equipment are shared with the template.
+        **Parameters:**
+        - `name` (str): NPC name.
+        - `archetype` (Optional[str]): Free-text archetype, kept on the NPC.
+        - `hp` (Optional[int]): Current hit points (also the maximum unless `max_hp` is given).
+        - `max_hp` (Optional[int]): Maximum hit points.
+        - `ac` (Optional[int]): Armor class.
+        - `attack_bonus` (Optional[int]): Attack bonus.
+        - `level` (Optional[int]): Challenge level.
+        **Returns:** A new NPC with a fresh id.
+        """
+        template = self.get_template(archetype, name)
+        base = template.combat_stats
+        if max_hp is None:
+            max_hp = hp if hp is not None else base.max_hit_points
+        current = hp if hp is not None else max_hp
+        combat_stats = base.model_copy(update={
+            'max_hit_points': max(max_hp, current),
+            'current_hit_points': current,
+            'armor_class': ac if ac is not None else base.armor_class,
+            'attack_bonus': attack_bonus if attack_bonus is not None else base.attack_bonus,
+        })
+        return template.model_copy(update={
+            'id': uuid4(),
+            'name': name,
+            'archetype': archetype or template.archetype,
+            'level': level if level is not None else template.level,
+            'combat_stats': combat_stats,
+        })
@@ -0,0 +1,169 @@
+"""
+Spells manager for the role-playing game system.
+Loads the spell catalog from `spells.yaml` once and indexes it by spell name and
+by sphere, so that casting a spell is a dictionary lookup.
+"""
+
+import difflib
+import os
+from typing import Any, Dict, List, Literal, Optional
+
+import yaml
+from pydantic import BaseModel, Field
+
+from back.config import get_data_dir
+
+
+class SpellEffect(BaseModel):
+    """
+    Mechanical effect of a spell, resolved by the spell engine.
+
+    Attributes:
+        type (str): 'damage' or 'heal'.
+        dice (Optional[str]): Damage dice (e.g. '3d6') for damage spells.
+        percent (Optional[int]): Share of the target's max HP restored by heal spells.
+        area (bool): True if the spell affects every given target instead of one.
+    """
+    type: Literal['damage', 'heal'] = Field(..., description="Effect type")
+    dice: Optional[str] = Field(default=None, description="Damage dice")
+    percent: Optional[int] = Field(default=None, ge=1, le=100, description="Healing in % of max HP")
+    area: bool = Field(default=False, description="Affects every target")
+
+
+class SpellDefinition(BaseModel):
+    """
+    A spell of the catalog.
+
+    Attributes:
+        name (str): Spell name.
+        sphere (str): Sphere the spell belongs to.
+        power_cost (int): Mana points spent to cast it.
+        description (str): Rules text.
+        effect (Optional[SpellEffect]): Mechanical effect; None for spells narrated by the Game Master.
+    """
+    name: str
+    sphere: str
+    power_cost: int = Field(..., ge=0)
+    description: str = ""
+    effect: Optional[SpellEffect] = None
+
+
+class SpellsManager:
+    """
+    Spells manager for the game.
+
+    Purpose:
+        Provides indexed access to the spell catalog. The YAML file is read lazily and
+        turned into `SpellDefinition` objects indexed by normalized name and by sphere.
+
+    Attributes:
+        _spells_by_name (Optional[Dict[str, SpellDefinition]]): Spells keyed by normalized name.
+        _spells_by_sphere (Dict[str, List[SpellDefinition]]): Spells keyed by normalized sphere name.
+    """
+
+    def __init__(self):
+        """
+        ### __init__
+        **Description:** Initialize spells manager. Data is loaded lazily.
+        **Parameters:** None
+        **Returns:** None
+        """
+        self._spells_by_name: Optional[Dict[str, SpellDefinition]] = None
+        self._spells_by_sphere: Dict[str, List[SpellDefinition]] = {}
+        self._sphere_names: List[str] = []
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """Normalize a spell or sphere name for lookups ('Magic  missile' -> 'magic missile')."""
+        return " ".join(str(name).replace("_", " ").split()).casefold()
+
+    @property
+    def spells(self) -> Dict[str, SpellDefinition]:
+        """Lazy load the spell catalog, keyed by normalized name."""
+        self._ensure_loaded()
+        return self._spells_by_name
+
+    def _ensure_loaded(self) -> None:
+        if self._spells_by_name is None:
+            self._index(self._load_spells_data())
+
+    def _load_spells_data(self) -> Dict[str, Any]:
+        """
+        ### _load_spells_data
+        **Description:** Load spells data from YAML file.
+        **Parameters:** None
+        **Returns:** The `magic_system` data dictionary.
+        """
+        data_path = os.path.join(get_data_dir(), 'spells.yaml')
+        try:
+            with open(data_path, 'r', encoding='utf-8') as file:
+                data = yaml.safe_load(file) or {}
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Spells data file not found: {data_path}. "
+                f"Please ensure that file exists and contains valid YAML data with spell definitions."
+            )
+        except yaml.YAMLError as e:
+            raise yaml.YAMLError(
+                f"Invalid YAML in spells file {data_path}: {str(e)}. "
+                f"Please check the file format and syntax."
+            )
+        return data.get('magic_system', {})
+
+    def _index(self, data: Dict[str, Any]) -> None:
+        by_name: Dict[str, SpellDefinition] = {}
+        by_sphere: Dict[str, List[SpellDefinition]] = {}
+        sphere_names: List[str] = []
+        for sphere in data.get('spheres', []):
+            sphere_name = sphere['name']
+            sphere_names.append(sphere_name)
+            spells = [SpellDefinition(sphere=sphere_name, **spell) for spell in sphere.get('spells', [])]
+            by_sphere[self.normalize(sphere_name)] = spells
+            for spell in spells:
+                by_name[self.normalize(spell.name)] = spell
+        self._spells_by_sphere = by_sphere
+        self._sphere_names = sphere_names
+        self._spells_by_name = by_name
+
+    def get_spell(self, name: str) -> Optional[SpellDefinition]:
+        """
+        ### get_spell
+        **Description:** Look up a spell by name (case and spacing insensitive).
+        **Parameters:**
+        - `name` (str): Spell name.
+        **Returns:** The spell, or None if unknown.
+        """
+        return self.spells.get(self.normalize(name))
+
+    def suggest(self, name: str, limit: int = 3) -> List[str]:
+        """
+        ### suggest
+        **Description:** Return catalog spell names close to an unknown name.
+        **Parameters:**
+        - `name` (str): The name that was not found.
+        - `limit` (int): Maximum number of suggestions.
+        **Returns:** List of spell names.
+        """
+        matches = difflib.get_close_matches(self.normalize(name), list(self.spells), n=limit)
+        return [self.spells[match].name for match in matches]
+
+    def get_sphere_spells(self, sphere: str) -> List[SpellDefinition]:
+        """
+        ### get_sphere_spells
+        **Description:** Return the spells of a sphere.
+        **Parameters:**
+        - `sphere` (str): Sphere name.
+        **Returns:** List of spells (empty if the sphere is unknown).
+        """
+        self._ensure_loaded()
+        return list(self._spells_by_sphere.get(self.normalize(sphere), []))
+
+    def get_sphere_names(self) -> List[str]:
+        """
+        ### get_sphere_names
+        **Description:** Return the sphere names in catalog order.
+        **Parameters:** None
+        **Returns:** List of sphere names.
+        """
+        self._ensure_loaded()
+        return list(self._sphere_names)
@@ -9,7 +9,8 @@ This manager loads the unified skills.yaml file containing:
 
 import yaml
 import os
-from typing import Dict, List, Optional, Any
+from bisect import bisect_right
+from typing import Dict, List, Optional, Any, Tuple
 from ...config import get_data_dir
 
 
@@ -26,10 +27,15 @@ class UnifiedSkillsManager:
 
     Attributes:
         _data (Dict): Complete skills data loaded from YAML including skill groups and racial affinities.
+        _skills_by_name (Dict[str, Dict]): Skill display name -> skill information with group context.
+        _stat_bonus_index (Dict[str, Tuple[List[int], List[Dict]]]): Stat name -> (sorted minimum values,
+            matching skill bonuses), so that the bonuses granted by a stat value are a prefix found by binary search.
     """
 
     def __init__(self):
         self._data: Dict = {}
+        self._skills_by_name: Dict[str, Dict] = {}
+        self._stat_bonus_index: Dict[str, Tuple[List[int], List[Dict]]] = {}
         self._load_skills_data()
 
     def _load_skills_data(self):
@@ -48,6 +54,45 @@ class UnifiedSkillsManager:
                 f"Invalid YAML in skills file {data_path}: {str(e)}. "
                 "Please check the file format and syntax."
             )
+        self._build_indexes()
+
+    def _build_indexes(self):
+        """Index skills by display name and stat bonuses by stat and minimum value."""
+        skills_by_name: Dict[str, Dict] = {}
+        stat_bonuses: Dict[str, List[Tuple[int, int, Dict]]] = {}
+        position = 0
+        for group_name, skills_dict in self.get_all_skills().items():
+            for skill_id, skill_info in skills_dict.items():
+                name = skill_info.get("name")
+                # The first skill with a given name wins, as with a scan in catalog order
+                if name is not None and name not in skills_by_name:
+                    skills_by_name[name] = {"group": group_name, "id": skill_id, **skill_info}
+                for stat_name, stat_bonus in self._iter_stat_bonuses(skill_info):
+                    stat_bonuses.setdefault(stat_name, []).append((
+                        stat_bonus.get("min_value", 0),
+                        position,
+                        {"group": group_name, "skill": skill_id, "bonus_points": stat_bonus.get("bonus_points", 0)}
+                    ))
+                position += 1
+
+        self._skills_by_name = skills_by_name
+        self._stat_bonus_index = {}
+        for stat_name, entries in stat_bonuses.items():
+            entries.sort(key=lambda entry: (entry[0], entry[1]))
+            self._stat_bonus_index[stat_name] = ([entry[0] for entry in entries], [entry[2] for entry in entries])
+
+    @staticmethod
+    def _iter_stat_bonuses(skill_info: Dict) -> List[Tuple[str, Dict]]:
+        """
+        (stat name, bonus) pairs of a skill. Accepts both `{stat: {min_value, bonus_points}}`
+        (skills.yaml) and `{stat_name, min_value, bonus_points}`.
+        """
+        stat_bonuses = skill_info.get("stat_bonuses")
+        if not isinstance(stat_bonuses, dict):
+            return []
+        if "stat_name" in stat_bonuses:
+            return [(stat_bonuses["stat_name"], stat_bonuses)]
+        return [(stat_name, bonus) for stat_name, bonus in stat_bonuses.items() if isinstance(bonus, dict)]
 
     @property
     def skill_groups(self) -> Dict[str, Dict]:
@@ -151,16 +196,8 @@ class UnifiedSkillsManager:
         Returns:
             Skill information with group context or None if not found
         """
-        for group_name, group_data in self.skill_groups.items():
-            if "skills" in group_data:
-                for skill_id, skill_info in group_data["skills"].items():
-                    if skill_info.get("name") == skill_name:
-                        return {
-                            "group": group_name,
-                            "id": skill_id,
-                            **skill_info
-                        }
-        return None
+        skill = self._skills_by_name.get(skill_name)
+        return dict(skill) if skill else None
 
     def get_all_races(self) -> List[str]:
         """
@@ -180,22 +217,10 @@ class UnifiedSkillsManager:
             stat_value: Value of the stat
 
         Returns:
-            List of skill bonuses that apply
+            List of skill bonuses that apply, ordered by minimum stat value
         """
-        bonuses = []
-        for group_name, group_data in self.skill_groups.items():
-            if "skills" in group_data:
-                for skill_id, skill_info in group_data["skills"].items():
-                    if "stat_bonuses" in skill_info:
-                        stat_bonus = skill_info["stat_bonuses"]
-                        if (stat_bonus.get("stat_name") == stat_name and
-                            stat_value >= stat_bonus.get("min_value", 0)):
-                            bonuses.append({
-                                "group": group_name,
-                                "skill": skill_id,
-                                "bonus_points": stat_bonus.get("bonus_points", 0)
-                            })
-        return bonuses
+        thresholds, bonuses = self._stat_bonus_index.get(stat_name, ([], []))
+        return [dict(bonus) for bonus in bonuses[:bisect_right(thresholds, stat_value)]]
 
     def get_all_data(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,94 @@
+"""
+Domain models for the token usage ledger of the game sessions.
+"""
+
+from datetime import datetime, timezone
+from typing import Dict
+
+from pydantic import BaseModel, Field, computed_field
+
+
+class TurnUsage(BaseModel):
+    """
+    ### TurnUsage
+    **Description:** Usage of one game turn, as appended to the session ledger.
+    **Attributes:**
+    - `timestamp` (datetime): End of the turn (UTC).
+    - `mode` (str): Session mode of the turn ("narrative" or "combat").
+    - `model` (str): LLM model that answered.
+    - `requests` (int): LLM requests made by the agent.
+    - `input_tokens` (int): Prompt tokens of the agent.
+    - `output_tokens` (int): Completion tokens of the agent.
+    - `summary_input_tokens` (int): Prompt tokens of the history summarization.
+    - `summary_output_tokens` (int): Completion tokens of the history summarization.
+    - `latency_ms` (float): Duration of the agent run.
+    """
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    mode: str
+    model: str = ""
+    requests: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    summary_input_tokens: int = 0
+    summary_output_tokens: int = 0
+    latency_ms: float = 0.0
+
+
+class UsageTotals(BaseModel):
+    """
+    ### UsageTotals
+    **Description:** Sums of the TurnUsage entries of a ledger (or of a part of it).
+    """
+    turns: int = 0
+    requests: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    summary_input_tokens: int = 0
+    summary_output_tokens: int = 0
+    latency_ms: float = 0.0
+
+    @computed_field
+    @property
+    def total_tokens(self) -> int:
+        """All the tokens, summarization included."""
+        return self.input_tokens + self.output_tokens + self.summary_input_tokens + self.summary_output_tokens
+
+    def add(self, usage: TurnUsage) -> None:
+        """
+        ### add
+        **Description:** Adds one turn to the totals.
+        **Parameters:**
+        - `usage` (TurnUsage): Turn to add.
+        """
+        self.turns += 1
+        self.requests += usage.requests
+        self.input_tokens += usage.input_tokens
+        self.output_tokens += usage.output_tokens
+        self.summary_input_tokens += usage.summary_input_tokens
+        self.summary_output_tokens += usage.summary_output_tokens
+        self.latency_ms += usage.latency_ms
+
+
+class UsageRollup(BaseModel):
+    """
+    ### UsageRollup
+    **Description:** Incremental rollup of a usage ledger: overall totals and totals by mode, model and
+    scenario. Updated on each turn so that reading it never replays the ledger.
+    """
+    totals: UsageTotals = Field(default_factory=UsageTotals)
+    by_mode: Dict[str, UsageTotals] = Field(default_factory=dict)
+    by_model: Dict[str, UsageTotals] = Field(default_factory=dict)
+    by_scenario: Dict[str, UsageTotals] = Field(default_factory=dict)
+
+    def add(self, usage: TurnUsage, scenario: str) -> None:
+        """
+        ### add
+        **Description:** Adds one turn of `scenario` to the rollup.
+        **Parameters:**
+        - `usage` (TurnUsage): Turn to add.
+        - `scenario` (str): Scenario of the session.
+        """
+        self.totals.add(usage)
+        self.by_mode.setdefault(usage.mode, UsageTotals()).add(usage)
+        self.by_model.setdefault(usage.model, UsageTotals()).add(usage)
+        self.by_scenario.setdefault(scenario, UsageTotals()).add(usage)
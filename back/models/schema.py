@@ -1,9 +1,11 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from uuid import UUID
-from typing import Dict, List, Optional, Any, TYPE_CHECKING, Union
+from datetime import datetime
+from typing import Dict, List, Literal, Optional, Any, TYPE_CHECKING, Union
 from enum import Enum
 from back.models.enums import CharacterStatus, ItemType
 from back.models.domain.items import EquipmentItem
+from back.models.domain.usage import UsageRollup
 
 # Import conditionnel pour éviter les imports circulaires
 if TYPE_CHECKING:
@@ -16,6 +18,8 @@ class LLMConfig(BaseModel):
     model: str
     token_limit: int = 4000
     keep_last_n_messages: int = 10
+    combat_state_token_budget: int = 600
+    combat_log_lines: int = 5
 
 
 
@@ -138,12 +142,68 @@ class StartScenarioResponse(BaseModel):
 
 class PlayScenarioResponse(BaseModel):
     """Response model for the /scenarios/play endpoint"""
-    response: List[ConversationMessage]
+    response: List[ConversationMessage]  # Messages of this turn, or the full history with full_history=true
     session_id: UUID
+    history_kind: Literal["narrative", "combat"] = "narrative"
+    history_version: int = 0  # Length of the history after this turn, to sync with GET /history?since=
 
 class ScenarioHistoryResponse(BaseModel):
     """Response model for the /scenarios/history/{session_id} endpoint"""
     history: List[ConversationMessage]
+    history_version: int = 0  # Length of the whole history (the next `since` cursor)
+
+class TurnTiming(BaseModel):
+    """Latency breakdown of one turn (milliseconds by phase)"""
+    started_at: datetime
+    total_ms: float
+    phases: Dict[str, float]
+    counts: Dict[str, int]
+
+class SessionTimingsResponse(BaseModel):
+    """Response model for the /gamesession/timings/{session_id} endpoint"""
+    session_id: UUID
+    turns: List[TurnTiming]
+
+class LatencyHistogramsResponse(BaseModel):
+    """Response model for the /gamesession/timings endpoint"""
+    phases: Dict[str, Dict[str, Any]]  # phase -> {"buckets": {upper bound: count}, "count", "sum"}
+
+class SessionUsageResponse(UsageRollup):
+    """Response model for the /gamesession/usage/{session_id} endpoint"""
+    session_id: UUID
+
+class ProfilingSettings(BaseModel):
+    """Runtime settings of the on-demand request profiling (/api/profiles/settings)"""
+    enabled: bool = False  # Sampling of the eligible requests
+    sample_rate: float = Field(default=0.0, ge=0.0, le=1.0)
+    mode: Literal["cprofile", "sampling"] = "cprofile"
+
+class ProfileInfo(BaseModel):
+    """A saved request profile, as listed by the /api/profiles endpoint"""
+    profile_id: str
+    created_at: datetime
+    method: str
+    path: str
+    status_code: Optional[int] = None  # None if the request failed before responding
+    duration_ms: float
+    mode: Literal["cprofile", "sampling"]
+    trigger: Literal["header", "sampled"]
+    filename: str  # .pstats (cprofile) or .speedscope.json (sampling)
+    size: int
+
+class SubsystemMemory(BaseModel):
+    """Live traced memory of a subsystem"""
+    bytes: int = 0
+    blocks: int = 0
+
+class MemoryReport(BaseModel):
+    """Memory footprint by subsystem (tracemalloc), for the /metrics/memory endpoint"""
+    tracing: bool  # False if tracemalloc is not running (nothing measured)
+    taken_at: datetime
+    traced_bytes: int = 0
+    peak_bytes: int = 0
+    frames: int = 0  # Traceback depth kept per allocation
+    subsystems: Dict[str, SubsystemMemory] = {}  # history, combat_states, characters, game_data, other
 
 class DeleteMessageResponse(BaseModel):
     """Response model for the DELETE /scenarios/history/{session_id}/{message_index} endpoint"""
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, status
-from typing import List
+from fastapi import APIRouter, HTTPException, Query, status
+from typing import List, Optional, Union
 from pydantic import BaseModel
 
-from back.models.domain.character import Character
+from back.models.domain.character import Character, CharacterSummary
 from back.services.character_data_service import CharacterDataService
 from back.utils.exceptions import InternalServerError
 from back.utils.logger import log_debug
@@ -14,19 +14,33 @@ class CharacterV2Response(BaseModel):
     character: Character
     status: str
 
+class CharacterListResponse(BaseModel):
+    """Response model for a page of characters"""
+    characters: Union[List[CharacterSummary], List[Character]]
+    next_cursor: Optional[str] = None
+
+
+MAX_PAGE_SIZE = 500
+
 router = APIRouter(tags=["characters"])
 
 
-@router.get("/", response_model=List[Character])
-async def list_characters():
+@router.get("/", response_model=CharacterListResponse)
+async def list_characters(
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE, description="Maximum number of characters in the page"),
+    cursor: Optional[str] = Query(None, description="Cursor returned as `next_cursor` by the previous page"),
+    full: bool = Query(False, description="Return full characters instead of summaries")
+) -> CharacterListResponse:
     """
-    Retrieve the list of all available characters in the system.
+    Retrieve a page of the characters available in the system, most recently updated first.
 
-    This endpoint allows obtaining all created characters, whether complete or in progress.
-    Incomplete characters (status="draft") are returned with only the available fields.
+    By default each character is a summary (id, name, race, level, status, updated_at) served from
+    the character index, without reading the character files. With `full=true` the characters of
+    the page are loaded in full, whether complete or in progress (status="draft").
+    Pass `next_cursor` back as `cursor` to get the next page; it is null on the last page.
 
     Returns:
-        CharacterListResponse: A list containing all available characters (complete or partial)
+        CharacterListResponse: The characters of the page and the cursor of the next page
 
     Example Response:
 
@@ -37,57 +51,40 @@ async def list_characters():
                     "id": "d7763165-4c03-4c8d-9bc6-6a2568b79eb3",
                     "name": "Aragorn",
                     "race": "Human",
-                    "culture": "Gondor",
-                    "stats": {
-                        "strength": 16,
-                        "constitution": 14,
-                        "agility": 15,
-                        "intelligence": 12,
-                        "wisdom": 14,
-                        "charisma": 16
-                    },
-                    "skills": {
-                        "combat": {"sword_combat": 7, "archery": 5}
-                    },
-                    "combat_stats": {
-                        "max_hit_points": 60,
-                        "current_hit_points": 60,
-                        "max_mana_points": 15,
-                        "current_mana_points": 15,
-                        "armor_class": 17,
-                        "attack_bonus": 5
-                    },
-                    "equipment": {
-                        "gold": 100
-                    },
-                    "spells": {
-                        "known_spells": [],
-                        "spell_slots": {}
-                    },
                     "level": 5,
                     "status": "active",
-                    "experience_points": 4500,
-                    "physical_description": "Tall, weathered, dark-haired, with keen grey eyes."
+                    "updated_at": "2025-11-13T21:30:00Z"
                 }
-            ]
+            ],
+            "next_cursor": "MTc2MzA2OTQwMDAwMDAwMDpkNzc2MzE2NS00YzAz"
         }
         ```
 
     Raises:
+        400: Invalid cursor
         500: Internal server error when retrieving characters
     """
-    log_debug("Appel endpoint characters/list_characters")
-    
+    log_debug("Appel endpoint characters/list_characters", limit=limit, full=full)
+
     try:
         data_service = CharacterDataService()
-        characters = data_service.get_all_characters()
-        
+        try:
+            summaries, next_cursor = data_service.list_character_summaries(limit, cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if full:
+            characters = [data_service.load_character(str(summary.id)) for summary in summaries]
+        else:
+            characters = summaries
+
         log_debug("Liste des personnages récupérée",
                   action="list_characters_success",
                   count=len(characters))
 
-        return characters
-        
+        return CharacterListResponse(characters=characters, next_cursor=next_cursor)
+
+    except HTTPException:
+        raise
     except Exception as e:
         log_debug("Erreur lors de la récupération des personnages", 
                  action="list_characters_error", 
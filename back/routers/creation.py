@@ -3,21 +3,22 @@ FastAPI router for character creation V2.
 Exposes the necessary routes for the new simplified character system using CharacterV2 models.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from uuid import uuid4
 from datetime import datetime
 from typing import List, Dict, Any
 
 from back.models.domain.character import Character, Stats, Skills
 from back.services.character_data_service import CharacterDataService
-from back.services.skill_allocation_service import SkillAllocationService
 from back.services.races_data_service import RacesDataService
+from back.services.random_character_service import CharacterFlavour
+from back.dependencies import global_container
+from back.utils.catalog_cache import CatalogCache
 from back.models.domain.stats_manager import StatsManager
 from back.models.domain.equipment_manager import EquipmentManager
 from back.models.domain.unified_skills_manager import UnifiedSkillsManager
 from back.models.schema import RaceData, SkillsResponse, EquipmentResponse, StatsResponse, EquipmentItem
 from back.agents.generic_agent import build_simple_gm_agent
-import random
 
 router = APIRouter(tags=["creation"])
 
@@ -112,6 +113,16 @@ def _validate_character_payload(character_payload: Dict[str, Any], character_id:
         )
 
 
+class RandomCharacterBatchResponse(BaseModel):
+    """Response model for bulk random character creation"""
+    characters: List[Character] = Field(..., description="Created characters")
+    count: int = Field(..., description="Number of created characters")
+    status: str = Field(..., description="Creation status")
+
+
+MAX_RANDOM_BATCH_SIZE = 5000
+
+
 class ValidateCharacterByIdRequest(BaseModel):
     """Request model for validating a character stored on disk."""
     character_id: str = Field(..., description="Identifier of the character to validate")
@@ -126,6 +137,9 @@ async def create_random_character() -> CharacterV2Response:
     """
     Creates a new random character using the V2 system with LLM-generated content.
 
+    The character is taken from the pre-generated pool when one is ready (instant response;
+    the pool refills in the background). Otherwise it is generated on the spot.
+
     **Response:**
     ```json
     {
@@ -185,72 +199,40 @@ async def create_random_character() -> CharacterV2Response:
     ```
     """
     try:
+        service = global_container.random_character_service
+
         # 1. Get random race and culture
-        races_service = RacesDataService()
         try:
-            random_race_data, random_culture_data = races_service.get_random_race_and_culture()
+            random_race_data, random_culture_data = service.pick_races_and_cultures(1)[0]
         except ValueError as error:
             raise HTTPException(status_code=500, detail=str(error))
 
-        # 2. Generate random stats
-        stats_manager = StatsManager()
-        stats_info = stats_manager.get_all_stats_data()['stats']
-        random_stats = {stat.lower(): random.randint(8, 15) for stat in stats_info}
-
-        # 3. Allocate skills based on race affinities and stats
-        skill_allocation_service = SkillAllocationService()
-        stats_obj = Stats(**random_stats)
-        allocated_skills = skill_allocation_service.allocate_random_skills_for_character(
-            random_race_data.name, random_culture_data.name, stats_obj
-        )
+        # 2. Take a pre-generated character from the pool (no LLM call on the request path)
+        character = global_container.character_pool.pop(random_race_data.id, random_culture_data.id)
 
-        # 4. Generate name, background and description with LLM
-        agent = build_simple_gm_agent()
+        if character is None:
+            # 3. Pool empty or disabled: generate stats and skills now
+            random_stats = service.roll_stats(1)[0]
+            allocated_skills = service.skill_allocation_service.allocate_random_skills_for_character(
+                random_race_data.name, random_culture_data.name, Stats(**random_stats)
+            )
 
-        name_prompt = f"Generate a single fantasy name for a {random_race_data.name} from {random_culture_data.name}. Only return the name."
-        background_prompt = f"Generate a short background story for a {random_race_data.name} from {random_culture_data.name}. Be creative and concise."
-        description_prompt = f"Generate a short physical description for a {random_race_data.name} from {random_culture_data.name}. Be creative and concise."
+            # 4. Generate name, background and description with LLM
+            agent = build_simple_gm_agent()
 
-        character_name = (await agent.run(name_prompt)).output
-        background = (await agent.run(background_prompt)).output
-        physical_description = (await agent.run(description_prompt)).output
+            name_prompt = f"Generate a single fantasy name for a {random_race_data.name} from {random_culture_data.name}. Only return the name."
+            background_prompt = f"Generate a short background story for a {random_race_data.name} from {random_culture_data.name}. Be creative and concise."
+            description_prompt = f"Generate a short physical description for a {random_race_data.name} from {random_culture_data.name}. Be creative and concise."
 
-        # 4. Calculate combat stats
-        strength_modifier = (random_stats['strength'] - 10) // 2
-        agility_modifier = (random_stats['agility'] - 10) // 2
-        
-        max_hp = random_stats['constitution'] * 10 + 5 # level 1
-        max_mp = random_stats['intelligence'] * 5 + random_stats['wisdom'] * 3
-        ac = 10 + agility_modifier
-        attack_bonus = strength_modifier
+            flavour = CharacterFlavour(
+                name=(await agent.run(name_prompt)).output,
+                background=(await agent.run(background_prompt)).output,
+                physical_description=(await agent.run(description_prompt)).output,
+            )
+            character = service.build_character(random_race_data, random_culture_data, random_stats, allocated_skills, flavour)
 
-        # 5. Create and save character
-        character_id = str(uuid4())
-        now = datetime.now().isoformat()
-
-        character_dict = {
-            "id": character_id,
-            "name": character_name,
-            "race": random_race_data.id,
-            "culture": random_culture_data.id,
-            "stats": Stats(**random_stats).model_dump(),
-            "skills": allocated_skills,
-            "combat_stats": {
-                "max_hit_points": max_hp, "current_hit_points": max_hp, 
-                "max_mana_points": max_mp, "current_mana_points": max_mp, 
-                "armor_class": ac, "attack_bonus": attack_bonus
-            },
-            "equipment": {"weapons": [], "armor": [], "accessories": [], "consumables": [], "gold": 0},
-            "spells": {"known_spells": [], "spell_slots": {}, "spell_bonus": 0},
-            "level": 1, "status": "draft", "experience_points": 0,
-            "created_at": now, "updated_at": now,
-            "description": background,
-            "physical_description": physical_description
-        }
-        
-        character = Character(**character_dict)
-        character.sync_status_from_completion()
-        CharacterDataService().save_character(character, character_id)
+        # 5. Save character
+        CharacterDataService().save_character(character, str(character.id))
         
         return CharacterV2Response(
             character=character,
@@ -264,8 +246,89 @@ async def create_random_character() -> CharacterV2Response:
         logger.error(f"Random character creation failed: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Random character creation failed: {str(e)}")
 
+@router.post(
+    "/random/batch",
+    response_model=RandomCharacterBatchResponse,
+    summary="Create random V2 characters in bulk",
+    description="Creates up to 5000 random characters in one call (NPC parties, test fixtures). LLM flavour text is optional."
+)
+async def create_random_characters_batch(
+    count: int = Query(..., ge=1, le=MAX_RANDOM_BATCH_SIZE, description="Number of characters to create"),
+    flavour: bool = Query(False, description="Generate names, backgrounds and descriptions with the LLM (batched)")
+) -> RandomCharacterBatchResponse:
+    """
+    Creates `count` random characters. Stats and skill allocations are drawn for the whole batch,
+    the LLM (if `flavour=true`) describes several characters per call, and all characters are
+    saved through one bulk write. Without flavour, characters get placeholder names
+    (e.g. "Rivendell Elves #3").
+
+    **Response:**
+    ```json
+    {
+        "characters": [{"id": "...", "name": "Rivendell Elves #1", "race": "elves", "...": "..."}],
+        "count": 1,
+        "status": "created"
+    }
+    ```
+    """
+    try:
+        agent = build_simple_gm_agent() if flavour else None
+        characters = await global_container.random_character_service.create_random_characters(count, agent)
+        return RandomCharacterBatchResponse(characters=characters, count=len(characters), status="created")
+    except ValueError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    except Exception as e:
+        import logging
+        logger = logging.getLogger(__name__)
+        logger.error(f"Random character batch creation failed: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Random character batch creation failed: {str(e)}")
+
+# Static catalogs: built and serialized once per version of their YAML files, served with ETag/304/gzip
+def _build_races() -> List[RaceData]:
+    return RacesDataService().get_all_races()
+
+
+def _build_skills() -> SkillsResponse:
+    return SkillsResponse(**UnifiedSkillsManager().get_all_data())
+
+
+def _build_equipment() -> EquipmentResponse:
+    equipment_manager = EquipmentManager()
+    equipment_data = equipment_manager.get_all_equipment()
+
+    # Convert dictionaries to EquipmentItem objects, handling type conversions
+    def convert_item(item: dict) -> EquipmentItem:
+        # Convert range to string if it's an integer
+        if 'range' in item and isinstance(item['range'], int):
+            item['range'] = str(item['range'])
+        return EquipmentItem(**item)
+
+    weapons = [convert_item(item) for item in equipment_data.get("weapons", [])]
+    armor = [convert_item(item) for item in equipment_data.get("armor", [])]
+    accessories = [convert_item(item) for item in equipment_data.get("accessories", [])]
+    consumables = [convert_item(item) for item in equipment_data.get("consumables", [])]
+
+    return EquipmentResponse(
+        weapons=weapons,
+        armor=armor,
+        accessories=accessories,
+        consumables=consumables
+    )
+
+
+def _build_stats() -> StatsResponse:
+    # StatsManager returns data that matches StatsResponse structure
+    return StatsResponse(**StatsManager().get_all_stats_data())
+
+
+_races_catalog = CatalogCache(["races_and_cultures.yaml"], _build_races, List[RaceData])
+_skills_catalog = CatalogCache(["skills.yaml"], _build_skills, SkillsResponse)
+_equipment_catalog = CatalogCache(["equipment.yaml"], _build_equipment, EquipmentResponse)
+_stats_catalog = CatalogCache(["stats.yaml"], _build_stats, StatsResponse)
+
+
 @router.get("/races", summary="List of races V2", response_model=List[RaceData])
-def get_races() -> List[RaceData]:
+def get_races(request: Request) -> Response:
     """
     Returns the complete list of available races for the V2 system.
 
@@ -291,14 +354,10 @@ def get_races() -> List[RaceData]:
     ]
     ```
     """
-    races_service = RacesDataService()
-    races_data = races_service.get_all_races()
-
-    # FastAPI will automatically serialize RaceData Pydantic objects to JSON
-    return races_data
+    return _races_catalog.respond(request)
 
 @router.get("/skills", summary="Skills data V2", response_model=SkillsResponse)
-def get_skills() -> SkillsResponse:
+def get_skills(request: Request) -> Response:
     """
     Returns the complete skills structure for the V2 system including racial affinities.
 
@@ -332,12 +391,10 @@ def get_skills() -> SkillsResponse:
     }
     ```
     """
-    skills_manager = UnifiedSkillsManager()
-    data = skills_manager.get_all_data()
-    return SkillsResponse(**data)
+    return _skills_catalog.respond(request)
 
 @router.get("/equipment", summary="Equipment data V2", response_model=EquipmentResponse)
-def get_equipment() -> EquipmentResponse:
+def get_equipment(request: Request) -> Response:
     """
     Returns the complete equipment structure for the V2 system.
 
@@ -375,30 +432,10 @@ def get_equipment() -> EquipmentResponse:
     }
     ```
     """
-    equipment_manager = EquipmentManager()
-    equipment_data = equipment_manager.get_all_equipment()
-
-    # Convert dictionaries to EquipmentItem objects, handling type conversions
-    def convert_item(item: dict) -> EquipmentItem:
-        # Convert range to string if it's an integer
-        if 'range' in item and isinstance(item['range'], int):
-            item['range'] = str(item['range'])
-        return EquipmentItem(**item)
-
-    weapons = [convert_item(item) for item in equipment_data.get("weapons", [])]
-    armor = [convert_item(item) for item in equipment_data.get("armor", [])]
-    accessories = [convert_item(item) for item in equipment_data.get("accessories", [])]
-    consumables = [convert_item(item) for item in equipment_data.get("consumables", [])]
-
-    return EquipmentResponse(
-        weapons=weapons,
-        armor=armor,
-        accessories=accessories,
-        consumables=consumables
-    )
+    return _equipment_catalog.respond(request)
 
 @router.get("/stats", summary="Stats data V2", response_model=StatsResponse)
-def get_stats() -> StatsResponse:
+def get_stats(request: Request) -> Response:
     """
     Returns the complete stats structure for the V2 system.
 
@@ -432,11 +469,7 @@ def get_stats() -> StatsResponse:
     }
     ```
     """
-    stats_manager = StatsManager()
-    stats_data = stats_manager.get_all_stats_data()
-
-    # StatsManager returns data that matches StatsResponse structure
-    return StatsResponse(**stats_data)
+    return _stats_catalog.respond(request)
 
 @router.post(
     "/create",
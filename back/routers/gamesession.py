@@ -3,10 +3,10 @@ Game Session router for managing game sessions with LLM gameplay.
 Handles session creation, listing, playing, and history management.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Response
 from fastapi.responses import StreamingResponse
 from uuid import UUID
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Literal, Optional
 import traceback
 import json
 
@@ -20,9 +20,14 @@ from back.models.schema import (
     ScenarioHistoryResponse,
     DeleteMessageResponse,
     SessionInfo,
+    SessionTimingsResponse,
+    SessionUsageResponse,
+    LatencyHistogramsResponse,
 )
 from back.utils.logger import log_debug
+from back.utils.timing import PHASE_SESSION_LOAD, timed, track_turn, turn_metrics
 from back.models.domain.character import Character
+from back.models.domain.usage import UsageRollup
 from back.models.enums import CharacterStatus
 from back.services.character_data_service import CharacterDataService
 from pydantic_ai.messages import ModelMessagesTypeAdapter
@@ -92,15 +97,26 @@ async def list_active_sessions() -> ActiveSessionsResponse:
 @router.post("/play", response_model=PlayScenarioResponse)
 async def play_scenario(
     request: PlayScenarioRequest,
-    session_id: Optional[UUID] = None
+    response: Response,
+    session_id: Optional[UUID] = None,
+    full_history: bool = Query(False, description="Return the whole history instead of this turn's messages")
 ) -> PlayScenarioResponse:
     """
     Play or start a scenario. If session_id is provided, continue the existing session.
     Otherwise, start a new session with scenario_name and character_id, then play with the default start message.
 
+    Only the messages of this turn are returned (the player's message and the GM's answer), with
+    `history_version`, the length of the history they were appended to. A client holding
+    `history_version - len(response)` messages of that history is in sync after appending them;
+    otherwise it catches up with `GET /history/{session_id}?since=<messages held>`.
+
+    The `Server-Timing` response header breaks the turn down by phase (session_load, history_load, prompt,
+    llm, tool.<name>, summarize, persist, total); see also `GET /timings/{session_id}`.
+
     **Parameters:**
     - session_id (UUID, optional): Existing session ID.
     - request (PlayScenarioRequest): Request body with optional message, and scenario_name/character_id for starting.
+    - full_history (bool, optional): Return the whole history of the current mode instead of this turn's messages.
 
     **Request Body:**
     ```json
@@ -113,7 +129,6 @@ async def play_scenario(
 
     **Response:**
     ```json
-    ```json
     {
         "session_id": "12345678-1234-5678-9012-123456789abc",
         "response": [
@@ -146,7 +161,9 @@ async def play_scenario(
                 "model_name": "deepseek-chat",
                 "timestamp": "2025-06-21T12:30:35.000000Z"
             }
-        ]
+        ],
+        "history_kind": "narrative",
+        "history_version": 12
     }
     ```
 
@@ -183,29 +200,40 @@ async def play_scenario(
 
     # Logique commune
     try:
-        session_service = await GameSessionService.load(str(session_id))
+        with track_turn(str(session_id)) as timings:
+            with timed(PHASE_SESSION_LOAD):
+                session_service = await GameSessionService.load(str(session_id))
+                game_state = await session_service.load_game_state()
+
+            if game_state is None:
+                game_state = GameState(
+                    session_mode="narrative",
+                    narrative_history_id="default",
+                    combat_history_id="default"
+                )
+                await session_service.update_game_state(game_state)
 
-        game_state = await session_service.load_game_state()
-        if game_state is None:
-            game_state = GameState(
-                session_mode="narrative",
-                narrative_history_id="default",
-                combat_history_id="default"
+            player_message = PlayerMessagePayload(message=message)
+            graph_state = SessionGraphState(
+                game_state=game_state,
+                pending_player_message=player_message
             )
-            await session_service.update_game_state(game_state)
 
-        player_message = PlayerMessagePayload(message=message)
-        graph_state = SessionGraphState(
-            game_state=game_state,
-            pending_player_message=player_message
-        )
+            result = await session_graph.run(DispatcherNode(), state=graph_state, deps=session_service)
 
-        result = await session_graph.run(DispatcherNode(), state=graph_state, deps=session_service)
-
-        log_debug("Graph response generated", action="play_scenario", session_id=str(session_id))
+        response.headers["Server-Timing"] = timings.server_timing()
+        dispatch = result.output
+        log_debug("Graph response generated", action="play_scenario", session_id=str(session_id),
+                  new_messages=len(dispatch.new_messages), history_version=dispatch.history_version)
+        messages = (
+            ModelMessagesTypeAdapter.dump_python(dispatch.history, mode='json') if full_history
+            else dispatch.new_messages
+        )
         return PlayScenarioResponse(
-            response=result.output.all_messages,
-            session_id=session_id
+            response=messages,
+            session_id=session_id,
+            history_kind=dispatch.history_kind,
+            history_version=dispatch.history_version
         )
 
     except SessionNotFoundError as e:
@@ -256,8 +284,9 @@ async def play_stream(session_id: UUID, message: PlayScenarioRequest):
             agent.run_stream() and yield tokens as they arrive from the LLM.
             """
             try:
-                # Run the full graph to completion
-                result = await session_graph.run(DispatcherNode(), state=graph_state, deps=session_service)
+                # Run the full graph to completion (timed per session; headers are already sent)
+                with track_turn(str(session_id)):
+                    result = await session_graph.run(DispatcherNode(), state=graph_state, deps=session_service)
                 
                 # Emit new messages (already serialized in DispatchResult)
                 for message_dict in result.output.new_messages:
@@ -300,12 +329,19 @@ async def play_stream(session_id: UUID, message: PlayScenarioRequest):
 
 
 @router.get("/history/{session_id}", response_model=ScenarioHistoryResponse)
-async def get_scenario_history(session_id: UUID) -> ScenarioHistoryResponse:
+async def get_scenario_history(
+    session_id: UUID,
+    since: int = Query(0, ge=0, description="Number of messages the client already holds"),
+    kind: Literal["narrative", "combat"] = Query(HISTORY_NARRATIVE, description="History to read")
+) -> ScenarioHistoryResponse:
     """
-    Retrieve the complete message history of the specified game session in raw JSON format.
+    Retrieve the message history of the specified game session in raw JSON format, from message
+    `since` on (the whole history by default), with `history_version`, the length of the whole history.
 
     **Parameters:**
     - `session_id` (UUID): Game session identifier.
+    - `since` (int, optional): Index of the first message to return (messages already held by the client).
+    - `kind` (str, optional): "narrative" (default) or "combat", as reported by `/play` in `history_kind`.
 
     **Response:**
     ```json
@@ -340,7 +376,8 @@ async def get_scenario_history(session_id: UUID) -> ScenarioHistoryResponse:
                 "model_name": "deepseek-chat",
                 "timestamp": "2025-06-21T12:00:05.123456Z"
             }
-        ]
+        ],
+        "history_version": 2
     }
     ```
 
@@ -350,11 +387,11 @@ async def get_scenario_history(session_id: UUID) -> ScenarioHistoryResponse:
 
     **Note:** This route returns raw JSON without Pydantic validation to ensure format consistency with `/gamesession/play`.
     """
-    log_debug("Endpoint call: gamesession/get_scenario_history", session_id=str(session_id))
+    log_debug("Endpoint call: gamesession/get_scenario_history", session_id=str(session_id), since=since, kind=kind)
     try:
         session = await GameSessionService.load(str(session_id))
-        history: List[Dict[str, Any]] = await session.load_history_raw_json(HISTORY_NARRATIVE)
-        return ScenarioHistoryResponse(history=history)
+        history: List[Dict[str, Any]] = await session.load_history_raw_json(kind)
+        return ScenarioHistoryResponse(history=history[since:], history_version=len(history))
     except SessionNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -456,6 +493,91 @@ async def delete_history_message(session_id: UUID, message_index: int) -> Delete
         )
         raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
 
+@router.get("/timings", response_model=LatencyHistogramsResponse)
+async def get_latency_histograms() -> LatencyHistogramsResponse:
+    """
+    Latency histograms of the turns played since the server started, by phase (seconds).
+
+    **Response:**
+    ```json
+    {
+        "phases": {
+            "llm": {"buckets": {"0.005": 0, "...": 0, "2.5": 3, "+Inf": 0}, "count": 3, "sum": 5.82},
+            "total": {"buckets": {"0.005": 0, "...": 0, "5.0": 3, "+Inf": 0}, "count": 3, "sum": 6.01}
+        }
+    }
+    ```
+    """
+    return LatencyHistogramsResponse(phases=turn_metrics.histograms())
+
+
+@router.get("/timings/{session_id}", response_model=SessionTimingsResponse)
+async def get_session_timings(session_id: UUID) -> SessionTimingsResponse:
+    """
+    Latency breakdown of the last turns of a session (kept in memory, oldest first).
+
+    **Parameters:**
+    - `session_id` (UUID): Game session identifier.
+
+    **Response:**
+    ```json
+    {
+        "session_id": "12345678-1234-5678-9012-123456789abc",
+        "turns": [
+            {
+                "started_at": "2025-06-21T12:00:00.000000+00:00",
+                "total_ms": 2161.0,
+                "phases": {"session_load": 3.2, "history_load": 4.1, "prompt": 1.3, "llm": 2140.7, "tool.character_heal": 2.4, "persist": 5.6},
+                "counts": {"session_load": 1, "history_load": 2, "prompt": 1, "llm": 1, "tool.character_heal": 1, "persist": 3}
+            }
+        ]
+    }
+    ```
+    """
+    return SessionTimingsResponse(session_id=session_id, turns=turn_metrics.session_turns(str(session_id)))
+
+
+@router.get("/usage", response_model=UsageRollup)
+async def get_usage_totals() -> UsageRollup:
+    """
+    Token usage of all the recorded turns (all sessions, deleted ones included), from the incremental
+    rollup: totals, by mode, by model and by scenario.
+
+    **Response:**
+    ```json
+    {
+        "totals": {"turns": 42, "requests": 63, "input_tokens": 251200, "output_tokens": 18900,
+                   "summary_input_tokens": 12000, "summary_output_tokens": 800, "latency_ms": 130250.5,
+                   "total_tokens": 282900},
+        "by_mode": {"narrative": {"turns": 30, "...": 0}, "combat": {"turns": 12, "...": 0}},
+        "by_model": {"deepseek-chat": {"turns": 42, "...": 0}},
+        "by_scenario": {"Les_Pierres_du_Passe.md": {"turns": 42, "...": 0}}
+    }
+    ```
+    """
+    return GameSessionService.get_global_usage()
+
+
+@router.get("/usage/{session_id}", response_model=SessionUsageResponse)
+async def get_session_usage(session_id: UUID) -> SessionUsageResponse:
+    """
+    Token usage of a session (tokens in/out, summarization tokens, LLM requests and latency), from its
+    incremental rollup: totals, by mode, by model and by scenario. Each turn is also appended to the
+    session ledger (`usage_ledger.jsonl`).
+
+    **Parameters:**
+    - `session_id` (UUID): Game session identifier.
+
+    **Raises:**
+    - HTTPException 404: If the session does not exist.
+    """
+    try:
+        session = await GameSessionService.load(str(session_id))
+    except SessionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return SessionUsageResponse(session_id=session_id, **dict(session.get_usage()))
+
+
 @router.get("/{session_id}/preferences", response_model=Dict[str, str])
 async def get_preferences(session_id: UUID) -> Dict[str, str]:
     """
@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Response
+
+from back.models.schema import MemoryReport
+from back.utils.memory import memory_report
+from back.utils.metrics import CONTENT_TYPE, registry
+
+router = APIRouter(tags=["metrics"])
+
+@router.get("/metrics", response_class=Response)
+def get_metrics() -> Response:
+    """
+    ### Get Metrics
+    **Description:** Prometheus scrape endpoint (text exposition format): turns per mode, agent run latency,
+    LLM requests and tokens, tool calls and durations, cache hits and misses, turn phase latencies, history
+    file sizes, active combat states and event-loop lag.
+    Synchronous on purpose: the files read on scrape are read in the threadpool, not on the event loop.
+    **Returns:**
+    - `Response`: The metrics, `text/plain; version=0.0.4`.
+    """
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
+
+@router.get("/metrics/memory", response_model=MemoryReport)
+def get_memory_report() -> MemoryReport:
+    """
+    ### Get Memory Report
+    **Description:** Live memory by subsystem (history, combat states, characters, game data, other), from a
+    fresh tracemalloc snapshot. Tracing is opt-in (`memory.tracemalloc` in `config.yaml` or
+    `PYTHONTRACEMALLOC`); without it, the report only says `tracing: false`.
+    Synchronous on purpose: the snapshot is taken in the threadpool, not on the event loop.
+    **Returns:**
+    - `MemoryReport`: Traced bytes and blocks by subsystem, total and peak traced bytes.
+    """
+    return memory_report()
@@ -0,0 +1,75 @@
+"""
+FastAPI router for outcome probabilities.
+Exposes exact odds of skill checks, attacks and dice expressions, computed without rolling.
+"""
+
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+
+from back.services.probability_service import ProbabilityService
+from back.utils.logger import log_debug
+
+router = APIRouter(tags=["probability"])
+
+# Plain `def` endpoints: the convolutions run in the threadpool, not on the event loop
+
+probability_service = ProbabilityService()
+
+
+@router.get("/check", summary="Skill check odds")
+def skill_check_odds(
+    target: int = Query(..., description="Target number of the d100 roll-under check (skill value minus difficulty)")
+) -> Dict[str, Any]:
+    """
+    Return the odds of a d100 skill check: success chance and the probability of each degree
+    of success or failure ('Critical Success' ... 'Critical Failure').
+
+    Example Response:
+
+    ```json
+    {
+        "target": 60,
+        "success_chance": 0.6,
+        "bands": {"Critical Success": 0.1, "Excellent Success": 0.2, "Good Success": 0.2, "...": "..."}
+    }
+    ```
+    """
+    log_debug("Endpoint call: probability/skill_check_odds", target=target)
+    return probability_service.skill_check_odds(target)
+
+
+@router.get("/attack", summary="Attack odds")
+def attack_odds(
+    attack_bonus: int = Query(..., description="Attack bonus of the attacker"),
+    armor_class: int = Query(..., description="Armor Class of the target"),
+    weapon_damage: str = Query("1d4", description="Weapon damage dice (e.g. '1d8+2')"),
+    target_hp: Optional[int] = Query(None, ge=1, description="Current HP of the target")
+) -> Dict[str, Any]:
+    """
+    Return the odds of a weapon attack under the combat rules: hit, critical and fumble chances,
+    expected damage per attack and per hit, the damage range and (with `target_hp`) the chance
+    to take the target down in one blow. Returns 400 for dice beyond 100 dice or 1000 faces.
+    """
+    log_debug("Endpoint call: probability/attack_odds", attack_bonus=attack_bonus,
+              armor_class=armor_class, weapon_damage=weapon_damage)
+    try:
+        return probability_service.attack_odds(attack_bonus, armor_class, weapon_damage, target_hp)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/dice", summary="Dice expression odds")
+def dice_odds(
+    expression: str = Query(..., description="Dice expression (e.g. '2d6+1')"),
+    target: Optional[int] = Query(None, description="Value to reach or exceed")
+) -> Dict[str, Any]:
+    """
+    Return the minimum, maximum and mean of a dice expression and, with `target`,
+    the chance to roll at least that value. Returns 400 for dice beyond 100 dice or 1000 faces.
+    """
+    log_debug("Endpoint call: probability/dice_odds", expression=expression, target=target)
+    try:
+        return probability_service.dice_odds(expression, target)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
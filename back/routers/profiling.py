@@ -0,0 +1,83 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from fastapi.responses import FileResponse
+
+from back.models.schema import ProfileInfo, ProfilingSettings
+from back.utils.logger import log_debug
+from back.utils.profiling import MODE_SAMPLING, request_profiler
+
+router = APIRouter(prefix="/api/profiles", tags=["profiling"])
+
+def require_profiling_admin(request: Request, x_admin_token: Optional[str] = Header(None)) -> None:
+    """
+    ### require_profiling_admin
+    **Description:** Guard of the profiling controls: requires the `X-Admin-Token` header when
+    `profiling.admin_token` is configured, a local client otherwise.
+    **Raises:**
+    - HTTPException 403: If the client is not allowed.
+    """
+    client_host = request.client.host if request.client else None
+    if not request_profiler.is_admin(client_host, x_admin_token):
+        raise HTTPException(status_code=403, detail="Profiling controls require an admin token or a local client")
+
+@router.get("", response_model=List[ProfileInfo], dependencies=[Depends(require_profiling_admin)])
+def list_profiles() -> List[ProfileInfo]:
+    """
+    ### List Profiles
+    **Description:** List the saved request profiles, newest first. A request on the eligible paths is
+    profiled when it carries the `X-Profile` header (`1`, `cprofile` or `sampling`; if `profiling.allow_header`
+    is on) or when sampling is enabled (see `/settings`); its profile id is returned in the `X-Profile-Id`
+    response header. Requires the `X-Admin-Token` header if `profiling.admin_token` is configured, a local
+    client otherwise (profiles expose call stacks and module paths).
+    **Returns:**
+    - `List[ProfileInfo]`: The saved profiles.
+    """
+    return request_profiler.list_profiles()
+
+@router.get("/settings", response_model=ProfilingSettings)
+def get_profiling_settings() -> ProfilingSettings:
+    """
+    ### Get Profiling Settings
+    **Description:** Retrieve the current sampling settings of the request profiler.
+    **Returns:**
+    - `ProfilingSettings`: `enabled`, `sample_rate` and `mode`.
+    """
+    return request_profiler.settings
+
+@router.put("/settings", response_model=ProfilingSettings, dependencies=[Depends(require_profiling_admin)])
+def update_profiling_settings(settings: ProfilingSettings) -> ProfilingSettings:
+    """
+    ### Update Profiling Settings
+    **Description:** Enable or disable the sampling of requests, or change its rate or mode. Applies to the
+    running process only (the defaults come from the `profiling` section of `config.yaml`). Requires the
+    `X-Admin-Token` header if `profiling.admin_token` is configured, a local client otherwise.
+    **Parameters:**
+    - `settings` (ProfilingSettings): The new settings.
+    **Returns:**
+    - `ProfilingSettings`: The applied settings.
+    """
+    log_debug("Endpoint call: PUT /api/profiles/settings", settings=settings.model_dump())
+    request_profiler.settings = settings
+    return settings
+
+@router.get("/{profile_id}", response_class=FileResponse, dependencies=[Depends(require_profiling_admin)])
+def download_profile(profile_id: str) -> FileResponse:
+    """
+    ### Download Profile
+    **Description:** Download a saved profile: a `.pstats` file (cprofile mode, e.g. `snakeviz`) or a
+    speedscope JSON file (sampling mode, https://www.speedscope.app). Same access rule as the profile list.
+    **Parameters:**
+    - `profile_id` (str): Profile identifier.
+    **Returns:**
+    - `FileResponse`: The profile file.
+    **Raises:**
+    - HTTPException 403: If the client is not allowed.
+    - HTTPException 404: If the profile does not exist.
+    """
+    found = request_profiler.get_profile(profile_id)
+    if found is None:
+        raise HTTPException(status_code=404, detail=f"Profile '{profile_id}' not found")
+    profile, path = found
+    media_type = "application/json" if profile.mode == MODE_SAMPLING else "application/octet-stream"
+    return FileResponse(path, media_type=media_type, filename=profile.filename)
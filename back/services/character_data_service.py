@@ -5,11 +5,21 @@ Respect du SRP - Responsabilité unique : gestion des données persistantes.
 
 import os
 import json
-from typing import List, Optional
-from back.models.domain.character import Character
+import base64
+import binascii
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from pydantic import ValidationError
+from back.models.domain.character import Character, CharacterSummary
+from back.storage.serialization import dump_data, write_atomic
 from back.utils.logger import log_debug
+from back.utils.trusted_load import load_model, trusted_loads
 from back.config import get_data_dir
 
+# Index des résumés de personnages : chemin -> ((mtime_ns, taille), résumés par identifiant)
+_INDEX_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, CharacterSummary]]] = {}
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
 
 class CharacterDataService:
     """
@@ -28,6 +38,10 @@ class CharacterDataService:
     def _get_characters_dir(self) -> str:
         return os.path.join(get_data_dir(), "characters")
 
+    def _get_index_path(self) -> str:
+        # Hors du répertoire characters : get_all_characters y lit chaque fichier .json
+        return os.path.join(get_data_dir(), "characters_index.json")
+
     def _get_character_file_path(self, character_id: str) -> str:
         if not character_id or not isinstance(character_id, str) or not character_id.strip():
             raise ValueError("Character ID must be a non-empty string")
@@ -51,13 +65,21 @@ class CharacterDataService:
             raise FileNotFoundError(f"Le personnage {character_id} n'existe pas.")
 
         try:
-            with open(filepath, "r", encoding="utf-8") as file:
-                character_data = json.load(file)
+            with open(filepath, "rb") as file:
+                raw = file.read()
 
+            # Les validateurs de cohérence sont sautés si le fichier est exactement celui que nous avons écrit
+            character = load_model(Character, raw, filepath)
             log_debug("Personnage chargé avec succès", action="load_character", character_id=character_id)
-            return Character(**character_data)
+            return character
 
-        except json.JSONDecodeError as e:
+        except ValidationError as e:
+            if not any(error["type"] == "json_invalid" for error in e.errors()):
+                log_debug("Erreur lors du chargement",
+                         action="load_character_error",
+                         character_id=character_id,
+                         error=str(e))
+                raise
             log_debug("Erreur de décodage JSON",
                      action="load_character_error",
                      character_id=character_id,
@@ -112,12 +134,15 @@ class CharacterDataService:
             # Créer le répertoire si nécessaire
             os.makedirs(os.path.dirname(filepath), exist_ok=True)
 
-            with open(filepath, "w", encoding="utf-8") as file:
-                json.dump(merged_data, file, ensure_ascii=False, indent=2)
+            raw = dump_data(merged_data)
+            write_atomic(filepath, raw)
 
             log_debug("Personnage sauvegardé", action="save_character", character_id=target_id)
-            
-            return Character(**merged_data)
+
+            saved_character = Character(**merged_data)
+            trusted_loads.remember(filepath, Character, raw)
+            self._update_index([saved_character])
+            return saved_character
 
         except Exception as e:
             log_debug("Erreur lors de la sauvegarde",
@@ -126,6 +151,36 @@ class CharacterDataService:
                      error=str(e))
             raise
     
+    def save_characters(self, characters: List[Character]) -> List[Character]:
+        """
+        ### save_characters
+        **Description:** Sauvegarde groupée de personnages. Le répertoire est préparé une seule fois et
+        les nouveaux personnages sont écrits directement, sans relecture ni fusion ; un personnage déjà
+        présent sur disque passe par `save_character` pour conserver la fusion.
+        **Paramètres:**
+        - `characters` (List[Character]): Personnages à sauvegarder
+        **Retour:** Les personnages sauvegardés
+        """
+        characters_dir = self._get_characters_dir()
+        os.makedirs(characters_dir, exist_ok=True)
+        existing = set(os.listdir(characters_dir))
+
+        saved: List[Character] = []
+        for character in characters:
+            character_id = str(character.id)
+            filepath = self._get_character_file_path(character_id)
+            if os.path.basename(filepath) in existing:
+                saved.append(self.save_character(character, character_id))
+                continue
+            raw = dump_data(character.model_dump(mode='json'))
+            write_atomic(filepath, raw)
+            trusted_loads.remember(filepath, Character, raw)
+            saved.append(character)
+
+        self._update_index(saved)
+        log_debug("Personnages sauvegardés en lot", action="save_characters", count=len(saved))
+        return saved
+
     def get_all_characters(self) -> List[Character]:
         """
         ### get_all_characters
@@ -155,6 +210,139 @@ class CharacterDataService:
         log_debug("Chargement de tous les personnages", action="get_all_characters", count=len(characters))
         return characters
     
+    def get_character_summaries(self) -> List[CharacterSummary]:
+        """
+        ### get_character_summaries
+        **Description:** Récupère le résumé (id, nom, race, niveau, statut, date de mise à jour) de tous
+        les personnages depuis l'index, sans lire les fichiers complets. L'index est réconcilié avec le
+        répertoire : seuls les fichiers absents de l'index sont lus, les entrées orphelines sont retirées.
+        **Retour:** Résumés triés du plus récemment modifié au plus ancien
+        """
+        characters_dir = self._get_characters_dir()
+        if not os.path.exists(characters_dir):
+            log_debug("Répertoire characters inexistant", action="get_character_summaries")
+            return []
+
+        index = self._load_index()
+        on_disk = {filename[:-5] for filename in os.listdir(characters_dir) if filename.endswith(".json")}
+        missing = on_disk - index.keys()
+        stale = index.keys() - on_disk
+
+        if missing or stale:
+            index = {character_id: summary for character_id, summary in index.items() if character_id in on_disk}
+            for character_id in missing:
+                try:
+                    with open(self._get_character_file_path(character_id), "r", encoding="utf-8") as file:
+                        index[character_id] = CharacterSummary.model_validate(json.load(file))
+                except (OSError, ValueError) as e:
+                    log_debug("Personnage ignoré dans l'index",
+                              action="get_character_summaries_error",
+                              character_id=character_id,
+                              error=str(e))
+            self._write_index(index)
+            log_debug("Index des personnages réconcilié", action="get_character_summaries",
+                      added=len(missing), removed=len(stale))
+
+        return sorted(index.values(), key=self._summary_sort_key)
+
+    def list_character_summaries(
+        self,
+        limit: int,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[CharacterSummary], Optional[str]]:
+        """
+        ### list_character_summaries
+        **Description:** Page de résumés de personnages, du plus récemment modifié au plus ancien.
+        La pagination se fait par clé (date de mise à jour, identifiant) : une page reste cohérente
+        même si des personnages sont créés entre deux appels.
+        **Paramètres:**
+        - `limit` (int): Nombre maximal de résumés
+        - `cursor` (Optional[str]): Curseur renvoyé par la page précédente
+        **Retour:** Les résumés de la page et le curseur de la page suivante (None s'il n'y en a pas)
+        **Lève:** ValueError si le curseur est invalide
+        """
+        summaries = self.get_character_summaries()
+        if cursor:
+            after = self._decode_cursor(cursor)
+            summaries = [summary for summary in summaries if self._summary_sort_key(summary) > after]
+
+        page = summaries[:limit]
+        next_cursor = self._encode_cursor(page[-1]) if len(summaries) > limit else None
+        return page, next_cursor
+
+    @staticmethod
+    def _summary_sort_key(summary: CharacterSummary) -> Tuple[int, str]:
+        micros = (summary.updated_at - _EPOCH) // timedelta(microseconds=1)
+        return -micros, str(summary.id)
+
+    def _encode_cursor(self, summary: CharacterSummary) -> str:
+        negated_micros, character_id = self._summary_sort_key(summary)
+        raw = f"{-negated_micros}:{character_id}".encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[int, str]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+            micros, character_id = raw.split(":", 1)
+            return -int(micros), character_id
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise ValueError(f"Curseur de pagination invalide: {cursor}")
+
+    def _load_index(self) -> Dict[str, CharacterSummary]:
+        path = self._get_index_path()
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return {}
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _INDEX_CACHE.get(path)
+        if cached and cached[0] == signature:
+            return dict(cached[1])
+
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            index = {character_id: CharacterSummary.model_validate(summary)
+                     for character_id, summary in data.get("characters", {}).items()}
+        except (OSError, ValueError, AttributeError) as e:
+            # Index illisible : il sera reconstruit depuis les fichiers
+            log_debug("Index des personnages illisible", action="load_index_error", error=str(e))
+            return {}
+        _INDEX_CACHE[path] = (signature, index)
+        return dict(index)
+
+    def _write_index(self, index: Dict[str, CharacterSummary]) -> None:
+        path = self._get_index_path()
+        data = {"characters": {character_id: summary.model_dump(mode='json') for character_id, summary in index.items()}}
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_atomic(path, dump_data(data))
+        stat = os.stat(path)
+        _INDEX_CACHE[path] = ((stat.st_mtime_ns, stat.st_size), dict(index))
+
+    def _update_index(self, characters: List[Character]) -> None:
+        # L'index n'est réécrit que si un résumé a changé (la plupart des sauvegardes touchent l'inventaire)
+        try:
+            index = self._load_index()
+            changed = False
+            for character in characters:
+                summary = CharacterSummary.from_character(character)
+                if index.get(str(character.id)) != summary:
+                    index[str(character.id)] = summary
+                    changed = True
+            if changed:
+                self._write_index(index)
+        except OSError as e:
+            log_debug("Mise à jour de l'index des personnages impossible", action="update_index_error", error=str(e))
+
+    def _remove_from_index(self, character_id: str) -> None:
+        try:
+            index = self._load_index()
+            if index.pop(character_id, None) is not None:
+                self._write_index(index)
+        except OSError as e:
+            log_debug("Mise à jour de l'index des personnages impossible", action="update_index_error", error=str(e))
+
     def get_character_by_id(self, character_id: str) -> Character:
         """
         ### get_character_by_id
@@ -191,6 +379,8 @@ class CharacterDataService:
         filepath = self._get_character_file_path(character_id)
         if os.path.exists(filepath):
             os.remove(filepath)
+            trusted_loads.forget(filepath)
+            self._remove_from_index(character_id)
             log_debug("Personnage supprimé", action="delete_character", character_id=character_id)
         else:
             log_debug("Suppression ignorée: personnage introuvable", action="delete_character", character_id=character_id)
@@ -0,0 +1,170 @@
+"""
+Pool of pre-generated random characters.
+Keeps a few ready-made draft characters (stats, skills, name, background, description)
+per race and culture so that random character creation does not wait for the LLM.
+The pool refills itself in the background when it runs low.
+"""
+
+import asyncio
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from back.models.domain.character import Character
+from back.services.random_character_service import RandomCharacterService
+from back.utils.logger import log_debug, log_error
+
+
+class CharacterPoolService:
+    """
+    ### CharacterPoolService
+    **Description:** Holds up to `size` unsaved draft characters per (race id, culture id).
+    `pop` is a deque pop; when a slot falls below `low_watermark`, a single background task
+    refills every slot to `size`, generating the flavour text of all missing characters in
+    batched LLM calls (see `RandomCharacterService.generate_flavours`).
+
+    **Attributes:**
+    - `generator` (RandomCharacterService): Builds the characters.
+    - `size` (int): Characters kept per race and culture; 0 disables the pool.
+    - `low_watermark` (int): A slot below this level triggers a refill.
+    """
+
+    # Seconds to wait after a failed refill before trying again
+    RETRY_DELAY = 30.0
+
+    def __init__(
+        self,
+        generator: RandomCharacterService,
+        size: int = 2,
+        low_watermark: int = 1,
+        agent_factory: Optional[Callable[[], Any]] = None
+    ) -> None:
+        """
+        ### __init__
+        **Description:** Initializes an empty pool. Nothing is generated until `schedule_refill` or `refill`.
+        **Parameters:**
+        - `generator` (RandomCharacterService): Character generator.
+        - `size` (int): Characters kept per race and culture.
+        - `low_watermark` (int): Refill threshold per race and culture.
+        - `agent_factory` (Optional[Callable]): Builds the LLM agent used for flavour text. Defaults to `build_simple_gm_agent`.
+        """
+        self.generator = generator
+        self.size = max(0, size)
+        self.low_watermark = min(max(1, low_watermark), self.size)
+        self._agent_factory = agent_factory
+        self._slots: Dict[Tuple[str, str], Deque[Character]] = {}
+        self._refill_task: Optional[asyncio.Task] = None
+        self._retry_at = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0
+
+    def levels(self) -> Dict[str, int]:
+        """
+        ### levels
+        **Description:** Number of ready characters per 'race_id/culture_id'.
+        **Parameters:** None
+        **Returns:** Dict of slot levels.
+        """
+        return {f"{race_id}/{culture_id}": len(slot) for (race_id, culture_id), slot in self._slots.items()}
+
+    def pop(self, race_id: str, culture_id: str) -> Optional[Character]:
+        """
+        ### pop
+        **Description:** Takes a ready character of the given race and culture, or of any other
+        race and culture if that slot is empty. Schedules a refill when the pool runs low.
+        **Parameters:**
+        - `race_id` (str): Preferred race id.
+        - `culture_id` (str): Preferred culture id.
+        **Returns:** An unsaved draft character with fresh timestamps, or None if the pool is empty.
+        """
+        slot = self._slots.get((race_id, culture_id))
+        if not slot:
+            slot = next((candidate for candidate in self._slots.values() if candidate), None)
+        character = slot.popleft() if slot else None
+        self.schedule_refill()
+        if character is None:
+            return None
+
+        now = datetime.now(timezone.utc)
+        character.created_at = now
+        character.updated_at = now
+        log_debug("Character taken from pool", action="character_pool_pop",
+                  race=character.race, culture=character.culture)
+        return character
+
+    def needs_refill(self) -> bool:
+        """True if the pool is enabled and some race and culture is below the low watermark."""
+        if not self.enabled:
+            return False
+        if not self._slots:
+            return True
+        return any(len(slot) < self.low_watermark for slot in self._slots.values())
+
+    def schedule_refill(self) -> bool:
+        """
+        ### schedule_refill
+        **Description:** Starts a background refill if the pool is low, no refill is running and the
+        last failure is old enough. Must be called from a running event loop; does nothing otherwise.
+        **Parameters:** None
+        **Returns:** True if a refill task was started.
+        """
+        if not self.needs_refill() or (self._refill_task and not self._refill_task.done()):
+            return False
+        if time.monotonic() < self._retry_at:
+            return False
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        self._refill_task = loop.create_task(self.refill())
+        return True
+
+    async def refill(self) -> int:
+        """
+        ### refill
+        **Description:** Tops every race and culture up to `size` ready characters.
+        **Parameters:** None
+        **Returns:** Number of characters added.
+        """
+        if not self.enabled:
+            return 0
+        try:
+            profiles = []
+            for race, culture in self.generator.race_culture_pairs():
+                slot = self._slots.setdefault((race.id, culture.id), deque())
+                profiles.extend([(race, culture)] * (self.size - len(slot)))
+            if not profiles:
+                return 0
+
+            characters = await self.generator.generate_characters(profiles, self._build_agent())
+            for (race, culture), character in zip(profiles, characters):
+                self._slots[(race.id, culture.id)].append(character)
+            log_debug("Character pool refilled", action="character_pool_refill", added=len(characters))
+            return len(characters)
+        except Exception as e:
+            self._retry_at = time.monotonic() + self.RETRY_DELAY
+            log_error(f"Character pool refill failed: {e}")
+            return 0
+
+    def _build_agent(self) -> Any:
+        if self._agent_factory is None:
+            from back.agents.generic_agent import build_simple_gm_agent
+            self._agent_factory = build_simple_gm_agent
+        return self._agent_factory()
+
+    async def close(self) -> None:
+        """
+        ### close
+        **Description:** Cancels a running refill (application shutdown).
+        **Parameters:** None
+        **Returns:** None
+        """
+        if self._refill_task and not self._refill_task.done():
+            self._refill_task.cancel()
+            try:
+                await self._refill_task
+            except asyncio.CancelledError:
+                pass
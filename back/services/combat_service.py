@@ -1,17 +1,22 @@
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Optional, Union
 from uuid import UUID, uuid4
-import random
 from back.models.domain.combat_state import CombatState, Combatant, CombatantType
-from back.models.domain.character import Stats, Skills, Equipment, CombatStats, Spells
-from back.models.domain.items import EquipmentItem
-from back.models.domain.equipment_manager import EquipmentManager
+from back.models.domain.character import Character
 from back.models.domain.npc import NPC
+from back.models.domain.npc_archetypes_manager import NpcArchetypesManager
+from back.models.domain.combat_system_manager import CombatRules, CombatSystemManager
+from back.models.domain.spells_manager import SpellsManager
 from back.services.character_service import CharacterService
+from back.services.combatant_resolver import CombatantResolver
+from back.dependencies import global_container
 from back.utils.logger import log_debug, log_error
 from back.utils.dice import roll_dice
 
 class CombatService:
-    def __init__(self):
+    def __init__(self, resolver: Optional[CombatantResolver] = None,
+                 npc_archetypes: Optional[NpcArchetypesManager] = None,
+                 combat_system: Optional[CombatSystemManager] = None,
+                 spells: Optional[SpellsManager] = None):
         """
         Initializes the CombatService.
 
@@ -19,20 +24,70 @@ class CombatService:
             Prepares the combat service for managing combat encounters.
             This service handles all combat-related operations including participant
             management, attack resolution, damage application, and turn progression.
+
+        Args:
+            resolver (Optional[CombatantResolver]): Resolver for the entities referenced by combatants.
+                Defaults to the shared resolver of the DependencyContainer.
+            npc_archetypes (Optional[NpcArchetypesManager]): Compiled NPC archetype catalog.
+                Defaults to the shared catalog of the DependencyContainer.
+            combat_system (Optional[CombatSystemManager]): Compiled combat rules (combat_system.yaml).
+                Defaults to the shared manager of the DependencyContainer.
+            spells (Optional[SpellsManager]): Indexed spell catalog (spells.yaml).
+                Defaults to the shared catalog of the DependencyContainer.
+        """
+        self.resolver = resolver if resolver else global_container.combatant_resolver
+        self.npc_archetypes = npc_archetypes if npc_archetypes else global_container.npc_archetypes_manager
+        self.combat_system = combat_system if combat_system else global_container.combat_system_manager
+        self.spells = spells if spells else global_container.spells_manager
+
+    @property
+    def rules(self) -> CombatRules:
+        """The compiled combat rules (recompiled only when combat_system.yaml changes)."""
+        return self.combat_system.get_rules()
+
+    def _formula_values(self, combatant: Combatant) -> Dict[str, int]:
+        """
+        Maps the variables of the combat rules formulas to a combatant's snapshot.
+
+        Args:
+            combatant (Combatant): The combatant.
+
+        Returns:
+            Dict[str, int]: Variable values. The snapshot already folds attribute bonuses into
+            `initiative_bonus` and `attack_bonus`, so the finer-grained variables count as 0.
+        """
+        return self.formula_values_for(self._get_attack_bonus(combatant), combatant.initiative_bonus)
+
+    @staticmethod
+    def formula_values_for(attack_bonus: int, initiative_bonus: int = 0) -> Dict[str, int]:
         """
-        self.equipment_manager = EquipmentManager()
+        Maps the variables of the combat rules formulas to raw bonuses.
+
+        Args:
+            attack_bonus (int): Attack bonus (weapon skill and damage modifier).
+            initiative_bonus (int): Initiative bonus.
+
+        Returns:
+            Dict[str, int]: Variable values for `CompiledFormula.evaluate`.
+        """
+        return {
+            "agility_bonus": initiative_bonus,
+            "weapon_skill": attack_bonus,
+            "strength_bonus": attack_bonus,
+        }
 
     def start_combat(self, participants_data: List[Dict[str, Any]], session_service: Any = None) -> CombatState:
         """
         Initializes a new combat state with the given participants.
 
         Purpose:
-            Creates a new combat session, generates participants (including NPCs with default equipment),
+            Creates a new combat session, generates participants (NPCs are cloned from the archetype catalog),
             and rolls initial initiative.
 
         Args:
             participants_data (List[Dict[str, Any]]): A list of dictionaries containing participant data.
-                Each dict should contain keys like 'name', 'camp', 'hp', etc.
+                Each dict should contain keys like 'name', 'camp', 'hp', etc. An NPC entry with
+                'count' > 1 spawns that many clones named 'Name #1', 'Name #2'...
             session_service (Any, optional): The GameSessionService instance to access player character data.
                 Defaults to None.
 
@@ -40,36 +95,40 @@ class CombatService:
             CombatState: The newly created and initialized combat state.
         """
         participants = []
-        for p_data in participants_data:
+        for p_data in self._expand_participants(participants_data):
             # Determine type
             is_player = p_data.get('camp') == 'player' or p_data.get('is_player', False)
             c_type = CombatantType.PLAYER if is_player else CombatantType.NPC
-            
-            character_ref = None
-            npc_ref = None
+            name = p_data.get('name', p_data.get('nom', 'Unknown'))
 
+            # Snapshot the combat numbers of the referenced entity; the entity itself stays in the resolver cache
+            snapshot: Dict[str, Any] = {}
             if c_type == CombatantType.PLAYER:
-                if session_service and session_service.character_data:
-                    character_ref = session_service.character_data
-                elif p_data.get('character'):
-                     character_ref = p_data.get('character')
+                character = self._get_session_character(session_service) or p_data.get('character')
+                if character:
+                    self.resolver.register_character(character)
+                    snapshot = Combatant.snapshot_from_character(character)
             else:
-                if p_data.get('npc'):
-                    npc_ref = p_data.get('npc')
-                else:
-                    # Generate NPC with equipment
-                    npc_ref = self._create_npc_with_equipment(p_data.get('name', p_data.get('nom', 'Unknown')), p_data)
+                npc = p_data.get('npc') or self._create_npc(name, p_data)
+                self.resolver.register_npc(npc)
+                snapshot = Combatant.snapshot_from_npc(npc)
+
+            # Explicit participant data overrides the entity snapshot
+            for data_key, field_name in (('hp', 'current_hit_points'), ('max_hp', 'max_hit_points'), ('ac', 'armor_class')):
+                if p_data.get(data_key) is not None:
+                    snapshot[field_name] = p_data[data_key]
+            if 'max_hit_points' not in snapshot and 'current_hit_points' in snapshot:
+                snapshot['max_hit_points'] = snapshot['current_hit_points']
+            snapshot.setdefault('current_hit_points', 10)
+            snapshot.setdefault('max_hit_points', 10)
+            snapshot.setdefault('armor_class', 10)
 
             combatant = Combatant(
                 id=UUID(str(p_data.get('id'))) if p_data.get('id') else uuid4(),
-                name=p_data.get('name', p_data.get('nom', 'Unknown')),
+                name=name,
                 type=c_type,
-                current_hit_points=p_data.get('hp', 10),
-                max_hit_points=p_data.get('max_hp', p_data.get('hp', 10)),
-                armor_class=p_data.get('ac', 10),
                 initiative_roll=p_data.get('initiative', 0),
-                character_ref=character_ref,
-                npc_ref=npc_ref
+                **snapshot
             )
             participants.append(combatant)
 
@@ -84,13 +143,68 @@ class CombatService:
         
         return state
 
-    def _create_npc_with_equipment(self, name: str, data: Dict[str, Any]) -> NPC:
+    @staticmethod
+    def _expand_participants(participants_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Expands participant entries carrying a 'count' into individual entries.
+
+        Args:
+            participants_data (List[Dict[str, Any]]): Raw participant entries.
+
+        Returns:
+            List[Dict[str, Any]]: One entry per combatant. Expanded entries drop any shared 'id'.
+        """
+        expanded: List[Dict[str, Any]] = []
+        for p_data in participants_data:
+            count = int(p_data.get('count') or 1)
+            if count <= 1:
+                expanded.append(p_data)
+                continue
+            name = p_data.get('name', p_data.get('nom', 'Unknown'))
+            for number in range(1, count + 1):
+                clone = {k: v for k, v in p_data.items() if k not in ('count', 'id', 'nom')}
+                clone['name'] = f"{name} #{number}"
+                expanded.append(clone)
+        return expanded
+
+    @staticmethod
+    def _get_session_character(session_service: Any) -> Optional[Character]:
+        """
+        Returns the player character loaded by the session, if any.
+
+        Args:
+            session_service (Any): The GameSessionService instance (or None).
+
+        Returns:
+            Optional[Character]: The session's character, or None.
+        """
+        character_service = getattr(session_service, 'character_service', None) if session_service else None
+        character = getattr(character_service, 'character_data', None)
+        return character if isinstance(character, Character) else None
+
+    def resolve_entity(self, combatant: Combatant) -> Optional[Union[Character, NPC]]:
         """
-        Creates an NPC and assigns default equipment based on archetype/data.
+        Resolves the full Character or NPC behind a reference-only combatant.
 
         Purpose:
-            Generates a fully populated NPC object with stats and equipment suitable for combat,
-            handling cases where explicit NPC data is missing.
+            Combatants only keep the numbers combat resolution needs. Callers that need
+            the full entity (inventory, skills, spells) fetch it here, from the resolver cache.
+
+        Args:
+            combatant (Combatant): The combatant to resolve.
+
+        Returns:
+            Optional[Union[Character, NPC]]: The referenced entity, or None if unavailable.
+        """
+        return self.resolver.resolve(combatant)
+
+    def _create_npc(self, name: str, data: Dict[str, Any]) -> NPC:
+        """
+        Creates a combat NPC from the archetype catalog.
+
+        Purpose:
+            Clones the precompiled template of the matching archetype, applying the
+            explicit values of the participant data (hp, max_hp, ac, attack_bonus, level).
 
         Args:
             name (str): The name of the NPC.
@@ -99,69 +213,14 @@ class CombatService:
         Returns:
             NPC: The constructed NPC object with equipment.
         """
-        archetype = data.get('archetype', 'Generic Enemy')
-        
-        # Default stats
-        stats = Stats(strength=10, constitution=10, agility=10, intelligence=10, wisdom=10, charisma=10)
-        
-        # Default equipment generation logic
-        equipment = Equipment()
-        
-        # Simple logic to assign weapons based on name/archetype
-        if "goblin" in name.lower() or "goblin" in archetype.lower():
-            self._add_item_to_equipment(equipment, "weapon_scimitar", "weapons")
-            self._add_item_to_equipment(equipment, "armor_leather", "armor")
-        elif "orc" in name.lower() or "orc" in archetype.lower():
-            self._add_item_to_equipment(equipment, "weapon_greataxe", "weapons")
-            self._add_item_to_equipment(equipment, "armor_hide", "armor")
-        elif "skeleton" in name.lower():
-            self._add_item_to_equipment(equipment, "weapon_shortsword", "weapons")
-        elif "archer" in name.lower() or "bandit" in name.lower():
-             self._add_item_to_equipment(equipment, "weapon_shortbow", "weapons")
-             self._add_item_to_equipment(equipment, "armor_leather", "armor")
-        else:
-            # Fallback weapon
-            self._add_item_to_equipment(equipment, "weapon_natural", "weapons")
-
-        return NPC(
-            name=name,
-            archetype=archetype,
-            stats=stats,
-            skills=Skills(),
-            equipment=equipment,
-            combat_stats=CombatStats(
-                max_hit_points=data.get('max_hp', 10), 
-                current_hit_points=data.get('hp', 10), 
-                armor_class=data.get('ac', 10), 
-                attack_bonus=data.get('attack_bonus', 2)
-            ),
-            spells=Spells()
-        )
-
-    def _add_item_to_equipment(self, equipment: Equipment, item_id: str, category_list: str):
-        item_data = self.equipment_manager.get_equipment_by_id(item_id)
-        if item_data:
-            item = self._dict_to_equipment_item(item_data)
-            if category_list == "weapons":
-                equipment.weapons.append(item)
-            elif category_list == "armor":
-                equipment.armor.append(item)
-
-    def _dict_to_equipment_item(self, data: Dict[str, Any]) -> EquipmentItem:
-         return EquipmentItem(
-            id=str(uuid4()),
-            name=data['name'],
-            category=data.get('category', 'misc'),
-            cost_gold=data.get('cost_gold', 0),
-            cost_silver=data.get('cost_silver', 0),
-            cost_copper=data.get('cost_copper', 0),
-            weight=float(data.get('weight', 0)),
-            quantity=1,
-            equipped=True,
-            damage=data.get('damage'),
-            range=data.get('range'),
-            protection=int(data.get('protection', 0)) if data.get('protection') else None,
-            type=data.get('type')
+        return self.npc_archetypes.create_npc(
+            name,
+            archetype=data.get('archetype'),
+            hp=data.get('hp'),
+            max_hp=data.get('max_hp'),
+            ac=data.get('ac'),
+            attack_bonus=data.get('attack_bonus'),
+            level=data.get('level'),
         )
 
     def roll_initiative(self, state: CombatState) -> CombatState:
@@ -169,7 +228,7 @@ class CombatService:
         Rolls initiative for all participants and sets the turn order.
 
         Purpose:
-            Calculates initiative for every participant based on their stats and a d20 roll,
+            Evaluates the initiative formula of the combat rules for every participant,
             then sorts them to determine the turn order.
 
         Args:
@@ -178,19 +237,13 @@ class CombatService:
         Returns:
             CombatState: The updated combat state with assigned initiative rolls and turn order.
         """
+        formula = self.rules.initiative
         for p in state.participants:
-            # Get initiative bonus
-            bonus = 0
-            if p.character_ref:
-                bonus = p.character_ref.calculate_initiative()
-            elif p.npc_ref:
-                # Simplified NPC initiative (usually just Dex mod, here 0 or from data)
-                bonus = 0 
-            
-            roll = random.randint(1, 20)
-            total = roll + bonus
+            # Initiative bonus is snapshotted on the combatant at combat start
+            dice = formula.roll_dice()
+            total = formula.evaluate(self._formula_values(p), dice)
             p.initiative_roll = total
-            state.add_log_entry(f"{p.name} rolled {total} ({roll}+{bonus}) for initiative.")
+            state.add_log_entry(f"{p.name} rolled {total} ({'+'.join(map(str, dice))}+{total - sum(dice)}) for initiative.")
 
         # Sort participants by initiative (descending)
         sorted_participants = sorted(state.participants, key=lambda p: p.initiative_roll, reverse=True)
@@ -211,20 +264,14 @@ class CombatService:
 
         Args:
             state (CombatState): The current combat state.
-            attacker_id (str): The UUID string of the attacking combatant.
-            target_id (str): The UUID string of the target combatant.
+            attacker_id (str): The UUID string or short alias (e.g. 'P1') of the attacking combatant.
+            target_id (str): The UUID string or short alias (e.g. 'E2') of the target combatant.
 
         Returns:
             Tuple[CombatState, str]: A tuple containing the updated combat state and a narrative result message.
         """
-        try:
-            attacker_uuid = UUID(attacker_id)
-            target_uuid = UUID(target_id)
-        except ValueError:
-            return state, "Invalid ID format."
-
-        attacker = state.get_combatant(attacker_uuid)
-        target = state.get_combatant(target_uuid)
+        attacker = state.find_combatant(attacker_id)
+        target = state.find_combatant(target_id)
 
         if not attacker or not target:
             return state, "Attacker or Target not found."
@@ -232,46 +279,48 @@ class CombatService:
         if not attacker.is_alive():
             return state, f"{attacker.name} is unconscious and cannot attack."
 
+        rules = self.rules
+
         # 1. Get Weapon and Bonuses
         weapon = self._get_equipped_weapon(attacker)
-        attack_bonus = self._get_attack_bonus(attacker)
-        
+        attacker_values = self._formula_values(attacker)
+
         weapon_name = weapon.get("name", "Unarmed Strike")
         damage_dice = weapon.get("damage", "1")
 
-        # 2. Attack Roll
-        d20 = random.randint(1, 20)
-        total_attack = d20 + attack_bonus
-        
-        is_crit = d20 == 20
-        is_auto_miss = d20 == 1
-        
-        log_msg = f"{attacker.name} attacks {target.name} with {weapon_name}. Roll: {d20} + {attack_bonus} = {total_attack} vs AC {target.armor_class}."
-        
+        # 2. Attack Roll (the natural roll of the first dice term decides criticals and fumbles)
+        dice = rules.attack_roll.roll_dice()
+        natural = dice[0] if dice else 0
+        total_attack = rules.attack_roll.evaluate(attacker_values, dice)
+        defense = target.armor_class + target.defense_bonus
+
+        is_crit = rules.is_critical(natural)
+        is_auto_miss = rules.is_fumble(natural)
+
         # 3. Resolve Hit
-        hits = (total_attack >= target.armor_class and not is_auto_miss) or is_crit
-        
+        hits = (total_attack >= defense and not is_auto_miss) or is_crit
+
         result_msg = ""
         if hits:
             # 4. Roll Damage
-            damage = roll_dice(damage_dice)
+            weapon_damage = roll_dice(damage_dice)
             if is_crit:
-                damage += roll_dice(damage_dice) # Simple crit: roll twice
-                log_msg += " CRITICAL HIT!"
-            
-            # Add ability mod to damage (simplified: same as attack bonus for now, or 0)
-            damage_mod = attack_bonus # Often Str/Dex mod is added
-            total_damage = max(1, damage + damage_mod)
-            
+                weapon_damage = rules.critical_weapon_damage(weapon_damage)
+            total_damage = max(1, rules.damage.evaluate({**attacker_values, "weapon_damage": weapon_damage}, ()))
+
             # 5. Apply Damage
             state = self.apply_direct_damage(state, target_id, total_damage, is_attack=True)
-            
+
             result_msg = f"Hit! {attacker.name} deals {total_damage} damage to {target.name}."
+            if is_crit:
+                result_msg = "Critical hit! " + result_msg
             if not target.is_alive():
                 result_msg += f" {target.name} is defeated!"
         else:
             result_msg = f"Miss! {attacker.name} missed {target.name}."
-            state.add_log_entry(f"{attacker.name} missed {target.name} with {weapon_name}.")
+            if is_auto_miss:
+                result_msg = f"Fumble! {attacker.name} missed {target.name}."
+            state.add_log_entry(f"{attacker.name} missed {target.name} with {weapon_name} ({total_attack} vs AC {defense}).")
 
         return state, result_msg
 
@@ -280,8 +329,8 @@ class CombatService:
         Retrieves the equipped weapon for a combatant.
 
         Purpose:
-            Helper method to find the active weapon for a combatant, falling back to an unarmed strike
-            if no weapon is equipped.
+            Helper method to read the weapon snapshotted on the combatant at combat start
+            (an unarmed strike if the entity had no weapon).
 
         Args:
             combatant (Combatant): The combatant to check.
@@ -289,28 +338,14 @@ class CombatService:
         Returns:
             Dict[str, Any]: A dictionary representing the weapon (name, damage, type).
         """
-        equipment = None
-        if combatant.character_ref:
-            equipment = combatant.character_ref.equipment
-        elif combatant.npc_ref:
-            equipment = combatant.npc_ref.equipment
-            
-        if equipment and equipment.weapons:
-            # TODO: Check for 'equipped' flag. For now, take the first one.
-            # In a real implementation, we would filter by w.get('equipped', True)
-            weapon = equipment.weapons[0]
-            if isinstance(weapon, EquipmentItem):
-                return weapon.model_dump()
-            return weapon
-            
-        return {"name": "Unarmed Strike", "damage": "1", "type": "melee"}
+        return {"name": combatant.weapon_name, "damage": combatant.weapon_damage}
 
     def _get_attack_bonus(self, combatant: Combatant) -> int:
         """
         Calculates the attack bonus for a combatant.
 
         Purpose:
-            Helper method to retrieve the attack bonus from the underlying character or NPC reference.
+            Helper method to retrieve the attack bonus snapshotted from the underlying character or NPC.
 
         Args:
             combatant (Combatant): The combatant to check.
@@ -318,11 +353,136 @@ class CombatService:
         Returns:
             int: The calculated attack bonus.
         """
-        if combatant.character_ref:
-            return combatant.character_ref.combat_stats.attack_bonus
-        elif combatant.npc_ref:
-            return combatant.npc_ref.combat_stats.attack_bonus
-        return 0
+        return combatant.attack_bonus
+
+    def defend(self, state: CombatState, combatant_id: str) -> Tuple[CombatState, str]:
+        """
+        Applies the defend action to a combatant.
+
+        Purpose:
+            Grants the Armor Class bonus of the 'defend' action of the combat rules until
+            the combatant's next turn.
+
+        Args:
+            state (CombatState): The current combat state.
+            combatant_id (str): The UUID string or short alias of the defending combatant.
+
+        Returns:
+            Tuple[CombatState, str]: The updated combat state and a result message.
+        """
+        combatant = state.find_combatant(combatant_id)
+        if not combatant:
+            return state, "Combatant not found."
+        if not combatant.is_alive():
+            return state, f"{combatant.name} is unconscious and cannot defend."
+
+        bonus = self.rules.action_bonus("defend")
+        combatant.defense_bonus = bonus
+        state.add_log_entry(f"{combatant.name} takes a defensive stance (+{bonus} AC until next turn).")
+        return state, f"{combatant.name} defends: +{bonus} AC until their next turn."
+
+    def cast_spell(self, state: CombatState, caster_id: str, spell_name: str,
+                   target_ids: Optional[List[str]] = None) -> Tuple[CombatState, Dict[str, Any]]:
+        """
+        Casts a spell from the catalog: checks and spends mana, then resolves its effect.
+
+        Purpose:
+            Resolves a whole spell action locally. Damage spells roll their dice and hit one
+            target (every given target for area spells); heal spells restore a share of the
+            target's max HP (the caster by default). Spells without a mechanical effect only
+            spend mana and are left to the narration. Casters with a known spell list can only
+            cast spells from it.
+
+        Args:
+            state (CombatState): The current combat state.
+            caster_id (str): The UUID string or short alias of the caster.
+            spell_name (str): Name of the spell (case insensitive).
+            target_ids (Optional[List[str]]): UUID strings or aliases of the targets.
+
+        Returns:
+            Tuple[CombatState, Dict[str, Any]]: The updated state and the result ('success',
+            'message', 'spell', 'cost', 'caster_mana' and one 'effects' entry per affected target).
+        """
+        def failure(message: str) -> Tuple[CombatState, Dict[str, Any]]:
+            return state, {"success": False, "message": message, "effects": []}
+
+        caster = state.find_combatant(caster_id)
+        if not caster:
+            return failure("Caster not found.")
+        if not caster.is_alive():
+            return failure(f"{caster.name} is unconscious and cannot cast spells.")
+
+        spell = self.spells.get_spell(spell_name)
+        if spell is None:
+            suggestions = self.spells.suggest(spell_name)
+            hint = f" Did you mean: {', '.join(suggestions)}?" if suggestions else ""
+            return failure(f"Unknown spell '{spell_name}'.{hint}")
+
+        entity = self.resolve_entity(caster)
+        known = [self.spells.normalize(name) for name in entity.spells.known_spells] if entity else []
+        if known and self.spells.normalize(spell.name) not in known:
+            return failure(f"{caster.name} does not know {spell.name}.")
+        if caster.current_mana_points < spell.power_cost:
+            return failure(
+                f"{caster.name} lacks the mana to cast {spell.name} "
+                f"({caster.current_mana_points}/{spell.power_cost} MP)."
+            )
+
+        targets: List[Combatant] = []
+        for target_id in target_ids or []:
+            target = state.find_combatant(target_id)
+            if target is None:
+                return failure(f"Target '{target_id}' not found.")
+            targets.append(target)
+        effect = spell.effect
+        if effect and effect.type == "heal" and not targets:
+            targets = [caster]
+        if effect and effect.type == "damage" and not targets:
+            return failure(f"{spell.name} needs a target.")
+        if effect and not effect.area:
+            targets = targets[:1]
+
+        caster.current_mana_points -= spell.power_cost
+        state.add_log_entry(f"{caster.name} casts {spell.name} ({spell.power_cost} MP).")
+
+        effects: List[Dict[str, Any]] = []
+        aliases = state.get_aliases()
+        for target in targets if effect else []:
+            if effect.type == "damage":
+                amount = roll_dice(effect.dice or "1")
+                state = self.apply_direct_damage(state, str(target.id), amount)
+            else:
+                amount = target.heal(max(1, target.max_hit_points * (effect.percent or 0) // 100))
+                state.add_log_entry(f"{target.name} recovers {amount} HP. HP: {target.current_hit_points}/{target.max_hit_points}")
+                if target.type == CombatantType.PLAYER and target is not caster:
+                    self._sync_player_hp(target)
+            effects.append({
+                "target": aliases.get(target.id),
+                "target_name": target.name,
+                "type": effect.type,
+                "amount": amount,
+                "target_hp": target.current_hit_points,
+                "defeated": not target.is_alive(),
+            })
+
+        if caster.type == CombatantType.PLAYER:
+            self._sync_player_hp(caster)
+
+        if effects:
+            verb = "deals" if effect.type == "damage" else "restores"
+            details = ", ".join(f"{e['amount']} to {e['target_name']}" for e in effects)
+            message = f"{caster.name} casts {spell.name} and {verb} {details}."
+        else:
+            message = f"{caster.name} casts {spell.name}: {spell.description}"
+        return state, {
+            "success": True,
+            "message": message,
+            "spell": spell.name,
+            "sphere": spell.sphere,
+            "cost": spell.power_cost,
+            "caster_mana": caster.current_mana_points,
+            "effects": effects,
+        }
 
     def apply_direct_damage(self, state: CombatState, target_id: str, amount: int, is_attack: bool = False) -> CombatState:
         """
@@ -334,42 +494,39 @@ class CombatService:
 
         Args:
             state (CombatState): The current combat state.
-            target_id (str): The UUID string of the target combatant.
+            target_id (str): The UUID string or short alias of the target combatant.
             amount (int): The amount of damage to apply.
             is_attack (bool, optional): Whether the damage is from an attack (affects logging). Defaults to False.
 
         Returns:
             CombatState: The updated combat state.
         """
-        try:
-            target_uuid = UUID(target_id)
-            combatant = state.get_combatant(target_uuid)
-            if combatant:
-                actual_damage = combatant.take_damage(amount)
-                source_str = "Attack" if is_attack else "Effect"
-                state.add_log_entry(f"{combatant.name} took {actual_damage} damage ({source_str}). HP: {combatant.current_hit_points}/{combatant.max_hit_points}")
-                
-                if not combatant.is_alive():
-                    state.add_log_entry(f"{combatant.name} has been defeated!")
-
-                # IMMEDIATE SYNC FOR PLAYERS
-                if combatant.type == CombatantType.PLAYER and combatant.character_ref:
-                    self._sync_player_hp(combatant)
-                
-                # TODO: Implement Status Effects (e.g., Poison, Stun) here.
-                # Future improvement: Add a 'status_effects' list to Combatant and process them.
+        combatant = state.find_combatant(target_id)
+        if combatant:
+            actual_damage = combatant.take_damage(amount)
+            source_str = "Attack" if is_attack else "Effect"
+            state.add_log_entry(f"{combatant.name} took {actual_damage} damage ({source_str}). HP: {combatant.current_hit_points}/{combatant.max_hit_points}")
+            
+            if not combatant.is_alive():
+                state.add_log_entry(f"{combatant.name} has been defeated!")
 
-        except ValueError:
-            log_debug(f"Invalid UUID for target_id: {target_id}")
+            # IMMEDIATE SYNC FOR PLAYERS
+            if combatant.type == CombatantType.PLAYER and combatant.character_id:
+                self._sync_player_hp(combatant)
+            
+            # TODO: Implement Status Effects (e.g., Poison, Stun) here.
+            # Future improvement: Add a 'status_effects' list to Combatant and process them.
+        else:
+            log_debug(f"Unknown target for direct damage: {target_id}")
         return state
 
     def _sync_player_hp(self, combatant: Combatant) -> None:
         """
-        Synchronizes the combatant's HP back to the persistent Character storage.
+        Synchronizes the combatant's HP and mana back to the persistent Character storage.
 
         Purpose:
-            Ensures that damage taken during combat is immediately reflected in the player's
-            persistent character record to prevent data loss.
+            Ensures that damage taken and mana spent during combat are immediately reflected
+            in the player's persistent character record to prevent data loss.
 
         Args:
             combatant (Combatant): The combatant (must be a player) to sync.
@@ -378,24 +535,26 @@ class CombatService:
             None
         """
         try:
-            if not combatant.character_ref:
+            if not combatant.character_id:
                 return
 
             # Persist via CharacterService
             # We instantiate a fresh service to ensure clean state handling
-            char_service = CharacterService(str(combatant.character_ref.id))
+            char_service = CharacterService(str(combatant.character_id))
             
             # Update the loaded character data with the current combat HP
             # We trust the combat state as the source of truth for HP during combat
             # Ensure we don't exceed max HP (though combat logic should handle this, safety first)
             new_hp = combatant.current_hit_points
             char_service.character_data.combat_stats.current_hit_points = new_hp
+            combat_stats = char_service.character_data.combat_stats
+            combat_stats.current_mana_points = min(combatant.current_mana_points, combat_stats.max_mana_points)
             
             # Save the updated character
             char_service.save_character()
             
-            # Update the local reference to keep it in sync with the "real" character
-            combatant.character_ref = char_service.character_data
+            # Refresh the cached entity to keep it in sync with the "real" character
+            self.resolver.register_character(char_service.character_data)
             
             log_debug(f"Synced HP for player {combatant.name} to {combatant.current_hit_points}")
             
@@ -440,15 +599,18 @@ class CombatService:
         Returns:
             Dict[str, Any]: A dictionary containing the combat summary.
         """
+        aliases = state.get_aliases()
         return {
             "combat_id": str(state.id),
             "round": state.round_number,
             "participants": [
                 {
                     "id": str(p.id),
+                    "alias": aliases[p.id],
                     "name": p.name,
                     "hp": p.current_hit_points,
                     "max_hp": p.max_hit_points,
+                    "mp": p.current_mana_points,
                     "camp": "player" if p.type == CombatantType.PLAYER else "enemy"
                 } for p in state.participants
             ],
@@ -464,6 +626,7 @@ class CombatService:
 
         Purpose:
             Updates the current turn holder, increments the round counter if necessary, and logs the transition.
+            Defeated combatants are skipped.
 
         Args:
             state (CombatState): The current combat state.
@@ -473,28 +636,15 @@ class CombatService:
         """
         if not state.turn_order:
             return state
-            
-        try:
-            if state.current_turn_combatant_id is None:
-                raise ValueError("Current turn combatant ID is None")
 
-            current_idx = state.turn_order.index(state.current_turn_combatant_id)
-            next_idx = (current_idx + 1) % len(state.turn_order)
-            state.current_turn_combatant_id = state.turn_order[next_idx]
-            
-            if next_idx == 0:
-                state.round_number += 1
-                state.add_log_entry(f"Round {state.round_number} started.")
-                
-            next_combatant = state.get_combatant(state.current_turn_combatant_id)
-            if next_combatant:
-                state.add_log_entry(f"It is now {next_combatant.name}'s turn.")
-                
-        except ValueError:
-            # Current combatant not in turn order (maybe died/removed?)
-            if state.turn_order:
-                state.current_turn_combatant_id = state.turn_order[0]
-        
+        next_combatant, new_round = state.advance_turn()
+        if new_round:
+            state.add_log_entry(f"Round {state.round_number} started.")
+        if next_combatant:
+            # Bonuses granted until the next turn (e.g. defend) expire now
+            next_combatant.defense_bonus = 0
+            state.add_log_entry(f"It is now {next_combatant.name}'s turn.")
+
         return state
 
     def check_combat_end(self, state: CombatState) -> bool:
@@ -510,7 +660,119 @@ class CombatService:
         Returns:
             bool: True if the combat should end, False otherwise.
         """
-        players_alive = any(p.type == CombatantType.PLAYER and p.is_alive() for p in state.participants)
-        enemies_alive = any(p.type == CombatantType.NPC and p.is_alive() for p in state.participants)
-        return not players_alive or not enemies_alive
+        return not state.alive_count(CombatantType.PLAYER) or not state.alive_count(CombatantType.NPC)
+
+    def _get_npc_tactic(self, combatant: Combatant) -> str:
+        """
+        Returns the targeting tactic of an NPC based on its catalog archetype (matched on archetype, then name).
+
+        Args:
+            combatant (Combatant): The NPC combatant.
+
+        Returns:
+            str: One of 'weakest', 'strongest', 'easiest' or 'first'.
+        """
+        return self.npc_archetypes.get_tactic(combatant.archetype, combatant.name)
+
+    def choose_npc_target(self, state: CombatState, npc: Combatant) -> Optional[Combatant]:
+        """
+        Picks the target of an NPC deterministically from its archetype tactic.
+
+        Purpose:
+            Applies simple archetype rules so NPC turns can be resolved without an LLM:
+            'weakest' focuses the lowest HP foe, 'strongest' engages the highest HP foe,
+            'easiest' goes for the lowest AC and 'first' attacks the first foe in turn order.
+            Ties are broken by turn order.
 
+        Args:
+            state (CombatState): The current combat state.
+            npc (Combatant): The acting NPC.
+
+        Returns:
+            Optional[Combatant]: The chosen target, or None if no foe is standing.
+        """
+        foes = [
+            p for p in state.participants
+            if p.type != npc.type and p.is_alive()
+        ]
+        if not foes:
+            return None
+        def turn_rank(p: Combatant) -> int:
+            position = state.turn_position(p.id)
+            return position if position is not None else len(state.turn_order)
+
+        foes.sort(key=turn_rank)
+
+        tactic = self._get_npc_tactic(npc)
+        if tactic == "weakest":
+            return min(foes, key=lambda p: p.current_hit_points)
+        if tactic == "strongest":
+            return max(foes, key=lambda p: p.current_hit_points)
+        if tactic == "easiest":
+            return min(foes, key=lambda p: p.armor_class)
+        return foes[0]
+
+    def resolve_npc_turns(self, state: CombatState) -> Tuple[CombatState, List[Dict[str, Any]]]:
+        """
+        Resolves every consecutive NPC turn locally until a player's turn (or the end of combat).
+
+        Purpose:
+            NPC turns do not need an LLM decision: the target is picked by `choose_npc_target`,
+            the attack is resolved with `execute_attack` and the turn is advanced. The agent only
+            receives the batch of results to narrate, instead of one tool round-trip per NPC action.
+
+        Args:
+            state (CombatState): The current combat state.
+
+        Returns:
+            Tuple[CombatState, List[Dict[str, Any]]]: The updated state and one result per NPC action
+            (actor, target, action, round, message).
+        """
+        results: List[Dict[str, Any]] = []
+        aliases = state.get_aliases()
+
+        # From an NPC turn, a full cycle of the turn order always reaches a player (or ends combat)
+        for _ in range(len(state.turn_order)):
+            if not state.is_active or self.check_combat_end(state):
+                break
+            current = state.get_current_combatant()
+            if current is None or current.type != CombatantType.NPC:
+                break
+
+            if current.is_alive():
+                target = self.choose_npc_target(state, current)
+                if target is None:
+                    break
+                state, message = self.execute_attack(state, str(current.id), str(target.id))
+                results.append({
+                    "round": state.round_number,
+                    "actor": aliases.get(current.id),
+                    "actor_name": current.name,
+                    "action": "attack",
+                    "target": aliases.get(target.id),
+                    "target_name": target.name,
+                    "target_hp": target.current_hit_points,
+                    "message": message
+                })
+                if self.check_combat_end(state):
+                    break
+
+            state = self.end_turn(state)
+
+        if results:
+            log_debug("NPC turns resolved locally", action="resolve_npc_turns", count=len(results))
+        return state, results
+
+    def get_end_reason(self, state: CombatState) -> Optional[str]:
+        """
+        Returns why the combat should end, if it should.
+
+        Args:
+            state (CombatState): The current combat state.
+
+        Returns:
+            Optional[str]: 'defeat' if no player is standing, 'victory' if no enemy is standing, None otherwise.
+        """
+        if not self.check_combat_end(state):
+            return None
+        return "victory" if state.alive_count(CombatantType.PLAYER) else "defeat"
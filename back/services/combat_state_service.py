@@ -1,10 +1,12 @@
 from typing import Optional
 from uuid import UUID
 import os
-import json
 from back.models.domain.combat_state import CombatState
 from back.config import get_data_dir
+from back.storage.serialization import dump_model, write_atomic
 from back.utils.logger import log_error
+from back.utils.trusted_load import load_model, trusted_loads
+from back.utils.timing import PHASE_PERSIST, PHASE_SESSION_LOAD, timed
 
 class CombatStateService:
     def _get_file_path(self, session_id: UUID) -> str:
@@ -16,9 +18,10 @@ class CombatStateService:
             return None
         
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            return CombatState.model_validate(data)
+            with timed(PHASE_SESSION_LOAD):
+                with open(file_path, 'rb') as f:
+                    raw = f.read()
+                return load_model(CombatState, raw, file_path)
         except Exception as e:
             log_error(f"Failed to load combat state for session {session_id}", error=str(e))
             return None
@@ -28,8 +31,10 @@ class CombatStateService:
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         
         try:
-            with open(file_path, 'w') as f:
-                f.write(state.model_dump_json(indent=2))
+            with timed(PHASE_PERSIST):
+                raw = dump_model(state)
+                write_atomic(file_path, raw)
+            trusted_loads.remember(file_path, CombatState, raw)
         except Exception as e:
             log_error(f"Failed to save combat state for session {session_id}", error=str(e))
 
@@ -38,6 +43,7 @@ class CombatStateService:
         if os.path.exists(file_path):
             try:
                 os.remove(file_path)
+                trusted_loads.forget(file_path)
             except Exception as e:
                 log_error(f"Failed to delete combat state for session {session_id}", error=str(e))
 
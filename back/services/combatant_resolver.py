@@ -0,0 +1,139 @@
+"""
+Resolver for reference-only combatants.
+Combatants only carry the id of their Character/NPC; this service fetches the
+full entity from an in-process cache when (and only when) it is needed.
+"""
+
+import os
+from collections import OrderedDict
+from typing import Optional, Union
+from uuid import UUID
+
+from back.models.domain.character import Character
+from back.models.domain.combat_state import Combatant, CombatantType
+from back.models.domain.npc import NPC
+from back.services.character_data_service import CharacterDataService
+from back.utils.logger import log_debug
+from back.utils.metrics import record_cache
+
+
+class CombatantResolver:
+    """
+    ### CombatantResolver
+    **Description:** Resolves a `Combatant` to its full `Character` or `NPC`.
+    Characters are loaded through `CharacterDataService` and cached until their file changes.
+    NPCs only live in memory: they are registered when a combat starts and kept in a bounded LRU.
+
+    **Attributes:**
+    - `data_service` (CharacterDataService): Persistence service used to load characters.
+    - `max_entries` (int): Maximum number of cached entities per kind.
+    """
+
+    DEFAULT_MAX_ENTRIES = 512
+
+    def __init__(self, data_service: Optional[CharacterDataService] = None, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        ### __init__
+        **Description:** Initializes empty character and NPC caches.
+        **Parameters:**
+        - `data_service` (Optional[CharacterDataService]): Injected data service. If None, creates a new instance.
+        - `max_entries` (int): Maximum number of cached entities per kind.
+        """
+        self.data_service = data_service if data_service else CharacterDataService()
+        self.max_entries = max_entries
+        # character_id -> (file mtime when cached, Character)
+        self._characters: "OrderedDict[str, tuple[float, Character]]" = OrderedDict()
+        self._npcs: "OrderedDict[str, NPC]" = OrderedDict()
+
+    def _character_mtime(self, character_id: str) -> Optional[float]:
+        try:
+            return os.path.getmtime(self.data_service._get_character_file_path(character_id))
+        except (OSError, ValueError):
+            return None
+
+    def _remember(self, cache: OrderedDict, key: str, value) -> None:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.max_entries:
+            cache.popitem(last=False)
+
+    def register_character(self, character: Character) -> None:
+        """
+        ### register_character
+        **Description:** Caches a character that is already loaded in memory.
+        **Parameters:**
+        - `character` (Character): The character to cache.
+        """
+        character_id = str(character.id)
+        self._remember(self._characters, character_id, (self._character_mtime(character_id) or 0.0, character))
+
+    def register_npc(self, npc: NPC) -> None:
+        """
+        ### register_npc
+        **Description:** Caches an NPC so that combatants referencing it can be resolved.
+        **Parameters:**
+        - `npc` (NPC): The NPC to cache.
+        """
+        self._remember(self._npcs, str(npc.id), npc)
+
+    def resolve_character(self, character_id: Union[str, UUID]) -> Optional[Character]:
+        """
+        ### resolve_character
+        **Description:** Returns the full character, reloading it only if its file changed since it was cached.
+        **Parameters:**
+        - `character_id` (str | UUID): Character identifier.
+        **Returns:** The Character, or None if it cannot be found.
+        """
+        key = str(character_id)
+        mtime = self._character_mtime(key)
+        cached = self._characters.get(key)
+        if cached and (mtime is None or cached[0] >= mtime):
+            record_cache("combatant_character", True)
+            self._characters.move_to_end(key)
+            return cached[1]
+        record_cache("combatant_character", False)
+
+        try:
+            character = self.data_service.load_character(key)
+        except (FileNotFoundError, ValueError) as e:
+            log_debug("Unable to resolve character", action="resolve_character", character_id=key, error=str(e))
+            return cached[1] if cached else None
+
+        self._remember(self._characters, key, (mtime or 0.0, character))
+        return character
+
+    def resolve_npc(self, npc_id: Union[str, UUID]) -> Optional[NPC]:
+        """
+        ### resolve_npc
+        **Description:** Returns the cached NPC.
+        **Parameters:**
+        - `npc_id` (str | UUID): NPC identifier.
+        **Returns:** The NPC, or None if it is not (or no longer) cached.
+        """
+        key = str(npc_id)
+        npc = self._npcs.get(key)
+        if npc is not None:
+            self._npcs.move_to_end(key)
+        return npc
+
+    def resolve(self, combatant: Combatant) -> Optional[Union[Character, NPC]]:
+        """
+        ### resolve
+        **Description:** Returns the full entity referenced by a combatant.
+        **Parameters:**
+        - `combatant` (Combatant): The reference-only combatant.
+        **Returns:** The Character or NPC, or None if it cannot be resolved.
+        """
+        if combatant.type == CombatantType.PLAYER and combatant.character_id:
+            return self.resolve_character(combatant.character_id)
+        if combatant.type == CombatantType.NPC and combatant.npc_id:
+            return self.resolve_npc(combatant.npc_id)
+        return None
+
+    def clear(self) -> None:
+        """
+        ### clear
+        **Description:** Drops every cached entity.
+        """
+        self._characters.clear()
+        self._npcs.clear()
@@ -4,22 +4,31 @@ Handles loading and saving of history, as well as character and scenario data.
 Refactored to use specialized services (Phase 3).
 """
 
+import asyncio
 import os
+import logging
 import pathlib
 from typing import Dict, Any, Optional, List
 from uuid import UUID, uuid4
 
 from pydantic_ai import ModelMessage
+from pydantic_ai.messages import ModelResponse
 
 from back.models.domain.character import Character
+from back.models.domain.combat_state import CombatState
 from back.models.enums import CharacterStatus
 from back.services.character_data_service import CharacterDataService
 from back.services.character_service import CharacterService
 from back.dependencies import global_container
 from back.services.equipment_service import EquipmentService
 from back.storage.pydantic_jsonl_store import PydanticJsonlStore
-from back.config import get_data_dir
-from back.utils.logger import log_debug, log_warning
+from back.storage.serialization import dump_data, dump_model, write_atomic
+from back.config import get_data_dir, get_llm_config
+from back.utils.file_lock import file_lock
+from back.utils.logger import log_debug, log_warning, logger
+from back.utils.timing import PHASE_PERSIST, timed
+from back.models.domain.usage import TurnUsage, UsageRollup
+from back.utils.combat_renderer import render_combat_state
 from back.agents.PROMPT import build_system_prompt
 from back.utils.exceptions import (
     ServiceNotInitializedError,
@@ -32,6 +41,49 @@ from back.utils.exceptions import (
 HISTORY_NARRATIVE = "narrative"
 HISTORY_COMBAT = "combat"
 
+# Token usage ledger (per session) and its rollups (per session, and global in the data directory)
+USAGE_LEDGER_FILE = "usage_ledger.jsonl"
+USAGE_ROLLUP_FILE = "usage_rollup.json"
+
+
+def _read_usage_rollup(path: str) -> Optional[UsageRollup]:
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        return UsageRollup.model_validate_json(f.read())
+
+
+def _rebuild_usage_rollup(ledger_path: str, scenario: str) -> UsageRollup:
+    rollup = UsageRollup()
+    if os.path.exists(ledger_path):
+        with open(ledger_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    rollup.add(TurnUsage.model_validate_json(line), scenario)
+    return rollup
+
+
+def _record_session_usage(ledger_path: str, rollup_path: str, turn: TurnUsage, scenario: str) -> None:
+    # The ledger append and the rollup update share the lock: a missing rollup is rebuilt from the ledger,
+    # which then already holds this turn, and no concurrent turn is counted twice
+    with open(ledger_path, 'a', encoding='utf-8') as ledger, file_lock(f"{rollup_path}.lock"):
+        ledger.write(turn.model_dump_json() + "\n")
+        ledger.flush()
+        rollup = _read_usage_rollup(rollup_path)
+        if rollup is None:
+            rollup = _rebuild_usage_rollup(ledger_path, scenario)
+        else:
+            rollup.add(turn, scenario)
+        write_atomic(rollup_path, dump_model(rollup))
+
+
+def _add_to_usage_rollup(path: str, turn: TurnUsage, scenario: str) -> None:
+    # Read-modify-write under a file lock: the global rollup is shared by every worker process
+    with file_lock(f"{path}.lock"):
+        rollup = _read_usage_rollup(path) or UsageRollup()
+        rollup.add(turn, scenario)
+        write_atomic(path, dump_model(rollup))
+
 
 class GameSessionService:
     """
@@ -497,11 +549,9 @@ class GameSessionService:
         
         **Returns:** None.
         """
-        import json
-        import aiofiles
         state_path = os.path.join(get_data_dir(), "sessions", self.session_id, "game_state.json")
-        async with aiofiles.open(state_path, 'w', encoding='utf-8') as f:
-            await f.write(json.dumps(game_state.model_dump(), ensure_ascii=False, indent=2))
+        with timed(PHASE_PERSIST):
+            await asyncio.to_thread(write_atomic, state_path, dump_data(game_state.model_dump()))
 
     async def load_game_state(self) -> Optional[Any]:
         """
@@ -522,6 +572,92 @@ class GameSessionService:
             return GameState(**data)
         return None
 
+    def _usage_ledger_path(self) -> str:
+        return os.path.join(get_data_dir(), "sessions", self.session_id, USAGE_LEDGER_FILE)
+
+    def _usage_rollup_path(self) -> str:
+        return os.path.join(get_data_dir(), "sessions", self.session_id, USAGE_ROLLUP_FILE)
+
+    async def record_turn_usage(self, mode: str, result: Any, latency_seconds: float,
+                                summary_usage: Optional[Any] = None) -> Optional[TurnUsage]:
+        """
+        ### record_turn_usage
+        **Description:** Appends the usage of a turn's agent run to the session ledger (`usage_ledger.jsonl`)
+        and adds it to the session and global rollups. The rollups are updated under a file lock, so that
+        concurrent turns and worker processes cannot drop updates; a missing session rollup is rebuilt from
+        the ledger. A ledger failure is logged and never fails the turn.
+
+        **Parameters:**
+        - `mode` (str): Session mode of the turn (HISTORY_NARRATIVE or HISTORY_COMBAT).
+        - `result` (AgentRunResult): Result of the agent run (`usage()`, `new_messages()`).
+        - `latency_seconds` (float): Duration of the agent run.
+        - `summary_usage` (Optional[SummaryUsage]): Tokens used by the history summarization during the run.
+
+        **Returns:**
+        - `Optional[TurnUsage]`: The recorded entry, or None if it could not be recorded.
+        """
+        try:
+            usage = result.usage()
+            model = next((message.model_name for message in reversed(result.new_messages())
+                          if isinstance(message, ModelResponse) and message.model_name), None)
+            turn = TurnUsage(
+                mode=mode,
+                model=model or get_llm_config().model,
+                requests=int(getattr(usage, "requests", 0) or 0),
+                input_tokens=int(getattr(usage, "input_tokens", 0) or 0),
+                output_tokens=int(getattr(usage, "output_tokens", 0) or 0),
+                summary_input_tokens=summary_usage.input_tokens if summary_usage else 0,
+                summary_output_tokens=summary_usage.output_tokens if summary_usage else 0,
+                latency_ms=round(latency_seconds * 1000.0, 3),
+            )
+            # Locked file updates, off the event loop (the lock may wait for another worker)
+            await asyncio.to_thread(_record_session_usage, self._usage_ledger_path(), self._usage_rollup_path(),
+                                    turn, self.scenario_id)
+            await asyncio.to_thread(_add_to_usage_rollup, os.path.join(get_data_dir(), USAGE_ROLLUP_FILE),
+                                    turn, self.scenario_id)
+            return turn
+        except Exception as e:
+            log_warning("Unable to record turn usage", action="record_turn_usage",
+                        session_id=self.session_id, error=str(e))
+            return None
+
+    def get_usage(self) -> UsageRollup:
+        """
+        ### get_usage
+        **Description:** Token usage totals of the session, read from its rollup (rebuilt from the ledger
+        if the rollup is missing).
+
+        **Returns:**
+        - `UsageRollup`: Totals, by mode, model and scenario (empty if no turn was recorded).
+        """
+        rollup_path = self._usage_rollup_path()
+        rollup = _read_usage_rollup(rollup_path)
+        if rollup is not None:
+            return rollup
+
+        ledger_path = self._usage_ledger_path()
+        if not os.path.exists(ledger_path):
+            return UsageRollup()
+        with file_lock(f"{rollup_path}.lock"):
+            # A turn may have rebuilt it while we waited for the lock
+            rollup = _read_usage_rollup(rollup_path)
+            if rollup is None:
+                rollup = _rebuild_usage_rollup(ledger_path, self.scenario_id)
+                write_atomic(rollup_path, dump_model(rollup))
+        return rollup
+
+    @staticmethod
+    def get_global_usage() -> UsageRollup:
+        """
+        ### get_global_usage
+        **Description:** Token usage totals of all the turns recorded on this data directory, by mode,
+        model and scenario (deleted sessions included).
+
+        **Returns:**
+        - `UsageRollup`: The global rollup (empty if no turn was recorded).
+        """
+        return _read_usage_rollup(os.path.join(get_data_dir(), USAGE_ROLLUP_FILE)) or UsageRollup()
+
     async def build_narrative_system_prompt(self, language: str = "English") -> str:
         """
         ### build_narrative_system_prompt
@@ -544,7 +680,7 @@ class GameSessionService:
 
         return prompt + f"\n\nCHARACTER INFORMATION:\n{character_info}"
 
-    async def build_combat_prompt(self, combat_state: Any, language: str = "English") -> str:
+    async def build_combat_prompt(self, combat_state: Any, language: str = "English", npc_turns: Optional[List[Dict[str, Any]]] = None) -> str:
         """
         ### build_combat_prompt
         **Description:** Builds the system prompt for the combat agent.
@@ -553,6 +689,7 @@ class GameSessionService:
         **Parameters:**
         - `combat_state` (Any): The current state of the combat (CombatState object or dict).
         - `language` (str): The language for the interaction.
+        - `npc_turns` (Optional[List[Dict[str, Any]]]): NPC turns already resolved by the engine, to be narrated.
 
         **Returns:**
         - `str`: The complete system prompt string.
@@ -562,15 +699,32 @@ class GameSessionService:
         if self.character_service and self.character_service.character_data:
             character_info = self.character_service.character_data.build_combat_prompt_block()
 
-        # Format combat state if it's an object
+        # Render combat state compactly (aliases, HP/AC, turn marker, last log lines)
         state_summary = combat_state
-        if hasattr(combat_state, 'model_dump'):
-             # It's a Pydantic model (CombatState)
-             # We can use a summary method if available, or dump it
-             # Ideally we use the service's summary method, but here we might just dump it
-             # or rely on the __str__ or similar.
-             # Let's use model_dump for now, or better, just pass it and let str() handle it if it's a dict
-             state_summary = combat_state.model_dump()
+        if isinstance(combat_state, CombatState):
+            llm_config = get_llm_config()
+            render = render_combat_state(
+                combat_state,
+                log_lines=llm_config.combat_log_lines,
+                token_budget=llm_config.combat_state_token_budget,
+                measure_savings=logger.isEnabledFor(logging.DEBUG)
+            )
+            state_summary = render.text
+            log_debug("Combat state rendered for prompt",
+                      action="build_combat_prompt",
+                      session_id=self.session_id,
+                      tokens=render.tokens,
+                      token_budget=render.token_budget,
+                      baseline_tokens=render.baseline_tokens,
+                      tokens_saved=render.tokens_saved)
+
+        npc_turns_block = ""
+        if npc_turns:
+            npc_lines = "\n".join(f"- {turn['actor']} ({turn['actor_name']}) -> {turn['target']}: {turn['message']}" for turn in npc_turns)
+            npc_turns_block = f"""
+NPC TURNS ALREADY RESOLVED (narrate them, do NOT replay them with tools):
+{npc_lines}
+"""
 
         return f"""
 You are a Combat Master for a Middle-earth RPG.
@@ -578,7 +732,7 @@ Language: {language}
 
 Current Combat State:
 {state_summary}
-
+{npc_turns_block}
 CHARACTER INFORMATION:
 {character_info}
 
@@ -589,28 +743,34 @@ YOUR ROLE:
 - Describe the action dynamically and immersively.
 
 TOOLS USAGE:
-- execute_attack_tool: Use this for ANY physical attack (melee or ranged). It handles the roll, AC check, and damage automatically.
-- apply_direct_damage_tool: Use this for spells, traps, or environmental damage that does NOT require an attack roll (e.g., "Fireball" save, falling damage).
-- end_turn_tool: MANDATORY at the end of the active participant's turn.
+- resolve_attack_action_tool: PREFERRED for a player attack. In ONE call it performs the attack (roll, AC check, damage), checks for the end of combat and ends the turn (resolving the following NPC turns).
+- execute_attack_tool: Use this for a physical attack (melee or ranged) when the turn must NOT end afterwards. It handles the roll, AC check, and damage automatically.
+- defend_tool: Use this when a participant takes a defensive stance (AC bonus until their next turn). Then call `end_turn_tool`.
+- cast_spell_tool: Use this when a participant casts a spell. In ONE call it checks and spends mana, resolves damage/healing and (by default) ends the turn, resolving the following NPC turns.
+- apply_direct_damage_tool: Use this for traps, environmental damage or effects outside the spell catalog that do NOT require an attack roll (e.g., falling damage).
+- end_turn_tool: MANDATORY at the end of the active participant's turn. It also resolves the following NPC turns.
 - check_combat_end_tool: Use this after every action that might end the combat.
 - end_combat_tool: Use this to force end the combat (e.g., surrender, escape).
 - get_combat_status_tool: Use this if you need to refresh the state.
+- attack_odds_tool: Use this to weigh an attack (hit chance, expected damage, chance to defeat the target) before choosing a target. It does not roll or change the state.
 - skill_check_with_character: Use this for non-combat actions (e.g., Acrobatics to jump on a table).
 - inventory_remove_item: Use this to remove items (sold/lost).
 - inventory_decrease_quantity: Use this to consume ammo (arrows) or supplies (potions).
 
 TURN FLOW:
 1. Analyze the current turn owner (Player or NPC).
-2. If NPC: Decide their action, execute it using tools, describe the result, and END TURN.
+2. NPC turns are resolved automatically by the game engine: `end_turn_tool` returns them in `npc_turns`.
+   Narrate those results; do NOT call `execute_attack_tool` for NPCs.
 3. If Player: Interpret their message.
-   - If they attack: Call `execute_attack_tool`.
-   - If they cast a spell (damage): Call `apply_direct_damage_tool` (after checking logic/saves if needed).
+   - If they attack: Call `resolve_attack_action_tool` (no need to call `check_combat_end_tool` or `end_turn_tool` afterwards).
+   - If they cast a spell: Call `cast_spell_tool` (no need to call `check_combat_end_tool` or `end_turn_tool` afterwards).
    - If they do something else: Resolve it.
-   - AFTER the action, call `check_combat_end_tool`.
+   - AFTER a non-attack action, call `check_combat_end_tool`.
    - If combat continues, call `end_turn_tool`.
 4. ALWAYS describe the outcome of the tools (hit/miss, damage) in the narrative.
 
 IMPORTANT:
-- `execute_attack_tool` requires `attacker_id` and `target_id`.
+- `resolve_attack_action_tool` and `execute_attack_tool` require `attacker_id` and `target_id`: use the short aliases from the combat state (e.g. `P1`, `E2`).
+- The line starting with `>` in the combat state is the active participant.
 - Do NOT hallucinate weapon names or damage dice; the tool handles it.
 """
\ No newline at end of file
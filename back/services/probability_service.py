@@ -0,0 +1,213 @@
+"""
+Exact outcome probabilities for skill checks, attacks and dice expressions.
+Distributions are computed by dice convolution (no sampling) and cached, so the
+odds of an action can be asked before every roll.
+"""
+
+import itertools
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from back.models.domain.combat_state import Combatant
+from back.models.domain.combat_system_manager import CombatRules, CombatSystemManager
+from back.utils.dice import dice_distribution, sum_distribution
+from back.utils.metrics import watch_lru_cache
+
+# Skill checks roll 1d100 under a target; the margin decides the degree of success
+SKILL_CHECK_DIE = 100
+SKILL_DEGREE_BANDS: List[Tuple[int, str, str]] = [
+    # (minimum margin, success degree, failure degree)
+    (50, "Critical Success", "Critical Failure"),
+    (30, "Excellent Success", "Severe Failure"),
+    (10, "Good Success", "Moderate Failure"),
+    (0, "Simple Success", "Simple Failure"),
+]
+
+
+def skill_check_degree(roll: int, target: int) -> str:
+    """
+    ### skill_check_degree
+    **Description:** Degree of success or failure of a d100 roll-under skill check.
+    **Parameters:**
+    - `roll` (int): The d100 roll.
+    - `target` (int): The target number (success if roll <= target).
+    **Returns:** The degree label (e.g. 'Good Success', 'Severe Failure').
+    """
+    success = roll <= target
+    margin = abs(roll - target)
+    for minimum, success_degree, failure_degree in SKILL_DEGREE_BANDS:
+        if margin >= minimum:
+            return success_degree if success else failure_degree
+    return "Simple Success" if success else "Simple Failure"
+
+
+def _round(probability: float) -> float:
+    return round(probability, 4)
+
+
+class ProbabilityService:
+    """
+    ### ProbabilityService
+    **Description:** Computes exact success chances, degree-of-success bands and expected damage.
+    Attack odds follow the compiled combat rules (attack formula, critical and fumble triggers,
+    damage formula) exactly as `CombatService.execute_attack` applies them. Results are cached
+    per (rules version, inputs).
+
+    **Attributes:**
+    - `combat_system` (CombatSystemManager): Source of the compiled combat rules.
+    """
+
+    CACHE_SIZE = 1024
+
+    def __init__(self, combat_system: Optional[CombatSystemManager] = None) -> None:
+        """
+        ### __init__
+        **Description:** Initializes the service and its result caches.
+        **Parameters:**
+        - `combat_system` (Optional[CombatSystemManager]): Combat rules manager. Defaults to the shared one.
+        """
+        if combat_system is None:
+            from back.dependencies import global_container
+            combat_system = global_container.combat_system_manager
+        self.combat_system = combat_system
+        self._attack_cache = lru_cache(maxsize=self.CACHE_SIZE)(self._compute_attack_odds)
+
+    def skill_check_odds(self, target: int) -> Dict[str, Any]:
+        """
+        ### skill_check_odds
+        **Description:** Odds of a d100 roll-under skill check.
+        **Parameters:**
+        - `target` (int): The target number (skill value minus difficulty).
+        **Returns:** Dict with `target`, `success_chance` and `bands` (probability of each degree).
+        """
+        # Copy: the cached dict is shared by every caller
+        odds = _skill_check_odds(int(target))
+        return {**odds, "bands": dict(odds["bands"])}
+
+    def attack_odds(self, attack_bonus: int, armor_class: int, weapon_damage: str,
+                    target_hp: Optional[int] = None) -> Dict[str, Any]:
+        """
+        ### attack_odds
+        **Description:** Odds of a weapon attack under the combat rules.
+        **Parameters:**
+        - `attack_bonus` (int): Attack bonus of the attacker (also its damage modifier).
+        - `armor_class` (int): Effective Armor Class of the target.
+        - `weapon_damage` (str): Weapon damage dice (e.g. '1d8+4').
+        - `target_hp` (Optional[int]): Current HP of the target, to compute the chance of taking it down.
+        **Returns:** Dict with hit/critical/fumble chances, expected damage (per attack and per hit),
+        the damage range and, if `target_hp` is given, `kill_chance`.
+        """
+        rules = self.combat_system.get_rules()
+        return dict(self._attack_cache(rules.version, int(attack_bonus), int(armor_class),
+                                       str(weapon_damage), target_hp))
+
+    def combatant_attack_odds(self, attacker: Combatant, target: Combatant) -> Dict[str, Any]:
+        """
+        ### combatant_attack_odds
+        **Description:** Odds of an attack between two combatants, from their combat snapshots
+        (attacker's attack bonus and weapon, target's AC including the defend bonus and current HP).
+        **Parameters:**
+        - `attacker` (Combatant): The attacking combatant.
+        - `target` (Combatant): The target combatant.
+        **Returns:** The `attack_odds` dict plus attacker, target, weapon and target AC.
+        """
+        armor_class = target.armor_class + target.defense_bonus
+        odds = self.attack_odds(attacker.attack_bonus, armor_class, attacker.weapon_damage,
+                                target.current_hit_points)
+        odds.update({
+            "attacker": attacker.name,
+            "target": target.name,
+            "weapon": attacker.weapon_name,
+            "target_armor_class": armor_class,
+        })
+        return odds
+
+    def dice_odds(self, expression: str, target: Optional[int] = None) -> Dict[str, Any]:
+        """
+        ### dice_odds
+        **Description:** Summary of a dice expression ('2d6+1') and the chance to reach a target.
+        **Parameters:**
+        - `expression` (str): Dice expression.
+        - `target` (Optional[int]): Value to reach or exceed.
+        **Returns:** Dict with `min`, `max`, `mean` and, if `target` is given, `at_least`.
+        **Raises:**
+        - ValueError: If the expression has too many dice or faces (see `back.utils.dice.MAX_DICE_COUNT`).
+        """
+        distribution = dice_distribution(expression)
+        result: Dict[str, Any] = {
+            "expression": expression,
+            "min": distribution[0][0],
+            "max": distribution[-1][0],
+            "mean": _round(sum(value * p for value, p in distribution)),
+        }
+        if target is not None:
+            result["at_least"] = _round(sum(p for value, p in distribution if value >= target))
+        return result
+
+    def _compute_attack_odds(self, rules_version: str, attack_bonus: int, armor_class: int,
+                             weapon_damage: str, target_hp: Optional[int]) -> Dict[str, Any]:
+        from back.services.combat_service import CombatService
+
+        rules: CombatRules = self.combat_system.get_rules()
+        values = CombatService.formula_values_for(attack_bonus)
+
+        hit = critical = fumble = 0.0
+        for combo in itertools.product(*(sum_distribution(count, sides) for count, sides in rules.attack_roll.dice)):
+            dice = [value for value, _ in combo]
+            probability = 1.0
+            for _, p in combo:
+                probability *= p
+            natural = dice[0] if dice else 0
+            if rules.is_critical(natural):
+                critical += probability
+            elif rules.is_fumble(natural):
+                fumble += probability
+            elif rules.attack_roll.evaluate(values, dice) >= armor_class:
+                hit += probability
+
+        weapon = dice_distribution(weapon_damage)
+        normal = [(self._damage(rules, values, w), p) for w, p in weapon]
+        crit = [(self._damage(rules, values, rules.critical_weapon_damage(w)), p) for w, p in weapon]
+        expected_normal = sum(d * p for d, p in normal)
+        expected_crit = sum(d * p for d, p in crit)
+        hit_chance = hit + critical
+
+        result: Dict[str, Any] = {
+            "hit_chance": _round(hit_chance),
+            "critical_chance": _round(critical),
+            "fumble_chance": _round(fumble),
+            "expected_damage": _round(hit * expected_normal + critical * expected_crit),
+            "expected_damage_on_hit": _round(
+                (hit * expected_normal + critical * expected_crit) / hit_chance if hit_chance else 0.0
+            ),
+            "damage_range": [min(d for d, _ in normal), max(d for d, _ in crit)],
+        }
+        if target_hp is not None:
+            result["kill_chance"] = _round(
+                hit * sum(p for d, p in normal if d >= target_hp)
+                + critical * sum(p for d, p in crit if d >= target_hp)
+            )
+        return result
+
+    @staticmethod
+    def _damage(rules: CombatRules, values: Dict[str, int], weapon_damage: int) -> int:
+        return max(1, rules.damage.evaluate({**values, "weapon_damage": weapon_damage}, ()))
+
+
+@lru_cache(maxsize=256)
+def _skill_check_odds(target: int) -> Dict[str, Any]:
+    bands: Dict[str, float] = {}
+    for roll in range(1, SKILL_CHECK_DIE + 1):
+        degree = skill_check_degree(roll, target)
+        bands[degree] = bands.get(degree, 0.0) + 1.0 / SKILL_CHECK_DIE
+    success = sum(1 for roll in range(1, SKILL_CHECK_DIE + 1) if roll <= target) / SKILL_CHECK_DIE
+    return {
+        "target": target,
+        "success_chance": _round(success),
+        "bands": {degree: _round(p) for degree, p in bands.items()},
+    }
+
+
+watch_lru_cache("skill_check_odds", _skill_check_odds)
+watch_lru_cache("dice_distribution", dice_distribution)
+watch_lru_cache("sum_distribution", sum_distribution)
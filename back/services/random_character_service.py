@@ -0,0 +1,279 @@
+"""
+Random character generation service.
+Generates random characters one at a time or in bulk: stats and skill allocations are drawn
+for the whole batch at once, LLM flavour text (name, background, description) is optional
+and requested in batches, and the characters are saved through one bulk write.
+"""
+
+import asyncio
+import random
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import uuid4
+
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field
+
+from back.models.domain.character import Character, Stats
+from back.models.schema import CultureData, RaceData
+from back.services.character_data_service import CharacterDataService
+from back.services.races_data_service import RacesDataService
+from back.services.skill_allocation_service import SkillAllocationService
+from back.utils.logger import log_debug
+
+
+class CharacterFlavour(BaseModel):
+    """LLM-generated flavour text of a random character"""
+    name: str = Field(..., description="Character name")
+    background: str = Field(default="", description="Short background story")
+    physical_description: str = Field(default="", description="Short physical description")
+
+
+class RandomCharacterService:
+    """
+    ### RandomCharacterService
+    **Description:** Builds random characters. Managers are created on first use and reused
+    across calls, so a batch of thousands of characters loads the game data once.
+    """
+
+    STAT_MIN = 8
+    STAT_MAX = 15
+    # Characters described per LLM call, and LLM calls in flight at once
+    FLAVOUR_BATCH_SIZE = 20
+    FLAVOUR_CONCURRENCY = 4
+
+    def __init__(
+        self,
+        character_data_service: Optional[CharacterDataService] = None,
+        races_service: Optional[RacesDataService] = None,
+        skill_allocation_service: Optional[SkillAllocationService] = None
+    ) -> None:
+        """
+        ### __init__
+        **Description:** Initializes the service. Missing collaborators are created lazily.
+        **Parameters:**
+        - `character_data_service` (Optional[CharacterDataService]): Persistence service.
+        - `races_service` (Optional[RacesDataService]): Race and culture lookups.
+        - `skill_allocation_service` (Optional[SkillAllocationService]): Skill allocation.
+        """
+        self.character_data_service = character_data_service or CharacterDataService()
+        self._races_service = races_service
+        self._skill_allocation_service = skill_allocation_service
+
+    @property
+    def races_service(self) -> RacesDataService:
+        if self._races_service is None:
+            self._races_service = RacesDataService()
+        return self._races_service
+
+    @property
+    def skill_allocation_service(self) -> SkillAllocationService:
+        if self._skill_allocation_service is None:
+            self._skill_allocation_service = SkillAllocationService()
+        return self._skill_allocation_service
+
+    def pick_races_and_cultures(self, count: int) -> List[Tuple[RaceData, CultureData]]:
+        """
+        ### pick_races_and_cultures
+        **Description:** Picks a random race and one of its cultures for each character.
+        **Parameters:**
+        - `count` (int): Number of characters.
+        **Returns:** List of (race, culture) pairs.
+        **Raises:** ValueError if no race has a culture.
+        """
+        races = [race for race in self.races_service.get_all_races() if race.cultures]
+        if not races:
+            raise ValueError("No races with cultures available to choose from.")
+        return [(race, random.choice(race.cultures)) for race in random.choices(races, k=count)]
+
+    def race_culture_pairs(self) -> List[Tuple[RaceData, CultureData]]:
+        """
+        ### race_culture_pairs
+        **Description:** Every (race, culture) combination a random character can have.
+        **Parameters:** None
+        **Returns:** List of (race, culture) pairs.
+        """
+        return [(race, culture) for race in self.races_service.get_all_races() for culture in race.cultures or []]
+
+    def roll_stats(self, count: int) -> List[Dict[str, int]]:
+        """
+        ### roll_stats
+        **Description:** Rolls the stats of `count` characters in one draw (each stat uniform in 8-15).
+        **Parameters:**
+        - `count` (int): Number of characters.
+        **Returns:** List of stat dictionaries.
+        """
+        names = list(Stats.model_fields)
+        values = random.choices(range(self.STAT_MIN, self.STAT_MAX + 1), k=count * len(names))
+        return [dict(zip(names, values[i * len(names):(i + 1) * len(names)])) for i in range(count)]
+
+    @staticmethod
+    def compute_combat_stats(stats: Dict[str, int]) -> Dict[str, int]:
+        """
+        ### compute_combat_stats
+        **Description:** Level 1 combat stats derived from the character stats.
+        **Parameters:**
+        - `stats` (Dict[str, int]): Character stats.
+        **Returns:** Combat stats dictionary.
+        """
+        strength_modifier = (stats['strength'] - 10) // 2
+        agility_modifier = (stats['agility'] - 10) // 2
+        max_hp = stats['constitution'] * 10 + 5  # level 1
+        max_mp = stats['intelligence'] * 5 + stats['wisdom'] * 3
+        return {
+            "max_hit_points": max_hp, "current_hit_points": max_hp,
+            "max_mana_points": max_mp, "current_mana_points": max_mp,
+            "armor_class": 10 + agility_modifier, "attack_bonus": strength_modifier
+        }
+
+    def build_character(
+        self,
+        race: RaceData,
+        culture: CultureData,
+        stats: Dict[str, int],
+        skills: Dict[str, Dict[str, int]],
+        flavour: CharacterFlavour
+    ) -> Character:
+        """
+        ### build_character
+        **Description:** Assembles a new draft character (not saved).
+        **Parameters:**
+        - `race` (RaceData): Race.
+        - `culture` (CultureData): Culture.
+        - `stats` (Dict[str, int]): Stats.
+        - `skills` (Dict[str, Dict[str, int]]): Allocated skills by group.
+        - `flavour` (CharacterFlavour): Name, background and physical description.
+        **Returns:** The character.
+        """
+        now = datetime.now().isoformat()
+        character = Character(**{
+            "id": str(uuid4()),
+            "name": flavour.name,
+            "race": race.id,
+            "culture": culture.id,
+            "stats": stats,
+            "skills": skills,
+            "combat_stats": self.compute_combat_stats(stats),
+            "equipment": {"weapons": [], "armor": [], "accessories": [], "consumables": [], "gold": 0},
+            "spells": {"known_spells": [], "spell_slots": {}, "spell_bonus": 0},
+            "level": 1, "status": "draft", "experience_points": 0,
+            "created_at": now, "updated_at": now,
+            "description": flavour.background or None,
+            "physical_description": flavour.physical_description or None
+        })
+        character.sync_status_from_completion()
+        return character
+
+    async def generate_flavours(
+        self,
+        agent: Any,
+        profiles: Sequence[Tuple[RaceData, CultureData]]
+    ) -> List[CharacterFlavour]:
+        """
+        ### generate_flavours
+        **Description:** Generates names, backgrounds and descriptions with the LLM, describing
+        `FLAVOUR_BATCH_SIZE` characters per call. Entries the LLM did not return fall back to default names.
+        **Parameters:**
+        - `agent` (Agent): Generation agent (see `build_simple_gm_agent`).
+        - `profiles` (Sequence[Tuple[RaceData, CultureData]]): Race and culture of each character.
+        **Returns:** One flavour per profile, in order.
+        """
+        semaphore = asyncio.Semaphore(self.FLAVOUR_CONCURRENCY)
+
+        async def describe(start: int) -> List[CharacterFlavour]:
+            chunk = profiles[start:start + self.FLAVOUR_BATCH_SIZE]
+            lines = "\n".join(f"{i + 1}. a {race.name} from {culture.name}" for i, (race, culture) in enumerate(chunk))
+            prompt = (
+                f"Generate {len(chunk)} distinct fantasy characters, in this order:\n{lines}\n"
+                "For each one give a single fantasy name, a short background story and a short "
+                "physical description. Be creative and concise."
+            )
+            async with semaphore:
+                result = await agent.run(prompt, output_type=List[CharacterFlavour])
+            return list(result.output)[:len(chunk)]
+
+        starts = range(0, len(profiles), self.FLAVOUR_BATCH_SIZE)
+        chunks = await asyncio.gather(*(describe(start) for start in starts))
+        flavours: List[CharacterFlavour] = []
+        for start, chunk in zip(starts, chunks):
+            # Chunks returned short are padded so that flavours stay aligned with profiles
+            flavours.extend(chunk)
+            end = min(start + self.FLAVOUR_BATCH_SIZE, len(profiles))
+            flavours.extend(self.default_flavour(*profiles[i], i + 1) for i in range(start + len(chunk), end))
+        log_debug("Random character flavours generated", action="generate_flavours",
+                  requested=len(profiles), generated=sum(len(chunk) for chunk in chunks))
+        return flavours
+
+    @staticmethod
+    def default_flavour(race: RaceData, culture: CultureData, number: int) -> CharacterFlavour:
+        """
+        ### default_flavour
+        **Description:** Placeholder flavour used when no LLM text is requested.
+        **Parameters:**
+        - `race` (RaceData): Race.
+        - `culture` (CultureData): Culture.
+        - `number` (int): Position of the character in its batch.
+        **Returns:** A flavour named after the culture and race.
+        """
+        return CharacterFlavour(name=f"{culture.name} {race.name} #{number}")
+
+    async def generate_characters(
+        self,
+        profiles: Sequence[Tuple[RaceData, CultureData]],
+        agent: Any = None
+    ) -> List[Character]:
+        """
+        ### generate_characters
+        **Description:** Builds one unsaved character per (race, culture) profile. Stats and skills are
+        drawn for the whole batch; flavour text is generated only if an agent is given.
+        **Parameters:**
+        - `profiles` (Sequence[Tuple[RaceData, CultureData]]): Race and culture of each character.
+        - `agent` (Optional[Agent]): Generation agent for names and descriptions; placeholder names if None.
+        **Returns:** The characters, in profile order.
+        """
+        # Stats, skills and character building are CPU-bound (thousands of characters): threadpool;
+        # only the LLM flavour step runs on the event loop
+        stats, skills = await run_in_threadpool(self._draw_stats_and_skills, profiles)
+        if agent is not None:
+            flavours = await self.generate_flavours(agent, profiles)
+        else:
+            flavours = [self.default_flavour(race, culture, i + 1) for i, (race, culture) in enumerate(profiles)]
+
+        return await run_in_threadpool(self._build_characters, profiles, stats, skills, flavours)
+
+    def _draw_stats_and_skills(
+        self, profiles: Sequence[Tuple[RaceData, CultureData]]
+    ) -> Tuple[List[Dict[str, int]], List[Any]]:
+        stats = self.roll_stats(len(profiles))
+        skills = self.skill_allocation_service.allocate_random_skills_batch(
+            [(race.name, Stats(**values)) for (race, _), values in zip(profiles, stats)]
+        )
+        return stats, skills
+
+    def _build_characters(
+        self,
+        profiles: Sequence[Tuple[RaceData, CultureData]],
+        stats: List[Dict[str, int]],
+        skills: List[Any],
+        flavours: List[CharacterFlavour]
+    ) -> List[Character]:
+        return [
+            self.build_character(race, culture, values, allocated, flavour)
+            for (race, culture), values, allocated, flavour in zip(profiles, stats, skills, flavours)
+        ]
+
+    async def create_random_characters(self, count: int, agent: Any = None) -> List[Character]:
+        """
+        ### create_random_characters
+        **Description:** Generates `count` random characters (see `generate_characters`) and saves
+        them with one bulk write.
+        **Parameters:**
+        - `count` (int): Number of characters.
+        - `agent` (Optional[Agent]): Generation agent for names and descriptions; placeholder names if None.
+        **Returns:** The saved characters.
+        """
+        characters = await self.generate_characters(self.pick_races_and_cultures(count), agent)
+        # Up to thousands of file writes: off the event loop
+        await run_in_threadpool(self.character_data_service.save_characters, characters)
+        log_debug("Random characters created", action="create_random_characters", count=len(characters))
+        return characters
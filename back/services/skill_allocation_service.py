@@ -5,7 +5,8 @@ This service handles the allocation of skills for random character generation,
 taking into account race affinities and character stats.
 """
 
-from typing import Dict, List, Tuple
+from collections import Counter
+from typing import Dict, List, Sequence, Tuple
 import random
 from back.models.domain.unified_skills_manager import UnifiedSkillsManager
 from back.models.domain.character import Stats
@@ -21,8 +22,13 @@ class SkillAllocationService:
     - Random distribution of remaining skill points
     """
 
+    TOTAL_SKILL_POINTS = 40
+
     def __init__(self):
         self.skills_manager = UnifiedSkillsManager()
+        self._skill_slots: List[Tuple[str, str]] = []
+        self._race_points: Dict[str, List[Tuple[str, str, int]]] = {}
+        self._stat_points: Dict[Tuple[str, int], List[Tuple[str, str, int]]] = {}
 
     def allocate_random_skills_for_character(
         self,
@@ -41,100 +47,99 @@ class SkillAllocationService:
         Returns:
             Dictionary of skill groups with allocated skills (all skills initialized to 0, then allocated)
         """
-        # Initialize all skills from YAML data with 0 points
-        allocated_skills: Dict[str, Dict[str, int]] = {}
-        all_skills = self.skills_manager.get_all_skills()
-        
-        for group_name, skills_dict in all_skills.items():
-            allocated_skills[group_name] = {}
-            for skill_id in skills_dict.keys():
-                allocated_skills[group_name][skill_id] = 0
-
-        # Step 1: Allocate race-based affinities
-        race_affinities: List[Dict[str, int]] = self.skills_manager.get_race_affinities(race_name)
-        allocated_skills = self._allocate_race_affinities(allocated_skills, race_affinities)
-
-        # Step 2: Allocate stat-based bonuses
-        stat_bonuses: List[Tuple[str, str, int]] = self._get_stat_based_bonuses(stats)
-        allocated_skills = self._allocate_stat_bonuses(allocated_skills, stat_bonuses)
-
-        # Step 3: Distribute remaining points randomly
-        remaining_points = 40 - self._calculate_total_points(allocated_skills)
-        if remaining_points > 0:
-            allocated_skills = self._distribute_remaining_points(allocated_skills, remaining_points)
-
-        return allocated_skills
+        return self.allocate_random_skills_batch([(race_name, stats)])[0]
 
-    def _allocate_race_affinities(
+    def allocate_random_skills_batch(
         self,
-        allocated_skills: Dict[str, Dict[str, int]],
-        affinities: List[Dict[str, int]]
-    ) -> Dict[str, Dict[str, int]]:
-        """Allocate base points for race affinities."""
-        for affinity in affinities:
-            # Each affinity dict contains skill mappings with base points
-            for skill_name, base_points in affinity.items():
-                # Find which group this skill belongs to
-                skill_info = self.skills_manager.get_skill_by_name(skill_name)
-                if skill_info:
-                    group_name = skill_info["group"]
-                    skill_id = skill_info["id"]
-
-                    if group_name in allocated_skills:
-                        allocated_skills[group_name][skill_id] = (
-                            allocated_skills[group_name].get(skill_id, 0) + base_points
-                        )
-
-        return allocated_skills
-
-    def _get_stat_based_bonuses(self, stats: Stats) -> List[Tuple[str, str, int]]:
-        """Get skill bonuses based on character stats."""
-        bonuses: List[Tuple[str, str, int]] = []
-
-        # Get all stat-based bonuses from the YAML data
-        stat_based_bonuses = self.skills_manager.get_stat_based_skill_bonuses("charisma", stats.charisma)
-        stat_based_bonuses.extend(self.skills_manager.get_stat_based_skill_bonuses("intelligence", stats.intelligence))
-        stat_based_bonuses.extend(self.skills_manager.get_stat_based_skill_bonuses("wisdom", stats.wisdom))
-        stat_based_bonuses.extend(self.skills_manager.get_stat_based_skill_bonuses("agility", stats.agility))
-        stat_based_bonuses.extend(self.skills_manager.get_stat_based_skill_bonuses("strength", stats.strength))
-
-        # Convert to the expected format
-        for bonus in stat_based_bonuses:
-            bonuses.append((bonus["group"], bonus["skill"], bonus["bonus_points"]))
+        profiles: Sequence[Tuple[str, Stats]]
+    ) -> List[Dict[str, Dict[str, int]]]:
+        """
+        Allocate skills for many characters at once.
 
-        return bonuses
+        Race affinities and stat bonuses are resolved once per race and per stat value,
+        and the remaining points of each character are drawn in a single multinomial draw.
 
-    def _allocate_stat_bonuses(
-        self,
-        allocated_skills: Dict[str, Dict[str, int]],
-        bonuses: List[Tuple[str, str, int]]
-    ) -> Dict[str, Dict[str, int]]:
-        """Apply stat-based bonuses to skills."""
-        for group, skill, points in bonuses:
-            if group in allocated_skills:
-                allocated_skills[group][skill] = allocated_skills[group].get(skill, 0) + points
+        Args:
+            profiles: (race name, stats) of each character
 
-        return allocated_skills
+        Returns:
+            One dictionary of skill groups with allocated skills per profile, in order
+        """
+        slots = self._get_skill_slots()
+        allocations: List[Dict[str, Dict[str, int]]] = []
+        for race_name, stats in profiles:
+            # Step 1: Initialize all skills from YAML data with 0 points
+            allocated_skills: Dict[str, Dict[str, int]] = {}
+            for group_name, skill_id in slots:
+                allocated_skills.setdefault(group_name, {})[skill_id] = 0
+
+            # Step 2: Race-based affinities, then stat-based bonuses
+            for group_name, skill_id, points in self._get_race_points(race_name) + self._get_stat_points(stats):
+                if group_name in allocated_skills:
+                    allocated_skills[group_name][skill_id] = allocated_skills[group_name].get(skill_id, 0) + points
+
+            # Step 3: Distribute remaining points randomly
+            remaining_points = self.TOTAL_SKILL_POINTS - self._calculate_total_points(allocated_skills)
+            if remaining_points > 0:
+                allocated_skills = self._distribute_remaining_points(allocated_skills, remaining_points)
+            allocations.append(allocated_skills)
+
+        return allocations
+
+    def _get_skill_slots(self) -> List[Tuple[str, str]]:
+        """(group, skill id) of every available skill, in catalog order."""
+        if not self._skill_slots:
+            self._skill_slots = [
+                (group_name, skill_id)
+                for group_name, skills_dict in self.skills_manager.get_all_skills().items()
+                for skill_id in skills_dict.keys()
+            ]
+        return self._skill_slots
+
+    def _get_race_points(self, race_name: str) -> List[Tuple[str, str, int]]:
+        """Base points granted by race affinities, as (group, skill id, points)."""
+        points = self._race_points.get(race_name)
+        if points is None:
+            points = []
+            for affinity in self.skills_manager.get_race_affinities(race_name):
+                # Each affinity dict contains skill mappings with base points
+                for skill_name, base_points in affinity.items():
+                    # Find which group this skill belongs to
+                    skill_info = self.skills_manager.get_skill_by_name(skill_name)
+                    if skill_info:
+                        points.append((skill_info["group"], skill_info["id"], base_points))
+            self._race_points[race_name] = points
+        return points
+
+    def _get_stat_points(self, stats: Stats) -> List[Tuple[str, str, int]]:
+        """Skill bonuses based on character stats, as (group, skill id, points)."""
+        points: List[Tuple[str, str, int]] = []
+        for stat_name in ("charisma", "intelligence", "wisdom", "agility", "strength"):
+            key = (stat_name, getattr(stats, stat_name))
+            bonuses = self._stat_points.get(key)
+            if bonuses is None:
+                bonuses = [
+                    (bonus["group"], bonus["skill"], bonus["bonus_points"])
+                    for bonus in self.skills_manager.get_stat_based_skill_bonuses(*key)
+                ]
+                self._stat_points[key] = bonuses
+            points.extend(bonuses)
+        return points
 
     def _distribute_remaining_points(
         self,
         allocated_skills: Dict[str, Dict[str, int]],
         remaining_points: int
     ) -> Dict[str, Dict[str, int]]:
-        """Distribute remaining skill points randomly across all available skills."""
-        # Get all available skills from the unified manager
-        all_skills: List[Tuple[str, str]] = []
-        all_skill_data = self.skills_manager.get_all_skills()
-
-        for group_name, skills_dict in all_skill_data.items():
-            for skill_id in skills_dict.keys():
-                all_skills.append((group_name, skill_id))
+        """Distribute remaining skill points uniformly at random across all available skills."""
+        slots = self._get_skill_slots()
+        if not slots:
+            return allocated_skills
 
-        # Distribute points randomly
-        for _ in range(remaining_points):
-            if all_skills:
-                group, skill = random.choice(all_skills)
-                allocated_skills[group][skill] = allocated_skills[group].get(skill, 0) + 1
+        # One multinomial draw: every point lands on a uniformly chosen skill
+        for slot, points in Counter(random.choices(range(len(slots)), k=remaining_points)).items():
+            group, skill = slots[slot]
+            allocated_skills.setdefault(group, {})[skill] = allocated_skills.get(group, {}).get(skill, 0) + points
 
         return allocated_skills
 
@@ -143,4 +148,4 @@ class SkillAllocationService:
         total = 0
         for group_skills in allocated_skills.values():
             total += sum(group_skills.values())
-        return total
\ No newline at end of file
+        return total
@@ -1,16 +1,40 @@
 """
 JSONL store adapted for PydanticAI.
 Compatible with PydanticAI message formats while maintaining the JsonlChatMessageStore interface.
+
+A long history is split in two files so that a turn does not rewrite it whole: the older messages go to
+an immutable compressed cold segment (`<file>.<id>.cold.gz`), and the file itself (the hot file) only
+holds the recent messages, after a header naming the cold segment it continues:
+`{"cold_segment":"...","cold_count":N,"messages":[...]}`. Short histories, and files written before
+segmentation, are a plain JSON array. Both forms are read transparently.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
 import os
-from typing import List, Any, Dict
+import re
+from typing import List, Any, Dict, Optional, Tuple, Callable
+from uuid import uuid4
 
 from pydantic_ai.messages import ModelMessagesTypeAdapter, ModelMessage
 
+from back.config import get_storage_config
+from back.storage.serialization import (
+    CODEC_NONE,
+    COLD_EXTENSIONS,
+    compress,
+    compression_codec,
+    decompress,
+    dump_messages,
+    write_atomic,
+)
 from back.utils.logger import log_debug
+from back.utils.timing import PHASE_HISTORY_LOAD, PHASE_PERSIST, timed
+
+# Header of a segmented hot file, always written compact (see `_hot_file_bytes`)
+_HOT_HEADER = re.compile(rb'^\{"cold_segment":"([^"/\\]+)","cold_count":(\d+),"messages":')
 
 
 class PydanticJsonlStore:
@@ -26,7 +50,8 @@ class PydanticJsonlStore:
     
     def __init__(self, filepath: str) -> None:
         self.filepath = filepath
-        log_debug("Initializing PydanticJsonlStore", action="init_store", filepath=os.path.abspath(filepath))
+        self._abs_filepath = os.path.abspath(filepath)
+        log_debug("Initializing PydanticJsonlStore", action="init_store", filepath=self._abs_filepath)
         self._ensure_file()
 
     def _ensure_file(self) -> None:
@@ -38,70 +63,169 @@ class PydanticJsonlStore:
         if not os.path.exists(self.filepath):
             with open(self.filepath, "w", encoding="utf-8"): 
                 pass
-            log_debug("Creating PydanticAI session file", action="create_session_file", filepath=os.path.abspath(self.filepath))
+            log_debug("Creating PydanticAI session file", action="create_session_file", filepath=self._abs_filepath)
         else:
-            log_debug("Existing PydanticAI session file", action="existing_session_file", filepath=os.path.abspath(self.filepath))
+            log_debug("Existing PydanticAI session file", action="existing_session_file", filepath=self._abs_filepath)
+
+    def _cold_path(self, name: str) -> str:
+        return os.path.join(os.path.dirname(self._abs_filepath), name)
+
+    def _read_cold(self, name: str) -> bytes:
+        with open(self._cold_path(name), "rb") as f:
+            return decompress(f.read())
+
+    def _split(self, content: bytes) -> Tuple[Optional[str], int, bytes]:
+        """
+        ### _split
+        **Description:** Splits the content of the hot file into the cold segment it continues (if any) and the
+        JSON array of its own messages.
+        **Parameters:**
+        - `content` (bytes): Stripped content of the hot file.
+        **Returns:** (cold segment name or None, messages in the cold segment, JSON array of the hot messages).
+        """
+        match = _HOT_HEADER.match(content)
+        if match is None:
+            return None, 0, content
+        return match.group(1).decode("utf-8"), int(match.group(2)), content[match.end():-1]
+
+    def _parse(self, content: bytes, cold: Optional[bytes], loads: Callable[[bytes], Any]) -> List[Any]:
+        _, _, hot = self._split(content)
+        messages = loads(hot)
+        if cold is None:
+            return messages
+        return loads(cold) + messages
+
+    def _hot_file_bytes(self, cold_name: str, cold_count: int, hot: List[ModelMessage]) -> bytes:
+        header = json.dumps({"cold_segment": cold_name, "cold_count": cold_count}, separators=(",", ":"))
+        return header[:-1].encode("utf-8") + b',"messages":' + dump_messages(hot) + b"}"
+
+    def _current_cold(self) -> Tuple[Optional[str], int]:
+        try:
+            with open(self.filepath, "rb") as f:
+                head = f.read(512)
+        except FileNotFoundError:
+            return None, 0
+        match = _HOT_HEADER.match(head.lstrip())
+        if match is None:
+            return None, 0
+        return match.group(1).decode("utf-8"), int(match.group(2))
+
+    def _remove_stale_segments(self, keep: Optional[str]) -> None:
+        prefix = os.path.basename(self.filepath) + "."
+        directory = os.path.dirname(self._abs_filepath)
+        for name in os.listdir(directory):
+            if name.startswith(prefix) and ".cold" in name[len(prefix):] and name != keep:
+                try:
+                    os.remove(os.path.join(directory, name))
+                except FileNotFoundError:
+                    pass
+
+    def _write(self, messages: List[ModelMessage]) -> Dict[str, Any]:
+        """
+        ### _write
+        **Description:** Saves the history, rewriting only its hot part when the current cold segment is still a
+        prefix of `messages` (byte-for-byte, which also covers summarized or edited histories: any change in
+        the cold part means a full rewrite). When the hot part exceeds `storage.hot_messages`, the whole history
+        is compressed into a new cold segment; the hot file is switched to it atomically, then the old segment is
+        removed.
+        **Parameters:**
+        - `messages` (List[ModelMessage]): The complete history.
+        **Returns:** Write statistics (`bytes_written`, `cold_count`, `rolled`) for logging.
+        """
+        codec = compression_codec()
+        cold_name, cold_count = self._current_cold()
+        if cold_name is not None:
+            try:
+                if cold_count > len(messages) or self._read_cold(cold_name) != dump_messages(messages[:cold_count]):
+                    cold_name, cold_count = None, 0
+            except (OSError, RuntimeError, EOFError) as e:
+                log_debug("Unreadable cold history segment, full rewrite", filepath=self._abs_filepath,
+                          segment=cold_name, error=str(e))
+                cold_name, cold_count = None, 0
+
+        bytes_written = 0
+        rolled = (codec != CODEC_NONE
+                  and len(messages) - cold_count > get_storage_config()["hot_messages"])
+        if rolled:
+            cold_name = f"{os.path.basename(self.filepath)}.{uuid4().hex[:12]}.cold{COLD_EXTENSIONS[codec]}"
+            cold_count = len(messages)
+            compressed = compress(dump_messages(messages), codec)
+            write_atomic(self._cold_path(cold_name), compressed)
+            bytes_written += len(compressed)
+
+        if cold_name is None:
+            raw = dump_messages(messages)
+        else:
+            raw = self._hot_file_bytes(cold_name, cold_count, messages[cold_count:])
+        write_atomic(self.filepath, raw)
+        bytes_written += len(raw)
+        self._remove_stale_segments(keep=cold_name)
+        return {"bytes_written": bytes_written, "cold_count": cold_count, "rolled": rolled}
 
     def save_pydantic_history(self, messages: List[ModelMessage]) -> None:
         """
         ### save_pydantic_history
-        **Description:** Serializes and saves a list of PydanticAI messages to the JSONL file, using ModelMessagesTypeAdapter.dump_json as recommended in the official documentation.
+        **Description:** Serializes and saves a list of PydanticAI messages, using ModelMessagesTypeAdapter.dump_json as recommended in the official documentation. Long histories are segmented (see the module docstring).
         **Parameters:**
         - `messages` (List[ModelMessage]): List of PydanticAI messages to save.
         """
-        import json
+        stats = self._write(messages)
+        log_debug("PydanticAI history saved (ModelMessagesTypeAdapter.dump_json)", action="save_pydantic_history", filepath=self._abs_filepath, count=len(messages), **stats)
 
-        # Use dump_json for consistent serialization with PydanticAI
-        json_bytes: bytes = ModelMessagesTypeAdapter.dump_json(messages, indent=2)
-        json_str: str = json_bytes.decode('utf-8')
+    def _load(self, loads: Callable[[bytes], Any]) -> List[Any]:
+        with open(self.filepath, "rb") as f:
+            content: bytes = f.read().strip()
+        if not content:  # Empty file
+            return []
+        cold_name, _, _ = self._split(content)
+        cold = self._read_cold(cold_name) if cold_name is not None else None
+        return self._parse(content, cold, loads)
+
+    async def _load_async(self, loads: Callable[[bytes], Any]) -> List[Any]:
+        import aiofiles
 
-        with open(self.filepath, "w", encoding="utf-8") as f:
-            f.write(json_str)
-        log_debug("PydanticAI history saved (ModelMessagesTypeAdapter.dump_json)", action="save_pydantic_history", filepath=os.path.abspath(self.filepath), count=len(messages))
+        async with aiofiles.open(self.filepath, "rb") as f:
+            content: bytes = (await f.read()).strip()
+        if not content:  # Empty file
+            return []
+        cold_name, _, _ = self._split(content)
+        cold = None
+        if cold_name is not None:
+            async with aiofiles.open(self._cold_path(cold_name), "rb") as f:
+                cold = decompress(await f.read())
+        return self._parse(content, cold, loads)
 
     def load_pydantic_history(self) -> List[ModelMessage]:
         """
         ### load_pydantic_history
-        **Description:** Reloads the complete PydanticAI history from the JSONL file, using ModelMessagesTypeAdapter.validate_python as in the official documentation.
+        **Description:** Reloads the complete PydanticAI history (cold segment included), using ModelMessagesTypeAdapter.validate_json.
         **Returns:** List of deserialized PydanticAI messages (List[ModelMessage]).
         """
-        import json
         if not os.path.exists(self.filepath):
             return []
         try:
-            with open(self.filepath, "r", encoding="utf-8") as f:
-                content: str = f.read().strip()
-                if not content:  # Empty file
-                    return []
-                data: Any = json.loads(content)
-
-            history: List[ModelMessage] = ModelMessagesTypeAdapter.validate_python(data)
-            log_debug("PydanticAI history reloaded (validate_python)", action="load_pydantic_history", filepath=os.path.abspath(self.filepath), count=len(history))
+            # Single pass from JSON text: no intermediate dict tree
+            history: List[ModelMessage] = self._load(ModelMessagesTypeAdapter.validate_json)
+            log_debug("PydanticAI history reloaded (validate_json)", action="load_pydantic_history", filepath=self._abs_filepath, count=len(history))
             return history
         except Exception as e:
-            log_debug("Error reloading PydanticAI history", error=str(e), filepath=os.path.abspath(self.filepath))
+            log_debug("Error reloading PydanticAI history", error=str(e), filepath=self._abs_filepath)
             return []
 
     def load_raw_json_history(self) -> List[Dict[str, Any]]:
         """
         ### load_raw_json_history
-        **Description:** Reloads the complete PydanticAI history from the JSONL file as raw JSON data, without validation.
+        **Description:** Reloads the complete PydanticAI history (cold segment included) as raw JSON data, without validation.
         **Returns:** List of raw JSON message dictionaries.
         """
-        import json
         if not os.path.exists(self.filepath):
             return []
         try:
-            with open(self.filepath, "r", encoding="utf-8") as f:
-                content: str = f.read().strip()
-                if not content:  # Empty file
-                    return []
-                data: Any = json.loads(content)
-
-            log_debug("Raw JSON history reloaded", action="load_raw_json_history", filepath=os.path.abspath(self.filepath), count=len(data) if isinstance(data, list) else 0)
+            data: Any = self._load(json.loads)
+            log_debug("Raw JSON history reloaded", action="load_raw_json_history", filepath=self._abs_filepath, count=len(data) if isinstance(data, list) else 0)
             return data if isinstance(data, list) else []
         except Exception as e:
-            log_debug("Error reloading raw JSON history", error=str(e), filepath=os.path.abspath(self.filepath))
+            log_debug("Error reloading raw JSON history", error=str(e), filepath=self._abs_filepath)
             return []
 
     # Only modern PydanticAI methods are retained.
@@ -109,66 +233,43 @@ class PydanticJsonlStore:
     async def save_pydantic_history_async(self, messages: List[ModelMessage]) -> None:
         """
         ### save_pydantic_history_async
-        **Description:** Asynchronously serializes and saves a list of PydanticAI messages to the JSONL file.
+        **Description:** Asynchronously serializes and saves a list of PydanticAI messages (in a worker thread: a segment roll compresses the whole history).
         **Parameters:**
         - `messages` (List[ModelMessage]): List of PydanticAI messages to save.
         """
-        import json
-        import aiofiles
-
-        # Use dump_json for consistent serialization with PydanticAI
-        json_bytes: bytes = ModelMessagesTypeAdapter.dump_json(messages, indent=2)
-        json_str: str = json_bytes.decode('utf-8')
-
-        async with aiofiles.open(self.filepath, "w", encoding="utf-8") as f:
-            await f.write(json_str)
-        log_debug("PydanticAI history saved async", action="save_pydantic_history_async", filepath=os.path.abspath(self.filepath), count=len(messages))
+        with timed(PHASE_PERSIST):
+            stats = await asyncio.to_thread(self._write, messages)
+        log_debug("PydanticAI history saved async", action="save_pydantic_history_async", filepath=self._abs_filepath, count=len(messages), **stats)
 
     async def load_pydantic_history_async(self) -> List[ModelMessage]:
         """
         ### load_pydantic_history_async
-        **Description:** Asynchronously reloads the complete PydanticAI history from the JSONL file.
+        **Description:** Asynchronously reloads the complete PydanticAI history (cold segment included).
         **Returns:** List of deserialized PydanticAI messages (List[ModelMessage]).
         """
-        import json
-        import aiofiles
-        
         if not os.path.exists(self.filepath):
             return []
         try:
-            async with aiofiles.open(self.filepath, "r", encoding="utf-8") as f:
-                content: str = (await f.read()).strip()
-                if not content:  # Empty file
-                    return []
-                data: Any = json.loads(content)
-
-            history: List[ModelMessage] = ModelMessagesTypeAdapter.validate_python(data)
-            log_debug("PydanticAI history reloaded async", action="load_pydantic_history_async", filepath=os.path.abspath(self.filepath), count=len(history))
+            with timed(PHASE_HISTORY_LOAD):
+                history: List[ModelMessage] = await self._load_async(ModelMessagesTypeAdapter.validate_json)
+            log_debug("PydanticAI history reloaded async", action="load_pydantic_history_async", filepath=self._abs_filepath, count=len(history))
             return history
         except Exception as e:
-            log_debug("Error reloading PydanticAI history async", error=str(e), filepath=os.path.abspath(self.filepath))
+            log_debug("Error reloading PydanticAI history async", error=str(e), filepath=self._abs_filepath)
             return []
 
     async def load_raw_json_history_async(self) -> List[Dict[str, Any]]:
         """
         ### load_raw_json_history_async
-        **Description:** Asynchronously reloads the complete PydanticAI history as raw JSON data.
+        **Description:** Asynchronously reloads the complete PydanticAI history (cold segment included) as raw JSON data.
         **Returns:** List of raw JSON message dictionaries.
         """
-        import json
-        import aiofiles
-        
         if not os.path.exists(self.filepath):
             return []
         try:
-            async with aiofiles.open(self.filepath, "r", encoding="utf-8") as f:
-                content: str = (await f.read()).strip()
-                if not content:  # Empty file
-                    return []
-                data: Any = json.loads(content)
-
-            log_debug("Raw JSON history reloaded async", action="load_raw_json_history_async", filepath=os.path.abspath(self.filepath), count=len(data) if isinstance(data, list) else 0)
+            data: Any = await self._load_async(json.loads)
+            log_debug("Raw JSON history reloaded async", action="load_raw_json_history_async", filepath=self._abs_filepath, count=len(data) if isinstance(data, list) else 0)
             return data if isinstance(data, list) else []
         except Exception as e:
-            log_debug("Error reloading raw JSON history async", error=str(e), filepath=os.path.abspath(self.filepath))
+            log_debug("Error reloading raw JSON history async", error=str(e), filepath=self._abs_filepath)
             return []
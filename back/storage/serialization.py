@@ -0,0 +1,160 @@
+"""
+On-disk serialization shared by the stores: JSON encoding (compact by default, `storage.json_indent`),
+compression of the cold history segments (`storage.compression`: gzip, or zstd when the optional
+`zstandard` package is installed) and atomic writes. Reading never depends on the configuration:
+indented or compact JSON load alike, and compressed data is recognised by its magic bytes.
+"""
+
+import gzip
+import os
+from functools import lru_cache
+from typing import Any, List, Optional
+from uuid import uuid4
+
+import pydantic_core
+from pydantic import BaseModel
+from pydantic_ai.messages import ModelMessage, ModelMessagesTypeAdapter
+
+from back.config import get_storage_config
+from back.utils.logger import log_warning
+
+CODEC_NONE = "none"
+CODEC_GZIP = "gzip"
+CODEC_ZSTD = "zstd"
+
+COLD_EXTENSIONS = {CODEC_GZIP: ".gz", CODEC_ZSTD: ".zst"}
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def json_indent() -> Optional[int]:
+    """Indentation of the JSON written to disk (None: compact)."""
+    return get_storage_config()["json_indent"]
+
+
+def dump_model(model: BaseModel) -> bytes:
+    """
+    ### dump_model
+    **Description:** Serializes a Pydantic model to JSON bytes with the configured indentation.
+    **Parameters:**
+    - `model` (BaseModel): Model to serialize.
+    **Returns:** UTF-8 JSON bytes.
+    """
+    return model.model_dump_json(indent=json_indent()).encode("utf-8")
+
+
+def dump_data(data: Any) -> bytes:
+    """
+    ### dump_data
+    **Description:** Serializes plain data (dicts, lists...) to JSON bytes with pydantic-core's encoder,
+    several times faster than `json.dumps`. Non-ASCII characters are written as UTF-8, as with
+    `ensure_ascii=False`.
+    **Parameters:**
+    - `data` (Any): Data to serialize.
+    **Returns:** UTF-8 JSON bytes.
+    """
+    return pydantic_core.to_json(data, indent=json_indent())
+
+
+def dump_messages(messages: List[ModelMessage]) -> bytes:
+    """
+    ### dump_messages
+    **Description:** Serializes PydanticAI messages with `ModelMessagesTypeAdapter.dump_json` and the
+    configured indentation.
+    **Parameters:**
+    - `messages` (List[ModelMessage]): Messages to serialize.
+    **Returns:** UTF-8 JSON bytes (a JSON array).
+    """
+    return ModelMessagesTypeAdapter.dump_json(messages, indent=json_indent())
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+@lru_cache(maxsize=None)
+def _resolve_codec(configured: str) -> str:
+    if configured in (CODEC_NONE, CODEC_GZIP):
+        return configured
+    if configured == CODEC_ZSTD:
+        if _zstandard() is not None:
+            return CODEC_ZSTD
+        log_warning("zstandard is not installed, cold history segments fall back to gzip",
+                    action="storage_codec_fallback")
+        return CODEC_GZIP
+    log_warning("Unknown storage compression, cold history segments use gzip",
+                action="storage_codec_fallback", compression=configured)
+    return CODEC_GZIP
+
+
+def compression_codec() -> str:
+    """Codec of the cold history segments: `none`, `gzip` or `zstd` (gzip if zstandard is missing)."""
+    return _resolve_codec(get_storage_config()["compression"])
+
+
+def compress(raw: bytes, codec: str) -> bytes:
+    """
+    ### compress
+    **Description:** Compresses bytes with the given codec and the configured `compression_level`.
+    **Parameters:**
+    - `raw` (bytes): Data to compress.
+    - `codec` (str): `gzip`, `zstd` or `none`.
+    **Returns:** The compressed bytes (unchanged for `none`).
+    """
+    level = get_storage_config()["compression_level"]
+    if codec == CODEC_ZSTD:
+        zstandard = _zstandard()
+        return zstandard.ZstdCompressor(level=level if level is not None else 3).compress(raw)
+    if codec == CODEC_GZIP:
+        # mtime=0: identical data gives identical files
+        return gzip.compress(raw, compresslevel=level if level is not None else 6, mtime=0)
+    return raw
+
+
+def decompress(raw: bytes) -> bytes:
+    """
+    ### decompress
+    **Description:** Decompresses gzip or zstd data, recognised by its magic bytes; other data is returned
+    as is.
+    **Parameters:**
+    - `raw` (bytes): Data read from disk.
+    **Returns:** The decompressed bytes.
+    **Raises:**
+    - RuntimeError: zstd data and the zstandard package is not installed.
+    """
+    if raw.startswith(_GZIP_MAGIC):
+        return gzip.decompress(raw)
+    if raw.startswith(_ZSTD_MAGIC):
+        zstandard = _zstandard()
+        if zstandard is None:
+            raise RuntimeError("zstd-compressed data requires the zstandard package")
+        return zstandard.ZstdDecompressor().decompressobj().decompress(raw)
+    return raw
+
+
+def write_atomic(path: str, raw: bytes) -> None:
+    """
+    ### write_atomic
+    **Description:** Writes bytes to a temporary file then renames it over `path`: readers see either the
+    previous content or the new one, never a partial file. The temporary name is unique, so concurrent
+    writers to the same path do not collide (the last rename wins).
+    **Parameters:**
+    - `path` (str): Destination file.
+    - `raw` (bytes): Content to write.
+    """
+    tmp_path = f"{path}.{uuid4().hex[:12]}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(raw)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
@@ -32,8 +32,9 @@ def clean_test_data_dir():
     else:
         os.makedirs(test_scenarios_dir, exist_ok=True)
 
-    # Copy static data files (equipment.yaml, skill_groups.yaml)
-    for filename in ['equipment.yaml', 'skill_groups.yaml']:
+    # Copy static data files (equipment, skills, races, NPC archetypes, combat rules, spells)
+    for filename in ['equipment.yaml', 'skill_groups.yaml', 'skills.yaml', 'races_and_cultures.yaml',
+                     'npc_archetypes.yaml', 'combat_system.yaml', 'spells.yaml']:
         src = os.path.join(PROD_DATA_DIR, filename)
         dst = os.path.join(TEST_DATA_DIR, filename)
         if os.path.exists(src):
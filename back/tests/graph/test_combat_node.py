@@ -26,8 +26,7 @@ def mock_graph_context(mock_session_service):
     player_message = PlayerMessagePayload(message="Attack")
     state = SessionGraphState(
         game_state=game_state,
-        pending_player_message=player_message,
-        model_messages=[]
+        pending_player_message=player_message
     )
     
     return GraphRunContext(
@@ -101,3 +100,39 @@ async def test_combat_node_run_end(mock_graph_context):
         assert mock_graph_context.state.game_state.last_combat_result == end_payload.model_dump()
         
         mock_graph_context.deps.update_game_state.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_combat_node_npc_turns_end_combat_before_agent(mock_graph_context):
+    from back.models.domain.combat_state import CombatState, Combatant, CombatantType
+
+    orc = Combatant(name="Orc", type=CombatantType.NPC, current_hit_points=12, max_hit_points=12,
+                    armor_class=12, initiative_roll=0, npc_id=uuid4(), weapon_damage="1d6")
+    hero = Combatant(name="Hero", type=CombatantType.PLAYER, current_hit_points=0, max_hit_points=30,
+                     armor_class=14, initiative_roll=0, character_id=uuid4())
+    state = CombatState(participants=[orc, hero], turn_order=[orc.id, hero.id], current_turn_combatant_id=orc.id)
+    npc_turns = [{"message": "Orc hits Hero for 9 damage."}]
+    mock_graph_context.deps.session_id = str(uuid4())
+    mock_graph_context.deps.load_history = AsyncMock(return_value=[])
+
+    with patch('back.graph.nodes.combat_node.CombatAgent'):
+        node = CombatNode()
+    with patch('back.services.combat_state_service.CombatStateService') as MockServiceClass, \
+            patch('back.graph.nodes.combat_node.CombatService') as MockCombatService:
+        MockServiceClass.return_value.load_combat_state.return_value = state
+        combat_service = MockCombatService.return_value
+        combat_service.resolve_npc_turns.return_value = (state, npc_turns)
+        combat_service.get_end_reason.return_value = "defeat"
+        combat_service.end_combat.return_value = state
+
+        result = await node.run(mock_graph_context)
+
+        # No LLM turn against the deleted combat
+        node.combat_agent.run.assert_not_called()
+        MockServiceClass.return_value.delete_combat_state.assert_called_once()
+    game_state = mock_graph_context.state.game_state
+    assert game_state.session_mode == "narrative"
+    assert game_state.active_combat_id is None
+    assert game_state.last_combat_result["winners"] == ["Orc"]
+    assert "Orc hits Hero" in game_state.last_combat_result["combat_summary"]
+    mock_graph_context.deps.save_history.assert_called_once()
+    assert result.data.new_messages[-1]["parts"][0]["content"].endswith("Combat ended: defeat")
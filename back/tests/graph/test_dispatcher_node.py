@@ -22,8 +22,7 @@ def mock_graph_context(mock_session_service):
     player_message = PlayerMessagePayload(message="Hello")
     state = SessionGraphState(
         game_state=game_state,
-        pending_player_message=player_message,
-        model_messages=[]
+        pending_player_message=player_message
     )
     
     return GraphRunContext(
@@ -42,8 +41,9 @@ async def test_dispatcher_node_route_narrative(mock_graph_context):
     
     # Assert
     assert isinstance(result, NarrativeNode)
-    mock_graph_context.deps.load_history.assert_called_once_with(HISTORY_NARRATIVE)
+    mock_graph_context.deps.load_history.assert_not_called()
     assert mock_graph_context.state.active_history_kind == HISTORY_NARRATIVE
+    assert mock_graph_context.state.history.kind == HISTORY_NARRATIVE
 
 @pytest.mark.asyncio
 async def test_dispatcher_node_route_combat(mock_graph_context):
@@ -56,8 +56,9 @@ async def test_dispatcher_node_route_combat(mock_graph_context):
     
     # Assert
     assert isinstance(result, CombatNode)
-    mock_graph_context.deps.load_history.assert_called_once_with(HISTORY_COMBAT)
+    mock_graph_context.deps.load_history.assert_not_called()
     assert mock_graph_context.state.active_history_kind == HISTORY_COMBAT
+    assert mock_graph_context.state.history.kind == HISTORY_COMBAT
 
 @pytest.mark.asyncio
 async def test_dispatcher_node_unknown_mode(mock_graph_context):
@@ -72,8 +73,9 @@ async def test_dispatcher_node_unknown_mode(mock_graph_context):
     # Based on current implementation: if mode == "narrative" -> NarrativeNode, else -> CombatNode
     assert isinstance(result, CombatNode)
     # history_kind logic: if mode == "narrative" -> HISTORY_NARRATIVE, else -> HISTORY_COMBAT
-    mock_graph_context.deps.load_history.assert_called_once_with(HISTORY_COMBAT)
+    mock_graph_context.deps.load_history.assert_not_called()
     assert mock_graph_context.state.active_history_kind == HISTORY_COMBAT
+    assert mock_graph_context.state.history.kind == HISTORY_COMBAT
 
 @pytest.mark.asyncio
 async def test_dispatcher_node_history_load_failure(mock_graph_context):
@@ -84,8 +86,11 @@ async def test_dispatcher_node_history_load_failure(mock_graph_context):
     # Mock load_history failure
     mock_graph_context.deps.load_history.side_effect = Exception("DB Error")
     
-    # Execute & Assert
+    # Execute: routing does not read the history
+    await node.run(mock_graph_context)
+
+    # Assert: the failure surfaces when a node reads the history
     with pytest.raises(Exception, match="DB Error"):
-        await node.run(mock_graph_context)
+        await mock_graph_context.state.history.get()
     
     mock_graph_context.deps.load_history.assert_called_once_with(HISTORY_NARRATIVE)
@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+from pydantic_ai.messages import ModelResponse, TextPart
+
+from back.graph.dto.session import GameState, HistoryHandle, PlayerMessagePayload, SessionGraphState
+from back.services.game_session_service import HISTORY_COMBAT, HISTORY_NARRATIVE
+
+
+def make_state() -> SessionGraphState:
+    return SessionGraphState(game_state=GameState(), pending_player_message=PlayerMessagePayload(message="Hello"))
+
+
+@pytest.mark.asyncio
+async def test_history_loaded_once_and_shared():
+    loader = AsyncMock(return_value=[ModelResponse(parts=[TextPart(content="Once upon a time")])])
+    handle = HistoryHandle(HISTORY_NARRATIVE, loader)
+
+    assert not handle.loaded
+    first, second = await asyncio.gather(handle.get(), handle.get())
+    first.append(ModelResponse(parts=[TextPart(content="The end")]))
+
+    assert first is second
+    assert len(await handle.get()) == 2
+    loader.assert_awaited_once_with(HISTORY_NARRATIVE)
+
+
+@pytest.mark.asyncio
+async def test_state_reuses_handle_of_same_kind():
+    state = make_state()
+    loader = AsyncMock(return_value=[])
+
+    narrative = state.history_handle(HISTORY_NARRATIVE, loader)
+    await narrative.get()
+
+    assert state.history_handle(HISTORY_NARRATIVE, loader) is narrative
+    assert state.active_history_kind == HISTORY_NARRATIVE
+    loader.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_state_replaces_handle_of_other_kind():
+    state = make_state()
+    loader = AsyncMock(return_value=[])
+
+    narrative = state.history_handle(HISTORY_NARRATIVE, loader)
+    combat = state.history_handle(HISTORY_COMBAT, loader)
+
+    assert combat is not narrative
+    assert state.history is combat
+    assert state.active_history_kind == HISTORY_COMBAT
+    loader.assert_not_awaited()
@@ -45,11 +45,9 @@ def mock_graph_context(mock_session_service):
     player_message = PlayerMessagePayload(message="Hello")
     state = SessionGraphState(
         game_state=game_state,
-        pending_player_message=player_message,
-        model_messages=[]
+        pending_player_message=player_message
     )
     
-    # Mock the history (state.history) if needed, but here we use model_messages
     
     return GraphRunContext(
         deps=mock_session_service,
@@ -66,8 +66,7 @@ async def test_narrative_summarization_integration(mock_deps, mock_llm_config):
         ctx.deps = mock_deps
         ctx.state = SessionGraphState(
             game_state=MagicMock(),
-            pending_player_message=MagicMock(message="Hello"),
-            model_messages=[]
+            pending_player_message=MagicMock(message="Hello")
         )
         
         # Mock agent response for run 1
@@ -79,7 +79,7 @@ def build_combatants(hero: Character, npc_count: int) -> List[Combatant]:
         max_hit_points=hero.combat_stats.max_hit_points,
         armor_class=hero.combat_stats.armor_class,
         initiative_roll=17,
-        character_ref=hero,
+        character_id=hero.id,
     )
     participants.append(hero_combatant)
 
@@ -92,7 +92,8 @@ def build_combatants(hero: Character, npc_count: int) -> List[Combatant]:
             max_hit_points=npc.combat_stats.max_hit_points,
             armor_class=npc.combat_stats.armor_class,
             initiative_roll=12 - i,
-            npc_ref=npc,
+            npc_id=npc.id,
+            archetype=npc.archetype,
         )
         participants.append(npc_combatant)
     return participants
@@ -118,8 +119,8 @@ def test_combat_round_player_vs_npcs(npc_count: int) -> None:
     combat_state.add_log_entry(f"{participants[0].name} strikes {target.name} for {dealt} damage")
     assert dealt == 10
     assert target.current_hit_points == target.max_hit_points - 10
-    assert target.npc_ref is not None
-    assert target.npc_ref.name == target.name
+    assert target.npc_id is not None
+    assert target.archetype == "Goblin Warrior"
 
     # Each NPC retaliates
     for npc_combatant in participants[1:]:
@@ -131,7 +132,7 @@ def test_combat_round_player_vs_npcs(npc_count: int) -> None:
         assert damage_to_player == 4
         assert npc_combatant.is_alive()
 
-    assert participants[0].character_ref is not None
+    assert participants[0].character_id == hero.id
     assert participants[0].current_hit_points == hero.combat_stats.max_hit_points - (4 * npc_count)
     # Ensure combat log captured each action (player + each NPC)
     assert len(combat_state.log) == 1 + npc_count
\ No newline at end of file
@@ -0,0 +1,112 @@
+"""Index, alive counters and turn advance of CombatState in large battles."""
+from uuid import uuid4
+
+from back.models.domain.combat_state import CombatState, Combatant, CombatantType
+from back.services.combat_service import CombatService
+
+
+def make_combatant(index: int, combatant_type: CombatantType, hp: int = 10) -> Combatant:
+    reference = {"character_id": uuid4()} if combatant_type == CombatantType.PLAYER else {"npc_id": uuid4()}
+    return Combatant(name=f"{combatant_type.value}-{index}", type=combatant_type, current_hit_points=hp,
+                     max_hit_points=hp, armor_class=10, initiative_roll=0, **reference)
+
+
+def make_battle(players: int = 4, npcs: int = 196) -> CombatState:
+    participants = [make_combatant(i, CombatantType.PLAYER) for i in range(players)]
+    participants += [make_combatant(i, CombatantType.NPC) for i in range(npcs)]
+    return CombatState(participants=participants, turn_order=[p.id for p in participants],
+                       current_turn_combatant_id=participants[0].id)
+
+
+def test_lookup_by_id_and_alias_in_large_battle():
+    state = make_battle()
+    last = state.participants[-1]
+
+    assert state.get_combatant(last.id) is last
+    assert state.find_combatant(str(last.id)) is last
+    assert state.find_combatant(str(last.id).upper()) is last
+    assert state.find_combatant(last.id.hex) is last
+    assert state.find_combatant("e196") is last
+    assert state.find_combatant("P4") is state.participants[3]
+    assert state.get_combatant(uuid4()) is None
+    assert state.find_combatant("E197") is None
+
+
+def test_alive_counters_follow_hit_points():
+    state = make_battle(players=2, npcs=3)
+    goblin = state.participants[2]
+
+    goblin.take_damage(goblin.max_hit_points)
+    assert state.alive_count(CombatantType.NPC) == 2
+
+    goblin.heal(1)
+    assert state.alive_count(CombatantType.NPC) == 3
+
+    state.participants[0].current_hit_points = 0
+    assert state.alive_count(CombatantType.PLAYER) == 1
+
+
+def test_advance_turn_skips_the_dead_and_counts_rounds():
+    state = make_battle(players=2, npcs=4)
+    hero, ally, *goblins = state.participants
+    goblins[0].take_damage(100)
+    goblins[3].take_damage(100)
+
+    order = []
+    for _ in range(6):
+        combatant, _ = state.advance_turn()
+        order.append(combatant.name)
+
+    assert order == ["player-1", "npc-1", "npc-2", "player-0", "player-1", "npc-1"]
+    assert state.round_number == 2
+    assert state.current_turn_index == state.turn_order.index(goblins[1].id)
+
+
+def test_revived_combatant_gets_its_turn_back():
+    state = make_battle(players=1, npcs=3)
+    goblin = state.participants[1]
+    goblin.take_damage(100)
+    state.advance_turn()
+    state.advance_turn()
+    state.advance_turn()
+
+    goblin.heal(5)
+    combatant, new_round = state.advance_turn()
+
+    assert combatant is goblin
+    assert not new_round
+
+
+def test_assigning_current_turn_moves_the_pointer():
+    state = make_battle(players=1, npcs=3)
+    target = state.participants[2]
+
+    state.current_turn_combatant_id = target.id
+
+    assert state.current_turn_index == 2
+    assert state.advance_turn()[0] is state.participants[3]
+
+
+def test_deep_copy_keeps_its_own_counters():
+    state = make_battle(players=1, npcs=2)
+    state.alive_count(CombatantType.NPC)
+    copy = state.model_copy(deep=True)
+
+    copy.participants[1].take_damage(100)
+
+    assert copy.alive_count(CombatantType.NPC) == 1
+    assert state.alive_count(CombatantType.NPC) == 2
+
+
+def test_end_turn_and_end_reason_in_mass_battle():
+    service = CombatService(resolver=object())
+    state = make_battle(players=1, npcs=150)
+    for goblin in state.participants[1:-1]:
+        goblin.take_damage(100)
+
+    service.end_turn(state)
+    assert state.get_current_combatant() is state.participants[-1]
+    assert service.get_end_reason(state) is None
+
+    state.participants[-1].take_damage(100)
+    assert service.get_end_reason(state) == "victory"
@@ -0,0 +1,61 @@
+"""Combat rules compiled from combat_system.yaml."""
+import os
+
+import pytest
+
+from back.config import get_data_dir
+from back.models.domain.combat_system_manager import CombatSystemManager, CompiledFormula
+
+
+def test_formula_compiles_dice_and_variables():
+    formula = CompiledFormula("1d20 + agility_bonus + (intuition / 3)")
+
+    assert formula.dice == [(1, 20)]
+    assert formula.variables == ["agility_bonus", "intuition"]
+    assert formula.evaluate({"agility_bonus": 2, "intuition": 8}, [10]) == 14
+    assert formula.evaluate({}, [7]) == 7
+
+
+def test_formula_strips_units():
+    assert CompiledFormula("agility * 1.5_meters").evaluate({"agility": 4}, ()) == 6
+
+
+@pytest.mark.parametrize("source", ["__import__('os').system('ls')", "agility.real", "[1, 2]", "1 +"])
+def test_formula_rejects_unsupported_expressions(source):
+    with pytest.raises(ValueError):
+        CompiledFormula(source)
+
+
+def test_rules_are_compiled_from_yaml():
+    rules = CombatSystemManager().get_rules()
+
+    assert rules.critical_roll == 20
+    assert rules.fumble_roll == 1
+    assert rules.critical_weapon_damage(5) == 10
+    assert rules.action_bonus("defend") == 4
+    assert rules.action_bonus("attack") == 0
+    assert rules.actions["flee"]["type"] == "major_action"
+    assert rules.attack_roll.evaluate({"weapon_skill": 3}, [12]) == 15
+
+
+def test_rules_are_cached_per_version():
+    first = CombatSystemManager()
+    second = CombatSystemManager()
+
+    assert first.get_rules() is second.get_rules()
+    assert first.get_rules() is first.get_rules()
+
+
+def test_rules_recompile_when_file_changes():
+    manager = CombatSystemManager()
+    before = manager.get_rules()
+    path = os.path.join(get_data_dir(), 'combat_system.yaml')
+    with open(path, encoding='utf-8') as file:
+        content = file.read()
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(content.replace("bonus: 4", "bonus: 5", 1))
+
+    after = manager.get_rules()
+
+    assert after.version != before.version
+    assert after.action_bonus("defend") == 5
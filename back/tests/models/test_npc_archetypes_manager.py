@@ -0,0 +1,50 @@
+"""NPC archetype catalog: compilation, matching and template cloning."""
+import pytest
+
+from back.models.domain.npc_archetypes_manager import NpcArchetypesManager
+
+
+@pytest.fixture
+def manager() -> NpcArchetypesManager:
+    return NpcArchetypesManager()
+
+
+@pytest.mark.parametrize("archetype, name, expected", [
+    ("Goblin Archer", "Snaga", "goblin"),
+    ("Orc Warrior", "Grishnakh", "orc"),
+    (None, "Skeleton Guard", "skeleton"),
+    ("Bandit", "Highwayman", "bandit"),
+    ("Dark Sorcerer", "Mage", "generic"),
+    (None, "Orcs of the Pass", "orc"),
+])
+def test_find_archetype_key(manager, archetype, name, expected):
+    assert manager.find_archetype_key(archetype, name) == expected
+
+
+def test_templates_are_compiled_with_equipment(manager):
+    orc = manager.templates["orc"]
+
+    assert orc.equipment.weapons[0].name == "Greataxe"
+    assert orc.equipment.armor[0].name == "Hide Armor"
+    assert orc.combat_stats.max_hit_points == 15
+
+
+def test_create_npc_clones_template(manager):
+    template = manager.get_template("Goblin Warrior")
+
+    first = manager.create_npc("Goblin #1", archetype="Goblin Warrior")
+    second = manager.create_npc("Goblin #2", archetype="Goblin Warrior", hp=20, ac=15)
+
+    assert first.id != second.id != template.id
+    assert first.equipment is template.equipment
+    assert first.combat_stats is not template.combat_stats
+    assert first.combat_stats.current_hit_points == template.combat_stats.max_hit_points
+    assert second.combat_stats.max_hit_points == 20
+    assert second.combat_stats.armor_class == 15
+    assert template.combat_stats.armor_class == 12
+
+
+def test_get_tactic(manager):
+    assert manager.get_tactic("Warg") == "easiest"
+    assert manager.get_tactic("Troll") == "strongest"
+    assert manager.get_tactic("Unknown Horror") == "weakest"
@@ -0,0 +1,37 @@
+"""Spell catalog loaded from spells.yaml."""
+import pytest
+
+from back.models.domain.spells_manager import SpellsManager
+
+
+@pytest.fixture
+def manager() -> SpellsManager:
+    return SpellsManager()
+
+
+def test_get_spell_is_case_and_spacing_insensitive(manager):
+    spell = manager.get_spell("  magic   MISSILE ")
+
+    assert spell is not None
+    assert spell.name == "Magic Missile"
+    assert spell.sphere == "Mage"
+    assert spell.power_cost == 2
+    assert spell.effect.type == "damage"
+    assert spell.effect.dice == "1d6"
+
+
+def test_spells_without_effect_are_narrative(manager):
+    assert manager.get_spell("Light").effect is None
+
+
+def test_sphere_index(manager):
+    healer = manager.get_sphere_spells("healer")
+
+    assert [spell.name for spell in healer][:2] == ["Major Healing", "Purification"]
+    assert manager.get_sphere_spells("Necromancy") == []
+    assert manager.get_sphere_names()[0] == "Universal"
+
+
+def test_unknown_spell_suggestions(manager):
+    assert manager.get_spell("Firebal") is None
+    assert "Fireball" in manager.suggest("Firebal")
@@ -0,0 +1,62 @@
+"""Precomputed lookups of UnifiedSkillsManager match a full scan of the skills data."""
+import pytest
+
+from back.models.domain.unified_skills_manager import UnifiedSkillsManager
+
+
+@pytest.fixture
+def manager():
+    return UnifiedSkillsManager()
+
+
+def scan_skill_by_name(manager, skill_name):
+    for group_name, skills in manager.get_all_skills().items():
+        for skill_id, info in skills.items():
+            if info.get("name") == skill_name:
+                return {"group": group_name, "id": skill_id, **info}
+    return None
+
+
+def scan_stat_bonuses(manager, stat_name, stat_value):
+    # skills.yaml: stat_bonuses: {<stat>: {min_value, bonus_points}}
+    return [
+        {"group": group_name, "skill": skill_id, "bonus_points": bonus.get("bonus_points", 0)}
+        for group_name, skills in manager.get_all_skills().items()
+        for skill_id, info in skills.items()
+        for name, bonus in info.get("stat_bonuses", {}).items()
+        if name == stat_name and stat_value >= bonus.get("min_value", 0)
+    ]
+
+
+def key(bonus):
+    return bonus["group"], bonus["skill"]
+
+
+def test_skill_by_name_matches_scan(manager):
+    names = [info["name"] for skills in manager.get_all_skills().values() for info in skills.values()]
+    assert names
+    for name in names:
+        assert manager.get_skill_by_name(name) == scan_skill_by_name(manager, name)
+    assert manager.get_skill_by_name("No Such Skill") is None
+
+
+def test_skill_by_name_returns_a_copy(manager):
+    name = next(iter(next(iter(manager.get_all_skills().values())).values()))["name"]
+    manager.get_skill_by_name(name)["group"] = "tampered"
+    assert manager.get_skill_by_name(name)["group"] != "tampered"
+
+
+@pytest.mark.parametrize("stat_name", ["strength", "agility", "intelligence", "wisdom", "charisma", "constitution"])
+def test_stat_bonuses_match_scan(manager, stat_name):
+    for value in range(0, 25):
+        indexed = manager.get_stat_based_skill_bonuses(stat_name, value)
+        assert sorted(indexed, key=key) == sorted(scan_stat_bonuses(manager, stat_name, value), key=key)
+
+
+def test_stat_bonuses_apply_above_threshold(manager):
+    assert manager.get_stat_based_skill_bonuses("charisma", 20)
+    assert manager.get_stat_based_skill_bonuses("charisma", 3) == []
+
+
+def test_unknown_stat_has_no_bonuses(manager):
+    assert manager.get_stat_based_skill_bonuses("luck", 20) == []
@@ -9,7 +9,7 @@ from fastapi.testclient import TestClient
 from unittest.mock import patch
 from uuid import uuid4
 from back.app import app
-from back.models.domain.character import Character, Stats, Skills, CombatStats, Equipment, Spells, CharacterStatus
+from back.models.domain.character import Character, CharacterSummary, Stats, Skills, CombatStats, Equipment, Spells, CharacterStatus
 from back.models.domain.items import EquipmentItem
 
 client = TestClient(app)
@@ -51,21 +51,77 @@ MOCK_CHARACTER_2 = Character(
 @patch('back.routers.characters.CharacterDataService')
 def test_list_characters_success(mock_data_service):
     """
-    Test successful listing of characters.
+    Test successful listing of characters as summaries.
     """
     mock_service_instance = mock_data_service.return_value
-    mock_service_instance.get_all_characters.return_value = [MOCK_CHARACTER_1, MOCK_CHARACTER_2]
+    mock_service_instance.list_character_summaries.return_value = (
+        [CharacterSummary.from_character(MOCK_CHARACTER_1), CharacterSummary.from_character(MOCK_CHARACTER_2)],
+        None
+    )
 
     response = client.get("/api/characters/")
 
     assert response.status_code == 200
     data = response.json()
-    assert isinstance(data, list)
-    assert len(data) == 2
-    assert data[0]["name"] == "Aragorn"
-    assert data[1]["name"] == "Legolas"
+    assert isinstance(data["characters"], list)
+    assert len(data["characters"]) == 2
+    assert data["characters"][0]["name"] == "Aragorn"
+    assert data["characters"][1]["name"] == "Legolas"
+    assert "stats" not in data["characters"][0]
+    assert data["next_cursor"] is None
 
-    mock_service_instance.get_all_characters.assert_called_once()
+    mock_service_instance.list_character_summaries.assert_called_once_with(50, None)
+    mock_service_instance.load_character.assert_not_called()
+
+
+@patch('back.routers.characters.CharacterDataService')
+def test_list_characters_pagination(mock_data_service):
+    """
+    Test that limit and cursor are passed through and the next cursor is returned.
+    """
+    mock_service_instance = mock_data_service.return_value
+    mock_service_instance.list_character_summaries.return_value = (
+        [CharacterSummary.from_character(MOCK_CHARACTER_1)], "next-page"
+    )
+
+    response = client.get("/api/characters/?limit=1&cursor=this-page")
+
+    assert response.status_code == 200
+    assert response.json()["next_cursor"] == "next-page"
+    mock_service_instance.list_character_summaries.assert_called_once_with(1, "this-page")
+
+
+@patch('back.routers.characters.CharacterDataService')
+def test_list_characters_full(mock_data_service):
+    """
+    Test that full=true loads the characters of the page in full.
+    """
+    mock_service_instance = mock_data_service.return_value
+    mock_service_instance.list_character_summaries.return_value = (
+        [CharacterSummary.from_character(MOCK_CHARACTER_1)], None
+    )
+    mock_service_instance.load_character.return_value = MOCK_CHARACTER_1
+
+    response = client.get("/api/characters/?full=true")
+
+    assert response.status_code == 200
+    character = response.json()["characters"][0]
+    assert character["stats"]["strength"] == 16
+    assert character["culture"] == "Gondor"
+    mock_service_instance.load_character.assert_called_once_with(str(MOCK_CHARACTER_1.id))
+
+
+@patch('back.routers.characters.CharacterDataService')
+def test_list_characters_invalid_cursor(mock_data_service):
+    """
+    Test listing characters with an invalid cursor.
+    """
+    mock_service_instance = mock_data_service.return_value
+    mock_service_instance.list_character_summaries.side_effect = ValueError("Curseur de pagination invalide: bad")
+
+    response = client.get("/api/characters/?cursor=bad")
+
+    assert response.status_code == 400
 
 
 @patch('back.routers.characters.CharacterDataService')
@@ -74,16 +130,16 @@ def test_list_characters_empty(mock_data_service):
     Test listing characters when no characters exist.
     """
     mock_service_instance = mock_data_service.return_value
-    mock_service_instance.get_all_characters.return_value = []
+    mock_service_instance.list_character_summaries.return_value = ([], None)
 
     response = client.get("/api/characters/")
 
     assert response.status_code == 200
     data = response.json()
-    assert isinstance(data, list)
-    assert len(data) == 0
+    assert isinstance(data["characters"], list)
+    assert len(data["characters"]) == 0
 
-    mock_service_instance.get_all_characters.assert_called_once()
+    mock_service_instance.list_character_summaries.assert_called_once()
 
 
 @patch('back.routers.characters.CharacterDataService')
@@ -92,7 +148,7 @@ def test_list_characters_service_error(mock_data_service):
     Test listing characters when service raises an exception.
     """
     mock_service_instance = mock_data_service.return_value
-    mock_service_instance.get_all_characters.side_effect = Exception("Database error")
+    mock_service_instance.list_character_summaries.side_effect = Exception("Database error")
 
     response = client.get("/api/characters/")
 
@@ -101,7 +157,7 @@ def test_list_characters_service_error(mock_data_service):
     assert "detail" in data
     assert "Erreur lors de la récupération des personnages" in data["detail"]
 
-    mock_service_instance.get_all_characters.assert_called_once()
+    mock_service_instance.list_character_summaries.assert_called_once()
 
 
 @patch('back.routers.characters.CharacterDataService')
@@ -187,7 +243,7 @@ def test_get_character_detail_empty_id():
     # This should route to list_characters, not get_character_detail
     assert response.status_code == 200
     data = response.json()
-    assert isinstance(data, list)
+    assert isinstance(data["characters"], list)
 
 
 @patch('back.routers.characters.CharacterDataService')
@@ -288,12 +344,14 @@ def test_list_characters_with_mixed_status(mock_data_service):
     draft_char.status = CharacterStatus.DRAFT
 
     mock_service_instance = mock_data_service.return_value
-    mock_service_instance.get_all_characters.return_value = [active_char, draft_char]
+    mock_service_instance.list_character_summaries.return_value = (
+        [CharacterSummary.from_character(active_char), CharacterSummary.from_character(draft_char)], None
+    )
 
     response = client.get("/api/characters/")
 
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()["characters"]
     assert len(data) == 2
     assert data[0]["status"] == "active"
     assert data[1]["status"] == "draft"
@@ -331,12 +389,14 @@ def test_list_characters_large_dataset(mock_data_service):
         char.name = f"Character {i+1}"
 
     mock_service_instance = mock_data_service.return_value
-    mock_service_instance.get_all_characters.return_value = characters
+    mock_service_instance.list_character_summaries.return_value = (
+        [CharacterSummary.from_character(char) for char in characters], None
+    )
 
     response = client.get("/api/characters/")
 
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()["characters"]
     assert len(data) == 50
     assert data[0]["name"] == "Character 1"
     assert data[49]["name"] == "Character 50"
@@ -419,4 +419,29 @@ def test_validate_character_by_id_invalid_payload(mock_data_service):
     assert response.status_code == 200
     payload = response.json()
     assert payload["valid"] is False
-    assert payload["errors"]
\ No newline at end of file
+    assert payload["errors"]
+
+@patch('back.routers.creation.global_container')
+def test_create_random_characters_batch(mock_container):
+    """
+    Test that the batch endpoint creates `count` characters without flavour text by default.
+    """
+    mock_service = mock_container.random_character_service
+
+    async def create_side_effect(count, agent):
+        assert agent is None
+        return [MOCK_CHARACTER_1] * count
+    mock_service.create_random_characters.side_effect = create_side_effect
+
+    resp = client.post("/api/creation/random/batch", params={"count": 3})
+
+    assert resp.status_code == 200
+    assert resp.json()["count"] == 3
+    assert len(resp.json()["characters"]) == 3
+
+
+def test_create_random_characters_batch_rejects_invalid_count():
+    """
+    Test that the batch size is bounded.
+    """
+    assert client.post("/api/creation/random/batch", params={"count": 0}).status_code == 422
@@ -138,7 +138,7 @@ def test_start_scenario_success():
         "timestamp": "2024-01-01T00:00:00Z"
     }
     
-    mock_dispatch_result = DispatchResult(all_messages=[expected_message_dict], new_messages=[expected_message_dict])
+    mock_dispatch_result = DispatchResult(new_messages=[expected_message_dict], history_version=1)
 
     with patch('back.routers.gamesession.CharacterDataService') as MockDataService:
         mock_data_instance = MockDataService.return_value
@@ -179,5 +179,133 @@ def test_start_scenario_success():
                 # Check content of response
                 assert len(response_data["response"]) == 1
                 assert response_data["response"][0]["parts"][0]["content"] == mock_llm_response
+                assert response_data["history_kind"] == "narrative"
+                assert response_data["history_version"] == 1
 
 
+def _continue_session(dispatch_result, query=""):
+    from back.graph.dto.session import GameState
+
+    session_id = uuid4()
+    with patch('back.routers.gamesession.GameSessionService') as MockSessionService:
+        mock_service_instance = MagicMock()
+        MockSessionService.load = AsyncMock(return_value=mock_service_instance)
+        mock_service_instance.load_game_state = AsyncMock(return_value=GameState())
+        with patch('back.routers.gamesession.session_graph.run', new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = MagicMock(output=dispatch_result)
+            return client.post(f"/api/gamesession/play?session_id={session_id}{query}", json={"message": "I look around."})
+
+
+def test_play_returns_only_new_messages():
+    """
+    Test that a turn returns only its own messages and the history version.
+    """
+    from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, UserPromptPart, ModelMessagesTypeAdapter
+    from back.graph.dto.session import DispatchResult
+
+    history = [ModelResponse(parts=[TextPart(content=f"Old answer {i}")]) for i in range(10)]
+    new_messages = [ModelRequest(parts=[UserPromptPart(content="I look around.")]),
+                    ModelResponse(parts=[TextPart(content="You see a tavern.")])]
+    history.extend(new_messages)
+    dispatch_result = DispatchResult(
+        new_messages=ModelMessagesTypeAdapter.dump_python(new_messages, mode='json'),
+        history=history,
+        history_kind="combat",
+        history_version=len(history)
+    )
+
+    response = _continue_session(dispatch_result)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [message["kind"] for message in data["response"]] == ["request", "response"]
+    assert data["history_kind"] == "combat"
+    assert data["history_version"] == 12
+
+    response = _continue_session(dispatch_result, "&full_history=true")
+
+    assert len(response.json()["response"]) == 12
+
+
+def test_get_history_since_cursor():
+    """
+    Test that the history can be fetched from a cursor.
+    """
+    history = [
+        {"parts": [{"content": f"Message {i}", "part_kind": "text"}], "kind": "response"}
+        for i in range(5)
+    ]
+    with patch('back.routers.gamesession.GameSessionService') as MockSessionService:
+        mock_service_instance = MagicMock()
+        MockSessionService.load = AsyncMock(return_value=mock_service_instance)
+        mock_service_instance.load_history_raw_json = AsyncMock(return_value=history)
+
+        response = client.get(f"/api/gamesession/history/{uuid4()}?since=3&kind=combat")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [message["parts"][0]["content"] for message in data["history"]] == ["Message 3", "Message 4"]
+    assert data["history_version"] == 5
+    mock_service_instance.load_history_raw_json.assert_awaited_once_with("combat")
+
+
+
+
+def test_play_reports_server_timing():
+    """
+    Test that a turn is broken down in the Server-Timing header and queryable per session.
+    """
+    from back.graph.dto.session import DispatchResult, GameState
+    from back.utils.timing import timed
+
+    async def run_graph(*args, **kwargs):
+        with timed("llm"):
+            return MagicMock(output=DispatchResult(new_messages=[], history_version=0))
+
+    session_id = uuid4()
+    with patch('back.routers.gamesession.GameSessionService') as MockSessionService:
+        mock_service_instance = MagicMock()
+        MockSessionService.load = AsyncMock(return_value=mock_service_instance)
+        mock_service_instance.load_game_state = AsyncMock(return_value=GameState())
+        with patch('back.routers.gamesession.session_graph.run', side_effect=run_graph):
+            response = client.post(f"/api/gamesession/play?session_id={session_id}", json={"message": "I look around."})
+
+    assert response.status_code == 200
+    metrics = [metric.split(";")[0] for metric in response.headers["Server-Timing"].split(", ")]
+    assert metrics == ["session_load", "llm", "total"]
+
+    timings = client.get(f"/api/gamesession/timings/{session_id}").json()
+    assert len(timings["turns"]) == 1
+    assert set(timings["turns"][0]["phases"]) == {"session_load", "llm"}
+
+    histograms = client.get("/api/gamesession/timings").json()["phases"]
+    assert histograms["llm"]["count"] >= 1
+
+
+def test_get_session_usage():
+    """
+    Test that the usage rollup of a session is returned, and that an unknown session is a 404.
+    """
+    from back.models.domain.usage import TurnUsage, UsageRollup
+    from back.utils.exceptions import SessionNotFoundError
+
+    rollup = UsageRollup()
+    rollup.add(TurnUsage(mode="narrative", model="deepseek-chat", requests=2, input_tokens=100, output_tokens=20), "scenario.md")
+
+    session_id = uuid4()
+    with patch('back.routers.gamesession.GameSessionService') as MockSessionService:
+        mock_service_instance = MagicMock()
+        MockSessionService.load = AsyncMock(return_value=mock_service_instance)
+        mock_service_instance.get_usage.return_value = rollup
+
+        response = client.get(f"/api/gamesession/usage/{session_id}")
+
+        MockSessionService.load = AsyncMock(side_effect=SessionNotFoundError("missing"))
+        missing = client.get(f"/api/gamesession/usage/{uuid4()}")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["session_id"] == str(session_id)
+    assert data["totals"]["total_tokens"] == 120
+    assert data["by_model"]["deepseek-chat"]["requests"] == 2
+    assert missing.status_code == 404
@@ -50,7 +50,7 @@ def test_play_stream_success():
         }
     ]
     
-    mock_result = DispatchResult(all_messages=expected_messages, new_messages=expected_messages)
+    mock_result = DispatchResult(new_messages=expected_messages)
 
     with patch('back.routers.gamesession.GameSessionService') as MockSessionService:
         mock_service_instance = AsyncMock()
@@ -103,7 +103,7 @@ def test_play_stream_valid_session():
         }
     ]
     
-    mock_result = DispatchResult(all_messages=expected_messages, new_messages=expected_messages)
+    mock_result = DispatchResult(new_messages=expected_messages)
 
     with patch('back.routers.gamesession.GameSessionService') as MockSessionService:
         mock_service_instance = AsyncMock()
@@ -161,7 +161,7 @@ def test_play_stream_combat_mode():
         }
     ]
     
-    mock_result = DispatchResult(all_messages=expected_messages, new_messages=expected_messages)
+    mock_result = DispatchResult(new_messages=expected_messages)
 
     with patch('back.routers.gamesession.GameSessionService') as MockSessionService:
         mock_service_instance = AsyncMock()
@@ -201,7 +201,7 @@ def test_play_stream_empty_message():
         }
     ]
     
-    mock_result = DispatchResult(all_messages=expected_messages, new_messages=expected_messages)
+    mock_result = DispatchResult(new_messages=expected_messages)
 
     with patch('back.routers.gamesession.GameSessionService') as MockSessionService:
         mock_service_instance = AsyncMock()
@@ -238,7 +238,7 @@ def test_play_stream_no_game_state():
         }
     ]
     
-    mock_result = DispatchResult(all_messages=expected_messages, new_messages=expected_messages)
+    mock_result = DispatchResult(new_messages=expected_messages)
 
     with patch('back.routers.gamesession.GameSessionService') as MockSessionService:
         mock_service_instance = AsyncMock()
@@ -0,0 +1,36 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from back.routers import metrics
+from back.utils.metrics import TURNS
+
+app = FastAPI()
+app.include_router(metrics.router)
+client = TestClient(app)
+
+
+def test_metrics_exposition():
+    """
+    Test that /metrics serves the Prometheus text format.
+    """
+    TURNS.inc(mode="narrative")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert "# TYPE jdr_turns_total counter" in body
+    assert 'jdr_turns_total{mode="narrative"}' in body
+    assert "# TYPE jdr_turn_phase_seconds histogram" in body
+    assert "jdr_combat_states_active 0" in body
+
+
+def test_memory_report_endpoint():
+    """
+    Test that /metrics/memory reports whether allocations are traced.
+    """
+    response = client.get("/metrics/memory")
+
+    assert response.status_code == 200
+    assert "tracing" in response.json()
@@ -0,0 +1,60 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from back.routers import probability
+
+app = FastAPI()
+app.include_router(probability.router, prefix="/api/probability")
+client = TestClient(app)
+
+
+def test_skill_check_odds_endpoint():
+    response = client.get("/api/probability/check", params={"target": 60})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success_chance"] == pytest.approx(0.6)
+    assert "Critical Success" in data["bands"]
+
+
+def test_attack_odds_endpoint():
+    response = client.get("/api/probability/attack", params={
+        "attack_bonus": 3, "armor_class": 14, "weapon_damage": "1d8", "target_hp": 8
+    })
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["hit_chance"] == pytest.approx(0.5)
+    assert data["damage_range"] == [4, 19]
+    assert 0 < data["kill_chance"] < data["hit_chance"]
+
+
+def test_attack_odds_endpoint_requires_armor_class():
+    response = client.get("/api/probability/attack", params={"attack_bonus": 3})
+
+    assert response.status_code == 422
+
+
+def test_dice_odds_endpoint():
+    response = client.get("/api/probability/dice", params={"expression": "2d6", "target": 7})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["mean"] == pytest.approx(7.0)
+    assert data["at_least"] == pytest.approx(21 / 36, abs=1e-4)
+
+
+@pytest.mark.parametrize("expression", ["101d6", "2d1001", "100d100000"])
+def test_dice_odds_endpoint_rejects_oversized_dice(expression):
+    response = client.get("/api/probability/dice", params={"expression": expression})
+
+    assert response.status_code == 400
+
+
+def test_attack_odds_endpoint_rejects_oversized_weapon_dice():
+    response = client.get("/api/probability/attack", params={
+        "attack_bonus": 3, "armor_class": 14, "weapon_damage": "500d500"
+    })
+
+    assert response.status_code == 400
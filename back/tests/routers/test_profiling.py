@@ -0,0 +1,170 @@
+import pstats
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from back.routers import profiling
+from back.utils.profiling import ProfilingMiddleware, request_profiler
+
+app = FastAPI()
+app.add_middleware(ProfilingMiddleware)
+app.include_router(profiling.router)
+
+
+@app.get("/api/gamesession/play-test")
+def slow_turn():
+    time.sleep(0.02)
+    return {"ok": True}
+
+
+@app.get("/api/gamesession/play-async")
+async def async_turn():
+    return {"total": build_story()}
+
+
+def build_story():
+    return sum(len(str(i)) for i in range(20000))
+
+
+@app.get("/api/gamesession/play-fails")
+def failing_request():
+    raise RuntimeError("boom")
+
+
+client = TestClient(app)
+
+
+ADMIN = {"X-Admin-Token": "test-admin"}
+
+
+@pytest.fixture(autouse=True)
+def reset_settings(monkeypatch):
+    settings = request_profiler.settings
+    monkeypatch.setattr(request_profiler, "allow_header", True)
+    monkeypatch.setattr(request_profiler, "admin_token", ADMIN["X-Admin-Token"])
+    yield
+    request_profiler.settings = settings
+
+
+def test_header_profiles_request_and_profile_can_be_downloaded():
+    """
+    Test that the X-Profile header profiles a request into a downloadable .pstats file.
+    """
+    response = client.get("/api/gamesession/play-async", headers={"X-Profile": "cprofile"})
+
+    assert response.status_code == 200
+    profile_id = response.headers["X-Profile-Id"]
+
+    profiles = client.get("/api/profiles", headers=ADMIN).json()
+    assert profiles[0]["profile_id"] == profile_id
+    assert profiles[0]["path"] == "/api/gamesession/play-async"
+    assert profiles[0]["status_code"] == 200
+    assert profiles[0]["trigger"] == "header"
+
+    download = client.get(f"/api/profiles/{profile_id}", headers=ADMIN)
+    assert download.status_code == 200
+    _, path = request_profiler.get_profile(profile_id)
+    functions = {name for _, _, name in pstats.Stats(path).stats}
+    assert {"async_turn", "build_story"} <= functions
+
+
+def test_sampling_profile_is_speedscope_json():
+    """
+    Test that the sampling mode saves a speedscope document covering the worker threads
+    (sync endpoints and tools run in the threadpool, out of reach of cProfile).
+    """
+    response = client.get("/api/gamesession/play-test", headers={"X-Profile": "sampling"})
+
+    document = client.get(f"/api/profiles/{response.headers['X-Profile-Id']}", headers=ADMIN).json()
+    assert document["$schema"] == "https://www.speedscope.app/file-format-schema.json"
+    names = {frame["name"] for frame in document["shared"]["frames"]}
+    assert "slow_turn" in names
+
+
+def test_unsampled_requests_are_not_profiled():
+    """
+    Test that requests are not profiled without the header while sampling is disabled.
+    """
+    response = client.get("/api/gamesession/play-test")
+
+    assert "X-Profile-Id" not in response.headers
+    assert client.get("/api/profiles", headers=ADMIN).json() == []
+
+
+def test_settings_toggle_sampling():
+    """
+    Test that sampling can be enabled at runtime and applies to the configured paths only.
+    """
+    response = client.put("/api/profiles/settings", json={"enabled": True, "sample_rate": 1.0, "mode": "cprofile"},
+                          headers=ADMIN)
+    assert response.status_code == 200
+    assert client.get("/api/profiles/settings").json()["enabled"] is True
+
+    sampled = client.get("/api/gamesession/play-test")
+    not_eligible = client.get("/api/profiles", headers=ADMIN)
+
+    assert "X-Profile-Id" in sampled.headers
+    assert "X-Profile-Id" not in not_eligible.headers
+    assert [profile["trigger"] for profile in not_eligible.json()] == ["sampled"]
+
+
+def test_invalid_sample_rate_is_rejected():
+    response = client.put("/api/profiles/settings", json={"enabled": True, "sample_rate": 2.0}, headers=ADMIN)
+
+    assert response.status_code == 422
+
+
+def test_settings_require_admin():
+    """
+    Test that the settings cannot be changed without the admin token, nor from a remote client
+    when no token is configured.
+    """
+    body = {"enabled": True, "sample_rate": 1.0, "mode": "cprofile"}
+
+    assert client.put("/api/profiles/settings", json=body).status_code == 403
+    assert client.put("/api/profiles/settings", json=body, headers={"X-Admin-Token": "nope"}).status_code == 403
+    request_profiler.admin_token = ""
+    # TestClient connects from "testclient", not a local address
+    assert client.put("/api/profiles/settings", json=body).status_code == 403
+    assert client.get("/api/profiles/settings").json()["enabled"] is False
+
+
+
+def test_profiles_require_admin():
+    """
+    Test that saved profiles cannot be listed nor downloaded without the admin token, nor from a
+    remote client when no token is configured.
+    """
+    response = client.get("/api/gamesession/play-test", headers={"X-Profile": "cprofile"})
+    profile_url = f"/api/profiles/{response.headers['X-Profile-Id']}"
+
+    assert client.get("/api/profiles").status_code == 403
+    assert client.get(profile_url, headers={"X-Admin-Token": "nope"}).status_code == 403
+    request_profiler.admin_token = ""
+    # TestClient connects from "testclient", not a local address
+    assert client.get("/api/profiles").status_code == 403
+    assert client.get(profile_url).status_code == 403
+
+def test_header_ignored_outside_eligible_paths():
+    response = client.get("/api/profiles", headers={**ADMIN, "X-Profile": "cprofile"})
+
+    assert "X-Profile-Id" not in response.headers
+
+
+def test_failed_request_is_profiled():
+    """
+    Test that a request failing with an error still leaves a profile.
+    """
+    with pytest.raises(RuntimeError):
+        client.get("/api/gamesession/play-fails", headers={"X-Profile": "1"})
+
+    profiles = client.get("/api/profiles", headers=ADMIN).json()
+    assert profiles[0]["path"] == "/api/gamesession/play-fails"
+    assert profiles[0]["status_code"] is None
+
+
+def test_unknown_profile_is_404():
+    assert client.get("/api/profiles/unknown", headers=ADMIN).status_code == 404
+    assert client.get("/api/profiles/..%2Fsettings", headers=ADMIN).status_code == 404
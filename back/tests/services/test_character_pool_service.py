@@ -0,0 +1,86 @@
+import asyncio
+from types import SimpleNamespace
+
+from back.services.character_pool_service import CharacterPoolService
+from back.services.random_character_service import CharacterFlavour, RandomCharacterService
+
+
+class FakeAgent:
+    def __init__(self):
+        self.calls = 0
+
+    async def run(self, prompt, output_type=None):
+        self.calls += 1
+        requested = int(prompt.split()[1])
+        return SimpleNamespace(output=[CharacterFlavour(name=f"Pooled {i}", background="bg") for i in range(requested)])
+
+
+class FailingAgent:
+    async def run(self, prompt, output_type=None):
+        raise RuntimeError("LLM unavailable")
+
+
+def make_pool(agent, size=2, low_watermark=1):
+    return CharacterPoolService(RandomCharacterService(), size=size, low_watermark=low_watermark,
+                                agent_factory=lambda: agent)
+
+
+def test_refill_fills_every_race_and_culture():
+    agent = FakeAgent()
+    pool = make_pool(agent)
+
+    added = asyncio.run(pool.refill())
+
+    pairs = pool.generator.race_culture_pairs()
+    assert added == 2 * len(pairs)
+    assert set(pool.levels().values()) == {2}
+    # Flavour text is generated in batches, not per character
+    assert agent.calls < added
+    assert asyncio.run(pool.refill()) == 0
+
+
+def test_pop_prefers_requested_slot_then_any():
+    pool = make_pool(FakeAgent(), size=1)
+    asyncio.run(pool.refill())
+    race, culture = pool.generator.race_culture_pairs()[0]
+
+    character = pool.pop(race.id, culture.id)
+    assert character.race == race.id
+    assert character.culture == culture.id
+    assert character.name.startswith("Pooled")
+
+    # The slot is empty now: another race and culture is served instead
+    other = pool.pop(race.id, culture.id)
+    assert other is not None
+    assert (other.race, other.culture) != (race.id, culture.id)
+
+
+def test_pop_schedules_background_refill():
+    pool = make_pool(FakeAgent(), size=1)
+
+    async def scenario():
+        assert pool.pop("unknown", "unknown") is None
+        assert pool._refill_task is not None
+        await pool._refill_task
+        return pool.levels()
+
+    levels = asyncio.run(scenario())
+    assert levels and set(levels.values()) == {1}
+
+
+def test_failed_refill_backs_off():
+    pool = make_pool(FailingAgent())
+
+    async def scenario():
+        assert await pool.refill() == 0
+        return pool.schedule_refill()
+
+    assert asyncio.run(scenario()) is False
+
+
+def test_disabled_pool():
+    pool = make_pool(FakeAgent(), size=0)
+
+    assert asyncio.run(pool.refill()) == 0
+    assert pool.needs_refill() is False
+    assert pool.pop("humans", "gondorians") is None
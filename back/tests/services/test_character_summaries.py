@@ -0,0 +1,124 @@
+"""
+Tests for the character summary index of CharacterDataService.
+Listings are served from the index, kept up to date on save and delete, and paginated by cursor.
+"""
+
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from back.config import get_data_dir
+from back.models.domain.character import Character, CharacterSummary, CharacterStatus
+from back.services.character_data_service import CharacterDataService
+
+
+def make_character(name: str, updated_at: datetime, level: int = 1) -> Character:
+    return Character(
+        id=uuid4(),
+        name=name,
+        race="humans",
+        culture="gondorians",
+        level=level,
+        stats={"strength": 12, "constitution": 12, "agility": 12, "intelligence": 12, "wisdom": 12, "charisma": 12},
+        skills={},
+        combat_stats={"max_hit_points": 50, "current_hit_points": 50, "max_mana_points": 10,
+                      "current_mana_points": 10, "armor_class": 10, "attack_bonus": 0},
+        updated_at=updated_at,
+    )
+
+
+@pytest.fixture
+def service():
+    return CharacterDataService()
+
+
+@pytest.fixture
+def characters(service):
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    saved = [make_character(f"Hero {i}", base + timedelta(hours=i)) for i in range(5)]
+    service.save_characters(saved)
+    return saved
+
+
+def index_path() -> str:
+    return os.path.join(get_data_dir(), "characters_index.json")
+
+
+def test_summaries_are_sorted_by_last_update(service, characters):
+    summaries = service.get_character_summaries()
+
+    assert [summary.name for summary in summaries] == ["Hero 4", "Hero 3", "Hero 2", "Hero 1", "Hero 0"]
+    assert summaries[0] == CharacterSummary.from_character(characters[4])
+
+
+def test_summaries_do_not_read_character_files(service, characters, monkeypatch):
+    service.get_character_summaries()
+    monkeypatch.setattr(service, "load_character", lambda *_: pytest.fail("character file read"))
+
+    assert len(service.get_character_summaries()) == 5
+
+
+def test_index_follows_save_and_delete(service, characters):
+    updated = characters[0].model_copy(update={"name": "Renamed", "level": 3,
+                                                "updated_at": datetime(2026, 1, 1, tzinfo=timezone.utc)})
+    service.save_character(updated)
+    service.delete_character(str(characters[1].id))
+
+    with open(index_path(), encoding="utf-8") as file:
+        index = json.load(file)["characters"]
+
+    assert str(characters[1].id) not in index
+    assert index[str(characters[0].id)]["name"] == "Renamed"
+    assert service.get_character_summaries()[0].level == 3
+
+
+def test_index_rebuilt_from_files(service, characters):
+    os.remove(index_path())
+    stray = make_character("Copied in", datetime(2024, 1, 1))
+    with open(os.path.join(get_data_dir(), "characters", f"{stray.id}.json"), "w", encoding="utf-8") as file:
+        json.dump(stray.model_dump(mode="json"), file)
+
+    summaries = service.get_character_summaries()
+
+    assert len(summaries) == 6
+    assert summaries[-1].name == "Copied in"
+    assert summaries[-1].updated_at.tzinfo is not None
+    assert os.path.exists(index_path())
+
+
+def test_cursor_pagination_walks_every_character(service, characters):
+    page, cursor = service.list_character_summaries(2)
+    names = [summary.name for summary in page]
+    while cursor:
+        page, cursor = service.list_character_summaries(2, cursor)
+        names.extend(summary.name for summary in page)
+
+    assert names == ["Hero 4", "Hero 3", "Hero 2", "Hero 1", "Hero 0"]
+
+
+def test_cursor_is_stable_when_characters_are_added(service, characters):
+    page, cursor = service.list_character_summaries(2)
+    service.save_character(make_character("Newcomer", datetime(2030, 1, 1, tzinfo=timezone.utc)))
+
+    page, _ = service.list_character_summaries(2, cursor)
+
+    assert [summary.name for summary in page] == ["Hero 2", "Hero 1"]
+
+
+def test_last_page_has_no_cursor(service, characters):
+    page, cursor = service.list_character_summaries(5)
+
+    assert len(page) == 5
+    assert cursor is None
+
+
+def test_invalid_cursor(service, characters):
+    with pytest.raises(ValueError):
+        service.list_character_summaries(2, "not-a-cursor")
+
+
+def test_summary_status(service, characters):
+    assert all(summary.status == CharacterStatus.DRAFT for summary in service.get_character_summaries())
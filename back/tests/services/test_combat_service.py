@@ -0,0 +1,361 @@
+import json
+from uuid import uuid4
+
+import pytest
+
+from back.models.domain.character import Character, CombatStats, Equipment, Skills, Stats
+from back.models.domain.combat_state import CombatState, Combatant, CombatantType
+from back.models.domain.items import EquipmentItem
+from back.services.character_data_service import CharacterDataService
+from back.services.combat_service import CombatService
+from back.services.combatant_resolver import CombatantResolver
+
+
+@pytest.fixture
+def hero() -> Character:
+    equipment = Equipment(weapons=[
+        EquipmentItem(id=str(uuid4()), name="Longsword", category="weapon", weight=1.5,
+                      quantity=1, equipped=True, damage="1d8+4")
+    ])
+    return Character(
+        name="Arandur",
+        race="Human",
+        culture="Gondor",
+        stats=Stats(strength=14, constitution=14, agility=14, intelligence=10, wisdom=12, charisma=10),
+        skills=Skills(),
+        equipment=equipment,
+        combat_stats=CombatStats(max_hit_points=40, current_hit_points=35, armor_class=15, attack_bonus=3),
+    )
+
+
+@pytest.fixture
+def resolver() -> CombatantResolver:
+    return CombatantResolver(CharacterDataService())
+
+
+@pytest.fixture
+def combat_service(resolver) -> CombatService:
+    return CombatService(resolver=resolver)
+
+
+def test_start_combat_stores_references_only(combat_service, resolver, hero):
+    participants = [
+        {"name": "Arandur", "camp": "player", "character": hero},
+        {"name": "Goblin Grunt", "camp": "enemy", "archetype": "Goblin Warrior", "hp": 12},
+    ]
+
+    state = combat_service.start_combat(participants)
+
+    player = next(p for p in state.participants if p.type == CombatantType.PLAYER)
+    goblin = next(p for p in state.participants if p.type == CombatantType.NPC)
+
+    assert player.character_id == hero.id
+    assert player.current_hit_points == 35
+    assert player.max_hit_points == 40
+    assert player.attack_bonus == 3
+    assert player.initiative_bonus == hero.calculate_initiative()
+    assert player.weapon_name == "Longsword"
+    assert player.weapon_damage == "1d8+4"
+
+    assert goblin.npc_id is not None
+    assert goblin.current_hit_points == 12
+    assert goblin.weapon_name == "Scimitar"
+
+    dumped = json.loads(state.model_dump_json())
+    for participant in dumped["participants"]:
+        assert "character_ref" not in participant
+        assert "npc_ref" not in participant
+        assert "skills" not in participant
+
+    assert combat_service.resolve_entity(player) is hero
+    resolved_npc = combat_service.resolve_entity(goblin)
+    assert resolved_npc is not None
+    assert resolved_npc.name == "Goblin Grunt"
+
+
+def test_legacy_embedded_references_are_converted(hero):
+    legacy = {
+        "name": hero.name,
+        "type": "player",
+        "current_hit_points": 20,
+        "max_hit_points": 40,
+        "armor_class": 15,
+        "initiative_roll": 12,
+        "character_ref": hero.model_dump(mode="json"),
+    }
+
+    combatant = Combatant.model_validate(legacy)
+
+    assert combatant.character_id == hero.id
+    assert combatant.current_hit_points == 20
+    assert combatant.attack_bonus == 3
+    assert combatant.weapon_name == "Longsword"
+
+
+def test_legacy_combat_state_file_loads(hero):
+    player = Combatant(name=hero.name, type=CombatantType.PLAYER, current_hit_points=35,
+                       max_hit_points=40, armor_class=15, initiative_roll=12, character_id=hero.id)
+    data = json.loads(CombatState(participants=[player], turn_order=[player.id]).model_dump_json())
+    data["participants"][0].pop("character_id")
+    data["participants"][0]["character_ref"] = hero.model_dump(mode="json")
+
+    state = CombatState.model_validate(data)
+
+    assert state.participants[0].character_id == hero.id
+
+
+def test_resolver_reloads_character_from_storage(resolver, hero):
+    CharacterDataService().save_character(hero)
+
+    resolved = resolver.resolve_character(hero.id)
+
+    assert resolved is not None
+    assert resolved.name == hero.name
+    assert resolver.resolve_character(hero.id) is resolved
+
+
+def test_resolver_unknown_npc_returns_none(resolver):
+    assert resolver.resolve_npc(uuid4()) is None
+
+
+def test_execute_attack_uses_snapshot(combat_service, hero, monkeypatch):
+    state = combat_service.start_combat([
+        {"name": "Arandur", "camp": "player", "character": hero},
+        {"name": "Orc Brute", "camp": "enemy", "hp": 30, "ac": 5},
+    ])
+    player = next(p for p in state.participants if p.type == CombatantType.PLAYER)
+    orc = next(p for p in state.participants if p.type == CombatantType.NPC)
+
+    monkeypatch.setattr("back.models.domain.combat_system_manager.random.randint", lambda a, b: 10)
+    monkeypatch.setattr("back.services.combat_service.roll_dice", lambda dice: 5)
+
+    state, message = combat_service.execute_attack(state, str(player.id), str(orc.id))
+
+    assert message.startswith("Hit!")
+    # 5 (dice) + 3 (attack bonus as damage modifier)
+    assert orc.current_hit_points == 30 - 8
+
+
+def test_start_combat_spawns_counted_clones(combat_service, hero):
+    state = combat_service.start_combat([
+        {"name": "Arandur", "camp": "player", "character": hero},
+        {"name": "Wolf", "camp": "enemy", "archetype": "Warg", "count": 12, "id": str(uuid4())},
+    ])
+
+    wolves = [p for p in state.participants if p.type == CombatantType.NPC]
+    assert len(wolves) == 12
+    assert len({w.id for w in wolves}) == 12
+    assert {w.name for w in wolves} == {f"Wolf #{i}" for i in range(1, 13)}
+    assert all(w.weapon_name == "Natural Weapon" for w in wolves)
+
+
+def make_npc_combatant(name: str, hp: int = 12, ac: int = 12, archetype: str = "Goblin Warrior") -> Combatant:
+    return Combatant(name=name, type=CombatantType.NPC, current_hit_points=hp, max_hit_points=hp,
+                     armor_class=ac, initiative_roll=0, npc_id=uuid4(), archetype=archetype,
+                     weapon_name="Scimitar", weapon_damage="1d6")
+
+
+def make_player_combatant(name: str, hp: int = 30, ac: int = 14) -> Combatant:
+    return Combatant(name=name, type=CombatantType.PLAYER, current_hit_points=hp, max_hit_points=hp,
+                     armor_class=ac, initiative_roll=0, character_id=uuid4())
+
+
+def make_state(participants) -> CombatState:
+    return CombatState(participants=participants, turn_order=[p.id for p in participants],
+                       current_turn_combatant_id=participants[0].id)
+
+
+@pytest.mark.parametrize("archetype, expected", [
+    ("Goblin Archer", "Weak"),
+    ("Orc Warrior", "Strong"),
+    ("Warg", "Armored"),
+    ("Skeleton", "Armored"),
+])
+def test_choose_npc_target_follows_archetype(combat_service, archetype, expected):
+    armored = make_player_combatant("Armored", hp=20, ac=10)
+    weak = make_player_combatant("Weak", hp=5, ac=16)
+    strong = make_player_combatant("Strong", hp=40, ac=18)
+    npc = make_npc_combatant("Foe", archetype=archetype)
+    state = make_state([armored, weak, strong, npc])
+
+    target = combat_service.choose_npc_target(state, npc)
+
+    assert target.name == expected
+
+
+def test_resolve_npc_turns_stops_at_player(combat_service, monkeypatch):
+    goblin_a = make_npc_combatant("Goblin A")
+    goblin_b = make_npc_combatant("Goblin B")
+    hero = make_player_combatant("Hero", hp=100)
+    state = make_state([goblin_a, goblin_b, hero])
+    monkeypatch.setattr(combat_service, "_sync_player_hp", lambda combatant: None)
+
+    state, npc_turns = combat_service.resolve_npc_turns(state)
+
+    assert [turn["actor"] for turn in npc_turns] == ["E1", "E2"]
+    assert all(turn["target"] == "P1" for turn in npc_turns)
+    assert state.current_turn_combatant_id == hero.id
+
+
+def test_resolve_npc_turns_skips_defeated_npcs(combat_service, monkeypatch):
+    goblin_a = make_npc_combatant("Goblin A")
+    goblin_b = make_npc_combatant("Goblin B")
+    hero = make_player_combatant("Hero", hp=100)
+    goblin_a.take_damage(goblin_a.max_hit_points)
+    state = make_state([goblin_a, goblin_b, hero])
+    monkeypatch.setattr(combat_service, "_sync_player_hp", lambda combatant: None)
+
+    state, npc_turns = combat_service.resolve_npc_turns(state)
+
+    assert [turn["actor_name"] for turn in npc_turns] == ["Goblin B"]
+    assert state.current_turn_combatant_id == hero.id
+
+
+def test_resolve_npc_turns_does_nothing_on_player_turn(combat_service):
+    hero = make_player_combatant("Hero")
+    state = make_state([hero, make_npc_combatant("Goblin")])
+
+    state, npc_turns = combat_service.resolve_npc_turns(state)
+
+    assert npc_turns == []
+    assert state.current_turn_combatant_id == hero.id
+
+
+def test_resolve_npc_turns_stops_when_player_falls(combat_service, monkeypatch):
+    goblin_a = make_npc_combatant("Goblin A")
+    goblin_b = make_npc_combatant("Goblin B")
+    hero = make_player_combatant("Hero", hp=1, ac=1)
+    state = make_state([goblin_a, goblin_b, hero])
+    monkeypatch.setattr(combat_service, "_sync_player_hp", lambda combatant: None)
+    monkeypatch.setattr("back.models.domain.combat_system_manager.random.randint", lambda a, b: 15)
+
+    state, npc_turns = combat_service.resolve_npc_turns(state)
+
+    assert len(npc_turns) == 1
+    assert combat_service.get_end_reason(state) == "defeat"
+
+
+def test_defend_raises_armor_class_until_next_turn(combat_service, monkeypatch):
+    hero = make_player_combatant("Hero", ac=14)
+    goblin = make_npc_combatant("Goblin")
+    state = make_state([hero, goblin])
+    monkeypatch.setattr("back.models.domain.combat_system_manager.random.randint", lambda a, b: 15)
+
+    state, _ = combat_service.defend(state, "P1")
+    assert hero.defense_bonus == combat_service.rules.action_bonus("defend") == 4
+
+    # 15 + 0 vs AC 14 + 4: miss
+    state, message = combat_service.execute_attack(state, "E1", "P1")
+    assert message.startswith("Miss!")
+
+    combat_service.end_turn(state)
+    combat_service.end_turn(state)
+    assert state.current_turn_combatant_id == hero.id
+    assert hero.defense_bonus == 0
+
+
+def test_critical_hit_doubles_weapon_damage(combat_service, monkeypatch):
+    hero = make_player_combatant("Hero")
+    goblin = make_npc_combatant("Goblin", hp=50, ac=30)
+    state = make_state([hero, goblin])
+    monkeypatch.setattr("back.models.domain.combat_system_manager.random.randint", lambda a, b: 20)
+    monkeypatch.setattr("back.services.combat_service.roll_dice", lambda dice: 3)
+    monkeypatch.setattr(combat_service, "_sync_player_hp", lambda combatant: None)
+
+    state, message = combat_service.execute_attack(state, "P1", "E1")
+
+    assert message.startswith("Critical hit!")
+    assert goblin.current_hit_points == 50 - 6
+
+
+def test_roll_initiative_uses_rules_formula(combat_service, monkeypatch):
+    quick = make_player_combatant("Quick")
+    quick.initiative_bonus = 3
+    state = make_state([make_npc_combatant("Goblin"), quick])
+    monkeypatch.setattr("back.models.domain.combat_system_manager.random.randint", lambda a, b: 10)
+
+    state = combat_service.roll_initiative(state)
+
+    assert quick.initiative_roll == 13
+    assert state.turn_order[0] == quick.id
+
+
+def make_caster(mana: int = 10) -> Combatant:
+    caster = make_player_combatant("Mage", hp=20)
+    caster.current_mana_points = caster.max_mana_points = mana
+    return caster
+
+
+def test_cast_damage_spell_spends_mana(combat_service, monkeypatch):
+    caster = make_caster(mana=10)
+    goblin = make_npc_combatant("Goblin", hp=12)
+    state = make_state([caster, goblin])
+    monkeypatch.setattr(combat_service, "_sync_player_hp", lambda combatant: None)
+    monkeypatch.setattr("back.services.combat_service.roll_dice", lambda dice: 4)
+
+    state, result = combat_service.cast_spell(state, "P1", "magic missile", ["E1"])
+
+    assert result["success"]
+    assert result["cost"] == 2
+    assert caster.current_mana_points == 8
+    assert goblin.current_hit_points == 8
+    assert result["effects"] == [{"target": "E1", "target_name": "Goblin", "type": "damage",
+                                  "amount": 4, "target_hp": 8, "defeated": False}]
+
+
+def test_cast_area_spell_hits_every_target(combat_service, monkeypatch):
+    caster = make_caster(mana=10)
+    goblins = [make_npc_combatant(f"Goblin {i}", hp=5) for i in range(3)]
+    state = make_state([caster, *goblins])
+    monkeypatch.setattr(combat_service, "_sync_player_hp", lambda combatant: None)
+    monkeypatch.setattr("back.services.combat_service.roll_dice", lambda dice: 9)
+
+    state, result = combat_service.cast_spell(state, "P1", "Fireball", ["E1", "E2", "E3"])
+
+    assert all(effect["defeated"] for effect in result["effects"])
+    assert combat_service.get_end_reason(state) == "victory"
+
+
+def test_cast_heal_spell_defaults_to_caster(combat_service, monkeypatch):
+    caster = make_caster(mana=5)
+    caster.take_damage(15)
+    state = make_state([caster, make_npc_combatant("Goblin")])
+    monkeypatch.setattr(combat_service, "_sync_player_hp", lambda combatant: None)
+
+    state, result = combat_service.cast_spell(state, "P1", "Minor Healing")
+
+    assert result["effects"][0]["amount"] == 5
+    assert caster.current_hit_points == 10
+
+
+@pytest.mark.parametrize("spell, mana, targets, error", [
+    ("Fireball", 2, ["E1"], "lacks the mana"),
+    ("Firebal", 20, ["E1"], "Did you mean: Fireball"),
+    ("Magic Missile", 20, [], "needs a target"),
+    ("Magic Missile", 20, ["E9"], "not found"),
+])
+def test_cast_spell_failures_leave_state_untouched(combat_service, spell, mana, targets, error):
+    caster = make_caster(mana=mana)
+    state = make_state([caster, make_npc_combatant("Goblin")])
+
+    state, result = combat_service.cast_spell(state, "P1", spell, targets)
+
+    assert not result["success"]
+    assert error in result["message"]
+    assert caster.current_mana_points == mana
+
+
+def test_cast_spell_requires_known_spell(combat_service, resolver, hero):
+    hero.spells.known_spells = ["Light"]
+    hero.combat_stats.max_mana_points = hero.combat_stats.current_mana_points = 20
+    state = combat_service.start_combat([
+        {"name": "Arandur", "camp": "player", "character": hero},
+        {"name": "Goblin", "camp": "enemy"},
+    ])
+    player = next(p for p in state.participants if p.type == CombatantType.PLAYER)
+
+    state, result = combat_service.cast_spell(state, str(player.id), "Fireball", ["E1"])
+
+    assert not result["success"]
+    assert "does not know" in result["message"]
+    assert player.current_mana_points == 20
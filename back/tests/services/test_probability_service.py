@@ -0,0 +1,110 @@
+import pytest
+from uuid import uuid4
+from unittest.mock import patch
+
+from back.models.domain.combat_state import Combatant, CombatantType
+from back.models.domain.combat_system_manager import CombatSystemManager
+from back.services.probability_service import ProbabilityService, skill_check_degree
+from back.utils.dice import dice_distribution, roll_dice
+
+
+@pytest.fixture
+def probability_service():
+    return ProbabilityService(combat_system=CombatSystemManager())
+
+
+def test_dice_distribution_is_exact():
+    distribution = dict(dice_distribution("2d6+1"))
+    assert distribution[8] == pytest.approx(6 / 36)
+    assert distribution[3] == pytest.approx(1 / 36)
+    assert sum(distribution.values()) == pytest.approx(1.0)
+
+
+def test_dice_distribution_matches_roll_dice_clamping():
+    # roll_dice never returns less than 1
+    assert dict(dice_distribution("1d4-2")) == pytest.approx({1: 0.75, 2: 0.25})
+    assert dict(dice_distribution("3")) == {3: 1.0}
+    with patch('back.utils.dice.random.randint', return_value=1):
+        assert roll_dice("1d4-2") == 1
+
+
+def test_skill_check_degree_bands():
+    assert skill_check_degree(45, 60) == "Good Success"
+    assert skill_check_degree(25, 60) == "Excellent Success"
+    assert skill_check_degree(1, 60) == "Critical Success"
+    assert skill_check_degree(55, 60) == "Simple Success"
+    assert skill_check_degree(95, 40) == "Critical Failure"
+    assert skill_check_degree(75, 40) == "Severe Failure"
+
+
+def test_skill_check_odds(probability_service):
+    odds = probability_service.skill_check_odds(60)
+
+    assert odds["success_chance"] == pytest.approx(0.6)
+    assert sum(odds["bands"].values()) == pytest.approx(1.0)
+    # Rolls 51-60 are simple successes, 61-69 simple failures
+    assert odds["bands"]["Simple Success"] == pytest.approx(0.10)
+    assert odds["bands"]["Simple Failure"] == pytest.approx(0.09)
+
+
+def test_skill_check_odds_result_is_not_the_cached_dict(probability_service):
+    odds = probability_service.skill_check_odds(60)
+    odds["success_chance"] = 0.0
+    odds["bands"].clear()
+
+    fresh = probability_service.skill_check_odds(60)
+    assert fresh["success_chance"] == pytest.approx(0.6)
+    assert fresh["bands"]
+
+
+def test_skill_check_odds_out_of_range_targets(probability_service):
+    assert probability_service.skill_check_odds(150)["success_chance"] == 1.0
+    assert probability_service.skill_check_odds(-10)["success_chance"] == 0.0
+
+
+def test_attack_odds(probability_service):
+    # 1d20 + 3 vs AC 14: natural 11-19 hit, 20 crits, 1 fumbles
+    odds = probability_service.attack_odds(3, 14, "1d8", target_hp=8)
+
+    assert odds["hit_chance"] == pytest.approx(0.5)
+    assert odds["critical_chance"] == pytest.approx(0.05)
+    assert odds["fumble_chance"] == pytest.approx(0.05)
+    # Damage = weapon + 3 (doubled weapon dice on a critical)
+    assert odds["damage_range"] == [4, 19]
+    expected = 0.45 * 7.5 + 0.05 * 12.0
+    assert odds["expected_damage"] == pytest.approx(expected, abs=1e-4)
+    assert odds["expected_damage_on_hit"] == pytest.approx(expected / 0.5, abs=1e-4)
+    # A normal hit kills on a weapon roll of 5+, a critical on 3+
+    assert odds["kill_chance"] == pytest.approx(0.45 * 0.5 + 0.05 * 0.75, abs=1e-4)
+
+
+def test_attack_odds_unreachable_armor_class(probability_service):
+    odds = probability_service.attack_odds(0, 40, "1d6")
+
+    # Only a natural 20 hits
+    assert odds["hit_chance"] == pytest.approx(0.05)
+    assert "kill_chance" not in odds
+
+
+def test_combatant_attack_odds_includes_defense_bonus(probability_service):
+    attacker = Combatant(name="Hero", type=CombatantType.PLAYER, character_id=uuid4(), current_hit_points=20,
+                         max_hit_points=20, armor_class=12, initiative_roll=0, attack_bonus=3,
+                         weapon_name="Sword", weapon_damage="1d8")
+    target = Combatant(name="Goblin", type=CombatantType.NPC, npc_id=uuid4(), current_hit_points=8,
+                       max_hit_points=8, armor_class=10, initiative_roll=0, defense_bonus=4)
+
+    odds = probability_service.combatant_attack_odds(attacker, target)
+
+    assert odds["target_armor_class"] == 14
+    assert odds["weapon"] == "Sword"
+    assert odds == {**probability_service.attack_odds(3, 14, "1d8", 8), **{
+        "attacker": "Hero", "target": "Goblin", "weapon": "Sword", "target_armor_class": 14}}
+
+
+def test_dice_odds(probability_service):
+    odds = probability_service.dice_odds("2d6", target=10)
+
+    assert odds["min"] == 2
+    assert odds["max"] == 12
+    assert odds["mean"] == pytest.approx(7.0)
+    assert odds["at_least"] == pytest.approx(6 / 36, abs=1e-4)
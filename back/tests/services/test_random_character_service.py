@@ -0,0 +1,97 @@
+import asyncio
+import os
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from back.config import get_data_dir
+from back.models.domain.character import Stats
+from back.services.random_character_service import CharacterFlavour, RandomCharacterService
+
+
+@pytest.fixture
+def service():
+    return RandomCharacterService()
+
+
+class FakeAgent:
+    """Returns one flavour less than requested, to exercise padding."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def run(self, prompt, output_type=None):
+        self.calls += 1
+        requested = int(prompt.split()[1])
+        output = [CharacterFlavour(name=f"Hero {self.calls}-{i}", background="bg") for i in range(requested - 1)]
+        return SimpleNamespace(output=output)
+
+
+def test_roll_stats_in_range(service):
+    stats = service.roll_stats(50)
+
+    assert len(stats) == 50
+    for values in stats:
+        assert set(values) == set(Stats.model_fields)
+        assert all(service.STAT_MIN <= value <= service.STAT_MAX for value in values.values())
+
+
+def test_batch_skill_allocation_spends_all_points(service):
+    stats = Stats(strength=15, constitution=10, agility=15, intelligence=15, wisdom=15, charisma=15)
+    allocations = service.skill_allocation_service.allocate_random_skills_batch([("Noldor", stats)] * 20)
+
+    assert len(allocations) == 20
+    for allocation in allocations:
+        assert service.skill_allocation_service._calculate_total_points(allocation) >= 40
+
+
+def test_create_random_characters_bulk_saves(service):
+    characters = asyncio.run(service.create_random_characters(25))
+
+    assert len(characters) == 25
+    assert len({character.id for character in characters}) == 25
+    saved = os.listdir(os.path.join(get_data_dir(), "characters"))
+    assert {f"{character.id}.json" for character in characters} <= set(saved)
+    assert service.character_data_service.load_character(str(characters[0].id)).name == characters[0].name
+
+
+def test_create_random_characters_keeps_cpu_and_disk_off_the_event_loop(service, monkeypatch):
+    loop_thread = []
+    worker_threads = []
+    save_characters = service.character_data_service.save_characters
+    build_character = service.build_character
+
+    def recording_save(characters):
+        worker_threads.append(threading.get_ident())
+        return save_characters(characters)
+
+    def recording_build(*args):
+        worker_threads.append(threading.get_ident())
+        return build_character(*args)
+
+    monkeypatch.setattr(service.character_data_service, "save_characters", recording_save)
+    monkeypatch.setattr(service, "build_character", recording_build)
+
+    async def create():
+        loop_thread.append(threading.get_ident())
+        return await service.create_random_characters(3)
+
+    asyncio.run(create())
+
+    assert worker_threads and loop_thread[0] not in worker_threads
+
+
+def test_generate_flavours_batches_and_pads(service):
+    agent = FakeAgent()
+    profiles = service.pick_races_and_cultures(45)
+
+    flavours = asyncio.run(service.generate_flavours(agent, profiles))
+
+    # 45 characters -> 3 LLM calls of at most FLAVOUR_BATCH_SIZE characters
+    assert agent.calls == 3
+    assert len(flavours) == 45
+    # The last entry of each chunk was missing and got a placeholder name
+    race, culture = profiles[19]
+    assert flavours[19].name == f"{culture.name} {race.name} #20"
+    assert flavours[20].name.startswith("Hero")
@@ -0,0 +1,135 @@
+import json
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, UserPromptPart
+from pydantic_ai.usage import RunUsage
+
+from back.services.game_session_service import (
+    GameSessionService,
+    HISTORY_COMBAT,
+    HISTORY_NARRATIVE,
+    USAGE_LEDGER_FILE,
+    USAGE_ROLLUP_FILE,
+)
+
+
+@pytest.fixture
+def mock_data_dir(tmp_path):
+    with patch("back.services.game_session_service.get_data_dir", return_value=str(tmp_path)):
+        yield tmp_path
+
+
+def make_service(data_dir, session_id, scenario):
+    (data_dir / "sessions" / session_id).mkdir(parents=True)
+    service = GameSessionService(session_id)
+    service.scenario_id = scenario
+    return service
+
+
+def make_result(input_tokens, output_tokens, requests=1, model_name="deepseek-chat"):
+    result = MagicMock()
+    result.usage.return_value = RunUsage(requests=requests, input_tokens=input_tokens, output_tokens=output_tokens)
+    result.new_messages.return_value = [
+        ModelRequest(parts=[UserPromptPart(content="I look around.")]),
+        ModelResponse(parts=[TextPart(content="You see a tavern.")], model_name=model_name),
+    ]
+    return result
+
+
+@pytest.mark.asyncio
+async def test_turns_are_appended_and_rolled_up(mock_data_dir):
+    service = make_service(mock_data_dir, "s1", "scenario_a.md")
+
+    await service.record_turn_usage(HISTORY_NARRATIVE, make_result(100, 20), 1.5,
+                                    SimpleNamespace(requests=1, input_tokens=50, output_tokens=5))
+    await service.record_turn_usage(HISTORY_COMBAT, make_result(200, 30, requests=3), 0.5)
+
+    lines = (mock_data_dir / "sessions" / "s1" / USAGE_LEDGER_FILE).read_text().splitlines()
+    assert [json.loads(line)["mode"] for line in lines] == ["narrative", "combat"]
+    assert json.loads(lines[0])["model"] == "deepseek-chat"
+
+    usage = service.get_usage()
+    assert usage.totals.turns == 2
+    assert usage.totals.requests == 4
+    assert usage.totals.input_tokens == 300
+    assert usage.totals.output_tokens == 50
+    assert usage.totals.summary_input_tokens == 50
+    assert usage.totals.latency_ms == pytest.approx(2000.0)
+    assert usage.totals.total_tokens == 405
+    assert usage.by_mode["combat"].input_tokens == 200
+    assert usage.by_scenario["scenario_a.md"].turns == 2
+
+
+@pytest.mark.asyncio
+async def test_global_rollup_spans_sessions(mock_data_dir):
+    first = make_service(mock_data_dir, "s1", "scenario_a.md")
+    second = make_service(mock_data_dir, "s2", "scenario_b.md")
+
+    await first.record_turn_usage(HISTORY_NARRATIVE, make_result(100, 20), 1.0)
+    await second.record_turn_usage(HISTORY_NARRATIVE, make_result(10, 2, model_name=""), 1.0)
+
+    usage = GameSessionService.get_global_usage()
+    assert usage.totals.turns == 2
+    assert usage.by_scenario["scenario_b.md"].input_tokens == 10
+    # The configured model is used when the response does not name it
+    assert sum(totals.turns for totals in usage.by_model.values()) == 2
+
+
+@pytest.mark.asyncio
+async def test_rollup_rebuilt_from_ledger(mock_data_dir):
+    service = make_service(mock_data_dir, "s1", "scenario_a.md")
+    await service.record_turn_usage(HISTORY_NARRATIVE, make_result(100, 20), 1.0)
+    (mock_data_dir / "sessions" / "s1" / USAGE_ROLLUP_FILE).unlink()
+
+    assert service.get_usage().totals.input_tokens == 100
+    assert (mock_data_dir / "sessions" / "s1" / USAGE_ROLLUP_FILE).exists()
+
+
+
+@pytest.mark.asyncio
+async def test_missing_rollup_is_rebuilt_on_the_next_turn(mock_data_dir):
+    service = make_service(mock_data_dir, "s1", "scenario_a.md")
+    await service.record_turn_usage(HISTORY_NARRATIVE, make_result(100, 20), 1.0)
+    rollup_path = mock_data_dir / "sessions" / "s1" / USAGE_ROLLUP_FILE
+    rollup_path.unlink()
+
+    await service.record_turn_usage(HISTORY_COMBAT, make_result(10, 2), 1.0)
+
+    rollup = json.loads(rollup_path.read_text())
+    assert rollup["totals"]["turns"] == 2
+    assert rollup["totals"]["input_tokens"] == 110
+
+@pytest.mark.asyncio
+async def test_ledger_failure_does_not_fail_the_turn(mock_data_dir):
+    service = GameSessionService("missing-session")
+
+    assert await service.record_turn_usage(HISTORY_NARRATIVE, make_result(1, 1), 0.1) is None
+    assert service.get_usage().totals.turns == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_turns_do_not_drop_rollup_updates(mock_data_dir):
+    import asyncio
+
+    services = [make_service(mock_data_dir, f"s{index}", "scenario_a.md") for index in range(4)]
+
+    await asyncio.gather(*(service.record_turn_usage(HISTORY_NARRATIVE, make_result(10, 1), 0.1)
+                           for service in services for _ in range(5)))
+
+    assert GameSessionService.get_global_usage().totals.turns == 20
+    assert all(service.get_usage().totals.turns == 5 for service in services)
+
+
+def test_global_rollup_updates_are_serialised_across_threads(mock_data_dir):
+    from concurrent.futures import ThreadPoolExecutor
+    from back.models.domain.usage import TurnUsage
+    from back.services.game_session_service import _add_to_usage_rollup
+
+    path = str(mock_data_dir / USAGE_ROLLUP_FILE)
+    turn = TurnUsage(mode="narrative", model="deepseek-chat", requests=1, input_tokens=10, output_tokens=1,
+                     latency_ms=1.0)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: _add_to_usage_rollup(path, turn, "scenario_a.md"), range(40)))
+
+    assert GameSessionService.get_global_usage().totals.turns == 40
@@ -7,6 +7,7 @@ import pytest
 import os
 from pathlib import Path
 
+from back.config import config
 from back.storage.pydantic_jsonl_store import PydanticJsonlStore
 from pydantic_ai.messages import ModelMessagesTypeAdapter, TextPart, UserPromptPart
 
@@ -242,4 +243,107 @@ class TestPydanticJsonlStore:
         assert len(loaded) == 3
         assert loaded[0]["parts"][0]["content"] == "Msg1"
         assert loaded[1]["parts"][0]["content"] == "Reply1"
-        assert loaded[2]["parts"][0]["content"] == "Msg2"
\ No newline at end of file
+        assert loaded[2]["parts"][0]["content"] == "Msg2"
+
+@pytest.fixture
+def segmented(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Storage configuration moving messages to a gzip cold segment beyond 4 hot messages."""
+    monkeypatch.setitem(config._config, "storage", {"compression": "gzip", "hot_messages": 4})
+
+
+def _conversation(count: int) -> list:
+    return ModelMessagesTypeAdapter.validate_python([
+        {"kind": "request", "parts": [{"content": f"Msg{index}", "part_kind": "user-prompt"}]}
+        if index % 2 == 0 else
+        {"kind": "response", "parts": [{"content": f"Reply{index}", "part_kind": "text"}]}
+        for index in range(count)
+    ])
+
+
+def _cold_segments(filepath: str) -> list:
+    directory, name = os.path.split(filepath)
+    return sorted(entry for entry in os.listdir(directory) if entry.startswith(name + ".") and ".cold" in entry)
+
+
+class TestSegmentedHistory:
+    """Hot file plus compressed cold segment."""
+
+    def test_short_history_stays_plain_compact_json(self, temp_filepath: str, segmented: None) -> None:
+        store = PydanticJsonlStore(temp_filepath)
+        store.save_pydantic_history(_conversation(4))
+        content = Path(temp_filepath).read_text()
+        assert content.startswith("[{") and "\n" not in content
+        assert _cold_segments(temp_filepath) == []
+
+    def test_long_history_rolls_into_cold_segment(self, temp_filepath: str, segmented: None) -> None:
+        store = PydanticJsonlStore(temp_filepath)
+        messages = _conversation(5)
+        store.save_pydantic_history(messages)
+        segments = _cold_segments(temp_filepath)
+        assert len(segments) == 1 and segments[0].endswith(".cold.gz")
+        assert store.load_pydantic_history() == messages
+
+        # Next turns only rewrite the hot file
+        messages = messages + _conversation(3)
+        store.save_pydantic_history(messages)
+        assert _cold_segments(temp_filepath) == segments
+        assert Path(temp_filepath).read_text().startswith(f'{{"cold_segment":"{segments[0]}","cold_count":5,')
+        assert store.load_pydantic_history() == messages
+        assert [m["parts"][0]["content"] for m in store.load_raw_json_history()][-1] == "Msg2"
+
+    def test_new_segment_replaces_the_previous_one(self, temp_filepath: str, segmented: None) -> None:
+        store = PydanticJsonlStore(temp_filepath)
+        messages = _conversation(5)
+        store.save_pydantic_history(messages)
+        first = _cold_segments(temp_filepath)
+        messages = messages + _conversation(5)
+        store.save_pydantic_history(messages)
+        second = _cold_segments(temp_filepath)
+        assert len(second) == 1 and second != first
+        assert store.load_pydantic_history() == messages
+
+    def test_rewritten_prefix_drops_the_segment(self, temp_filepath: str, segmented: None) -> None:
+        """A summarized or edited history no longer starts with the cold segment: full rewrite."""
+        store = PydanticJsonlStore(temp_filepath)
+        store.save_pydantic_history(_conversation(6))
+        summarized = _conversation(2)
+        store.save_pydantic_history(summarized)
+        assert _cold_segments(temp_filepath) == []
+        assert store.load_pydantic_history() == summarized
+
+    def test_tool_calls_survive_segmentation(self, temp_filepath: str, segmented: None) -> None:
+        """Relies on dump -> load -> dump being byte-stable, including tool calls and returns."""
+        from back.benchmarks.memory import build_history
+
+        store = PydanticJsonlStore(temp_filepath)
+        history = build_history(6)
+        for end in range(1, len(history) + 1):
+            store.save_pydantic_history(history[:end])
+            assert store.load_pydantic_history() == history[:end]
+        assert len(_cold_segments(temp_filepath)) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_save_and_load_segmented(self, temp_filepath: str, segmented: None) -> None:
+        store = PydanticJsonlStore(temp_filepath)
+        messages = _conversation(7)
+        await store.save_pydantic_history_async(messages)
+        assert len(_cold_segments(temp_filepath)) == 1
+        assert await store.load_pydantic_history_async() == messages
+        assert len(await store.load_raw_json_history_async()) == 7
+
+    def test_reads_legacy_indented_file(self, temp_filepath: str, segmented: None) -> None:
+        messages = _conversation(6)
+        Path(temp_filepath).write_bytes(ModelMessagesTypeAdapter.dump_json(messages, indent=2))
+        store = PydanticJsonlStore(temp_filepath)
+        assert store.load_pydantic_history() == messages
+        store.save_pydantic_history(messages)
+        assert len(_cold_segments(temp_filepath)) == 1
+        assert store.load_pydantic_history() == messages
+
+    def test_compression_none_keeps_a_single_file(self, temp_filepath: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setitem(config._config, "storage", {"compression": "none", "hot_messages": 4})
+        store = PydanticJsonlStore(temp_filepath)
+        messages = _conversation(10)
+        store.save_pydantic_history(messages)
+        assert _cold_segments(temp_filepath) == []
+        assert store.load_pydantic_history() == messages
@@ -0,0 +1,97 @@
+"""
+Unit tests for the on-disk serialization helpers.
+"""
+
+import gzip
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+from back.config import config
+from back.storage.serialization import (
+    CODEC_GZIP,
+    CODEC_NONE,
+    compress,
+    compression_codec,
+    decompress,
+    dump_data,
+    dump_model,
+    write_atomic,
+)
+
+
+class _Hero(BaseModel):
+    name: str
+    hp: int
+
+
+def test_dump_data_is_compact_utf8_by_default():
+    raw = dump_data({"name": "Éowyn", "stats": [1, 2]})
+    assert raw == '{"name":"Éowyn","stats":[1,2]}'.encode("utf-8")
+
+
+def test_dump_honours_configured_indent(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setitem(config._config, "storage", {"json_indent": 2})
+    assert b"\n  " in dump_data({"a": 1})
+    assert b"\n  " in dump_model(_Hero(name="Aragorn", hp=42))
+
+
+def test_dump_model_roundtrips():
+    hero = _Hero(name="Éowyn", hp=30)
+    assert dump_model(hero) == '{"name":"Éowyn","hp":30}'.encode("utf-8")
+    assert _Hero.model_validate_json(dump_model(hero)) == hero
+
+
+def test_gzip_roundtrip_is_deterministic():
+    raw = json.dumps([{"content": "x" * 1000}]).encode("utf-8")
+    compressed = compress(raw, CODEC_GZIP)
+    assert compressed == compress(raw, CODEC_GZIP)
+    assert len(compressed) < len(raw) // 10
+    assert decompress(compressed) == raw
+
+
+def test_decompress_passes_plain_data_through():
+    assert decompress(b'[{"a":1}]') == b'[{"a":1}]'
+    assert compress(b"abc", CODEC_NONE) == b"abc"
+
+
+def test_decompress_reads_gzip_written_elsewhere():
+    assert decompress(gzip.compress(b"[]")) == b"[]"
+
+
+def test_zstd_falls_back_to_gzip_without_zstandard(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setitem(config._config, "storage", {"compression": "zstd"})
+    try:
+        import zstandard  # noqa: F401
+        expected = "zstd"
+    except ImportError:
+        expected = CODEC_GZIP
+    assert compression_codec() == expected
+
+
+def test_write_atomic_replaces_content(tmp_path: Path):
+    path = str(tmp_path / "state.json")
+    write_atomic(path, b"old")
+    write_atomic(path, b"new")
+    assert Path(path).read_bytes() == b"new"
+    assert os.listdir(tmp_path) == ["state.json"]
+
+
+def test_write_atomic_concurrent_writers_do_not_collide(tmp_path: Path):
+    path = str(tmp_path / "state.json")
+    payloads = [bytes([65 + index]) * 4096 for index in range(8)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda raw: write_atomic(path, raw), payloads * 10))
+    assert Path(path).read_bytes() in payloads
+    assert os.listdir(tmp_path) == ["state.json"]
+
+
+def test_write_atomic_removes_temporary_file_on_failure(tmp_path: Path):
+    path = str(tmp_path / "missing" / "state.json")
+    with pytest.raises(FileNotFoundError):
+        write_atomic(path, b"data")
+    assert os.listdir(tmp_path) == []
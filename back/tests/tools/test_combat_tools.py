@@ -6,6 +6,10 @@ from pydantic_ai.usage import RunUsage
 from back.services.game_session_service import GameSessionService
 from back.tools.combat_tools import (
     execute_attack_tool,
+    resolve_attack_action_tool,
+    defend_tool,
+    attack_odds_tool,
+    cast_spell_tool,
     apply_direct_damage_tool,
     end_combat_tool,
     end_turn_tool,
@@ -41,7 +45,7 @@ def test_execute_attack_tool(mock_combat_service, mock_combat_state_service, moc
     
     # Mock successful attack result
     mock_combat_service.execute_attack.return_value = (mock_state, "Hit! 5 damage.")
-    mock_combat_service.check_combat_end.return_value = False
+    mock_combat_service.get_end_reason.return_value = None
     mock_combat_service.get_combat_summary.return_value = {"status": "ongoing"}
     
     result = execute_attack_tool(mock_run_context, attacker_id, target_id)
@@ -60,18 +64,9 @@ def test_execute_attack_tool_ends_combat(mock_combat_service, mock_combat_state_
     
     mock_state = MagicMock(spec=CombatState)
     mock_state.id = combat_id
-    # Mock participants for end check
-    p1 = MagicMock(spec=Combatant)
-    p1.type = CombatantType.PLAYER
-    p1.is_alive.return_value = True
-    p2 = MagicMock(spec=Combatant)
-    p2.type = CombatantType.NPC
-    p2.is_alive.return_value = False # Enemy dead
-    mock_state.participants = [p1, p2]
-    
     mock_combat_state_service.load_combat_state.return_value = mock_state
     mock_combat_service.execute_attack.return_value = (mock_state, "Hit! Enemy dead.")
-    mock_combat_service.check_combat_end.return_value = True
+    mock_combat_service.get_end_reason.return_value = "victory"
     mock_combat_service.end_combat.return_value = mock_state
     
     result = execute_attack_tool(mock_run_context, attacker_id, target_id)
@@ -81,6 +76,78 @@ def test_execute_attack_tool_ends_combat(mock_combat_service, mock_combat_state_
     assert result["auto_ended"]["ended"] is True
     assert result["auto_ended"]["reason"] == "victory"
 
+@patch('back.tools.combat_tools.combat_state_service')
+@patch('back.tools.combat_tools.combat_service')
+def test_resolve_attack_action_tool(mock_combat_service, mock_combat_state_service, mock_run_context):
+    mock_state = MagicMock(spec=CombatState)
+    mock_state.id = "combat-123"
+    next_p = MagicMock()
+    next_p.name = "Player"
+    mock_state.get_current_combatant.return_value = next_p
+    mock_state.find_combatant.return_value = next_p
+    npc_turns = [{"actor": "E1", "target": "P1", "action": "attack", "message": "Miss!"}]
+
+    mock_combat_state_service.load_combat_state.return_value = mock_state
+    mock_combat_service.execute_attack.return_value = (mock_state, "Hit! 5 damage.")
+    mock_combat_service.get_end_reason.return_value = None
+    mock_combat_service.end_turn.return_value = mock_state
+    mock_combat_service.resolve_npc_turns.return_value = (mock_state, npc_turns)
+    mock_combat_service.get_combat_summary.return_value = {"status": "ongoing"}
+
+    result = resolve_attack_action_tool(mock_run_context, "P1", "E1")
+
+    mock_combat_state_service.load_combat_state.assert_called_once()
+    mock_combat_service.execute_attack.assert_called_once_with(mock_state, "P1", "E1")
+    mock_combat_service.end_turn.assert_called_once_with(mock_state)
+    mock_combat_state_service.save_combat_state.assert_called_once()
+    mock_combat_state_service.delete_combat_state.assert_not_called()
+    assert result["message"] == "Hit! 5 damage."
+    assert result["npc_turns"] == npc_turns
+    assert result["auto_ended"] is None
+    assert result["next_turn"] == "Player"
+
+@patch('back.tools.combat_tools.combat_state_service')
+@patch('back.tools.combat_tools.combat_service')
+def test_resolve_attack_action_tool_victory(mock_combat_service, mock_combat_state_service, mock_run_context):
+    mock_state = MagicMock(spec=CombatState)
+    mock_state.id = "combat-123"
+    mock_state.find_combatant.return_value = mock_state.get_current_combatant.return_value
+
+    mock_combat_state_service.load_combat_state.return_value = mock_state
+    mock_combat_service.execute_attack.return_value = (mock_state, "Hit! Goblin is defeated!")
+    mock_combat_service.get_end_reason.return_value = "victory"
+    mock_combat_service.end_combat.return_value = mock_state
+    mock_combat_service.get_combat_summary.return_value = {"status": "ended"}
+
+    result = resolve_attack_action_tool(mock_run_context, "P1", "E1")
+
+    mock_combat_service.end_turn.assert_not_called()
+    mock_combat_service.end_combat.assert_called_once_with(mock_state, "victory")
+    mock_combat_state_service.delete_combat_state.assert_called_once()
+    mock_combat_state_service.save_combat_state.assert_not_called()
+    assert result["auto_ended"] == {"ended": True, "reason": "victory"}
+    assert result["next_turn"] is None
+
+@patch('back.tools.combat_tools.combat_state_service')
+@patch('back.tools.combat_tools.combat_service')
+def test_resolve_attack_action_tool_rejects_out_of_turn_attacker(mock_combat_service, mock_combat_state_service, mock_run_context):
+    hero = Combatant(name="Hero", type=CombatantType.PLAYER, current_hit_points=30, max_hit_points=30,
+                     armor_class=14, initiative_roll=0, character_id=uuid4())
+    ally = Combatant(name="Ally", type=CombatantType.PLAYER, current_hit_points=30, max_hit_points=30,
+                     armor_class=14, initiative_roll=0, character_id=uuid4())
+    goblin = Combatant(name="Goblin", type=CombatantType.NPC, current_hit_points=7, max_hit_points=7,
+                       armor_class=12, initiative_roll=0, npc_id=uuid4())
+    state = CombatState(participants=[hero, ally, goblin], turn_order=[hero.id, ally.id, goblin.id],
+                        current_turn_combatant_id=hero.id)
+    mock_combat_state_service.load_combat_state.return_value = state
+
+    result = resolve_attack_action_tool(mock_run_context, "P2", "E1")
+
+    assert "Hero's turn" in result["error"]
+    mock_combat_service.execute_attack.assert_not_called()
+    mock_combat_service.end_turn.assert_not_called()
+    mock_combat_state_service.save_combat_state.assert_not_called()
+
 @patch('back.tools.combat_tools.combat_state_service')
 @patch('back.tools.combat_tools.combat_service')
 def test_apply_direct_damage_tool(mock_combat_service, mock_combat_state_service, mock_run_context):
@@ -93,7 +160,7 @@ def test_apply_direct_damage_tool(mock_combat_service, mock_combat_state_service
     
     mock_combat_state_service.load_combat_state.return_value = mock_state
     mock_combat_service.apply_direct_damage.return_value = mock_state
-    mock_combat_service.check_combat_end.return_value = False
+    mock_combat_service.get_end_reason.return_value = None
     mock_combat_service.get_combat_summary.return_value = {}
     
     result = apply_direct_damage_tool(mock_run_context, target_id, amount, "Fireball")
@@ -128,6 +195,7 @@ def test_end_turn_tool(mock_combat_service, mock_combat_state_service, mock_run_
     
     mock_combat_state_service.load_combat_state.return_value = mock_state
     mock_combat_service.end_turn.return_value = mock_state
+    mock_combat_service.resolve_npc_turns.return_value = (mock_state, [])
     mock_combat_service.get_combat_summary.return_value = {}
     
     current_p = MagicMock()
@@ -137,8 +205,34 @@ def test_end_turn_tool(mock_combat_service, mock_combat_state_service, mock_run_
     result = end_turn_tool(mock_run_context, combat_id)
     
     mock_combat_service.end_turn.assert_called_once()
+    mock_combat_service.resolve_npc_turns.assert_called_once_with(mock_state)
     mock_combat_state_service.save_combat_state.assert_called_once()
     assert "Turn ended" in result["message"]
+    assert result["npc_turns"] == []
+    assert result["auto_ended"] is None
+
+@patch('back.tools.combat_tools.combat_state_service')
+@patch('back.tools.combat_tools.combat_service')
+def test_end_turn_tool_npc_turns_end_combat(mock_combat_service, mock_combat_state_service, mock_run_context):
+    combat_id = "combat-123"
+    mock_state = MagicMock(spec=CombatState)
+    mock_state.id = combat_id
+
+    npc_turns = [{"actor": "E1", "target": "P1", "action": "attack", "message": "Hit! Player is defeated!"}]
+    mock_combat_state_service.load_combat_state.return_value = mock_state
+    mock_combat_service.end_turn.return_value = mock_state
+    mock_combat_service.resolve_npc_turns.return_value = (mock_state, npc_turns)
+    mock_combat_service.get_end_reason.return_value = "defeat"
+    mock_combat_service.end_combat.return_value = mock_state
+    mock_combat_service.get_combat_summary.return_value = {}
+
+    result = end_turn_tool(mock_run_context, combat_id)
+
+    mock_combat_service.end_combat.assert_called_once_with(mock_state, "defeat")
+    mock_combat_state_service.delete_combat_state.assert_called_once()
+    mock_combat_state_service.save_combat_state.assert_not_called()
+    assert result["npc_turns"] == npc_turns
+    assert result["auto_ended"] == {"ended": True, "reason": "defeat"}
 
 @patch('back.tools.combat_tools.combat_state_service')
 @patch('back.tools.combat_tools.combat_service')
@@ -148,7 +242,7 @@ def test_check_combat_end_tool_ongoing(mock_combat_service, mock_combat_state_se
     mock_state.id = combat_id
     
     mock_combat_state_service.load_combat_state.return_value = mock_state
-    mock_combat_service.check_combat_end.return_value = False
+    mock_combat_service.get_end_reason.return_value = None
     
     result = check_combat_end_tool(mock_run_context, combat_id)
     
@@ -192,3 +286,89 @@ def test_start_combat_tool(mock_combat_service, mock_combat_state_service, mock_
     assert "combat_id" in result
     assert "message" in result
     assert location in result["message"]
+
+@patch('back.tools.combat_tools.combat_state_service')
+@patch('back.tools.combat_tools.combat_service')
+def test_defend_tool(mock_combat_service, mock_combat_state_service, mock_run_context):
+    mock_state = MagicMock(spec=CombatState)
+    mock_combat_state_service.load_combat_state.return_value = mock_state
+    mock_combat_service.defend.return_value = (mock_state, "Hero defends: +4 AC until their next turn.")
+    mock_combat_service.get_combat_summary.return_value = {"status": "ongoing"}
+
+    result = defend_tool(mock_run_context, "P1")
+
+    mock_combat_service.defend.assert_called_once_with(mock_state, "P1")
+    mock_combat_state_service.save_combat_state.assert_called_once()
+    assert result["message"].startswith("Hero defends")
+
+@patch('back.tools.combat_tools.combat_state_service')
+@patch('back.tools.combat_tools.combat_service')
+def test_cast_spell_tool_resolves_and_ends_turn(mock_combat_service, mock_combat_state_service, mock_run_context):
+    mock_state = MagicMock(spec=CombatState)
+    mock_state.find_combatant.return_value = mock_state.get_current_combatant.return_value
+    mock_combat_state_service.load_combat_state.return_value = mock_state
+    mock_combat_service.cast_spell.return_value = (mock_state, {"success": True, "message": "Boom", "effects": []})
+    mock_combat_service.get_end_reason.return_value = None
+    mock_combat_service.end_turn.return_value = mock_state
+    mock_combat_service.resolve_npc_turns.return_value = (mock_state, [{"actor": "E1"}])
+    mock_combat_service.get_combat_summary.return_value = {"status": "ongoing"}
+
+    result = cast_spell_tool(mock_run_context, "P1", "Fireball", ["E1", "E2"])
+
+    mock_combat_service.cast_spell.assert_called_once_with(mock_state, "P1", "Fireball", ["E1", "E2"])
+    mock_combat_service.end_turn.assert_called_once_with(mock_state)
+    mock_combat_state_service.save_combat_state.assert_called_once()
+    assert result["message"] == "Boom"
+    assert result["npc_turns"] == [{"actor": "E1"}]
+
+
+@patch('back.tools.combat_tools.combat_state_service')
+@patch('back.tools.combat_tools.combat_service')
+def test_cast_spell_tool_failure_does_not_save(mock_combat_service, mock_combat_state_service, mock_run_context):
+    mock_state = MagicMock(spec=CombatState)
+    mock_state.find_combatant.return_value = mock_state.get_current_combatant.return_value
+    mock_combat_state_service.load_combat_state.return_value = mock_state
+    mock_combat_service.cast_spell.return_value = (mock_state, {"success": False, "message": "No mana", "effects": []})
+
+    result = cast_spell_tool(mock_run_context, "P1", "Fireball", ["E1"])
+
+    assert result == {"error": "No mana"}
+    mock_combat_state_service.save_combat_state.assert_not_called()
+
+@patch('back.tools.combat_tools.combat_state_service')
+@patch('back.tools.combat_tools.combat_service')
+def test_cast_spell_tool_rejects_out_of_turn_caster(mock_combat_service, mock_combat_state_service, mock_run_context):
+    hero = Combatant(name="Hero", type=CombatantType.PLAYER, current_hit_points=30, max_hit_points=30,
+                     armor_class=14, initiative_roll=0, character_id=uuid4())
+    mage = Combatant(name="Mage", type=CombatantType.PLAYER, current_hit_points=20, max_hit_points=20,
+                     armor_class=12, initiative_roll=0, character_id=uuid4())
+    goblin = Combatant(name="Goblin", type=CombatantType.NPC, current_hit_points=7, max_hit_points=7,
+                       armor_class=12, initiative_roll=0, npc_id=uuid4())
+    state = CombatState(participants=[hero, mage, goblin], turn_order=[hero.id, mage.id, goblin.id],
+                        current_turn_combatant_id=hero.id)
+    mock_combat_state_service.load_combat_state.return_value = state
+
+    result = cast_spell_tool(mock_run_context, "P2", "Fireball", ["E1"], end_turn=True)
+
+    assert "Hero's turn" in result["error"]
+    assert state.current_turn_combatant_id == hero.id
+    assert state.turn_order == [hero.id, mage.id, goblin.id]
+    mock_combat_service.cast_spell.assert_not_called()
+    mock_combat_service.end_turn.assert_not_called()
+    mock_combat_state_service.save_combat_state.assert_not_called()
+
+@patch('back.tools.combat_tools.combat_state_service')
+def test_attack_odds_tool_does_not_save(mock_combat_state_service, mock_run_context):
+    attacker = Combatant(name="Hero", type=CombatantType.PLAYER, character_id=uuid4(), current_hit_points=20,
+                         max_hit_points=20, armor_class=12, initiative_roll=0, attack_bonus=3, weapon_damage="1d8")
+    target = Combatant(name="Goblin", type=CombatantType.NPC, npc_id=uuid4(), current_hit_points=8,
+                       max_hit_points=8, armor_class=14, initiative_roll=0)
+    mock_combat_state_service.load_combat_state.return_value = CombatState(participants=[attacker, target])
+
+    result = attack_odds_tool(mock_run_context, "P1", "E1")
+
+    assert result["attacker"] == "Hero"
+    assert result["hit_chance"] == pytest.approx(0.5)
+    assert "kill_chance" in result
+    mock_combat_state_service.save_combat_state.assert_not_called()
+
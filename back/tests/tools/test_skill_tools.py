@@ -4,7 +4,7 @@ from uuid import uuid4
 from pydantic_ai import RunContext
 from pydantic_ai.usage import RunUsage
 from back.services.game_session_service import GameSessionService
-from back.tools.skill_tools import skill_check_with_character
+from back.tools.skill_tools import skill_check_with_character, skill_check_odds_tool
 from back.models.domain.character import Character, Stats, Skills, CombatStats
 
 
@@ -189,3 +189,21 @@ def test_skill_check_error(mock_character_service, mock_run_context):
     assert "error" in result
     assert "Error during skill check for perception" in result["error"]
     assert "Service error" in result["error"]
+
+
+@patch('back.tools.skill_tools.CharacterService')
+def test_skill_check_odds_tool(mock_character_service, mock_run_context, sample_character):
+    """Test skill check odds use the same target as the roll, without rolling"""
+    mock_character_instance = MagicMock()
+    mock_character_instance.get_character.return_value = sample_character
+    mock_character_service.return_value = mock_character_instance
+
+    # charisma is 15, so skill_value = 75; unfavorable adds 20 difficulty -> target 55
+    with patch('back.tools.skill_tools.random.randint') as mock_randint:
+        result = skill_check_odds_tool(mock_run_context, "charisma", "unfavorable")
+        mock_randint.assert_not_called()
+
+    assert result["target"] == 55
+    assert result["skill_value"] == 75
+    assert result["success_chance"] == pytest.approx(0.55)
+    assert sum(result["bands"].values()) == pytest.approx(1.0)
@@ -0,0 +1,103 @@
+import gzip
+import json
+import os
+import time
+
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+from typing import Dict, List
+
+import yaml
+
+from back.config import get_data_dir
+from back.utils.catalog_cache import CatalogCache
+
+CATALOG_FILE = "catalog_test.yaml"
+
+
+def write_catalog(items: List[str]) -> None:
+    with open(os.path.join(get_data_dir(), CATALOG_FILE), "w", encoding="utf-8") as file:
+        yaml.safe_dump({"items": items}, file)
+
+
+def make_client():
+    builds = []
+
+    def build() -> Dict[str, List[str]]:
+        builds.append(1)
+        with open(os.path.join(get_data_dir(), CATALOG_FILE), encoding="utf-8") as file:
+            return yaml.safe_load(file)
+
+    catalog = CatalogCache([CATALOG_FILE], build, Dict[str, List[str]])
+    app = FastAPI()
+
+    @app.get("/catalog")
+    def get_catalog(request: Request) -> Response:
+        return catalog.respond(request)
+
+    return TestClient(app), builds
+
+
+def test_catalog_is_built_once_and_gzipped():
+    write_catalog(["sword", "axe"])
+    client, builds = make_client()
+
+    first = client.get("/catalog", headers={"Accept-Encoding": "gzip"})
+    second = client.get("/catalog", headers={"Accept-Encoding": "gzip"})
+
+    assert first.status_code == 200
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.headers["cache-control"].startswith("public")
+    assert first.json() == {"items": ["sword", "axe"]}
+    assert second.headers["etag"] == first.headers["etag"]
+    assert len(builds) == 1
+
+
+def test_identity_encoding_has_its_own_etag():
+    write_catalog(["sword"])
+    client, _ = make_client()
+
+    plain = client.get("/catalog", headers={"Accept-Encoding": "identity"})
+    zipped = client.get("/catalog", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in plain.headers
+    assert json.loads(plain.content) == {"items": ["sword"]}
+    assert plain.headers["etag"] != zipped.headers["etag"]
+    assert plain.headers["etag"].startswith('"')
+
+
+def test_not_modified_when_etag_matches():
+    write_catalog(["sword"])
+    client, _ = make_client()
+    etag = client.get("/catalog").headers["etag"]
+
+    response = client.get("/catalog", headers={"If-None-Match": f'"other", W/{etag}'})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_catalog_rebuilt_when_source_changes():
+    write_catalog(["sword"])
+    client, builds = make_client()
+    etag = client.get("/catalog").headers["etag"]
+
+    time.sleep(0.01)
+    write_catalog(["sword", "bow"])
+    response = client.get("/catalog", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json() == {"items": ["sword", "bow"]}
+    assert len(builds) == 2
+
+
+def test_gzip_body_is_deterministic():
+    write_catalog(["sword"])
+    catalog = CatalogCache([CATALOG_FILE], lambda: {"items": ["sword"]}, Dict[str, List[str]])
+
+    payload = catalog.get()
+    catalog.invalidate()
+
+    assert catalog.get().gzip_body == payload.gzip_body
+    assert gzip.decompress(payload.gzip_body) == payload.body
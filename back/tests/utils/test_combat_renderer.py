@@ -0,0 +1,94 @@
+from uuid import uuid4
+
+from back.models.domain.combat_state import CombatState, Combatant, CombatantType
+from back.utils.combat_renderer import render_combat_state
+
+
+def count_words(text: str) -> int:
+    return len(text.split())
+
+
+def make_state(npc_count: int = 2) -> CombatState:
+    hero = Combatant(name="Arandur", type=CombatantType.PLAYER, current_hit_points=30, max_hit_points=40,
+                     armor_class=15, initiative_roll=18, character_id=uuid4(), attack_bonus=3,
+                     weapon_name="Longsword", weapon_damage="1d8+4")
+    goblins = [
+        Combatant(name=f"Goblin #{i + 1}", type=CombatantType.NPC, current_hit_points=12, max_hit_points=12,
+                  armor_class=13, initiative_roll=10 - i, npc_id=uuid4(), archetype="Goblin Warrior")
+        for i in range(npc_count)
+    ]
+    participants = [hero, *goblins]
+    return CombatState(
+        participants=participants,
+        turn_order=[p.id for p in participants],
+        current_turn_combatant_id=hero.id,
+        log=["Combat started."] + [f"Round 1 - event {i}" for i in range(10)],
+    )
+
+
+def test_render_uses_aliases_and_turn_marker():
+    state = make_state()
+
+    render = render_combat_state(state, log_lines=3, count_tokens=count_words)
+
+    assert ">P1 Arandur [ally] HP 30/40 AC 15" in render.text
+    assert " E1 Goblin #1 [foe]" in render.text
+    for p in state.participants:
+        assert str(p.id) not in render.text
+    assert "- Round 1 - event 9" in render.text
+    assert "event 6" not in render.text
+    assert render.log_lines == 3
+
+
+def test_render_replaces_uuids_in_log():
+    state = make_state()
+    goblin = state.participants[1]
+    state.add_log_entry(f"Damage applied to target {goblin.id}: 4 (fire)")
+
+    render = render_combat_state(state, log_lines=1, count_tokens=count_words)
+
+    assert "Damage applied to target E1: 4 (fire)" in render.text
+
+
+def test_render_fits_token_budget():
+    state = make_state(npc_count=6)
+    for goblin in state.participants[1:5]:
+        goblin.take_damage(goblin.max_hit_points)
+
+    full = render_combat_state(state, log_lines=10, token_budget=10_000, count_tokens=count_words)
+    fitted = render_combat_state(state, log_lines=10, token_budget=full.tokens - 20, count_tokens=count_words)
+
+    assert fitted.tokens <= fitted.token_budget
+    assert fitted.log_lines < full.log_lines
+    assert not fitted.over_budget
+
+
+def test_render_collapses_defeated_when_log_is_not_enough():
+    state = make_state(npc_count=6)
+    for goblin in state.participants[1:5]:
+        goblin.take_damage(goblin.max_hit_points)
+
+    render = render_combat_state(state, log_lines=0, token_budget=60, count_tokens=count_words)
+
+    assert " Down: E1, E2, E3, E4" in render.text
+    assert "Goblin #1" not in render.text
+
+
+def test_render_measures_savings():
+    state = make_state()
+
+    render = render_combat_state(state, count_tokens=count_words, measure_savings=True)
+
+    assert render.baseline_tokens is not None
+    assert render.tokens_saved == render.baseline_tokens - render.tokens
+    assert render.tokens_saved > 0
+
+
+def test_find_combatant_by_alias_or_uuid():
+    state = make_state()
+    goblin = state.participants[2]
+
+    assert state.find_combatant("E2") is goblin
+    assert state.find_combatant("e2") is goblin
+    assert state.find_combatant(str(goblin.id)) is goblin
+    assert state.find_combatant("E9") is None
@@ -3,7 +3,12 @@ Tests for the logging utility functions.
 Validates that logging functions work correctly and don't conflict with LogRecord attributes.
 """
 
+import json
+import logging
+import logging.handlers
+
 import pytest
+from back.config import JsonFormatter, config
 from back.utils.logger import log_debug, log_info, log_warning, log_error, log_critical
 
 
@@ -87,3 +92,43 @@ def test_log_with_empty_kwargs():
     log_warning("Simple message")
     log_error("Simple message")
     log_critical("Simple message")
+
+
+def test_disabled_level_returns_before_logging(monkeypatch):
+    """Test that a disabled level skips the record (and the reserved-key check) entirely"""
+    from back.utils import logger as logger_module
+
+    monkeypatch.setattr(logger_module.logger, "isEnabledFor", lambda level: level >= logging.INFO)
+    calls = []
+    monkeypatch.setattr(logger_module.logger, "log", lambda *args, **kwargs: calls.append(args))
+
+    log_debug("Skipped", levelname="CUSTOM")
+    log_info("Kept", action="test")
+
+    assert calls == [(logging.INFO, "Kept")]
+
+
+def test_json_formatter_emits_fields():
+    """Test that structured kwargs become top-level JSON fields"""
+    record = logging.LogRecord("back.test", logging.INFO, __file__, 1, "Hello %s", ("world",), None)
+    record.fields = {"action": "test", "count": 3, "level": "overridden", "obj": object()}
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["message"] == "Hello world"
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "back.test"
+    assert entry["action"] == "test"
+    assert entry["count"] == 3
+    assert entry["obj"].startswith("<object object")
+    assert entry["timestamp"].endswith("+00:00")
+
+
+def test_root_logger_writes_through_queue():
+    """Test that handlers run on the queue listener, not on the caller"""
+    root_handlers = logging.getLogger().handlers
+    listener_handlers = config._log_listener.handlers
+
+    assert any(isinstance(h, logging.handlers.QueueHandler) for h in root_handlers)
+    assert any(isinstance(h, logging.StreamHandler) for h in listener_handlers)
+    assert not set(listener_handlers) & set(root_handlers)
@@ -0,0 +1,61 @@
+"""
+Tests for the per-subsystem memory report.
+"""
+
+import os
+import tracemalloc
+
+import pytest
+from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, UserPromptPart
+
+from back.storage.pydantic_jsonl_store import PydanticJsonlStore
+from back.utils.memory import _PROJECT_ROOT, _subsystem_of_file, memory_report
+
+
+def test_files_map_to_subsystems():
+    def subsystem(relative_path):
+        return _subsystem_of_file(os.path.join(_PROJECT_ROOT, *relative_path.split("/")))
+
+    assert subsystem("back/storage/pydantic_jsonl_store.py") == "history"
+    # More specific entries win over the game data managers' directory
+    assert subsystem("back/models/domain/combat_state.py") == "combat_states"
+    assert subsystem("back/models/domain/character.py") == "characters"
+    assert subsystem("back/models/domain/spells_manager.py") == "game_data"
+    assert subsystem("back/routers/gamesession.py") == "other"
+    assert _subsystem_of_file("/usr/lib/python3/json/decoder.py") is None
+
+
+def test_report_without_tracing():
+    if tracemalloc.is_tracing():
+        pytest.skip("tracemalloc started by the environment")
+
+    report = memory_report()
+
+    assert report.tracing is False
+    assert report.subsystems == {}
+
+
+def test_loaded_history_is_charged_to_history(tmp_path):
+    store = PydanticJsonlStore(str(tmp_path / "history.jsonl"))
+    store.save_pydantic_history([
+        message
+        for i in range(50)
+        for message in (ModelRequest(parts=[UserPromptPart(content=f"Player turn {i} " * 20)]),
+                        ModelResponse(parts=[TextPart(content=f"GM answer {i} " * 60)]))
+    ])
+    # Traced after the save: building the message serializers once would dominate the snapshot
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start(25)
+    try:
+        before = memory_report().subsystems["history"].bytes
+        history = store.load_pydantic_history()
+        after = memory_report()
+    finally:
+        if started:
+            tracemalloc.stop()
+
+    assert len(history) == 100
+    assert after.tracing is True
+    assert after.subsystems["history"].bytes - before > os.path.getsize(store.filepath) / 2
+    assert set(after.subsystems) == {"history", "combat_states", "characters", "game_data", "other"}
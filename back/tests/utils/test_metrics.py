@@ -0,0 +1,123 @@
+"""
+Tests for the in-process Prometheus metrics.
+"""
+
+import asyncio
+import os
+import time
+from functools import lru_cache
+
+import pytest
+
+from back.config import get_data_dir
+from back.utils.metrics import (
+    EVENT_LOOP_LAG_SECONDS,
+    TOOL_CALLS,
+    Counter,
+    MetricsRegistry,
+    registry,
+    watch_event_loop_lag,
+    watch_lru_cache,
+)
+from back.utils.timing import timed_tool
+
+
+def test_counter_and_histogram_exposition():
+    local = MetricsRegistry()
+    turns = local.counter("test_turns", "Turns.", ["mode"])
+    latency = local.histogram("test_seconds", "Latency.", buckets=(0.1, 1.0))
+
+    turns.inc(mode="narrative")
+    turns.inc(2, mode="combat")
+    for seconds in (0.05, 0.5, 3.0):
+        latency.observe(seconds)
+
+    lines = local.render().splitlines()
+    assert "# TYPE test_turns_total counter" in lines
+    assert 'test_turns_total{mode="combat"} 2' in lines
+    assert 'test_turns_total{mode="narrative"} 1' in lines
+    assert "# TYPE test_seconds histogram" in lines
+    assert 'test_seconds_bucket{le="0.1"} 1' in lines
+    assert 'test_seconds_bucket{le="1"} 2' in lines
+    assert 'test_seconds_bucket{le="+Inf"} 3' in lines
+    assert "test_seconds_sum 3.55" in lines
+    assert "test_seconds_count 3" in lines
+
+
+def test_metric_validation():
+    counter = Counter("test_counter", "Counter.", ["cache"])
+    with pytest.raises(ValueError):
+        counter.inc(-1, cache="x")
+    with pytest.raises(ValueError):
+        counter.inc(other="x")
+    local = MetricsRegistry()
+    local.counter("dup", "A.")
+    with pytest.raises(ValueError):
+        local.counter("dup", "B.")
+
+
+def test_label_values_are_escaped():
+    local = MetricsRegistry()
+    local.counter("test_escape", "Escape.", ["name"]).inc(name='a "b"\n')
+
+    assert 'test_escape_total{name="a \\"b\\"\\n"} 1' in local.render()
+
+
+def test_tool_calls_are_counted_by_outcome():
+    def failing_tool() -> None:
+        raise RuntimeError("boom")
+
+    tool = timed_tool(failing_tool)
+    with pytest.raises(RuntimeError):
+        tool()
+
+    assert TOOL_CALLS.value(tool="failing_tool", outcome="error") == 1
+    assert TOOL_CALLS.value(tool="failing_tool", outcome="ok") == 0
+
+
+def test_lru_cache_statistics():
+    @lru_cache(maxsize=8)
+    def square(x: int) -> int:
+        return x * x
+
+    watch_lru_cache("test_square", square)
+    square(2), square(2), square(3)
+
+    body = registry.render()
+    assert 'jdr_lru_cache_requests_total{cache="test_square",result="hit"} 1' in body
+    assert 'jdr_lru_cache_requests_total{cache="test_square",result="miss"} 2' in body
+
+
+def test_storage_gauges():
+    session_dir = os.path.join(get_data_dir(), "sessions", "s1")
+    os.makedirs(session_dir)
+    with open(os.path.join(session_dir, "history_narrative.jsonl"), "w") as f:
+        f.write("x" * 10)
+    with open(os.path.join(session_dir, "history_narrative.jsonl.0a1b.cold.gz"), "w") as f:
+        f.write("x" * 6)
+    with open(os.path.join(session_dir, "history_narrative_llm.jsonl"), "w") as f:
+        f.write("x" * 4)
+    os.makedirs(os.path.join(get_data_dir(), "combat"))
+    with open(os.path.join(get_data_dir(), "combat", "s1.json"), "w") as f:
+        f.write("{}")
+
+    lines = registry.render().splitlines()
+    # A cold segment counts with its hot file
+    assert 'jdr_history_bytes{kind="narrative"} 16' in lines
+    assert 'jdr_history_files{kind="narrative"} 1' in lines
+    assert 'jdr_history_files{kind="narrative_llm"} 1' in lines
+    assert "jdr_combat_states_active 1" in lines
+
+
+def test_event_loop_lag_is_sampled():
+    async def block_loop():
+        watcher = asyncio.create_task(watch_event_loop_lag(interval=0.01))
+        await asyncio.sleep(0)
+        time.sleep(0.05)  # Blocking call on the loop
+        await asyncio.sleep(0.03)
+        watcher.cancel()
+
+    before = EVENT_LOOP_LAG_SECONDS.count()
+    asyncio.run(block_loop())
+
+    assert EVENT_LOOP_LAG_SECONDS.count() > before
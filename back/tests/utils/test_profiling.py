@@ -0,0 +1,82 @@
+"""
+Tests for the on-demand request profiler.
+"""
+
+from datetime import datetime, timezone
+
+from back.models.schema import ProfilingSettings
+from back.utils.profiling import MODE_CPROFILE, MODE_SAMPLING, RequestProfiler
+
+
+def make_profiler(**kwargs) -> RequestProfiler:
+    kwargs.setdefault("allow_header", True)
+    return RequestProfiler(ProfilingSettings(), paths=["/api/gamesession/play"], **kwargs)
+
+
+def profile_info(profile_id: str, mode: str = MODE_CPROFILE) -> dict:
+    return {
+        "profile_id": profile_id,
+        "created_at": datetime.now(timezone.utc),
+        "method": "POST",
+        "path": "/api/gamesession/play",
+        "status_code": 200,
+        "duration_ms": 1.0,
+        "mode": mode,
+        "trigger": "header",
+    }
+
+
+def test_select():
+    profiler = make_profiler()
+
+    assert profiler.select("/api/gamesession/play", None) is None
+    assert profiler.select("/api/gamesession/play", "sampling") == (MODE_SAMPLING, "header")
+    assert profiler.select("/api/gamesession/play", "true") == (MODE_CPROFILE, "header")
+    assert profiler.select("/api/gamesession/play", "nope") is None
+    # The header only applies to the eligible paths
+    assert profiler.select("/api/characters", "cprofile") is None
+
+    profiler.settings = ProfilingSettings(enabled=True, sample_rate=1.0, mode=MODE_SAMPLING)
+    assert profiler.select("/api/gamesession/play", None) == (MODE_SAMPLING, "sampled")
+    assert profiler.select("/api/characters", None) is None
+
+
+def test_header_can_be_disabled():
+    assert make_profiler(allow_header=False).select("/api/gamesession/play", "1") is None
+    assert RequestProfiler(ProfilingSettings(), paths=["/api/gamesession/play"]).select(
+        "/api/gamesession/play", "1") is None
+
+
+def test_admin_requires_token_or_local_client():
+    assert make_profiler().is_admin("127.0.0.1", None)
+    assert make_profiler().is_admin("::1", None)
+    assert not make_profiler().is_admin("192.168.1.20", None)
+
+    guarded = make_profiler(admin_token="s3cret")
+    assert guarded.is_admin("192.168.1.20", "s3cret")
+    assert not guarded.is_admin("127.0.0.1", None)
+    assert not guarded.is_admin("127.0.0.1", "wrong")
+
+
+def test_one_request_profiled_at_a_time():
+    profiler = make_profiler()
+
+    with profiler.capture(MODE_CPROFILE) as first:
+        with profiler.capture(MODE_CPROFILE) as second:
+            pass
+
+    assert first is not None
+    assert second is None
+
+
+def test_oldest_profiles_are_dropped():
+    profiler = make_profiler(max_profiles=2)
+
+    for profile_id in ("p1", "p2", "p3"):
+        with profiler.capture(MODE_SAMPLING) as captured:
+            pass
+        profiler.save(captured, profile_info(profile_id, MODE_SAMPLING))
+
+    assert [profile.profile_id for profile in profiler.list_profiles()] == ["p3", "p2"]
+    assert profiler.get_profile("p1") is None
+    assert profiler.get_profile("p3")[1].endswith("p3.speedscope.json")
@@ -0,0 +1,108 @@
+"""
+Tests for the per-turn latency breakdown.
+"""
+
+import asyncio
+
+import pytest
+
+from back.utils.timing import (
+    LatencyHistogram,
+    TurnMetrics,
+    timed,
+    timed_tool,
+    track_turn,
+    turn_metrics,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    turn_metrics.reset()
+    yield
+    turn_metrics.reset()
+
+
+def test_spans_outside_a_turn_are_ignored():
+    with timed("llm"):
+        pass
+
+    assert turn_metrics.histograms() == {}
+
+
+def test_turn_sums_repeated_spans_and_is_recorded():
+    with track_turn("s1") as turn:
+        with timed("history_load"):
+            pass
+        with timed("history_load"):
+            pass
+        with timed("llm"):
+            pass
+
+    assert turn.counts == {"history_load": 2, "llm": 1}
+    assert turn.total_ms >= turn.phases["history_load"] + turn.phases["llm"]
+    assert [metric.split(";")[0] for metric in turn.server_timing().split(", ")] == ["history_load", "llm", "total"]
+
+    histograms = turn_metrics.histograms()
+    assert histograms["history_load"]["count"] == 1
+    assert histograms["total"]["count"] == 1
+    assert [t["counts"] for t in turn_metrics.session_turns("s1")] == [{"history_load": 2, "llm": 1}]
+
+
+def test_turn_is_recorded_on_error():
+    with pytest.raises(RuntimeError):
+        with track_turn("s1"):
+            with timed("llm"):
+                raise RuntimeError("LLM down")
+
+    assert len(turn_metrics.session_turns("s1")) == 1
+
+
+def test_timed_tool_sync_and_async():
+    def sync_tool(x: int) -> int:
+        """Sync tool."""
+        return x + 1
+
+    async def async_tool(x: int) -> int:
+        """Async tool."""
+        return x * 2
+
+    wrapped_sync, wrapped_async = timed_tool(sync_tool), timed_tool(async_tool)
+
+    async def play():
+        with track_turn("s1") as turn:
+            assert wrapped_sync(1) == 2
+            assert await wrapped_async(2) == 4
+            # Sync tools run in worker threads
+            assert await asyncio.to_thread(wrapped_sync, 3) == 4
+        return turn
+
+    turn = asyncio.run(play())
+
+    assert wrapped_sync.__name__ == "sync_tool" and wrapped_async.__doc__ == "Async tool."
+    assert asyncio.iscoroutinefunction(wrapped_async) and not asyncio.iscoroutinefunction(wrapped_sync)
+    assert turn.counts == {"tool.sync_tool": 2, "tool.async_tool": 1}
+
+
+def test_histogram_buckets():
+    histogram = LatencyHistogram(buckets=(0.1, 1.0))
+    for seconds in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(seconds)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == {"0.1": 2, "1.0": 1, "+Inf": 1}
+    assert snapshot["count"] == 4
+    assert snapshot["sum"] == pytest.approx(3.65)
+
+
+def test_sessions_are_bounded():
+    metrics = TurnMetrics(turns_per_session=2, max_sessions=2)
+    for session_id in ("a", "a", "a", "b", "c"):
+        with track_turn(session_id) as turn:
+            pass
+        metrics.record(turn)
+
+    assert metrics.session_turns("a") == []
+    assert len(metrics.session_turns("b")) == 1
+    assert len(metrics.session_turns("c")) == 1
+    assert metrics.histograms()["total"]["count"] == 5
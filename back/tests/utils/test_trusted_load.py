@@ -0,0 +1,104 @@
+import json
+import os
+from uuid import uuid4
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from back.config import get_data_dir
+from back.models.domain.character import Character, CombatStats
+from back.models.domain.combat_state import CombatState, Combatant, CombatantType
+from back.services.character_data_service import CharacterDataService
+from back.services.combat_state_service import CombatStateService
+from back.utils.trusted_load import TRUSTED_CONTEXT, load_model, trusted_loads
+
+
+def make_character() -> Character:
+    return Character(
+        name="Boromir",
+        race="humans",
+        culture="gondorians",
+        stats={"strength": 15, "constitution": 14, "agility": 12, "intelligence": 10, "wisdom": 11, "charisma": 13},
+        skills={"combat": {"melee_weapons": 5}},
+        combat_stats={"max_hit_points": 140, "current_hit_points": 140, "max_mana_points": 80,
+                      "current_mana_points": 80, "armor_class": 11, "attack_bonus": 2},
+    )
+
+
+def character_path(character: Character) -> str:
+    return os.path.join(get_data_dir(), "characters", f"{character.id}.json")
+
+
+def test_saved_character_is_trusted():
+    service = CharacterDataService()
+    character = service.save_character(make_character())
+
+    with open(character_path(character), "rb") as file:
+        raw = file.read()
+
+    assert trusted_loads.is_trusted(character_path(character), Character, raw)
+    assert service.load_character(str(character.id)) == character
+
+
+def test_edited_file_is_fully_validated():
+    service = CharacterDataService()
+    character = service.save_character(make_character())
+    path = character_path(character)
+
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+    data["combat_stats"]["current_hit_points"] = 500
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file)
+
+    with pytest.raises(ValidationError, match="Current HP cannot exceed maximum HP"):
+        service.load_character(str(character.id))
+
+
+def test_trusted_content_skips_consistency_validators():
+    data = {"max_hit_points": 10, "current_hit_points": 50, "max_mana_points": 0, "current_mana_points": 0}
+
+    with pytest.raises(ValidationError):
+        CombatStats.model_validate(data)
+    assert CombatStats.model_validate(data, context=TRUSTED_CONTEXT).current_hit_points == 50
+
+
+def test_validated_file_is_trusted_on_next_load(tmp_path):
+    path = str(tmp_path / "character.json")
+    raw = make_character().model_dump_json().encode("utf-8")
+
+    assert not trusted_loads.is_trusted(path, Character, raw)
+    first = load_model(Character, raw, path)
+
+    assert trusted_loads.is_trusted(path, Character, raw)
+    assert load_model(Character, raw, path) == first
+
+
+def test_checksum_is_keyed_on_schema(tmp_path):
+    class OtherModel(BaseModel):
+        name: str
+
+    path = str(tmp_path / "character.json")
+    raw = make_character().model_dump_json().encode("utf-8")
+    trusted_loads.remember(path, Character, raw)
+
+    assert not trusted_loads.is_trusted(path, OtherModel, raw)
+
+
+def test_combat_state_round_trip_and_delete():
+    service = CombatStateService()
+    session_id = uuid4()
+    player = Combatant(name="Boromir", type=CombatantType.PLAYER, current_hit_points=10, max_hit_points=10,
+                       armor_class=12, initiative_roll=5, character_id=uuid4())
+    state = CombatState(participants=[player], turn_order=[player.id], current_turn_combatant_id=player.id)
+
+    service.save_combat_state(session_id, state)
+    path = service._get_file_path(session_id)
+    with open(path, "rb") as file:
+        raw = file.read()
+
+    assert trusted_loads.is_trusted(path, CombatState, raw)
+    assert service.load_combat_state(session_id).model_dump() == state.model_dump()
+
+    service.delete_combat_state(session_id)
+    assert not trusted_loads.is_trusted(path, CombatState, raw)
@@ -0,0 +1,37 @@
+"""
+Tests for the startup warm-up and the lazy imports.
+"""
+
+import threading
+
+import pytest
+
+from back.benchmarks.startup import measure_import
+from back.utils.warmup import warm_up
+
+
+@pytest.mark.asyncio
+async def test_warm_up_runs_steps_in_parallel():
+    # Each step waits for the other: this only completes if they run at the same time
+    barrier = threading.Barrier(2, timeout=5)
+
+    durations = await warm_up({"first": barrier.wait, "second": barrier.wait})
+
+    assert set(durations) == {"first", "second"}
+    assert all(seconds >= 0 for seconds in durations.values())
+
+
+@pytest.mark.asyncio
+async def test_failing_step_does_not_stop_the_warm_up():
+    def fail():
+        raise RuntimeError("no network")
+
+    durations = await warm_up({"tokenizer": fail, "game_data": lambda: None})
+
+    assert set(durations) == {"game_data"}
+
+
+def test_agents_do_not_load_heavy_dependencies_at_import():
+    result = measure_import("back.agents.narrative_agent")
+
+    assert result["heavy_modules"] == []
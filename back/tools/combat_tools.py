@@ -2,12 +2,13 @@ from pydantic_ai import RunContext
 from back.utils.logger import log_debug, log_error
 from back.services.combat_service import CombatService
 from back.services.combat_state_service import CombatStateService
+from back.services.probability_service import ProbabilityService
 from back.services.game_session_service import GameSessionService
-from back.models.domain.combat_state import CombatantType
 import uuid
 
 combat_service = CombatService()
 combat_state_service = CombatStateService()
+probability_service = ProbabilityService()
 
 def start_combat_tool(ctx: RunContext[GameSessionService], location: str, description: str, participants: list[dict]) -> dict:
     """
@@ -26,6 +27,7 @@ def start_combat_tool(ctx: RunContext[GameSessionService], location: str, descri
             - archetype (str): Description/Class (e.g., "Orc Warrior", "Goblin Archer").
             - level (int, optional): Level of the NPC if known/defined in scenario.
             - is_unique_npc (bool, optional): If this is a specific named NPC from the scenario.
+            - count (int, optional): Number of identical enemies to spawn (e.g. a pack of 8 wolves).
 
     Returns:
         dict: A dictionary containing the combat ID and a confirmation message.
@@ -93,8 +95,8 @@ def execute_attack_tool(ctx: RunContext[GameSessionService], attacker_id: str, t
     This updates the combat state and may result in damage or death.
 
     Args:
-        attacker_id (str): The UUID of the attacker.
-        target_id (str): The UUID of the target.
+        attacker_id (str): The short alias (e.g. "P1") or UUID of the attacker.
+        target_id (str): The short alias (e.g. "E2") or UUID of the target.
 
     Returns:
         dict: A dictionary containing the result of the attack (message, updated state summary, and auto-end info).
@@ -112,22 +114,12 @@ def execute_attack_tool(ctx: RunContext[GameSessionService], attacker_id: str, t
         combat_state, result_message = combat_service.execute_attack(combat_state, attacker_id, target_id)
         
         # Check for combat end
-        is_ended = combat_service.check_combat_end(combat_state)
+        end_reason = combat_service.get_end_reason(combat_state)
         auto_end_info = None
         
-        if is_ended:
-            players_alive = any(p.type == CombatantType.PLAYER and p.is_alive() for p in combat_state.participants)
-            enemies_alive = any(p.type == CombatantType.NPC and p.is_alive() for p in combat_state.participants)
-            
-            if not players_alive:
-                reason = "defeat"
-            elif not enemies_alive:
-                reason = "victory"
-            else:
-                reason = "draw"
-            
-            combat_state = combat_service.end_combat(combat_state, reason)
-            auto_end_info = {"ended": True, "reason": reason}
+        if end_reason:
+            combat_state = combat_service.end_combat(combat_state, end_reason)
+            auto_end_info = {"ended": True, "reason": end_reason}
             
             # Delete the combat state since it's finished
             combat_state_service.delete_combat_state(session_id)
@@ -145,6 +137,206 @@ def execute_attack_tool(ctx: RunContext[GameSessionService], attacker_id: str, t
         log_error(f"Error in execute_attack_tool: {e}")
         return {"error": str(e)}
 
+def resolve_attack_action_tool(ctx: RunContext[GameSessionService], attacker_id: str, target_id: str) -> dict:
+    """
+    Resolves a complete attack action: attack, combat end check and turn advance.
+
+    This tool performs the whole player attack sequence atomically, with a single
+    combat state load and save. It replaces calling `execute_attack_tool`,
+    `check_combat_end_tool` and `end_turn_tool` one after another.
+    It should be used when the active combatant attacks and then ends their turn.
+    Following NPC turns are resolved automatically and returned in `npc_turns`.
+
+    Args:
+        attacker_id (str): The short alias (e.g. "P1") or UUID of the attacker.
+        target_id (str): The short alias (e.g. "E2") or UUID of the target.
+
+    Returns:
+        dict: A dictionary containing the attack message, the resolved NPC turns,
+        auto-end info, the next combatant and the updated combat summary, or an error
+        if the attacker is not the current combatant.
+    """
+    log_debug("Tool resolve_attack_action_tool called", tool="resolve_attack_action_tool", attacker_id=attacker_id, target_id=target_id)
+
+    try:
+        session_id = uuid.UUID(ctx.deps.session_id)
+        combat_state = combat_state_service.load_combat_state(session_id)
+
+        if not combat_state:
+            return {"error": "No active combat found"}
+
+        # Only the combatant whose turn it is may attack (its turn is consumed below)
+        current = combat_state.get_current_combatant()
+        if current is None or combat_state.find_combatant(attacker_id) is not current:
+            return {"error": f"{attacker_id} cannot act now: it is "
+                             f"{current.name if current else 'nobody'}'s turn"}
+
+        # 1. Attack
+        combat_state, result_message = combat_service.execute_attack(combat_state, attacker_id, target_id)
+
+        # 2. End check, then 3. turn advance (with local NPC turns) if combat continues
+        npc_turns = []
+        end_reason = combat_service.get_end_reason(combat_state)
+        if not end_reason:
+            combat_state = combat_service.end_turn(combat_state)
+            combat_state, npc_turns = combat_service.resolve_npc_turns(combat_state)
+            end_reason = combat_service.get_end_reason(combat_state)
+
+        # Single persistence step
+        if end_reason:
+            combat_state = combat_service.end_combat(combat_state, end_reason)
+            combat_state_service.delete_combat_state(session_id)
+        else:
+            combat_state_service.save_combat_state(session_id, combat_state)
+
+        current_participant = combat_state.get_current_combatant()
+        return {
+            "message": result_message,
+            "npc_turns": npc_turns,
+            "auto_ended": {"ended": True, "reason": end_reason} if end_reason else None,
+            "next_turn": current_participant.name if current_participant and not end_reason else None,
+            "combat_state": combat_service.get_combat_summary(combat_state)
+        }
+
+    except Exception as e:
+        log_error(f"Error in resolve_attack_action_tool: {e}")
+        return {"error": str(e)}
+
+def cast_spell_tool(ctx: RunContext[GameSessionService], caster_id: str, spell_name: str, target_ids: list[str] | None = None, end_turn: bool = True) -> dict:
+    """
+    Casts a spell from the spell catalog and resolves it in one call.
+
+    This tool checks that the caster knows the spell and has enough mana, spends the mana,
+    and resolves the spell effect (damage dice, healing) locally. Area spells hit every
+    given target; single-target spells use the first one; healing spells default to the caster.
+    Spells without a mechanical effect only spend mana: narrate their effect yourself.
+    By default it then checks the end of combat and ends the turn, resolving the following
+    NPC turns (returned in `npc_turns`), with a single combat state load and save.
+
+    Args:
+        caster_id (str): The short alias (e.g. "P1") or UUID of the caster.
+        spell_name (str): The spell name (e.g. "Magic Missile", "Fireball").
+        target_ids (list[str], optional): Short aliases or UUIDs of the targets.
+        end_turn (bool, optional): End the caster's turn after the spell. Defaults to True.
+
+    Returns:
+        dict: The spell result (message, mana cost, remaining mana, effects per target),
+        the resolved NPC turns, auto-end info and the updated combat summary, or an error
+        if the caster is not the current combatant.
+    """
+    log_debug("Tool cast_spell_tool called", tool="cast_spell_tool", caster_id=caster_id, spell_name=spell_name, target_ids=target_ids)
+
+    try:
+        session_id = uuid.UUID(ctx.deps.session_id)
+        combat_state = combat_state_service.load_combat_state(session_id)
+
+        if not combat_state:
+            return {"error": "No active combat found"}
+
+        # Only the combatant whose turn it is may cast (its turn may be ended below)
+        current = combat_state.get_current_combatant()
+        if current is None or combat_state.find_combatant(caster_id) is not current:
+            return {"error": f"{caster_id} cannot act now: it is "
+                             f"{current.name if current else 'nobody'}'s turn"}
+
+        combat_state, spell_result = combat_service.cast_spell(combat_state, caster_id, spell_name, target_ids)
+        if not spell_result["success"]:
+            return {"error": spell_result["message"]}
+
+        npc_turns = []
+        end_reason = combat_service.get_end_reason(combat_state)
+        if not end_reason and end_turn:
+            combat_state = combat_service.end_turn(combat_state)
+            combat_state, npc_turns = combat_service.resolve_npc_turns(combat_state)
+            end_reason = combat_service.get_end_reason(combat_state)
+
+        if end_reason:
+            combat_state = combat_service.end_combat(combat_state, end_reason)
+            combat_state_service.delete_combat_state(session_id)
+        else:
+            combat_state_service.save_combat_state(session_id, combat_state)
+
+        return {
+            **spell_result,
+            "npc_turns": npc_turns,
+            "auto_ended": {"ended": True, "reason": end_reason} if end_reason else None,
+            "combat_state": combat_service.get_combat_summary(combat_state)
+        }
+
+    except Exception as e:
+        log_error(f"Error in cast_spell_tool: {e}")
+        return {"error": str(e)}
+
+def defend_tool(ctx: RunContext[GameSessionService], combatant_id: str) -> dict:
+    """
+    Puts a combatant in a defensive stance.
+
+    This tool applies the "defend" action of the combat rules: the combatant gains an Armor Class
+    bonus until the start of their next turn. It uses the combatant's major action;
+    call end_turn_tool afterwards.
+
+    Args:
+        combatant_id (str): The short alias (e.g. "P1") or UUID of the defending combatant.
+
+    Returns:
+        dict: A dictionary containing the result message and the updated state summary.
+    """
+    log_debug("Tool defend_tool called", tool="defend_tool", combatant_id=combatant_id)
+
+    try:
+        session_id = uuid.UUID(ctx.deps.session_id)
+        combat_state = combat_state_service.load_combat_state(session_id)
+
+        if not combat_state:
+            return {"error": "No active combat found"}
+
+        combat_state, result_message = combat_service.defend(combat_state, combatant_id)
+        combat_state_service.save_combat_state(session_id, combat_state)
+
+        return {
+            "message": result_message,
+            "combat_state": combat_service.get_combat_summary(combat_state)
+        }
+
+    except Exception as e:
+        log_error(f"Error in defend_tool: {e}")
+        return {"error": str(e)}
+
+def attack_odds_tool(ctx: RunContext[GameSessionService], attacker_id: str, target_id: str) -> dict:
+    """
+    Estimates the odds of an attack without rolling or changing the combat state.
+
+    This tool returns the exact hit, critical and fumble chances of the attacker against the target,
+    the expected damage and the chance to take the target down in one blow. Use it to choose a target
+    or to describe how risky an attack looks; then call execute_attack_tool to actually attack.
+
+    Args:
+        attacker_id (str): The short alias (e.g. "P1") or UUID of the attacker.
+        target_id (str): The short alias (e.g. "E2") or UUID of the target.
+
+    Returns:
+        dict: A dictionary containing the attack odds.
+    """
+    log_debug("Tool attack_odds_tool called", tool="attack_odds_tool", attacker_id=attacker_id, target_id=target_id)
+
+    try:
+        session_id = uuid.UUID(ctx.deps.session_id)
+        combat_state = combat_state_service.load_combat_state(session_id)
+
+        if not combat_state:
+            return {"error": "No active combat found"}
+
+        attacker = combat_state.find_combatant(attacker_id)
+        target = combat_state.find_combatant(target_id)
+        if not attacker or not target:
+            return {"error": "Attacker or Target not found."}
+
+        return probability_service.combatant_attack_odds(attacker, target)
+
+    except Exception as e:
+        log_error(f"Error in attack_odds_tool: {e}")
+        return {"error": str(e)}
+
 def apply_direct_damage_tool(ctx: RunContext[GameSessionService], target_id: str, amount: int, reason: str = "effect") -> dict:
     """
     Applies direct damage to a target (e.g., from a spell, trap, or environment).
@@ -154,7 +346,7 @@ def apply_direct_damage_tool(ctx: RunContext[GameSessionService], target_id: str
     This updates the target's health and checks for combat end conditions.
 
     Args:
-        target_id (str): The UUID of the target.
+        target_id (str): The short alias (e.g. "E2") or UUID of the target.
         amount (int): Amount of damage to apply. Must be a positive integer.
         reason (str): The source or reason for the damage (e.g., "fireball", "trap"). Default is "effect".
 
@@ -175,22 +367,12 @@ def apply_direct_damage_tool(ctx: RunContext[GameSessionService], target_id: str
         combat_state.add_log_entry(f"Damage applied to target {target_id}: {amount} ({reason})")
         
         # Check for combat end
-        is_ended = combat_service.check_combat_end(combat_state)
+        end_reason = combat_service.get_end_reason(combat_state)
         auto_end_info = None
         
-        if is_ended:
-            players_alive = any(p.type == CombatantType.PLAYER and p.is_alive() for p in combat_state.participants)
-            enemies_alive = any(p.type == CombatantType.NPC and p.is_alive() for p in combat_state.participants)
-            
-            if not players_alive:
-                reason = "defeat"
-            elif not enemies_alive:
-                reason = "victory"
-            else:
-                reason = "draw"
-            
-            combat_state = combat_service.end_combat(combat_state, reason)
-            auto_end_info = {"ended": True, "reason": reason}
+        if end_reason:
+            combat_state = combat_service.end_combat(combat_state, end_reason)
+            auto_end_info = {"ended": True, "reason": end_reason}
             
             combat_state_service.delete_combat_state(session_id)
         else:
@@ -212,13 +394,15 @@ def end_turn_tool(ctx: RunContext[GameSessionService], combat_id: str) -> dict:
 
     This tool advances the combat to the next participant's turn.
     It should be used after the current combatant has completed their actions.
-    This updates the initiative order and current turn holder.
+    If the next participants are NPCs, their turns are resolved automatically until
+    the player's turn; their results are returned in `npc_turns` to be narrated.
 
     Args:
         combat_id (str): The UUID of the current combat.
 
     Returns:
-        dict: A dictionary containing the updated combat summary and the name of the next combatant.
+        dict: A dictionary containing the updated combat summary, the name of the next combatant,
+        the resolved NPC turns (`npc_turns`) and auto-end info.
     """
     log_debug("Tool end_turn_tool called", tool="end_turn_tool", combat_id=combat_id)
     
@@ -230,12 +414,23 @@ def end_turn_tool(ctx: RunContext[GameSessionService], combat_id: str) -> dict:
             return {"error": "Combat not found", "combat_id": combat_id}
         
         combat_state = combat_service.end_turn(combat_state)
-        combat_state_service.save_combat_state(session_id, combat_state)
+
+        # NPC turns are resolved locally; the agent only narrates the batch of results
+        combat_state, npc_turns = combat_service.resolve_npc_turns(combat_state)
+
+        end_reason = combat_service.get_end_reason(combat_state) if npc_turns else None
+        if end_reason:
+            combat_state = combat_service.end_combat(combat_state, end_reason)
+            combat_state_service.delete_combat_state(session_id)
+        else:
+            combat_state_service.save_combat_state(session_id, combat_state)
         
         summary = combat_service.get_combat_summary(combat_state)
         current_participant = combat_state.get_current_combatant()
         
         summary["message"] = f"Turn ended. It's now {current_participant.name if current_participant else 'Unknown'}'s turn"
+        summary["npc_turns"] = npc_turns
+        summary["auto_ended"] = {"ended": True, "reason": end_reason} if end_reason else None
         
         return summary
         
@@ -266,27 +461,17 @@ def check_combat_end_tool(ctx: RunContext[GameSessionService], combat_id: str) -
         if not combat_state or str(combat_state.id) != combat_id:
             return {"error": "Combat not found", "combat_id": combat_id}
             
-        is_ended = combat_service.check_combat_end(combat_state)
+        end_reason = combat_service.get_end_reason(combat_state)
         
-        if is_ended:
-            players_alive = any(p.type == CombatantType.PLAYER and p.is_alive() for p in combat_state.participants)
-            enemies_alive = any(p.type == CombatantType.NPC and p.is_alive() for p in combat_state.participants)
-            
-            if not players_alive:
-                reason = "defeat"
-            elif not enemies_alive:
-                reason = "victory"
-            else:
-                reason = "draw"
-            
-            combat_state = combat_service.end_combat(combat_state, reason)
+        if end_reason:
+            combat_state = combat_service.end_combat(combat_state, end_reason)
             combat_state_service.delete_combat_state(session_id)
             
             return {
                 "combat_ended": True,
                 "status": "ended",
-                "end_reason": reason,
-                "message": f"Combat ended: {reason}",
+                "end_reason": end_reason,
+                "message": f"Combat ended: {end_reason}",
                 "summary": combat_service.get_combat_summary(combat_state)
             }
         else:
@@ -0,0 +1,139 @@
+"""
+HTTP-cacheable responses for static game-data catalogs (races, skills, equipment, stats).
+A catalog is built and serialized once per version of its YAML files; every request is then
+answered from memory with a strong ETag, `Cache-Control`, 304 handling and a pre-gzipped body.
+"""
+
+import gzip
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+
+from back.config import get_data_dir
+from back.utils.logger import log_debug
+from back.utils.metrics import record_cache
+
+# Catalogs only change on deploy: clients may reuse them briefly, then revalidate with the ETag
+CACHE_CONTROL = "public, max-age=300, must-revalidate"
+GZIP_LEVEL = 6
+
+
+@dataclass(frozen=True)
+class CatalogPayload:
+    """
+    A serialized catalog.
+
+    Attributes:
+        body (bytes): JSON body.
+        gzip_body (bytes): Gzip-compressed JSON body.
+        etag (str): Strong ETag of the JSON body.
+        gzip_etag (str): Strong ETag of the gzip body (a different representation needs its own ETag).
+    """
+    body: bytes
+    gzip_body: bytes
+    etag: str
+    gzip_etag: str
+
+
+class CatalogCache:
+    """
+    Precomputed response of a static catalog endpoint.
+
+    Purpose:
+        Builds the catalog with `build`, validates and serializes it with `response_type` and keeps
+        the bytes until one of the `source_files` (relative to the data directory) changes, as
+        detected by its modification time and size.
+
+    Attributes:
+        source_files (Sequence[str]): YAML files the catalog is built from.
+    """
+
+    def __init__(self, source_files: Sequence[str], build: Callable[[], Any], response_type: Any):
+        self.source_files = tuple(source_files)
+        self._build = build
+        self._adapter = TypeAdapter(response_type)
+        self._payload: Optional[CatalogPayload] = None
+        self._signature: Optional[Tuple] = None
+
+    def _current_signature(self) -> Tuple:
+        signature = []
+        for name in self.source_files:
+            path = os.path.join(get_data_dir(), name)
+            try:
+                stat = os.stat(path)
+                signature.append((path, stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append((path, None, None))
+        return tuple(signature)
+
+    def get(self) -> CatalogPayload:
+        """
+        ### get
+        **Description:** Return the serialized catalog, rebuilding it only if a source file changed.
+        **Parameters:** None
+        **Returns:** The `CatalogPayload`.
+        """
+        signature = self._current_signature()
+        hit = self._payload is not None and signature == self._signature
+        record_cache("catalog", hit)
+        if not hit:
+            body = self._adapter.dump_json(self._adapter.validate_python(self._build()))
+            digest = hashlib.sha256(body).hexdigest()[:32]
+            self._payload = CatalogPayload(
+                body=body,
+                gzip_body=gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0),
+                etag=f'"{digest}"',
+                gzip_etag=f'"{digest}-gzip"',
+            )
+            self._signature = signature
+            log_debug("Catalog serialized", action="catalog_cache_build",
+                      sources=",".join(self.source_files), size=len(body))
+        return self._payload
+
+    def invalidate(self) -> None:
+        """Drop the serialized catalog; the next request rebuilds it."""
+        self._payload = None
+        self._signature = None
+
+    def respond(self, request: Request) -> Response:
+        """
+        ### respond
+        **Description:** Answer a catalog request: 304 if the client's ETag is current, otherwise the
+        gzip body when the client accepts it, or the plain JSON body.
+        **Parameters:**
+        - `request` (Request): The incoming request.
+        **Returns:** The HTTP response.
+        """
+        payload = self.get()
+        use_gzip = _accepts_gzip(request.headers.get("accept-encoding", ""))
+        etag = payload.gzip_etag if use_gzip else payload.etag
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL, "Vary": "Accept-Encoding"}
+
+        if _etag_matches(request.headers.get("if-none-match"), (payload.etag, payload.gzip_etag)):
+            return Response(status_code=304, headers=headers)
+        if use_gzip:
+            headers["Content-Encoding"] = "gzip"
+            return Response(content=payload.gzip_body, media_type="application/json", headers=headers)
+        return Response(content=payload.body, media_type="application/json", headers=headers)
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() in ("gzip", "*"):
+            return params.replace(" ", "").lower() not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+def _etag_matches(if_none_match: Optional[str], etags: Sequence[str]) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison: a W/ prefix does not prevent a match
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return any(etag in candidates for etag in etags)
@@ -0,0 +1,141 @@
+"""
+Token-compact rendering of a combat state for the combat agent's system prompt.
+Replaces the raw `CombatState.model_dump()` (UUIDs, nested dict repr) with one
+short line per combatant, short aliases and the last few log lines.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+from uuid import UUID
+
+from back.models.domain.combat_state import CombatState, CombatantType
+
+TokenCounter = Callable[[str], int]
+
+_UUID_PATTERN = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+
+
+@dataclass
+class CombatStateRender:
+    """
+    ### CombatStateRender
+    **Description:** Result of rendering a combat state for a prompt.
+    **Attributes:**
+    - `text` (str): The compact rendering.
+    - `tokens` (int): Token count of `text`.
+    - `token_budget` (int): Budget the rendering was fitted to.
+    - `log_lines` (int): Number of log lines kept.
+    - `baseline_tokens` (Optional[int]): Token count of the legacy `model_dump()` rendering, if measured.
+    """
+    text: str
+    tokens: int
+    token_budget: int
+    log_lines: int
+    baseline_tokens: Optional[int] = None
+
+    @property
+    def tokens_saved(self) -> Optional[int]:
+        """Tokens saved compared to the legacy rendering (None if not measured)."""
+        if self.baseline_tokens is None:
+            return None
+        return self.baseline_tokens - self.tokens
+
+    @property
+    def over_budget(self) -> bool:
+        """True if the rendering could not be fitted into the budget."""
+        return self.tokens > self.token_budget
+
+
+def _default_token_counter(text: str) -> int:
+    from back.utils.history_processors import count_tokens
+    return count_tokens(text)
+
+
+def _replace_uuids(line: str, aliases_by_str: Dict[str, str]) -> str:
+    return _UUID_PATTERN.sub(lambda m: aliases_by_str.get(m.group(0).lower(), m.group(0)), line)
+
+
+def _render(state: CombatState, aliases: Dict[UUID, str], log: List[str], collapse_defeated: bool) -> str:
+    current = aliases.get(state.current_turn_combatant_id) if state.current_turn_combatant_id else None
+    status = "ongoing" if state.is_active else "ended"
+    lines = [f"Combat {state.id} | Round {state.round_number} | {status} | Turn: {current or '-'}"]
+
+    unordered = len(state.turn_order)
+    participants = sorted(
+        state.participants,
+        key=lambda p: position if (position := state.turn_position(p.id)) is not None else unordered,
+    )
+
+    defeated: List[str] = []
+    for p in participants:
+        alias = aliases[p.id]
+        if collapse_defeated and not p.is_alive():
+            defeated.append(alias)
+            continue
+        marker = ">" if alias == current else " "
+        camp = "ally" if p.type == CombatantType.PLAYER else "foe"
+        armor = f"{p.armor_class}+{p.defense_bonus}" if p.defense_bonus else str(p.armor_class)
+        line = (
+            f"{marker}{alias} {p.name} [{camp}] HP {p.current_hit_points}/{p.max_hit_points} "
+            f"AC {armor} Init {p.initiative_roll} Atk {p.attack_bonus:+d} {p.weapon_name} {p.weapon_damage}"
+        )
+        if p.max_mana_points:
+            line += f" MP {p.current_mana_points}/{p.max_mana_points}"
+        if not p.is_alive():
+            line += " DOWN"
+        lines.append(line)
+    if defeated:
+        lines.append(f" Down: {', '.join(defeated)}")
+
+    if log:
+        lines.append("Log:")
+        lines.extend(f"- {entry}" for entry in log)
+    return "\n".join(lines)
+
+
+def render_combat_state(
+    state: CombatState,
+    log_lines: int = 5,
+    token_budget: int = 600,
+    count_tokens: Optional[TokenCounter] = None,
+    measure_savings: bool = False,
+) -> CombatStateRender:
+    """
+    ### render_combat_state
+    **Description:** Renders a combat state as compact text fitted into a token budget.
+    Combatants are referred to by short aliases ('P1', 'E2') which the combat tools accept
+    in place of UUIDs. When the rendering exceeds the budget, log lines are dropped oldest
+    first, then defeated combatants are collapsed into a single line.
+    **Parameters:**
+    - `state` (CombatState): The combat state to render.
+    - `log_lines` (int): Maximum number of recent log lines to include.
+    - `token_budget` (int): Maximum number of tokens for the rendering.
+    - `count_tokens` (Optional[TokenCounter]): Token counter; defaults to the history tokenizer.
+    - `measure_savings` (bool): Also count the tokens of the legacy `model_dump()` rendering.
+    **Returns:** A `CombatStateRender` with the text and its token measurements.
+    """
+    counter = count_tokens or _default_token_counter
+    aliases = state.get_aliases()
+    aliases_by_str = {str(combatant_id): alias for combatant_id, alias in aliases.items()}
+    log = [_replace_uuids(entry, aliases_by_str) for entry in state.log[-log_lines:]] if log_lines > 0 else []
+
+    collapse_defeated = False
+    text = _render(state, aliases, log, collapse_defeated)
+    tokens = counter(text)
+    while tokens > token_budget and (log or not collapse_defeated):
+        if log:
+            log = log[1:]
+        else:
+            collapse_defeated = True
+        text = _render(state, aliases, log, collapse_defeated)
+        tokens = counter(text)
+
+    baseline_tokens = counter(str(state.model_dump())) if measure_savings else None
+    return CombatStateRender(
+        text=text,
+        tokens=tokens,
+        token_budget=token_budget,
+        log_lines=len(log),
+        baseline_tokens=baseline_tokens,
+    )
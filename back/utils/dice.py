@@ -1,5 +1,11 @@
 import random
 import re
+from functools import lru_cache
+from typing import Tuple
+
+# Largest expressions whose exact distribution is computed (beyond, the convolution takes seconds)
+MAX_DICE_COUNT = 100
+MAX_DICE_SIDES = 1000
 
 # Jets de dés
 
@@ -41,6 +47,85 @@ def roll_dice(dice_str: str) -> int:
     except Exception:
         return 1
 
+def convolve(left: Tuple[Tuple[int, float], ...], right: Tuple[Tuple[int, float], ...]) -> Tuple[Tuple[int, float], ...]:
+    """
+    Distribution of the sum of two independent distributions.
+
+    Args:
+        left, right (Tuple[Tuple[int, float], ...]): (value, probability) pairs.
+
+    Returns:
+        Tuple[Tuple[int, float], ...]: (value, probability) pairs sorted by value.
+    """
+    result: dict = {}
+    for a, pa in left:
+        for b, pb in right:
+            result[a + b] = result.get(a + b, 0.0) + pa * pb
+    return tuple(sorted(result.items()))
+
+
+@lru_cache(maxsize=256)
+def sum_distribution(count: int, sides: int) -> Tuple[Tuple[int, float], ...]:
+    """
+    Exact distribution of the sum of `count` dice with `sides` faces (e.g. 3d6).
+
+    Args:
+        count (int): Number of dice.
+        sides (int): Faces per die.
+
+    Returns:
+        Tuple[Tuple[int, float], ...]: (value, probability) pairs sorted by value.
+
+    Raises:
+        ValueError: More than MAX_DICE_COUNT dice or MAX_DICE_SIDES faces.
+    """
+    if count > MAX_DICE_COUNT or sides > MAX_DICE_SIDES:
+        raise ValueError(f"Dice too large: {count}d{sides} (at most {MAX_DICE_COUNT}d{MAX_DICE_SIDES})")
+    die = tuple((face, 1.0 / sides) for face in range(1, sides + 1))
+    distribution: Tuple[Tuple[int, float], ...] = ((0, 1.0),)
+    # Square-and-multiply: log2(count) convolutions instead of count
+    while count:
+        if count & 1:
+            distribution = convolve(distribution, die)
+        count >>= 1
+        if count:
+            die = convolve(die, die)
+    return distribution
+
+
+@lru_cache(maxsize=512)
+def dice_distribution(dice_str: str) -> Tuple[Tuple[int, float], ...]:
+    """
+    Exact outcome distribution of `roll_dice(dice_str)`.
+
+    Follows the same parsing and clamping rules as `roll_dice` (static numbers, 'XdY+Z',
+    minimum 1, unparsable strings count as 1). Results are cached per dice string.
+
+    Args:
+        dice_str (str): The dice string (e.g. '1d8+4').
+
+    Returns:
+        Tuple[Tuple[int, float], ...]: (value, probability) pairs sorted by value.
+
+    Raises:
+        ValueError: More than MAX_DICE_COUNT dice or MAX_DICE_SIDES faces.
+    """
+    normalized = str(dice_str).replace(" ", "")
+    if normalized.isdigit():
+        return ((int(normalized), 1.0),)
+    match = re.match(r"(\d+)d(\d+)(?:([+-])(\d+))?", normalized)
+    if not match or int(match.group(2)) < 1:
+        return ((1, 1.0),)
+    modifier = int(match.group(4)) if match.group(4) else 0
+    if match.group(3) == '-':
+        modifier = -modifier
+    clamped: dict = {}
+    for value, probability in sum_distribution(int(match.group(1)), int(match.group(2))):
+        total = max(1, value + modifier)
+        clamped[total] = clamped.get(total, 0.0) + probability
+    return tuple(sorted(clamped.items()))
+
+
 def roll_attack(dice: str) -> int:
     """
     Effectue un jet d'attaque en lançant les dés spécifiés.
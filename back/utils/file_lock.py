@@ -0,0 +1,43 @@
+"""
+Exclusive advisory lock on a file, shared by the threads of a process and by the worker processes
+of a deployment (fcntl on POSIX, msvcrt on Windows). Used to serialise read-modify-write updates of
+shared files such as the global usage rollup.
+"""
+
+import os
+from contextlib import contextmanager
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """
+    ### file_lock
+    **Description:** Holds an exclusive lock on `path` (created if missing) for the duration of the block.
+    Blocks until the lock is available.
+    **Parameters:**
+    - `path` (str): Lock file, usually `<protected file>.lock`.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    finally:
+        os.close(fd)
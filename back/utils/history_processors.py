@@ -3,24 +3,64 @@ History processors for PydanticAI agents.
 Handles message summarization to manage token limits.
 """
 
-import tiktoken
-from typing import List
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Iterator, List, Optional
 from pydantic_ai import Agent, ModelMessage
 from pydantic_ai.messages import ModelResponse, TextPart, UserPromptPart, SystemPromptPart
 from back.config import get_llm_config
+from back.utils.timing import PHASE_SUMMARIZE, timed
+
+@lru_cache(maxsize=None)
+def get_tokenizer() -> Any:
+    """
+    Tokenizer used to count tokens (cl100k_base, standard for GPT-4/3.5/DeepSeek).
+    Loaded on first use (or by the startup warm-up), not at import: the encoding is read from the
+    tiktoken cache or downloaded.
+    """
+    import tiktoken
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # Fallback if encoding not found
+        return tiktoken.get_encoding("gpt2")
+
+@dataclass
+class SummaryUsage:
+    """Tokens used by the summarizations of one agent run."""
+    requests: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+    def add(self, usage: Any) -> None:
+        self.requests += int(getattr(usage, "requests", 0) or 0)
+        self.input_tokens += int(getattr(usage, "input_tokens", 0) or 0)
+        self.output_tokens += int(getattr(usage, "output_tokens", 0) or 0)
+
+
+_summary_usage: ContextVar[Optional[SummaryUsage]] = ContextVar("summary_usage", default=None)
 
-# Initialize tokenizer (using cl100k_base which is standard for GPT-4/3.5/DeepSeek)
-try:
-    tokenizer = tiktoken.get_encoding("cl100k_base")
-except Exception:
-    # Fallback if encoding not found
-    tokenizer = tiktoken.get_encoding("gpt2")
+
+@contextmanager
+def collect_summary_usage() -> Iterator[SummaryUsage]:
+    """
+    Collect the usage of the summarizations run inside the block (by the agents' history processor),
+    for the session usage ledger.
+    """
+    collected = SummaryUsage()
+    token = _summary_usage.set(collected)
+    try:
+        yield collected
+    finally:
+        _summary_usage.reset(token)
 
 def count_tokens(text: str) -> int:
     """
     Count tokens in a text string.
     """
-    return len(tokenizer.encode(text))
+    return len(get_tokenizer().encode(text))
 
 def estimate_history_tokens(messages: List[ModelMessage]) -> int:
     """
@@ -36,6 +76,14 @@ def estimate_history_tokens(messages: List[ModelMessage]) -> int:
     return total
 
 async def summarize_old_messages(messages: List[ModelMessage]) -> List[ModelMessage]:
+    """
+    History processor of the agents: see `_summarize_old_messages`.
+    Timed as the `summarize` phase of the turn (token counting included).
+    """
+    with timed(PHASE_SUMMARIZE):
+        return await _summarize_old_messages(messages)
+
+async def _summarize_old_messages(messages: List[ModelMessage]) -> List[ModelMessage]:
     """
     Summarize old messages if the total token count exceeds the configured limit.
     
@@ -117,6 +165,9 @@ async def summarize_old_messages(messages: List[ModelMessage]) -> List[ModelMess
 
     try:
         result = await summarizer_agent.run(summary_prompt)
+        collected = _summary_usage.get()
+        if collected is not None:
+            collected.add(result.usage())
         summary_text = result.data
     except Exception as e:
         # Fallback if summarization fails
@@ -1,48 +1,47 @@
 # Logger JSON (Grafana/Loki‑friendly) - Migration vers système de logging standard
 
-from datetime import datetime, timezone
+import logging
+from typing import Any, Dict
 
-from ..config import get_logger
+from ..config import LOG_FIELDS_ATTR, get_logger
 
 # Logger pour ce module
 logger = get_logger(__name__)
 
+# Attributs de LogRecord qui ne peuvent pas servir de champ structuré
+RESERVED_ATTRS = frozenset({'message', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+                            'filename', 'module', 'lineno', 'funcName', 'created',
+                            'msecs', 'relativeCreated', 'thread', 'threadName',
+                            'processName', 'process', 'name'})
+
+
+def _log(level: int, message: str, fields: Dict[str, Any]) -> None:
+    """Met l'enregistrement en file ; les champs sont sérialisés en JSON par le thread de logging."""
+    try:
+        logger.log(level, message, extra={LOG_FIELDS_ATTR: fields})
+    except Exception as e:
+        print(f"[LOGGING ERROR] {e}")
+
+
 def log_debug(message: str, **kwargs):
     """
     ### log_debug
-    **Description :** Écrit un message de log JSON sur la sortie standard et/ou dans un fichier si DEBUG est à true ou LOG_FILE défini.
+    **Description :** Écrit un message de log JSON (console et/ou fichier) si le niveau DEBUG est actif.
+    Retourne immédiatement sinon.
     **Paramètres :**
     - `message` (str) : Message à logger.
-    - `kwargs` (dict) : Informations additionnelles à inclure dans le log.
+    - `kwargs` (dict) : Informations additionnelles, émises comme champs JSON.
     **Retour :** None
     **Raises :** ValueError si des attributs réservés sont passés dans kwargs.
     """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     # Prévenir le conflit sur les attributs réservés dans kwargs
-    reserved_attrs = {'message', 'msg', 'args', 'levelname', 'levelno', 'pathname', 
-                     'filename', 'module', 'lineno', 'funcName', 'created', 
-                     'msecs', 'relativeCreated', 'thread', 'threadName', 
-                     'processName', 'process', 'name'}
-    conflicting = set(kwargs.keys()) & reserved_attrs
+    conflicting = RESERVED_ATTRS.intersection(kwargs)
     if conflicting:
         raise ValueError(f"Les clés suivantes sont réservées par LogRecord: {conflicting}")
+    _log(logging.DEBUG, message, kwargs)
 
-    try:
-        # Utiliser le système de logging standard avec format JSON
-        # Ne pas mettre 'message' ou 'level' dans extra pour éviter les conflits
-        extra_data = {
-            "log_timestamp": datetime.now(timezone.utc).isoformat(),
-            "log_level": "DEBUG",
-            **kwargs
-        }
-
-        # Log via le logger standard Python
-        logger.debug(message, extra=extra_data)
-
-    except Exception as e:
-        # Log minimal sur erreur de log (pas pour les erreurs de validation)
-        print(f"[LOGGING ERROR] {e}")
-        import traceback
-        print(traceback.format_exc())
 
 def log_info(message: str, **kwargs):
     """
@@ -52,15 +51,9 @@ def log_info(message: str, **kwargs):
     - `message` (str) : Message à logger.
     - `kwargs` (dict) : Informations additionnelles.
     """
-    try:
-        extra_data = {
-            "log_timestamp": datetime.now(timezone.utc).isoformat(),
-            "log_level": "INFO",
-            **kwargs
-        }
-        logger.info(message, extra=extra_data)
-    except Exception as e:
-        print(f"[LOGGING ERROR] {e}")
+    if logger.isEnabledFor(logging.INFO):
+        _log(logging.INFO, message, kwargs)
+
 
 def log_warning(message: str, **kwargs):
     """
@@ -70,15 +63,9 @@ def log_warning(message: str, **kwargs):
     - `message` (str) : Message à logger.
     - `kwargs` (dict) : Informations additionnelles.
     """
-    try:
-        extra_data = {
-            "log_timestamp": datetime.now(timezone.utc).isoformat(),
-            "log_level": "WARNING",
-            **kwargs
-        }
-        logger.warning(message, extra=extra_data)
-    except Exception as e:
-        print(f"[LOGGING ERROR] {e}")
+    if logger.isEnabledFor(logging.WARNING):
+        _log(logging.WARNING, message, kwargs)
+
 
 def log_error(message: str, **kwargs):
     """
@@ -88,15 +75,9 @@ def log_error(message: str, **kwargs):
     - `message` (str) : Message à logger.
     - `kwargs` (dict) : Informations additionnelles.
     """
-    try:
-        extra_data = {
-            "log_timestamp": datetime.now(timezone.utc).isoformat(),
-            "log_level": "ERROR",
-            **kwargs
-        }
-        logger.error(message, extra=extra_data)
-    except Exception as e:
-        print(f"[LOGGING ERROR] {e}")
+    if logger.isEnabledFor(logging.ERROR):
+        _log(logging.ERROR, message, kwargs)
+
 
 def log_critical(message: str, **kwargs):
     """
@@ -106,12 +87,5 @@ def log_critical(message: str, **kwargs):
     - `message` (str) : Message à logger.
     - `kwargs` (dict) : Informations additionnelles.
     """
-    try:
-        extra_data = {
-            "log_timestamp": datetime.now(timezone.utc).isoformat(),
-            "log_level": "CRITICAL",
-            **kwargs
-        }
-        logger.critical(message, extra=extra_data)
-    except Exception as e:
-        print(f"[LOGGING ERROR] {e}")
+    if logger.isEnabledFor(logging.CRITICAL):
+        _log(logging.CRITICAL, message, kwargs)
@@ -59,15 +59,16 @@ class LoggingTool(Tool):
         try:
             # Exécuter l'outil original
             result = self.original_function(**kwargs)
+            result_text = str(result)
             
             # Journaliser le résultat
             log_debug(
                 f"Tool completed: {self.name}",
                 action="tool_completed",
                 tool_name=self.name,
-                result=str(result)[:200]  # Limiter la longueur pour les logs
+                result=result_text[:200]  # Limiter la longueur pour les logs
             )            # Créer un message pour le résultat de l'outil
-            tool_result_content = f"[TOOL_RESULT] {self.name}: {str(result)}"
+            tool_result_content = f"[TOOL_RESULT] {self.name}: {result_text}"
             tool_result_message = ChatMessage.from_tool(
                 tool_result_content,
                 origin=self.name
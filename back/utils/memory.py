@@ -0,0 +1,148 @@
+"""
+Memory footprint by subsystem, measured with tracemalloc (opt-in: `memory.tracemalloc` in the configuration,
+or `PYTHONTRACEMALLOC=<frames>`). Each live allocation is attributed to the subsystem of the innermost
+`back/` frame of its traceback (history store, character services, combat states, game data managers),
+so that memory held by caches is charged to the code that filled them. Only allocations made after tracing
+started are seen: tracing is started before the startup warm-up.
+"""
+
+import os
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+
+from back.config import get_memory_config
+from back.models.schema import MemoryReport, SubsystemMemory
+from back.utils.metrics import MetricFamily, registry
+
+SUBSYSTEM_OTHER = "other"
+
+# Subsystem -> source paths (relative to the project root); the first match wins
+SUBSYSTEMS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("history", (
+        "back/storage/",
+        "back/utils/history_processors.py",
+        "back/graph/dto/session.py",
+    )),
+    ("combat_states", (
+        "back/services/combat_state_service.py",
+        "back/services/combat_service.py",
+        "back/models/domain/combat_state.py",
+        "back/models/domain/npc.py",
+        "back/utils/combat_renderer.py",
+    )),
+    ("characters", (
+        "back/services/character_data_service.py",
+        "back/services/character_service.py",
+        "back/services/combatant_resolver.py",
+        "back/services/character_pool_service.py",
+        "back/services/random_character_service.py",
+        "back/models/domain/character.py",
+    )),
+    ("game_data", (
+        "back/models/domain/",
+        "back/utils/catalog_cache.py",
+        "back/utils/trusted_load.py",
+        "back/services/probability_service.py",
+        "back/services/races_data_service.py",
+        "back/services/equipment_service.py",
+        "back/routers/creation.py",
+    )),
+)
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_BACK_DIR = os.path.join(_PROJECT_ROOT, "back") + os.sep
+
+
+def start_tracing() -> bool:
+    """
+    ### start_tracing
+    **Description:** Starts tracemalloc if enabled in the configuration (no-op if already tracing).
+    **Returns:** True if allocations are traced.
+    """
+    memory_config = get_memory_config()
+    if not tracemalloc.is_tracing() and memory_config["tracemalloc"]:
+        tracemalloc.start(memory_config["frames"])
+    return tracemalloc.is_tracing()
+
+
+@lru_cache(maxsize=None)
+def _subsystem_of_file(filename: str) -> Optional[str]:
+    if not filename.startswith(_BACK_DIR):
+        return None
+    relative = os.path.relpath(filename, _PROJECT_ROOT).replace(os.sep, "/")
+    for subsystem, prefixes in SUBSYSTEMS:
+        if relative.startswith(prefixes):
+            return subsystem
+    return SUBSYSTEM_OTHER
+
+
+def subsystem_of(traceback: tracemalloc.Traceback) -> str:
+    """Subsystem of the innermost `back/` frame of an allocation traceback (`other` if none matches)."""
+    # Frames are sorted from the oldest to the most recent
+    for frame in reversed(traceback):
+        subsystem = _subsystem_of_file(frame.filename)
+        if subsystem is not None:
+            return subsystem
+    return SUBSYSTEM_OTHER
+
+
+def memory_report() -> MemoryReport:
+    """
+    ### memory_report
+    **Description:** Takes a tracemalloc snapshot and sums the live allocations by subsystem. Takes from
+    milliseconds to a few seconds depending on the heap: call it from a worker thread.
+    **Returns:** The MemoryReport (`tracing` False and no subsystem if tracemalloc is not running).
+    """
+    if not tracemalloc.is_tracing():
+        return MemoryReport(tracing=False, taken_at=datetime.now(timezone.utc))
+    # No `filter_traces`: its pattern matching in Python costs more than the whole grouping
+    snapshot = tracemalloc.take_snapshot()
+    subsystems: Dict[str, SubsystemMemory] = {name: SubsystemMemory() for name, _ in SUBSYSTEMS}
+    subsystems[SUBSYSTEM_OTHER] = SubsystemMemory()
+    for statistic in snapshot.statistics("traceback"):
+        subsystem = subsystem_of(statistic.traceback)
+        subsystems[subsystem].bytes += statistic.size
+        subsystems[subsystem].blocks += statistic.count
+    traced, peak = tracemalloc.get_traced_memory()
+    return MemoryReport(tracing=True, taken_at=datetime.now(timezone.utc), traced_bytes=traced,
+                        peak_bytes=peak, frames=tracemalloc.get_traceback_limit(), subsystems=subsystems)
+
+
+class _ReportCache:
+    """Last report, reused on scrape for `max_age` seconds (a snapshot is too slow for every scrape)."""
+
+    def __init__(self, max_age: float = 30.0):
+        self.max_age = max_age
+        self._report: Optional[MemoryReport] = None
+        self._taken = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> MemoryReport:
+        with self._lock:
+            if self._report is None or time.monotonic() - self._taken > self.max_age:
+                self._report = memory_report()
+                self._taken = time.monotonic()
+            return self._report
+
+
+_report_cache = _ReportCache()
+
+
+def _collect_memory() -> Iterable[MetricFamily]:
+    """Traced memory by subsystem (only while tracemalloc is running)."""
+    if not tracemalloc.is_tracing():
+        return
+    report = _report_cache.get()
+    yield MetricFamily("jdr_memory_traced_bytes", "gauge",
+                       "Live memory allocated since tracing started, by subsystem (tracemalloc).",
+                       [("jdr_memory_traced_bytes", {"subsystem": name}, usage.bytes)
+                        for name, usage in report.subsystems.items()])
+    yield MetricFamily("jdr_memory_traced_peak_bytes", "gauge", "Peak traced memory (tracemalloc).",
+                       [("jdr_memory_traced_peak_bytes", {}, report.peak_bytes)])
+
+
+registry.add_collector(_collect_memory)
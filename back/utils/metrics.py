@@ -0,0 +1,332 @@
+"""
+In-process Prometheus metrics, rendered in the text exposition format (0.0.4) by `GET /metrics`.
+No client library or external service: counters and histograms live in this process and are read on
+scrape, together with collectors that compute values at scrape time (cache statistics, history file
+sizes, active combat states).
+With several worker processes, each one exposes its own values.
+"""
+
+import asyncio
+import bisect
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+
+from back.config import get_data_dir
+
+# Upper bounds (seconds) of the latency histogram buckets, +Inf being implicit
+LATENCY_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# (sample name, labels, value)
+Sample = Tuple[str, Dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_sample(name: str, labels: Dict[str, str], value: float) -> str:
+    if labels:
+        label_text = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels.items())
+        return f"{name}{{{label_text}}} {_format_value(value)}"
+    return f"{name} {_format_value(value)}"
+
+
+class MetricFamily:
+    """
+    ### MetricFamily
+    **Description:** One metric (name, type, help) and its samples, as rendered on scrape.
+    """
+
+    def __init__(self, name: str, metric_type: str, documentation: str, samples: Iterable[Sample]):
+        self.name = name
+        self.metric_type = metric_type
+        self.documentation = documentation
+        self.samples = list(samples)
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        lines.extend(_format_sample(name, labels, value) for name, labels, value in self.samples)
+        return "\n".join(lines)
+
+
+def histogram_samples(name: str, labels: Dict[str, str], buckets: Sequence[float],
+                      bucket_counts: Sequence[int], total: float, count: int) -> List[Sample]:
+    """
+    ### histogram_samples
+    **Description:** Prometheus samples of a histogram kept as non-cumulative counts per bucket.
+    **Parameters:**
+    - `name` (str): Metric name.
+    - `labels` (Dict[str, str]): Labels of the series.
+    - `buckets` (Sequence[float]): Bucket upper bounds, without +Inf.
+    - `bucket_counts` (Sequence[int]): Observations per bucket, the last one being +Inf.
+    - `total` (float): Sum of the observations.
+    - `count` (int): Number of observations.
+    **Returns:** `_bucket` (cumulative), `_sum` and `_count` samples.
+    """
+    samples: List[Sample] = []
+    cumulative = 0
+    for bound, bucket_count in zip(list(buckets) + [float("inf")], bucket_counts):
+        cumulative += bucket_count
+        samples.append((f"{name}_bucket", {**labels, "le": _format_value(bound)}, cumulative))
+    samples.append((f"{name}_sum", labels, total))
+    samples.append((f"{name}_count", labels, count))
+    return samples
+
+
+class _Metric:
+    metric_type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: Tuple[str, ...]) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def collect(self) -> MetricFamily:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """
+    ### Counter
+    **Description:** Monotonic counter per label set (`inc(amount, **labels)`).
+    """
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Adds `amount` (>= 0) to the series of `labels`."""
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        """Current value of a series (0 if never incremented)."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def collect(self) -> MetricFamily:
+        with self._lock:
+            samples = [(f"{self.name}_total", self._labels(key), value) for key, value in sorted(self._values.items())]
+        return MetricFamily(f"{self.name}_total", self.metric_type, self.documentation, samples)
+
+
+class Histogram(_Metric):
+    """
+    ### Histogram
+    **Description:** Distribution of observations per label set (`observe(value, **labels)`).
+    """
+
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        # key -> [bucket counts (last one is +Inf), sum, count]
+        self._series: Dict[Tuple[str, ...], List[Any]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Adds one observation to the series of `labels`."""
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, **labels: Any) -> int:
+        """Number of observations of a series."""
+        with self._lock:
+            series = self._series.get(self._key(labels))
+            return series[2] if series else 0
+
+    def collect(self) -> MetricFamily:
+        samples: List[Sample] = []
+        with self._lock:
+            for key, (bucket_counts, total, count) in sorted(self._series.items()):
+                samples.extend(histogram_samples(self.name, self._labels(key), self.buckets,
+                                                 bucket_counts, total, count))
+        return MetricFamily(self.name, self.metric_type, self.documentation, samples)
+
+
+class MetricsRegistry:
+    """
+    ### MetricsRegistry
+    **Description:** Metrics and scrape-time collectors exposed by `GET /metrics`.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], Iterable[MetricFamily]]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        """Registers a metric (name must be unique) and returns it."""
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], Iterable[MetricFamily]]) -> None:
+        """Adds a function called on each scrape, returning the metric families it computes."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """
+        ### render
+        **Description:** All metrics in the Prometheus text exposition format.
+        **Returns:** The response body of `GET /metrics`.
+        """
+        families = [metric.collect() for metric in self._metrics.values()]
+        for collector in self._collectors:
+            families.extend(collector())
+        return "\n".join(family.render() for family in families) + "\n"
+
+
+registry = MetricsRegistry()
+
+TURNS = registry.counter("jdr_turns", "Game turns played, by session mode.", ["mode"])
+LLM_RUN_SECONDS = registry.histogram(
+    "jdr_llm_run_seconds", "Duration of an agent run (LLM requests and the tool calls between them).", ["agent"])
+LLM_REQUESTS = registry.counter("jdr_llm_requests", "LLM requests made by the agents.", ["agent"])
+LLM_TOKENS = registry.counter("jdr_llm_tokens", "LLM tokens used by the agents (result.usage()).", ["agent", "kind"])
+TOOL_CALLS = registry.counter("jdr_tool_calls", "Agent tool calls, by tool and outcome.", ["tool", "outcome"])
+TOOL_SECONDS = registry.histogram("jdr_tool_seconds", "Duration of agent tool calls.", ["tool"])
+CACHE_REQUESTS = registry.counter("jdr_cache_requests", "Cache lookups, by cache and result (hit or miss).",
+                                  ["cache", "result"])
+EVENT_LOOP_LAG_SECONDS = registry.histogram(
+    "jdr_event_loop_lag_seconds", "Delay of the event loop in waking up a periodic task.",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5))
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """Counts one lookup of `cache`."""
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def record_agent_run(agent: str, seconds: float, usage: Any) -> None:
+    """
+    ### record_agent_run
+    **Description:** Records the duration and the usage of an agent run.
+    **Parameters:**
+    - `agent` (str): Agent name ("narrative", "combat").
+    - `seconds` (float): Duration of the run.
+    - `usage` (RunUsage): `result.usage()` of the run.
+    """
+    LLM_RUN_SECONDS.observe(seconds, agent=agent)
+    LLM_REQUESTS.inc(int(getattr(usage, "requests", 0) or 0), agent=agent)
+    LLM_TOKENS.inc(int(getattr(usage, "input_tokens", 0) or 0), agent=agent, kind="input")
+    LLM_TOKENS.inc(int(getattr(usage, "output_tokens", 0) or 0), agent=agent, kind="output")
+
+
+# Caches whose statistics are read on scrape: name -> function decorated with functools.lru_cache
+_lru_caches: Dict[str, Callable] = {}
+
+
+def watch_lru_cache(name: str, cached_function: Callable) -> None:
+    """Exposes the hits and misses of an `lru_cache` function as `jdr_cache_requests_total{cache=name}`."""
+    _lru_caches[name] = cached_function
+
+
+def _collect_lru_caches() -> Iterable[MetricFamily]:
+    samples: List[Sample] = []
+    for name, cached_function in sorted(_lru_caches.items()):
+        info = cached_function.cache_info()
+        samples.append(("jdr_lru_cache_requests_total", {"cache": name, "result": "hit"}, info.hits))
+        samples.append(("jdr_lru_cache_requests_total", {"cache": name, "result": "miss"}, info.misses))
+    yield MetricFamily("jdr_lru_cache_requests_total", "counter", "Lookups of the in-memory computation caches.", samples)
+
+
+def _history_file_sizes(data_dir: str) -> Dict[str, List[int]]:
+    """Sizes of the session histories, by kind (narrative, combat, narrative_llm...), cold segments included."""
+    sizes: Dict[str, List[int]] = {}
+    try:
+        with os.scandir(os.path.join(data_dir, "sessions")) as sessions:
+            for session in sessions:
+                if not session.is_dir():
+                    continue
+                session_sizes: Dict[str, int] = {}
+                with os.scandir(session.path) as files:
+                    for entry in files:
+                        if entry.name.startswith("history_") and not entry.name.endswith(".tmp") and entry.is_file():
+                            # history_<kind>.jsonl and its cold segments history_<kind>.jsonl.<id>.cold.gz
+                            kind = entry.name[len("history_"):].split(".", 1)[0]
+                            session_sizes[kind] = session_sizes.get(kind, 0) + entry.stat().st_size
+                for kind, size in session_sizes.items():
+                    sizes.setdefault(kind, []).append(size)
+    except FileNotFoundError:
+        pass
+    return sizes
+
+
+def _collect_storage() -> Iterable[MetricFamily]:
+    """History file sizes and active combat states, read from the data directory on scrape."""
+    data_dir = get_data_dir()
+    sizes = sorted(_history_file_sizes(data_dir).items())
+    yield MetricFamily("jdr_history_files", "gauge", "History files, by kind.",
+                       [("jdr_history_files", {"kind": kind}, len(values)) for kind, values in sizes])
+    yield MetricFamily("jdr_history_bytes", "gauge", "Total size of the history files, by kind.",
+                       [("jdr_history_bytes", {"kind": kind}, sum(values)) for kind, values in sizes])
+    yield MetricFamily("jdr_history_max_bytes", "gauge", "Size of the largest history file, by kind.",
+                       [("jdr_history_max_bytes", {"kind": kind}, max(values)) for kind, values in sizes])
+
+    try:
+        combat_states = sum(1 for name in os.listdir(os.path.join(data_dir, "combat")) if name.endswith(".json"))
+    except FileNotFoundError:
+        combat_states = 0
+    yield MetricFamily("jdr_combat_states_active", "gauge", "Combat states saved (combats in progress).",
+                       [("jdr_combat_states_active", {}, combat_states)])
+
+
+registry.add_collector(_collect_lru_caches)
+registry.add_collector(_collect_storage)
+
+
+async def watch_event_loop_lag(interval: float = 0.5) -> None:
+    """
+    ### watch_event_loop_lag
+    **Description:** Background task measuring how late the event loop wakes up a sleep of `interval`
+    seconds (blocking code on the loop shows up as lag). Runs until cancelled.
+    **Parameters:**
+    - `interval` (float): Sampling period in seconds.
+    """
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG_SECONDS.observe(max(0.0, time.perf_counter() - start - interval))
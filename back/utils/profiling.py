@@ -0,0 +1,382 @@
+"""
+On-demand request profiling. `ProfilingMiddleware` profiles a request on the configured path prefixes when
+the `X-Profile` header asks for it (off by default: `allow_header`), or when sampling is enabled and the
+request is drawn (`sample_rate`); other requests only pay one random draw. A profile covers the whole request (graph run, tools, storage)
+and is saved in `<data dir>/profiles`:
+- `cprofile`: deterministic profile of the event-loop thread, as a `.pstats` file (snakeviz, `pstats`).
+- `sampling`: stacks of all the threads sampled every few milliseconds (sync tools run in worker threads),
+  as a speedscope JSON file (https://www.speedscope.app).
+One request is profiled at a time: the profilers see the whole process, so concurrent requests show up.
+"""
+
+import asyncio
+import cProfile
+import json
+import os
+import random
+import re
+import secrets
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from back.config import get_data_dir, get_profiling_config
+from back.models.schema import ProfileInfo, ProfilingSettings
+from back.utils.logger import log_debug, log_warning
+
+PROFILE_HEADER = "x-profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+PROFILES_DIR = "profiles"
+MODE_CPROFILE = "cprofile"
+MODE_SAMPLING = "sampling"
+TRIGGER_HEADER = "header"
+TRIGGER_SAMPLED = "sampled"
+
+_MODE_EXTENSIONS = {MODE_CPROFILE: ".pstats", MODE_SAMPLING: ".speedscope.json"}
+_META_EXTENSION = ".meta.json"
+_PROFILE_ID_PATTERN = re.compile(r"^[0-9A-Za-z_-]+$")
+_LOCAL_HOSTS = ("127.0.0.1", "::1")
+
+
+class SamplingProfiler:
+    """
+    ### SamplingProfiler
+    **Description:** Samples the stacks of all the threads (but its own) from a background thread, and renders
+    them as a speedscope "sampled" profile per thread.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self._frames: List[Dict[str, Any]] = []
+        self._frame_index: Dict[Tuple[str, str, int], int] = {}
+        self._samples: Dict[int, Tuple[List[List[int]], List[float]]] = {}
+        self._thread_names: Dict[int, str] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Starts sampling."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops sampling (waits for the last sample)."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _frame_id(self, code: Any) -> int:
+        key = (code.co_name, code.co_filename, code.co_firstlineno)
+        index = self._frame_index.get(key)
+        if index is None:
+            index = self._frame_index[key] = len(self._frames)
+            self._frames.append({"name": code.co_name, "file": code.co_filename, "line": code.co_firstlineno})
+        return index
+
+    def _sample(self, weight: float) -> None:
+        own = threading.get_ident()
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(self._frame_id(frame.f_code))
+                frame = frame.f_back
+            stack.reverse()
+            stacks, weights = self._samples.setdefault(thread_id, ([], []))
+            stacks.append(stack)
+            weights.append(weight)
+
+    def _run(self) -> None:
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            self._sample(now - last)
+            last = now
+        self._thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+
+    def to_speedscope(self, name: str) -> Dict[str, Any]:
+        """
+        ### to_speedscope
+        **Description:** Renders the samples in the speedscope file format.
+        **Parameters:**
+        - `name` (str): Profile name shown by speedscope.
+        **Returns:** The speedscope document (JSON-ready).
+        """
+        profiles = []
+        for thread_id, (stacks, weights) in self._samples.items():
+            profiles.append({
+                "type": "sampled",
+                "name": self._thread_names.get(thread_id, f"thread-{thread_id}"),
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": stacks,
+                "weights": weights,
+            })
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "jdr-request-profiler",
+            "activeProfileIndex": 0,
+            "shared": {"frames": self._frames},
+            "profiles": profiles,
+        }
+
+
+class RequestProfiler:
+    """
+    ### RequestProfiler
+    **Description:** Decides which requests are profiled, captures them and manages the saved profiles.
+    Settings (`enabled`, `sample_rate`, `mode`) can be changed at runtime; the rest comes from the
+    `profiling` section of the configuration.
+    """
+
+    def __init__(self, settings: ProfilingSettings, allow_header: bool = False, paths: Optional[List[str]] = None,
+                 max_profiles: int = 50, sampling_interval: float = 0.005, admin_token: str = ""):
+        self.settings = settings
+        self.allow_header = allow_header
+        self.admin_token = admin_token
+        self.paths = tuple(paths or ())
+        self.max_profiles = max_profiles
+        self.sampling_interval = sampling_interval
+        self._busy = threading.Lock()
+
+    @classmethod
+    def from_config(cls) -> "RequestProfiler":
+        """Builds the profiler from the `profiling` configuration section."""
+        profiling_config = get_profiling_config()
+        return cls(
+            ProfilingSettings(enabled=profiling_config["enabled"], sample_rate=profiling_config["sample_rate"],
+                              mode=profiling_config["mode"]),
+            allow_header=profiling_config["allow_header"],
+            paths=profiling_config["paths"],
+            max_profiles=profiling_config["max_profiles"],
+            sampling_interval=profiling_config["sampling_interval_ms"] / 1000.0,
+            admin_token=profiling_config["admin_token"],
+        )
+
+    def is_admin(self, client_host: Optional[str], token: Optional[str]) -> bool:
+        """
+        ### is_admin
+        **Description:** Whether a client may change the profiling settings: with the configured admin token,
+        or from the local machine if no token is configured.
+        **Parameters:**
+        - `client_host` (Optional[str]): Address of the client.
+        - `token` (Optional[str]): `X-Admin-Token` header value.
+        **Returns:** True if the client is allowed.
+        """
+        if self.admin_token:
+            return token is not None and secrets.compare_digest(token.encode("utf-8"),
+                                                                self.admin_token.encode("utf-8"))
+        return client_host in _LOCAL_HOSTS
+
+    @staticmethod
+    def profiles_dir() -> str:
+        return os.path.join(get_data_dir(), PROFILES_DIR)
+
+    def select(self, path: str, header: Optional[str]) -> Optional[Tuple[str, str]]:
+        """
+        ### select
+        **Description:** Decides whether a request is profiled. Only the configured path prefixes are eligible,
+        whatever the trigger.
+        **Parameters:**
+        - `path` (str): Request path.
+        - `header` (Optional[str]): `X-Profile` header value: "1"/"true" (configured mode), "cprofile" or
+          "sampling"; anything else, or any value when `allow_header` is off, is ignored.
+        **Returns:** `(mode, trigger)`, or None if the request is not profiled.
+        """
+        if not path.startswith(self.paths):
+            return None
+        if header is not None and self.allow_header:
+            value = header.strip().lower()
+            if value in _MODE_EXTENSIONS:
+                return value, TRIGGER_HEADER
+            if value in ("1", "true", "yes"):
+                return self.settings.mode, TRIGGER_HEADER
+        settings = self.settings
+        if settings.enabled and settings.sample_rate > 0 and random.random() < settings.sample_rate:
+            return settings.mode, TRIGGER_SAMPLED
+        return None
+
+    @contextmanager
+    def capture(self, mode: str) -> Iterator[Optional[Any]]:
+        """
+        ### capture
+        **Description:** Profiles the block with `mode`. Yields None (nothing profiled) if another request is
+        already being profiled.
+        **Parameters:**
+        - `mode` (str): MODE_CPROFILE or MODE_SAMPLING.
+        **Returns:** The profiler (`cProfile.Profile` or `SamplingProfiler`), or None.
+        """
+        if not self._busy.acquire(blocking=False):
+            yield None
+            return
+        profiler: Any = cProfile.Profile() if mode == MODE_CPROFILE else SamplingProfiler(self.sampling_interval)
+        try:
+            if mode == MODE_CPROFILE:
+                profiler.enable()
+            else:
+                profiler.start()
+            try:
+                yield profiler
+            finally:
+                if mode == MODE_CPROFILE:
+                    profiler.disable()
+                else:
+                    profiler.stop()
+        finally:
+            self._busy.release()
+
+    @staticmethod
+    def new_profile_id() -> str:
+        return f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S}_{secrets.token_hex(3)}"
+
+    def save(self, profiler: Any, info: Dict[str, Any]) -> ProfileInfo:
+        """
+        ### save
+        **Description:** Writes a captured profile and its metadata, then drops the oldest profiles beyond
+        `max_profiles`.
+        **Parameters:**
+        - `profiler` (Any): Profiler returned by `capture`.
+        - `info` (Dict[str, Any]): ProfileInfo fields but `filename` and `size`.
+        **Returns:** The saved profile's ProfileInfo.
+        """
+        directory = self.profiles_dir()
+        os.makedirs(directory, exist_ok=True)
+        filename = f"{info['profile_id']}{_MODE_EXTENSIONS[info['mode']]}"
+        path = os.path.join(directory, filename)
+        if info["mode"] == MODE_CPROFILE:
+            profiler.dump_stats(path)
+        else:
+            document = profiler.to_speedscope(f"{info['method']} {info['path']}")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(document, f, separators=(",", ":"))
+        profile = ProfileInfo(**info, filename=filename, size=os.path.getsize(path))
+        with open(os.path.join(directory, f"{profile.profile_id}{_META_EXTENSION}"), "w", encoding="utf-8") as f:
+            f.write(profile.model_dump_json())
+        for old in self.list_profiles()[self.max_profiles:]:
+            self.delete(old)
+        log_debug("Request profile saved", action="profile_saved", profile_id=profile.profile_id,
+                  mode=profile.mode, path=profile.path, duration_ms=profile.duration_ms, size=profile.size)
+        return profile
+
+    def list_profiles(self) -> List[ProfileInfo]:
+        """Saved profiles, newest first."""
+        directory = self.profiles_dir()
+        if not os.path.isdir(directory):
+            return []
+        profiles = []
+        for name in os.listdir(directory):
+            if not name.endswith(_META_EXTENSION):
+                continue
+            try:
+                with open(os.path.join(directory, name), "rb") as f:
+                    profiles.append(ProfileInfo.model_validate_json(f.read()))
+            except (OSError, ValueError) as e:
+                log_warning("Unreadable profile metadata", action="list_profiles", file=name, error=str(e))
+        return sorted(profiles, key=lambda profile: profile.created_at, reverse=True)
+
+    def get_profile(self, profile_id: str) -> Optional[Tuple[ProfileInfo, str]]:
+        """
+        ### get_profile
+        **Description:** Finds a saved profile.
+        **Parameters:**
+        - `profile_id` (str): Profile identifier.
+        **Returns:** `(ProfileInfo, profile file path)`, or None if unknown.
+        """
+        if not _PROFILE_ID_PATTERN.match(profile_id):
+            return None
+        meta_path = os.path.join(self.profiles_dir(), f"{profile_id}{_META_EXTENSION}")
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, "rb") as f:
+            profile = ProfileInfo.model_validate_json(f.read())
+        path = os.path.join(self.profiles_dir(), profile.filename)
+        return (profile, path) if os.path.exists(path) else None
+
+    def delete(self, profile: ProfileInfo) -> None:
+        """Deletes a saved profile and its metadata."""
+        for name in (profile.filename, f"{profile.profile_id}{_META_EXTENSION}"):
+            try:
+                os.remove(os.path.join(self.profiles_dir(), name))
+            except FileNotFoundError:
+                pass
+
+
+request_profiler = RequestProfiler.from_config()
+
+
+class ProfilingMiddleware:
+    """
+    ### ProfilingMiddleware
+    **Description:** ASGI middleware profiling the requests selected by the request profiler (see module
+    docstring). The profile id is returned in the `X-Profile-Id` response header; the profile is written
+    after the response, in a worker thread.
+    """
+
+    def __init__(self, app: Any, profiler: Optional[RequestProfiler] = None):
+        self.app = app
+        self.profiler = profiler or request_profiler
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        header = next((value.decode("latin-1") for key, value in scope.get("headers", ())
+                       if key == PROFILE_HEADER.encode()), None)
+        selected = self.profiler.select(scope["path"], header)
+        if selected is None:
+            await self.app(scope, receive, send)
+            return
+
+        mode, trigger = selected
+        profile_id = self.profiler.new_profile_id()
+        status_code: Optional[int] = None
+        profiled = False
+
+        async def send_with_profile_id(message: Dict[str, Any]) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if profiled:
+                    message = dict(message, headers=list(message.get("headers", []))
+                                   + [(PROFILE_ID_HEADER.encode(), profile_id.encode())])
+            await send(message)
+
+        created_at = datetime.now(timezone.utc)
+        start = time.perf_counter()
+        error: Optional[Exception] = None
+        with self.profiler.capture(mode) as profiler:
+            profiled = profiler is not None
+            try:
+                await self.app(scope, receive, send_with_profile_id)
+            except Exception as e:
+                # Failed requests are profiled too; the error is raised once the profile is saved
+                error = e
+        duration_ms = (time.perf_counter() - start) * 1000.0
+        if profiler is not None:
+            await self._save(profiler, {
+                "profile_id": profile_id,
+                "created_at": created_at,
+                "method": scope.get("method", ""),
+                "path": scope["path"],
+                "status_code": status_code,
+                "duration_ms": round(duration_ms, 3),
+                "mode": mode,
+                "trigger": trigger,
+            })
+        if error is not None:
+            raise error
+
+    async def _save(self, profiler: Any, info: Dict[str, Any]) -> None:
+        try:
+            await asyncio.to_thread(self.profiler.save, profiler, info)
+        except Exception as e:
+            log_warning("Request profile could not be saved", action="profile_saved",
+                        profile_id=info["profile_id"], error=str(e))
@@ -0,0 +1,260 @@
+"""
+Per-turn latency breakdown, measured in-process (no logfire or exporter required).
+A `/play` turn is wrapped in `track_turn`; `timed(phase)` spans in the router, graph nodes, tools and
+storage add their duration to the current turn (no-op outside a turn). When the turn ends, its phases
+are aggregated into latency histograms and kept per session (`turn_metrics`), and the router renders
+them as a `Server-Timing` header.
+Phases may nest: `llm` includes the tool calls and the summarization that happen during the agent run.
+"""
+
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from back.utils.metrics import LATENCY_BUCKETS, TOOL_CALLS, TOOL_SECONDS, MetricFamily, histogram_samples, registry
+
+# Phases of a turn
+PHASE_SESSION_LOAD = "session_load"
+PHASE_HISTORY_LOAD = "history_load"
+PHASE_PROMPT = "prompt"
+PHASE_LLM = "llm"
+PHASE_SUMMARIZE = "summarize"
+PHASE_PERSIST = "persist"
+PHASE_TOTAL = "total"
+TOOL_PHASE_PREFIX = "tool."
+
+
+class TurnTimings:
+    """
+    ### TurnTimings
+    **Description:** Time spent per phase during one turn (milliseconds, summed over repeated spans).
+    """
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.started_at = datetime.now(timezone.utc)
+        self.phases: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+        self.total_ms = 0.0
+        self._start = time.perf_counter()
+        # Sync tools run in worker threads
+        self._lock = threading.Lock()
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Adds one span of `phase`."""
+        with self._lock:
+            self.phases[phase] = self.phases.get(phase, 0.0) + seconds * 1000.0
+            self.counts[phase] = self.counts.get(phase, 0) + 1
+
+    def finish(self) -> None:
+        """Freezes the total duration of the turn."""
+        self.total_ms = (time.perf_counter() - self._start) * 1000.0
+
+    def server_timing(self) -> str:
+        """
+        ### server_timing
+        **Description:** Renders the phases as a `Server-Timing` header value.
+        **Returns:** e.g. `session_load;dur=3.2, llm;dur=2140.7, total;dur=2161.0`.
+        """
+        metrics = [f"{phase};dur={ms:.1f}" for phase, ms in self.phases.items()]
+        metrics.append(f"{PHASE_TOTAL};dur={self.total_ms:.1f}")
+        return ", ".join(metrics)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready view of the turn."""
+        return {
+            "started_at": self.started_at.isoformat(),
+            "total_ms": round(self.total_ms, 3),
+            "phases": {phase: round(ms, 3) for phase, ms in self.phases.items()},
+            "counts": dict(self.counts),
+        }
+
+
+class LatencyHistogram:
+    """
+    ### LatencyHistogram
+    **Description:** Latency histogram in seconds: count per bucket (not cumulative), sum and count.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.bucket_counts: List[int] = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Adds one observation."""
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                index = i
+                break
+        self.bucket_counts[index] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-ready view: bucket upper bounds (`+Inf` last) with their counts, sum and count."""
+        bounds = [str(bound) for bound in self.buckets] + ["+Inf"]
+        return {
+            "buckets": dict(zip(bounds, self.bucket_counts)),
+            "count": self.count,
+            "sum": round(self.sum, 6),
+        }
+
+
+class TurnMetrics:
+    """
+    ### TurnMetrics
+    **Description:** In-process aggregation of finished turns: one latency histogram per phase, and the
+    last turns of each session (bounded, least recently played sessions are dropped first).
+    """
+
+    def __init__(self, turns_per_session: int = 20, max_sessions: int = 256):
+        self.turns_per_session = turns_per_session
+        self.max_sessions = max_sessions
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._sessions: "OrderedDict[str, Deque[TurnTimings]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, turn: TurnTimings) -> None:
+        """
+        ### record
+        **Description:** Adds a finished turn to the histograms and to its session.
+        **Parameters:**
+        - `turn` (TurnTimings): Finished turn.
+        """
+        with self._lock:
+            for phase, ms in list(turn.phases.items()) + [(PHASE_TOTAL, turn.total_ms)]:
+                histogram = self._histograms.get(phase)
+                if histogram is None:
+                    histogram = self._histograms[phase] = LatencyHistogram()
+                histogram.observe(ms / 1000.0)
+
+            turns = self._sessions.pop(turn.session_id, None)
+            if turns is None:
+                turns = deque(maxlen=self.turns_per_session)
+            turns.append(turn)
+            self._sessions[turn.session_id] = turns
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+    def histograms(self) -> Dict[str, Dict[str, Any]]:
+        """Histogram snapshots by phase."""
+        with self._lock:
+            return {phase: histogram.snapshot() for phase, histogram in sorted(self._histograms.items())}
+
+    def session_turns(self, session_id: str) -> List[Dict[str, Any]]:
+        """Last turns of a session, oldest first (empty if unknown)."""
+        with self._lock:
+            return [turn.to_dict() for turn in self._sessions.get(session_id, ())]
+
+    def reset(self) -> None:
+        """Drops all the recorded turns."""
+        with self._lock:
+            self._histograms.clear()
+            self._sessions.clear()
+
+    def collect(self) -> Iterable[MetricFamily]:
+        """Phase histograms as the `jdr_turn_phase_seconds` Prometheus metric."""
+        samples = []
+        with self._lock:
+            for phase, histogram in sorted(self._histograms.items()):
+                samples.extend(histogram_samples("jdr_turn_phase_seconds", {"phase": phase}, histogram.buckets,
+                                                 histogram.bucket_counts, histogram.sum, histogram.count))
+        yield MetricFamily("jdr_turn_phase_seconds", "histogram", "Time spent per phase of a game turn.", samples)
+
+
+turn_metrics = TurnMetrics()
+registry.add_collector(turn_metrics.collect)
+
+_current_turn: ContextVar[Optional[TurnTimings]] = ContextVar("current_turn", default=None)
+
+
+@contextmanager
+def track_turn(session_id: str) -> Iterator[TurnTimings]:
+    """
+    ### track_turn
+    **Description:** Measures one turn of `session_id`; spans opened inside are added to it, and the turn is
+    recorded in `turn_metrics` when the block exits (even on error).
+    **Parameters:**
+    - `session_id` (str): Session identifier.
+    **Returns:** The TurnTimings being filled.
+    """
+    turn = TurnTimings(session_id)
+    token = _current_turn.set(turn)
+    try:
+        yield turn
+    finally:
+        _current_turn.reset(token)
+        turn.finish()
+        turn_metrics.record(turn)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """
+    ### timed
+    **Description:** Adds the duration of the block to `phase` of the current turn; no-op outside a turn.
+    **Parameters:**
+    - `phase` (str): Phase name (a `Server-Timing` token: letters, digits, `_`, `.`).
+    """
+    turn = _current_turn.get()
+    if turn is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        turn.add(phase, time.perf_counter() - start)
+
+
+def timed_tool(func: Callable) -> Callable:
+    """
+    ### timed_tool
+    **Description:** Wraps an agent tool so that each call is timed as `tool.<name>` in the current turn and
+    counted in the tool metrics. The wrapper keeps the signature, annotations and docstring the agent builds
+    the tool schema from.
+    **Parameters:**
+    - `func` (Callable): Tool function (sync or async).
+    **Returns:** The wrapped tool.
+    """
+    name = func.__name__
+    phase = f"{TOOL_PHASE_PREFIX}{name}"
+
+    @contextmanager
+    def measured() -> Iterator[None]:
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            with timed(phase):
+                yield
+            outcome = "ok"
+        finally:
+            TOOL_SECONDS.observe(time.perf_counter() - start, tool=name)
+            TOOL_CALLS.inc(tool=name, outcome=outcome)
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            with measured():
+                return await func(*args, **kwargs)
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with measured():
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def timed_tools(tools: List[Callable]) -> List[Callable]:
+    """Applies `timed_tool` to a list of tools."""
+    return [timed_tool(tool) for tool in tools]
@@ -0,0 +1,93 @@
+"""
+Trusted loads of files written by the application.
+A file whose bytes match the checksum recorded when we wrote (or last fully validated) it, for the
+same model schema, is decoded with the validation context `TRUSTED_CONTEXT`: the Python-level
+consistency validators of the domain models return early (see `is_trusted_load`). Anything else -
+API input, a file edited by hand, written by another version or never seen by this process - is
+fully validated.
+"""
+
+import hashlib
+import json
+import os
+from functools import lru_cache
+from typing import Dict, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, ValidationInfo
+
+from back.utils.metrics import record_cache
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+TRUSTED_CONTEXT = {"trusted": True}
+
+
+def is_trusted_load(info: ValidationInfo) -> bool:
+    """True when the model is being decoded from trusted storage; check-only validators can return early."""
+    return bool(info.context and info.context.get("trusted"))
+
+
+@lru_cache(maxsize=None)
+def schema_version(model_cls: Type[BaseModel]) -> str:
+    """
+    ### schema_version
+    **Description:** Fingerprint of a model's schema; a checksum recorded under another fingerprint is not trusted.
+    **Parameters:**
+    - `model_cls` (Type[BaseModel]): Model class.
+    **Returns:** 'Model:hash' string.
+    """
+    schema = json.dumps(model_cls.model_json_schema(), sort_keys=True).encode("utf-8")
+    return f"{model_cls.__qualname__}:{hashlib.sha256(schema).hexdigest()[:16]}"
+
+
+class TrustedLoads:
+    """
+    ### TrustedLoads
+    **Description:** Checksums of the files this process wrote or fully validated, by path.
+    Checksums are kept in memory, so the first load of a file after a restart is always validated.
+    """
+
+    def __init__(self) -> None:
+        self._digests: Dict[str, Tuple[str, str]] = {}
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.abspath(path)
+
+    def remember(self, path: str, model_cls: Type[BaseModel], raw: bytes) -> None:
+        """Record `raw` as the trusted content of `path` for `model_cls`."""
+        self._digests[self._key(path)] = (schema_version(model_cls), hashlib.sha256(raw).hexdigest())
+
+    def forget(self, path: str) -> None:
+        """Stop trusting `path` (file deleted)."""
+        self._digests.pop(self._key(path), None)
+
+    def is_trusted(self, path: str, model_cls: Type[BaseModel], raw: bytes) -> bool:
+        """True if `raw` is exactly the content recorded for `path` under the current schema of `model_cls`."""
+        recorded = self._digests.get(self._key(path))
+        return recorded is not None and recorded == (schema_version(model_cls), hashlib.sha256(raw).hexdigest())
+
+
+trusted_loads = TrustedLoads()
+
+
+def load_model(model_cls: Type[ModelT], raw: bytes, path: str) -> ModelT:
+    """
+    ### load_model
+    **Description:** Decodes a model stored as JSON at `path`, straight from the bytes. Trusted content
+    skips the consistency validators; other content is fully validated and trusted from then on.
+    **Parameters:**
+    - `model_cls` (Type[BaseModel]): Model class.
+    - `raw` (bytes): File content.
+    - `path` (str): File path.
+    **Returns:** The model instance.
+    **Raises:** pydantic.ValidationError on invalid content.
+    """
+    trusted = trusted_loads.is_trusted(path, model_cls, raw)
+    record_cache("trusted_load", trusted)
+    if trusted:
+        return model_cls.model_validate_json(raw, context=TRUSTED_CONTEXT)
+
+    model = model_cls.model_validate_json(raw)
+    trusted_loads.remember(path, model_cls, raw)
+    return model
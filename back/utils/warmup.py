@@ -0,0 +1,67 @@
+"""
+Startup warm-up: loads ahead of the first turn what is no longer loaded at import time (tokenizer,
+game data, agents and their LLM client), so that worker boot and test collection stay fast while the
+first turn is still warm. Steps run in parallel worker threads; a failing step is logged and skipped.
+"""
+
+import asyncio
+import time
+from typing import Callable, Dict, Optional
+
+from back.config import get_llm_config
+from back.utils.logger import log_info, log_warning
+
+
+def _warm_tokenizer() -> None:
+    from back.utils.history_processors import get_tokenizer
+    get_tokenizer()
+
+
+def _warm_game_data() -> None:
+    from back.dependencies import global_container
+    global_container.npc_archetypes_manager.templates
+    global_container.spells_manager.spells
+    global_container.combat_system_manager.get_rules()
+
+
+def _warm_agents() -> None:
+    # Agents are built per turn; building one of each imports the LLM client and the tool modules
+    from back.agents.narrative_agent import NarrativeAgent
+    from back.agents.combat_agent import CombatAgent
+    llm_config = get_llm_config()
+    NarrativeAgent(llm_config)
+    CombatAgent(llm_config)
+
+
+WARMUP_STEPS: Dict[str, Callable[[], None]] = {
+    "tokenizer": _warm_tokenizer,
+    "game_data": _warm_game_data,
+    "agents": _warm_agents,
+}
+
+
+async def warm_up(steps: Optional[Dict[str, Callable[[], None]]] = None) -> Dict[str, float]:
+    """
+    ### warm_up
+    **Description:** Runs the warm-up steps in parallel worker threads.
+    **Parameters:**
+    - `steps` (Optional[Dict[str, Callable[[], None]]]): Steps by name; defaults to `WARMUP_STEPS`.
+    **Returns:** Duration in seconds of each step that succeeded.
+    """
+    steps = WARMUP_STEPS if steps is None else steps
+    durations: Dict[str, float] = {}
+
+    async def run_step(name: str, step: Callable[[], None]) -> None:
+        start = time.perf_counter()
+        try:
+            await asyncio.to_thread(step)
+        except Exception as e:
+            log_warning("Warm-up step failed", action="warm_up", step=name, error=str(e))
+            return
+        durations[name] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run_step(name, step) for name, step in steps.items()))
+    log_info("Warm-up done", action="warm_up", duration_ms=round((time.perf_counter() - start) * 1000, 1),
+             **{f"{name}_ms": round(seconds * 1000, 1) for name, seconds in durations.items()})
+    return durations